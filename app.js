@@ -8,6 +8,19 @@ function normalizeSearch(s) {
     .replace(/\s+/g, '');                              // retire espaces
 }
 
+// Identifiant canonique d'une société (sid calculé par fetch_data.py ;
+// données plus anciennes : clé de recherche normalisée)
+function socId(p) {
+  return p.sid || normalizeSearch(p.societe);
+}
+
+// Mots d'un nom de société ou d'une requête (cf. societe_tokens côté pipeline)
+function societeTokens(s) {
+  return (s || '').toLowerCase()
+    .normalize('NFD').replace(/[\u0300-\u036f]/g, '')
+    .match(/[a-z0-9]+/g) || [];
+}
+
 function formatEur(n) {
   if (!n || isNaN(n)) return '—';
   if (n >= 1e6) return (n / 1e6).toFixed(2) + 'M€';
@@ -45,6 +58,7 @@ function isStructurePrivee(name) {
 // Filtre les participations selon le mode actif
 // En mode bourse : exclut les structures privées (SCI, SARL, SAS…) et les "non publiées"
 function filterParticipations(parts) {
+  if (!parts) return [];   // détails pas encore chargés (shards)
   if (!onlyBourse) return parts;
   return parts.filter(p => !isNonPublic(p.societe) && !isStructurePrivee(p.societe));
 }
@@ -178,13 +192,18 @@ function updateKpis() {
   else if (activeGroupe) base = allData.filter(d => d.groupe === activeGroupe);
   else if (excludedGroupes.size > 0) base = allData.filter(d => !excludedGroupes.has(d.groupe));
 
-  const nbDeputes = base.length;
-  const valeurs = base.map(d => filterParticipations(d.participations).reduce((s, p) => s + (p.evaluation || 0), 0));
-  const totalVal = valeurs.reduce((s, v) => s + v, 0);
-  const moyenne = nbDeputes > 0 ? totalVal / nbDeputes : 0;
-  // Médiane calculée uniquement sur les députés avec au moins une participation déclarée
-  const valeursAvecPart = valeurs.filter(v => v > 0);
-  const med = median(valeursAvecPart);
+  let nbDeputes, totalVal, moyenne, med;
+  const agg = precomputed();
+  if (agg) {
+    ({ membres: nbDeputes, valeur: totalVal, moyenne, mediane: med } = agg.kpis);
+  } else {
+    nbDeputes = base.length;
+    const valeurs = base.map(d => filterParticipations(d.participations).reduce((s, p) => s + (p.evaluation || 0), 0));
+    totalVal = valeurs.reduce((s, v) => s + v, 0);
+    moyenne = nbDeputes > 0 ? totalVal / nbDeputes : 0;
+    // Médiane calculée uniquement sur les députés avec au moins une participation déclarée
+    med = median(valeurs.filter(v => v > 0));
+  }
 
   document.getElementById('stat-deputes').textContent = nbDeputes.toLocaleString('fr-FR');
   document.getElementById('stat-valeur').textContent = formatEur(totalVal);
@@ -218,7 +237,120 @@ function aggregateByGroupe(data) {
   return Object.values(map).sort((a, b) => b.valeur - a.valeur);
 }
 
+/* ── Agrégats précalculés (générés par fetch_data.py) ────────────────────── */
+// Valables uniquement pour la vue par défaut : aucun filtre actif, mode bourse désactivé.
+let currentAgg = null;
+
+function loadAgg(raw, agg) {
+  if (!agg || agg.n !== raw.length) return null;
+  const societes = agg.societes.map(([label, totalValeur, byGroupe, detenteurs, sid]) => ({
+    label, totalValeur, byGroupe, detenteurs,
+    sid: sid || normalizeSearch(label),
+    prive: isStructurePrivee(label),
+  }));
+  return {
+    ...agg,
+    // Libellés normalisés (recherche par sous-chaîne)
+    societeKeys: societes.map(s => normalizeSearch(s.label)),
+    nonPublicKeys: (agg.nonPublic || []).map(([label]) => normalizeSearch(label)),
+    membres: agg.membres.map(([url, prenom, nom, groupe]) => ({ url, prenom, nom, groupe })),
+    societes,
+    socIndex: new Map(societes.map((s, si) => [s.sid, si])),
+  };
+}
+
+/* ── Index des sociétés (généré par fetch_data.py) ───────────────────────── */
+// Valable quels que soient les filtres : une société correspond à la requête
+// si chaque mot de la requête commence un mot de son libellé (index mot →
+// sociétés, « tot ener » → TotalEnergies) ou si la requête est une
+// sous-chaîne du libellé normalisé (comme la recherche sans index) ; puis
+// société → détenteurs. Sans agrégats, les appelants reviennent au parcours
+// des participations.
+
+// Entrées de l'index dont un mot commence par chacun des mots de la requête :
+// col 1 = sociétés publiques, col 2 = libellés non publiés
+function searchIndex(query, col) {
+  const toks = currentAgg.tokens;
+  let hits = null;
+  for (const w of societeTokens(query)) {
+    // Premier mot >= w (dichotomie), puis tous ceux qui commencent par w
+    let lo = 0, hi = toks.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (toks[mid][0] < w) lo = mid + 1; else hi = mid;
+    }
+    const found = new Set();
+    for (let i = lo; i < toks.length && toks[i][0].startsWith(w); i++) {
+      for (const x of toks[i][col] || []) if (!hits || hits.has(x)) found.add(x);
+    }
+    hits = found;
+  }
+  return hits || new Set();
+}
+
+// Indices des libellés dont la clé normalisée contient la requête
+function searchKeys(keys, query, hits) {
+  const q = normalizeSearch(query);
+  if (q) keys.forEach((key, i) => { if (key.includes(q)) hits.add(i); });
+  return hits;
+}
+
+// Indices des sociétés publiques correspondant à la requête (null sans index)
+function searchSocietes(query) {
+  if (!currentAgg || !currentAgg.tokens) return null;
+  const hits = searchKeys(currentAgg.societeKeys, query, searchIndex(query, 1));
+  if (onlyBourse) for (const si of hits) if (currentAgg.societes[si].prive) hits.delete(si);
+  return hits;
+}
+
+// URLs des parlementaires qui détiennent l'une des sociétés (indices)
+function holdersOf(indices) {
+  const urls = new Set();
+  for (const si of indices) {
+    for (const mi of currentAgg.societes[si].detenteurs) urls.add(currentAgg.membres[mi].url);
+  }
+  return urls;
+}
+
+// URLs des parlementaires dont une participation, publique ou non, correspond
+// à la requête (null sans index)
+function searchHolders(query) {
+  const hits = searchSocietes(query);
+  if (!hits) return null;
+  const urls = holdersOf(hits);
+  if (!onlyBourse && currentAgg.nonPublic) {
+    for (const ni of searchKeys(currentAgg.nonPublicKeys, query, searchIndex(query, 2))) {
+      for (const mi of currentAgg.nonPublic[ni][1]) urls.add(currentAgg.membres[mi].url);
+    }
+  }
+  return urls;
+}
+
+// Détenteurs des sociétés sélectionnées dans le picker (null sans index)
+function activeSocietesHolders() {
+  if (!currentAgg) return null;
+  const indices = [...activeSocietes]
+    .map(sid => currentAgg.socIndex.get(sid))
+    .filter(si => si !== undefined && !(onlyBourse && currentAgg.societes[si].prive));
+  return holdersOf(indices);
+}
+
+function precomputed() {
+  if (!currentAgg || onlyBourse || activeGroupe || activeDepute
+      || excludedGroupes.size > 0 || activeSocietes.size > 0) return null;
+  return currentAgg;
+}
+
+// Agrégat par groupe sur toutes les données (indépendant des filtres, sauf mode bourse)
+function aggregateAll() {
+  if (currentAgg && !onlyBourse) {
+    return currentAgg.groupes.map(g => ({ ...g, couleur: gColor(g.groupe), valeurs: [...g.valeurs] }));
+  }
+  return aggregateByGroupe(allData);
+}
+
 function filteredForCharts() {
+  if (precomputed()) return aggregateAll();
   let base = allData;
   if (activeDepute) base = allData.filter(d => d.url === activeDepute.url);
   else if (activeGroupe) base = allData.filter(d => d.groupe === activeGroupe);
@@ -226,6 +358,87 @@ function filteredForCharts() {
   return aggregateByGroupe(base);
 }
 
+/* ── Détails chargés à la demande (fetch_data.py --shards) ───────────────── */
+// data.js ne contient alors que les résumés (totaux, principales sociétés) ;
+// les sections DIA complètes sont chargées par groupe quand un filtre en a
+// besoin, puis les graphiques sont recalculés.
+let currentShards = null;     // manifeste du jeu courant (null = données complètes)
+const _shardLoads = {};       // url du shard → Promise
+
+function normalizeParticipations(parts) {
+  return parts.map(p => ({ ...p, societe: (p.societe || '').replace(/\s+/g, ' ').trim() }));
+}
+
+// Record brut (complet ou résumé) → entrée de allData
+function prepareMember(d) {
+  const parts = d.participations ? normalizeParticipations(d.participations) : null;
+  return {
+    ...d,
+    groupe: decodeHtml(d.groupe || ''),
+    participations: parts,
+    top: d.top && normalizeParticipations(d.top),
+    nbParts: parts ? parts.length : d.nbParts,
+    valeurTotale: parts ? parts.reduce((s, p) => s + (p.evaluation || 0), 0) : d.valeurTotale,
+  };
+}
+
+// Parlementaires dont les participations sont nécessaires pour l'état courant
+function membersInScope() {
+  if (onlyBourse) return allData;
+  const q = document.getElementById('search').value.trim();
+  if (precomputed() && !q) return [];
+  if (activeDepute) return allData.filter(d => d.url === activeDepute.url);
+  if (activeGroupe) return allData.filter(d => d.groupe === activeGroupe);
+  return allData.filter(d => !excludedGroupes.has(d.groupe));
+}
+
+function loadShard(shards, key) {
+  const url = shards.base + shards.shards[key].file;
+  if (!_shardLoads[url]) {
+    _shardLoads[url] = fetch(url)
+      .then(r => { if (!r.ok) throw new Error(`${url} : HTTP ${r.status}`); return r.json(); })
+      .catch(err => { delete _shardLoads[url]; throw err; });
+  }
+  return _shardLoads[url];
+}
+
+function ensureDetails() {
+  if (!currentShards) return;
+  const missing = [...new Set(membersInScope().filter(d => !d.participations).map(d => d.shard))];
+  if (!missing.length) return;
+  const shards = currentShards;
+  document.body.classList.add('details-loading');
+  Promise.all(missing.map(key => loadShard(shards, key))).then(loaded => {
+    if (shards !== currentShards) return;   // jeu de données changé entre-temps
+    const byUrl = Object.assign({}, ...loaded);
+    let merged = 0;
+    for (const d of allData) {
+      const det = byUrl[d.url];
+      if (!det || d.participations) continue;
+      Object.assign(d, det, { participations: normalizeParticipations(det.participations || []) });
+      merged++;
+    }
+    document.body.classList.remove('details-loading');
+    if (merged) refreshDetails();
+  }).catch(err => {
+    document.body.classList.remove('details-loading');
+    console.error('Erreur : détails introuvables', err);
+  });
+}
+
+// Recalcule tout ce qui dépend des participations, sans toucher aux filtres
+function refreshDetails() {
+  updateKpis();
+  updateChartTitles();
+  const fg = filteredForCharts();
+  buildBarValeurGroupe('bar-valeur-groupe-wrap', fg);
+  buildBarSocietesStacked('bar-societes-wrap');
+  if (_currentExplorerView === 'sunburst') rebuildSunburstKeepZoom();
+  else rebuildExplorer();
+  _socList = null;
+  applyTableFilters();
+}
+
 /* ── Titres dynamiques ───────────────────────────────────────────────────── */
 function updateChartTitles() {
   const elSoc     = document.getElementById('title-societes');
@@ -233,7 +446,7 @@ function updateChartTitles() {
   const elMediane = document.getElementById('title-mediane');
 
   if (activeSocietes.size > 0) {
-    const labels = [...activeSocietes].slice(0, 3).join('", "');
+    const labels = getActiveSocietesLabels().slice(0, 3).map(s => s.label).join('", "');
     const more = activeSocietes.size > 3 ? ` +${activeSocietes.size - 3}` : '';
     if (elSoc) elSoc.textContent = `Sociétés : "${labels}"${more} — valeur en M€ par groupe`;
   } else if (activeDepute) {
@@ -310,7 +523,7 @@ function buildGroupeBtns() {
   bar.appendChild(bourseBtn);
 
   // Groupes triés par valeur totale décroissante, avec couleur
-  const byG = aggregateByGroupe(allData).sort((a, b) => b.valeur - a.valeur);
+  const byG = aggregateAll().sort((a, b) => b.valeur - a.valeur);
 
   for (const g of byG) {
     if (g.groupe === 'Inconnu') continue;
@@ -494,6 +707,7 @@ function clearFilter() {
 
 function toggleBourse() {
   onlyBourse = !onlyBourse;
+  _socList = null;
   const btn = document.getElementById('bourse-btn');
   if (btn) btn.classList.toggle('active', onlyBourse);
   // Rebuild complet : KPIs, barres, explorer, table
@@ -512,7 +726,49 @@ window.toggleBourse = toggleBourse;
    SUNBURST DATA
    ══════════════════════════════════════════════════════════════════════════ */
 
+// Version de buildSunburstData à partir des agrégats précalculés (vue par défaut)
+function sunburstFromAgg(agg) {
+  const root = { name: 'root', children: [] };
+  const groupMap = {};
+  for (const [mi, filteredVal, nbParts, top, nbNonPublic] of agg.sunburst) {
+    const m = agg.membres[mi];
+    const g = m.groupe;
+    if (!groupMap[g]) {
+      groupMap[g] = { name: g, couleur: gColor(g), children: [] };
+      root.children.push(groupMap[g]);
+    }
+    const publicSocietes = top.map(([si, value]) => ({
+      name: agg.societes[si].label, value, type: 'societe', couleur: gColor(g),
+    }));
+    const societes = [...publicSocietes];
+    if (nbNonPublic > 0) {
+      const baseRef = publicSocietes.length > 0 ? publicSocietes[publicSocietes.length - 1].value : 10000;
+      societes.push({
+        name: nbNonPublic > 1 ? `Non publié ×${nbNonPublic}` : 'Non publié',
+        value: Math.max(baseRef * 0.3, 5000),
+        type: 'nonpublic',
+        couleur: '#7a8a90',
+        isNonPublic: true,
+      });
+    }
+    const socSum = publicSocietes.reduce((s, p) => s + (p.value || 0), 0);
+    groupMap[g].children.push({
+      name: `${m.prenom} ${m.nom}`,
+      groupe: g,
+      couleur: gColor(g),
+      url: m.url,
+      value: societes.length ? Math.max(filteredVal - socSum, 0) : Math.max(filteredVal, 1000),
+      rawValue: filteredVal,
+      nbParts,
+      children: societes.length ? societes : undefined,
+    });
+  }
+  return root;
+}
+
 function buildSunburstData() {
+  const agg = precomputed();
+  if (agg) return sunburstFromAgg(agg);
   const root = { name: 'root', children: [] };
   const groupMap = {};
   for (const d of allData) {
@@ -523,13 +779,7 @@ function buildSunburstData() {
     const filteredParts = filterParticipations(d.participations);
     if (filteredParts.length === 0) continue;
     // Filtre société actif : n'inclure que les députés qui possèdent cette société
-    if (activeSocietes.size > 0) {
-      const hasMatch = filteredParts.some(p => {
-        const norm = normalizeSearch(p.societe);
-        return [...activeSocietes].some(sel => norm.includes(sel));
-      });
-      if (!hasMatch) continue;
-    }
+    if (activeSocietes.size > 0 && !filteredParts.some(p => activeSocietes.has(socId(p)))) continue;
     const g = d.groupe || 'Inconnu';
     if (!groupMap[g]) {
       groupMap[g] = { name: g, couleur: gColor(g), children: [] };
@@ -608,6 +858,22 @@ function rebuildExplorer() {
   else buildSunburst();
 }
 
+// Rebuild du sunburst en conservant le zoom courant (groupe ou député)
+function rebuildSunburstKeepZoom() {
+  const savedZoom = _sunburstZoomed;
+  buildSunburst();
+  if (savedZoom && _sunburstG && _sunburstHier) {
+    if (savedZoom.level === 1 && savedZoom.groupeNode) {
+      const gn = _sunburstHier.descendants().find(d => d.depth === 1 && d.data.name === savedZoom.groupeNode.data.name);
+      if (gn) { _sunburstZoomed = { level: 1, groupeNode: gn, deputeNode: null }; _sunburstRender(_sunburstG, gn, null, _sunburstSize / 2, false); }
+    } else if (savedZoom.level === 2 && savedZoom.groupeNode && savedZoom.deputeNode) {
+      const gn = _sunburstHier.descendants().find(d => d.depth === 1 && d.data.name === savedZoom.groupeNode.data.name);
+      const dn = gn?.children?.find(d => d.data.url === savedZoom.deputeNode.data.url);
+      if (gn && dn) { _sunburstZoomed = { level: 2, groupeNode: gn, deputeNode: dn }; _sunburstRender(_sunburstG, gn, dn, _sunburstSize / 2, false); }
+    }
+  }
+}
+
 function buildSunburst() {
   const wrap = document.getElementById('sunburst-wrap');
   if (!wrap) return;
@@ -1212,8 +1478,7 @@ function buildBarMediane(wrapperId, byG) {
 
 // Sélectionne une société depuis un clic sur le graphique (même logique que le picker)
 function selectSocieteFromChart(label) {
-  if (!_socList) _socList = getSocietyList();
-  const norm = normalizeSearch(label);
+  const norm = socIdFromLabel(label);
   if (activeSocietes.has(norm)) {
     activeSocietes.delete(norm);
   } else {
@@ -1243,14 +1508,16 @@ function buildBarSocietesStacked(wrapperId) {
   const allGroupes = [...new Set(allData.map(d => d.groupe || 'Inconnu'))];
 
   // Calcul valeur par (société, groupe) — sur dataSource uniquement
+  // (précalculé par fetch_data.py pour la vue par défaut)
+  const agg = precomputed();
   const socMap = {};
-  for (const d of dataSource) {
+  for (const d of agg ? [] : dataSource) {
     const g = d.groupe || 'Inconnu';
     for (const p of filterParticipations(d.participations)) {
       if (isNonPublic(p.societe)) continue;
-      const key = p.societe.toUpperCase();
+      const key = socId(p);
       if (!socMap[key]) {
-        socMap[key] = { label: p.societe, totalValeur: 0, byGroupe: {} };
+        socMap[key] = { label: p.societe, sid: key, totalValeur: 0, byGroupe: {} };
         for (const gr of allGroupes) socMap[key].byGroupe[gr] = 0;
       }
       socMap[key].totalValeur += p.evaluation || 0;
@@ -1260,12 +1527,9 @@ function buildBarSocietesStacked(wrapperId) {
 
   // Tri par valeur totale — pas de limite, scrollable
   // Si recherche société active : filtre sur le nom
-  let topSoc = Object.values(socMap).sort((a, b) => b.totalValeur - a.totalValeur);
+  let topSoc = agg ? agg.societes : Object.values(socMap).sort((a, b) => b.totalValeur - a.totalValeur);
   if (activeSocietes.size > 0) {
-    topSoc = topSoc.filter(s => {
-      const norm = normalizeSearch(s.label);
-      return [...activeSocietes].some(sel => norm.includes(sel));
-    });
+    topSoc = topSoc.filter(s => activeSocietes.has(s.sid));
   }
   if (!topSoc.length) return;
 
@@ -1422,8 +1686,11 @@ function syncSocCardHeight() {
 
 function applyTableFilters() {
   const q = document.getElementById('search').value.toLowerCase().trim();
+  // Avec l'index des sociétés : détenteurs obtenus par lookup, sans parcourir
+  // les participations de chaque parlementaire
+  const qHolders = q ? searchHolders(q) : null;
+  const socHolders = activeSocietes.size > 0 ? activeSocietesHolders() : null;
   const filtered = allData.filter(d => {
-    const parts = filterParticipations(d.participations);
     const matchG = activeGroupe ? d.groupe === activeGroupe
       : excludedGroupes.size > 0 ? !excludedGroupes.has(d.groupe)
       : true;
@@ -1431,27 +1698,33 @@ function applyTableFilters() {
     const matchQ = !q
       || d.nom.toLowerCase().includes(q)
       || d.prenom.toLowerCase().includes(q)
-      || parts.some(p => p.societe.toLowerCase().includes(q));
+      || (qHolders ? qHolders.has(d.url)
+          : filterParticipations(d.participations).some(p => p.societe.toLowerCase().includes(q)));
     const matchSoc = activeSocietes.size === 0
-      || parts.some(p => {
-           const norm = normalizeSearch(p.societe);
-           return [...activeSocietes].some(sel => norm.includes(sel));
-         });
+      || (socHolders ? socHolders.has(d.url)
+          : filterParticipations(d.participations).some(p => activeSocietes.has(socId(p))));
     return matchG && matchD && matchQ && matchSoc;
   });
   renderTable(filtered);
   syncSocCardHeight();
+  ensureDetails();
 }
 
 /* ── Société multi-picker ─────────────────────────────────────────────────── */
 
 // Construit la liste de toutes les sociétés publiques triées par valeur totale
 function getSocietyList() {
+  if (currentAgg) {
+    // Mode bourse : une société est entièrement privée ou non (libellé canonique)
+    return currentAgg.picker
+      .filter(([si]) => !onlyBourse || !currentAgg.societes[si].prive)
+      .map(([si, norm, total]) => ({ si, label: currentAgg.societes[si].label, norm, total }));
+  }
   const map = {};
   for (const d of allData) {
     for (const p of filterParticipations(d.participations)) {
       if (isNonPublic(p.societe)) continue;
-      const key = normalizeSearch(p.societe);
+      const key = socId(p);
       if (!map[key]) map[key] = { label: p.societe, norm: key, total: 0 };
       map[key].total += p.evaluation || 0;
     }
@@ -1460,6 +1733,18 @@ function getSocietyList() {
 }
 
 let _socList = null; // cache
+let _socIdsByLabel = null, _socIdsFor = null;
+
+// Identifiant d'une société depuis son libellé (les nœuds des graphiques ne
+// portent que le nom)
+function socIdFromLabel(label) {
+  if (!_socList) _socList = getSocietyList();
+  if (_socIdsFor !== _socList) {
+    _socIdsByLabel = new Map(_socList.map(s => [s.label, s.norm]));
+    _socIdsFor = _socList;
+  }
+  return _socIdsByLabel.get(label) || normalizeSearch(label);
+}
 
 function socPickerApply() {
   currentPage = 1;
@@ -1493,9 +1778,11 @@ function socPickerRenderDropdown() {
   const q = normalizeSearch(input.value);
   if (!_socList) _socList = getSocietyList();
 
-  const filtered = q
-    ? _socList.filter(s => s.norm.includes(q))
-    : _socList;
+  // Index : préfixes de mots ou sous-chaîne ; sinon sous-chaîne du libellé
+  const hits = q ? searchSocietes(input.value) : null;
+  const filtered = !q ? _socList
+    : hits ? _socList.filter(s => hits.has(s.si))
+    : _socList.filter(s => normalizeSearch(s.label).includes(q));
 
   dropdown.innerHTML = '';
   if (filtered.length === 0) {
@@ -1660,7 +1947,7 @@ function renderTable(filtered) {
       const norm = sortKey.slice(4);
       const parts = filterParticipations(d.participations);
       return parts
-        .filter(p => normalizeSearch(p.societe).includes(norm))
+        .filter(p => socId(p) === norm)
         .reduce((s, p) => s + (p.evaluation || 0), 0);
     }
     return d[sortKey] ?? '';
@@ -1678,7 +1965,8 @@ function renderTable(filtered) {
   const tbody = document.getElementById('table-body');
   tbody.innerHTML = '';
   for (const d of slice) {
-    const visibleParts = filterParticipations(d.participations);
+    // Sans détails chargés (shards) : principales sociétés du résumé
+    const visibleParts = d.participations ? filterParticipations(d.participations) : d.top;
     const color = gColor(d.groupe);
     const isActive = activeDepute && activeDepute.url === d.url;
     const tr = document.createElement('tr');
@@ -1719,7 +2007,7 @@ function renderTable(filtered) {
         const td = document.createElement('td');
         td.className = 'amount';
         const val = visibleParts
-          .filter(p => normalizeSearch(p.societe).includes(norm))
+          .filter(p => socId(p) === norm)
           .reduce((s, p) => s + (p.evaluation || 0), 0);
         if (val > 0) {
           td.innerHTML = `<strong style="color:var(--accent2)">${formatEur(val)}</strong>`;
@@ -1733,7 +2021,8 @@ function renderTable(filtered) {
       const topSoc = visibleParts.slice().sort((a, b) => b.evaluation - a.evaluation)
         .filter(p => !isNonPublic(p.societe)).slice(0, 4)
         .map(p => `<span class="tag" title="${formatEur(p.evaluation)}">${p.societe}</span>`).join('');
-      const nonPubCount = d.participations.filter(p => isNonPublic(p.societe)).length;
+      const nonPubCount = d.participations
+        ? d.participations.filter(p => isNonPublic(p.societe)).length : d.nbNonPublic;
       const nonPubStr = nonPubCount > 0
         ? `<span class="tag" style="color:#64748b">${nonPubCount} non publiée${nonPubCount > 1 ? 's' : ''}</span>` : '';
       const td = document.createElement('td');
@@ -1778,19 +2067,10 @@ function main() {
     return;
   }
 
-  allData = raw.map(d => ({
-    ...d,
-    groupe: decodeHtml(d.groupe || ''),
-    participations: d.participations.map(p => ({ ...p, societe: (p.societe || '').replace(/\s+/g, ' ').trim() })),
-    nbParts: d.participations.length,
-    valeurTotale: d.participations.reduce((s, p) => s + (p.evaluation || 0), 0),
-  }));
+  allData = raw.map(prepareMember);
+  currentShards = window.HATVP_DATA_SHARDS || null;
 
-  // Correctifs manuels — députés non reconnus par le scraping AN (apostrophes Unicode, etc.)
-  const _GROUPE_OVERRIDES = {
-    '/pages_nominatives/d-intorni-christelle-20430': 'Union des droites pour la République',
-  };
-  allData.forEach(d => { if (_GROUPE_OVERRIDES[d.url]) d.groupe = _GROUPE_OVERRIDES[d.url]; });
+  currentAgg = loadAgg(raw, window.HATVP_DATA_AGG);
 
   buildColorMap(allData);
   updateHeaderDesc();
@@ -1800,7 +2080,7 @@ function main() {
   updateKpis();
 
 
-  const byG = aggregateByGroupe(allData);
+  const byG = filteredForCharts();
   buildSunburst();
   buildBarValeurGroupe('bar-valeur-groupe-wrap', byG);
   buildBarSocietesStacked('bar-societes-wrap');
@@ -1824,20 +2104,7 @@ function main() {
       const sbW = wrap ? wrap.clientWidth : 0;
       if (Math.abs(sbW - _lastSunburstWidth) > 10) {
         _lastSunburstWidth = sbW;
-        // Sauvegarder l'état du zoom avant rebuild
-        const savedZoom = _sunburstZoomed;
-        buildSunburst();
-        // Restaurer le zoom après rebuild
-        if (savedZoom && _sunburstG && _sunburstHier) {
-          if (savedZoom.level === 1 && savedZoom.groupeNode) {
-            const gn = _sunburstHier.descendants().find(d => d.depth === 1 && d.data.name === savedZoom.groupeNode.data.name);
-            if (gn) { _sunburstZoomed = { level: 1, groupeNode: gn, deputeNode: null }; _sunburstRender(_sunburstG, gn, null, _sunburstSize / 2, false); }
-          } else if (savedZoom.level === 2 && savedZoom.groupeNode && savedZoom.deputeNode) {
-            const gn = _sunburstHier.descendants().find(d => d.depth === 1 && d.data.name === savedZoom.groupeNode.data.name);
-            const dn = gn?.children?.find(d => d.data.url === savedZoom.deputeNode.data.url);
-            if (gn && dn) { _sunburstZoomed = { level: 2, groupeNode: gn, deputeNode: dn }; _sunburstRender(_sunburstG, gn, dn, _sunburstSize / 2, false); }
-          }
-        }
+        rebuildSunburstKeepZoom();
       }
     } else {
       rebuildExplorer();
@@ -2009,13 +2276,9 @@ function switchDataset(ds, btn) {
     `Anneau intérieur = groupe · anneau externe = ${word} · surface ∝ valeur déclarée · double-clic pour zoomer`;
 
   // Reconstruire allData
-  allData = raw.map(d => ({
-    ...d,
-    groupe: decodeHtml(d.groupe || ''),
-    participations: d.participations.map(p => ({ ...p, societe: (p.societe || '').replace(/\s+/g, ' ').trim() })),
-    nbParts: d.participations.length,
-    valeurTotale: d.participations.reduce((s, p) => s + (p.evaluation || 0), 0),
-  }));
+  allData = raw.map(prepareMember);
+  currentShards = (ds === 'senateurs' ? window.HATVP_DATA_SENATEURS_SHARDS : window.HATVP_DATA_SHARDS) || null;
+  currentAgg = loadAgg(raw, ds === 'senateurs' ? window.HATVP_DATA_SENATEURS_AGG : window.HATVP_DATA_AGG);
 
   buildColorMap(allData);
 
@@ -2094,7 +2357,7 @@ function buildTreemap() {
       const nw = Math.max(0, node.x1 - node.x0);
       const nh = Math.max(0, node.y1 - node.y0);
       const ratio = root.value ? node.value / root.value : 0;
-      const isActive = !node.data.isNonPublic && activeSocietes.has(normalizeSearch(node.data.name));
+      const isActive = !node.data.isNonPublic && activeSocietes.has(socIdFromLabel(node.data.name));
       const fill    = node.data.isNonPublic ? '#5a6870' : clr;
       const opacity = node.data.isNonPublic ? 0.55 : (isActive ? 1 : 0.42 + ratio * 0.50);
 
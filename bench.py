@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Benchmarks du pipeline fetch_data.py.
+
+  python bench.py parse [FICHIER_OU_DOSSIER ...]
+      Compare le parseur DIA (fetch_data.parse_xml, quatre sections) à l'ancien
+      parseur limité aux participations, ainsi que son chemin en flux
+      (parse_xml_stream, utilisé au-delà de PARSE_STREAM_MIN) : temps par
+      fichier et pic mémoire (tracemalloc).
+      Sans argument, utilise les dossiers XML du cache HTTP (.cache/http).
+
+  python bench.py format [FICHIER_JSON ...]
+      Compare data.json au format compact (colonnes + table de chaînes) :
+      tailles brute / gzip / brotli et temps de décodage (json.loads, puis
+      expand_compact pour le format compact). Défaut : data.json et
+      data_senateurs.json.
+
+  python bench.py serve ARCHIVE [--port 8765] [--latency MS] [--error-rate P]
+      Serveur HTTP local qui rejoue une archive enregistrée par
+      `fetch_data.py --record ARCHIVE`, avec latence et erreurs injectées.
+      Utilisable par `fetch_data.py --replay 127.0.0.1:8765`.
+
+  python bench.py stages ARCHIVE [--latency MS] [--repeat N] [--save F] [--compare F]
+      Rejoue l'archive et chronomètre chaque étape du pipeline (load_groupes,
+      load_csv, build_results, write_output), caches vides à chaque passe.
+      --save / --compare permettent de comparer deux versions du code.
+      --scheduled chronomètre à la place le run ordonnancé (les deux
+      chambres en parallèle, fetch_data.run_chambers).
+"""
+
+import argparse
+import glob
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from collections import Counter
+from contextlib import redirect_stdout
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import fetch_data
+
+# ── Parseur de référence (ancien parse_xml, participations seules) ─────────
+
+def parse_xml_tree(xml_text):
+    participations = []
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError:
+        return participations
+
+    for node in root.iter("participationFinanciereDto"):
+        neant = node.find("neant")
+        if neant is not None and neant.text and neant.text.strip() == "true":
+            continue
+        items_wrapper = node.find("items")
+        if items_wrapper is None:
+            continue
+        for item in items_wrapper.findall("items"):
+            societe = (item.findtext("nomSociete") or "").strip()
+            if not societe:
+                continue
+            evaluation = 0.0
+            try:
+                evaluation = float(item.findtext("evaluation") or 0)
+            except ValueError:
+                pass
+            nb_parts = 0.0
+            try:
+                nb_parts = float(item.findtext("nombreParts") or 0)
+            except ValueError:
+                pass
+            remun = 0.0
+            try:
+                remun = float(item.findtext("remuneration") or 0)
+            except ValueError:
+                pass
+            participations.append({
+                "societe": societe,
+                "evaluation": evaluation,
+                "nbParts": nb_parts,
+                "remuneration": remun,
+            })
+
+    return participations
+
+# ── Parse ──────────────────────────────────────────────────────────────────
+
+def xml_files(paths):
+    if not paths:
+        paths = [fetch_data.HTTP_CACHE_DIR]
+    files = []
+    for p in paths:
+        if os.path.isdir(p):
+            files += glob.glob(os.path.join(p, "**", "*.xml"), recursive=True)
+            files += glob.glob(os.path.join(p, "**", "*.body"), recursive=True)
+        else:
+            files.append(p)
+    docs = []
+    for path in sorted(files):
+        with open(path, "rb") as f:
+            data = f.read()
+        if data.lstrip()[:1] == b"<":
+            docs.append((path, data))
+    return docs
+
+def measure(fn, docs, repeat):
+    """Retourne ([temps par fichier en ms], [pic mémoire par fichier en Ko])."""
+    times, peaks = [], []
+    for _, data in docs:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn(data)
+            best = min(best, time.perf_counter() - t0)
+        times.append(best * 1000)
+        tracemalloc.start()
+        fn(data)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+    return times, peaks
+
+def bench_parse(args):
+    docs = xml_files(args.paths)
+    if not docs:
+        sys.exit("Aucun fichier XML trouvé (lancer fetch_data.py pour remplir le cache, "
+                 "ou passer des fichiers en argument).")
+    total = sum(len(d) for _, d in docs)
+    print(f"{len(docs)} fichiers · {total / 1024:.0f} Ko · meilleur de {args.repeat} passes\n")
+
+    parsers = [
+        ("ancien",  lambda data: parse_xml_tree(data.decode("utf-8", errors="replace"))),
+        ("actuel",  fetch_data.parse_xml),
+        ("flux",    fetch_data.parse_xml_stream),
+    ]
+    rows = []
+    for name, fn in parsers:
+        times, peaks = measure(fn, docs, args.repeat)
+        rows.append((name, sum(times), statistics.mean(times), statistics.median(times),
+                     max(times), statistics.mean(peaks), max(peaks)))
+
+    print(f"{'parseur':<16}{'total ms':>10}{'moy ms':>9}{'méd ms':>9}{'max ms':>9}"
+          f"{'moy Ko':>9}{'pic Ko':>9}")
+    for name, tot, moy, med, mx, pmoy, pmax in rows:
+        print(f"{name:<16}{tot:>10.1f}{moy:>9.3f}{med:>9.3f}{mx:>9.3f}{pmoy:>9.0f}{pmax:>9.0f}")
+    (_, t_old, *_, p_old, _), (_, t_new, *_, p_new, _), (_, t_flux, *_, p_flux, _) = rows
+    print(f"\n→ temps ×{t_old / t_new:.2f} · mémoire moyenne ×{p_old / p_new:.2f} (ancien / actuel)")
+    print(f"→ temps ×{t_new / t_flux:.2f} · mémoire moyenne ×{p_new / p_flux:.2f} (actuel / flux)")
+
+# ── Format de sortie ───────────────────────────────────────────────────────
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+def bench_format(args):
+    paths = args.paths or [p for p in ("data.json", "data_senateurs.json") if os.path.exists(p)]
+    if not paths:
+        sys.exit("Aucun data.json trouvé (lancer fetch_data.py ou passer des fichiers en argument).")
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            plain = f.read()
+        results = json.loads(plain)
+        compact = json.dumps(fetch_data.compact_results(results), ensure_ascii=False,
+                             separators=(",", ":"))
+        if fetch_data.expand_compact(json.loads(compact)) != results:
+            sys.exit(f"{path} : l'aller-retour compact ne restitue pas les données d'origine")
+        print(f"{path} · {len(results)} entrées")
+        fetch_data.size_report({"json": plain, "compact": compact})
+        t_plain = best_of(lambda: json.loads(plain), args.repeat)
+        t_compact = best_of(lambda: fetch_data.expand_compact(json.loads(compact)), args.repeat)
+        print(f"  décodage : json {t_plain:.2f} ms · compact {t_compact:.2f} ms "
+              f"(meilleur de {args.repeat})\n")
+
+# ── Serveur de rejeu ───────────────────────────────────────────────────────
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, comme les vrais serveurs
+
+    def do_GET(self):
+        fixture = self.server.fixture
+        scheme = self.headers.get(fetch_data.REPLAY_SCHEME_HEADER, "https")
+        url = f"{scheme}://{self.headers.get('Host', '')}{self.path}"
+        delay, fail = fixture.draw()
+        time.sleep(delay)
+        if fail:
+            fixture.stats["erreurs injectées"] += 1
+            return self._reply(503)
+        entry, body = fixture.archive.get(url)
+        if entry is None:
+            fixture.stats["absentes"] += 1
+            return self._reply(404)
+        etag = f'"{entry["sha256"][:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            fixture.stats["304"] += 1
+            return self._reply(304, etag=etag)
+        fixture.stats["servies"] += 1
+        self._reply(200, body, entry.get("content_type"), etag)
+
+    def _reply(self, status, body=b"", content_type=None, etag=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FixtureServer:
+    """Rejoue une archive fetch_data.Archive sur un port local, avec une latence
+    par requête (fixe + gigue uniforme, en secondes) et un taux de 503."""
+
+    def __init__(self, archive_dir, latency=0.0, jitter=0.0, error_rate=0.0, seed=0,
+                 host="127.0.0.1", port=0):
+        self.archive = fetch_data.Archive(archive_dir)
+        if not self.archive.entries:
+            sys.exit(f"Archive vide ou introuvable : {archive_dir} "
+                     "(l'enregistrer avec fetch_data.py --record)")
+        self.latency, self.jitter, self.error_rate = latency, jitter, error_rate
+        self.stats = Counter()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), _ReplayHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.fixture = self
+
+    @property
+    def address(self):
+        return self.httpd.server_address[:2]
+
+    def draw(self):
+        with self._rng_lock:
+            return (self.latency + self._rng.uniform(0, self.jitter),
+                    self._rng.random() < self.error_rate)
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def fixture_from_args(args, port=0):
+    return FixtureServer(args.archive, latency=args.latency / 1000, jitter=args.jitter / 1000,
+                         error_rate=args.error_rate, seed=args.seed, port=port)
+
+def bench_serve(args):
+    fixture = fixture_from_args(args, port=args.port)
+    host, port = fixture.address
+    print(f"Rejeu de {len(fixture.archive.entries)} réponses sur http://{host}:{port} "
+          f"(latence {args.latency:g} ms ± {args.jitter:g} · erreurs {args.error_rate:.0%})")
+    print(f"→ python fetch_data.py --replay {host}:{port}   (Ctrl-C pour arrêter)")
+    with fixture:
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    print(" · ".join(f"{k} {v}" for k, v in fixture.stats.items()))
+
+# ── Étapes du pipeline ─────────────────────────────────────────────────────
+
+def run_stages(fixture, workdir, parse_workers, scheduled=False):
+    """Un run complet contre le serveur de rejeu ; retourne {étape: secondes}."""
+    fetch_data.use_replay(*fixture.address)
+    fetch_data.HTTP_CACHE_DIR = os.path.join(workdir, "http")
+    fetch_data.fetch_failures.clear()
+    for k in fetch_data.cache_stats:
+        fetch_data.cache_stats[k] = 0
+    if scheduled:
+        return run_scheduled(workdir, parse_workers)
+    timings = {}
+
+    def timed(name, fn):
+        t0 = time.perf_counter()
+        out = fn()
+        timings[name] = time.perf_counter() - t0
+        return out
+
+    out = lambda name: os.path.join(workdir, name)
+    with redirect_stdout(io.StringIO()):
+        groupes = timed("load_groupes", lambda: fetch_data.load_groupes(
+            store_path=out("an_groupes.json")))
+        listes = timed("load_csv", fetch_data.load_csv)
+        res = timed("build_results", lambda: fetch_data.build_results(
+            listes["deputes"], groupes, "députés", parse_workers))
+        outputs = [(res, "data.json", "data.js", "window.HATVP_DATA")]
+        if listes.get("senateurs"):
+            groupes_s = timed("load_groupes_senat", fetch_data.load_groupes_senat)
+            res_s = timed("build_results_senat", lambda: fetch_data.build_results(
+                listes["senateurs"], groupes_s, "sénateurs", parse_workers))
+            outputs.append((res_s, "data_senateurs.json", "data_senateurs.js",
+                            "window.HATVP_DATA_SENATEURS"))
+        timed("write_output", lambda: [fetch_data.write_output(r, out(j), out(js), var)
+                                       for r, j, js, var in outputs])
+    timings["total"] = sum(timings.values())
+    return timings
+
+def run_scheduled(workdir, parse_workers):
+    """Run ordonnancé : durées des tâches lues dans fetch_data.run_report
+    (elles se recouvrent ; total = durée réelle du run)."""
+    loaders = {"deputes": partial(fetch_data.load_groupes,
+                                  store_path=os.path.join(workdir, "an_groupes.json")),
+               "senateurs": fetch_data.load_groupes_senat}
+    first = len(fetch_data.run_report.stages)
+    t0 = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        fetch_data.run_chambers(loaders, parse_workers, out_dir=workdir)
+    timings = {s["etape"]: s["mur_s"] for s in fetch_data.run_report.stages[first:]}
+    timings["total"] = time.perf_counter() - t0
+    return timings
+
+def bench_stages(args):
+    runs = []
+    with fixture_from_args(args) as fixture, tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.repeat):
+            workdir = tmp if args.warm else os.path.join(tmp, f"run{i}")
+            runs.append(run_stages(fixture, workdir, args.parse_workers, args.scheduled))
+            print(f"  passe {i + 1}/{args.repeat} : {runs[-1]['total']:.2f} s", flush=True)
+        stats = dict(fixture.stats)
+    failures = len(fetch_data.fetch_failures)
+
+    stages = {name: [r[name] for r in runs] for name in runs[0]}
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)["stages"]
+
+    print(f"\nlatence {args.latency:g} ms ± {args.jitter:g} · erreurs {args.error_rate:.0%} · "
+          f"{'cache conservé' if args.warm else 'caches vides'} · {args.repeat} passes")
+    print(f"{'étape':<26}{'méd s':>9}{'min s':>9}{'max s':>9}" + (f"{'réf s':>9}{'écart':>9}" if previous else ""))
+    for name, times in stages.items():
+        med = statistics.median(times)
+        line = f"{name:<26}{med:>9.3f}{min(times):>9.3f}{max(times):>9.3f}"
+        if name in previous:
+            ref = statistics.median(previous[name])
+            line += f"{ref:>9.3f}{(med - ref) / ref if ref else 0:>+9.1%}"
+        print(line)
+    print(f"\nserveur : " + " · ".join(f"{k} {v}" for k, v in stats.items())
+          + f" · échecs définitifs (dernière passe) {failures}")
+
+    if args.save:
+        params = {k: getattr(args, k) for k in ("latency", "jitter", "error_rate", "seed",
+                                                "repeat", "warm", "parse_workers",
+                                                "scheduled")}
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"params": params, "stages": stages}, f, indent=1)
+        print(f"✓ résultats enregistrés dans {args.save}")
+
+# ── Main ───────────────────────────────────────────────────────────────────
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip(),
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("parse", help="parseur DIA actuel vs ancien parseur")
+    p.add_argument("paths", nargs="*", help="fichiers XML ou dossiers (défaut : cache HTTP)")
+    p.add_argument("--repeat", type=int, default=5, help="passes par fichier (défaut : 5)")
+    p.set_defaults(func=bench_parse)
+
+    p = sub.add_parser("format", help="data.json vs format compact : tailles et décodage")
+    p.add_argument("paths", nargs="*", help="fichiers data.json (défaut : data.json, data_senateurs.json)")
+    p.add_argument("--repeat", type=int, default=20, help="passes (défaut : 20)")
+    p.set_defaults(func=bench_format)
+
+    def replay_args(p):
+        p.add_argument("archive", help="dossier enregistré par fetch_data.py --record")
+        p.add_argument("--latency", type=float, default=50, help="latence par requête en ms (défaut : 50)")
+        p.add_argument("--jitter", type=float, default=20, help="gigue uniforme en ms (défaut : 20)")
+        p.add_argument("--error-rate", type=float, default=0.0,
+                       help="proportion de réponses 503 injectées (défaut : 0)")
+        p.add_argument("--seed", type=int, default=0, help="graine du tirage latence / erreurs")
+
+    p = sub.add_parser("serve", help="serveur local de rejeu d'une archive")
+    replay_args(p)
+    p.add_argument("--port", type=int, default=8765, help="port d'écoute (défaut : 8765)")
+    p.set_defaults(func=bench_serve)
+
+    p = sub.add_parser("stages", help="durée de chaque étape du pipeline en rejeu")
+    replay_args(p)
+    p.add_argument("--repeat", type=int, default=3, help="passes (défaut : 3)")
+    p.add_argument("--warm", action="store_true",
+                   help="conserver le cache HTTP entre les passes (défaut : caches vides)")
+    p.add_argument("--parse-workers", type=int, default=None, metavar="N",
+                   help="processus de parsing XML (comme fetch_data.py)")
+    p.add_argument("--scheduled", action="store_true",
+                   help="chronométrer le run ordonnancé (chambres en parallèle)")
+    p.add_argument("--save", metavar="FICHIER", help="enregistrer les durées (JSON)")
+    p.add_argument("--compare", metavar="FICHIER", help="comparer à des durées enregistrées")
+    p.set_defaults(func=bench_stages)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
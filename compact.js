@@ -0,0 +1,49 @@
+/* ══════════════════════════════════════════════════════════════════════════
+   FORMAT COMPACT — décodage des bundles générés par fetch_data.py --compact
+   data.js contient alors window.HATVP_DATA=expandCompact({...}) : colonnes
+   par champ + table de chaînes, reconverties ici en tableau de records
+   identique à data.json. Doit être chargé avant data.js.
+   ══════════════════════════════════════════════════════════════════════════ */
+
+function expandCompact(c) {
+  const strings = c.strings;
+  const interned = new Set(c.interned);
+  const values = (name, col) => interned.has(name) ? col.map(v => v === null ? null : strings[v]) : col;
+
+  const membres = {};
+  for (const k in c.membres) membres[k] = values(k, c.membres[k]);
+
+  // Sections DIA : n[i] items consécutifs par parlementaire (null = champ absent)
+  const sections = {};
+  for (const k in c.sections) {
+    const s = c.sections[k];
+    const fields = Object.keys(s.cols);
+    const cols = fields.map(f => values(f, s.cols[f]));
+    const items = [];
+    let pos = 0;
+    for (const count of s.n) {
+      if (count === null) { items.push(null); continue; }
+      const list = [];
+      for (let j = pos; j < pos + count; j++) {
+        const item = {};
+        fields.forEach((f, fi) => { if (cols[fi][j] !== null) item[f] = cols[fi][j]; });
+        list.push(item);
+      }
+      items.push(list);
+      pos += count;
+    }
+    sections[k] = items;
+  }
+
+  const out = new Array(c.n);
+  for (let i = 0; i < c.n; i++) {
+    const r = {};
+    for (const k of c.keys) {
+      const v = k in sections ? sections[k][i] : membres[k][i];
+      if (v !== null) r[k] = v;
+    }
+    out[i] = r;
+  }
+  return out;
+}
+window.expandCompact = expandCompact;
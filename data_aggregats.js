@@ -0,0 +1,2 @@
+/* AUTO-GENERATED — do not edit manually, run fetch_data.py instead */
+window.HATVP_DATA_AGG={"n":547,"kpis":{"membres":547,"valeur":150626008.0,"moyenne":275367.4734917733,"mediane":37500.0},"groupes":[{"groupe":"Ensemble pour la République","total":134,"valeur":48404879.0,"deputes":79,"avecPart":42,"valeurs":[10000.0,5000.0,61197.0,19897.0,250.0,84150.0,47.0,74414.0,1000.0,30000.0,2813.0,600000.0,2000.0,9732800.0,130000.0,69866.0,91.0,18643.0,9253.0,21933.0,62126.0,718644.0,4567383.0,8750.0,136368.0,855.0,200800.0,402514.0,2140.0,83.0,47233.0,153283.0,1500.0,203997.0,276357.0,88770.0,27832900.0,105672.0,885000.0,3542.0,1655952.0,177656.0],"couleur":"#7B4591","mediane":61661.5,"pctAvecPart":53.164556962025316},{"groupe":"Union des droites pour la République","total":73,"valeur":46293707.0,"deputes":15,"avecPart":8,"valeurs":[237903.0,15813.0,794000.0,297023.0,12661300.0,24500000.0,24674.0,7762994.0],"couleur":"#3367A7","mediane":545511.5,"pctAvecPart":53.333333333333336},{"groupe":"Horizons & Indépendants","total":77,"valeur":17086667.0,"deputes":31,"avecPart":20,"valeurs":[1922698.0,8.0,227.0,0,327055.0,96500.0,11525012.0,119900.0,1550000.0,360010.0,60000.0,126390.0,250.0,70000.0,70150.0,8500.0,402793.0,91637.0,105537.0,250000.0],"couleur":"#B5E2F9","mediane":101018.5,"pctAvecPart":64.51612903225806},{"groupe":"Les Démocrates","total":86,"valeur":16735123.0,"deputes":35,"avecPart":21,"valeurs":[318865.0,1739803.0,437500.0,20000.0,1920.0,4165.0,24283.0,19837.0,29011.0,184225.0,680.0,10359186.0,52375.0,179227.0,95839.0,549970.0,4087.0,2584465.0,790.0,1800.0,127095.0],"couleur":"#F07E26","mediane":52375.0,"pctAvecPart":60.0},{"groupe":"Droite Républicaine","total":68,"valeur":10670491.0,"deputes":41,"avecPart":21,"valeurs":[0,905023.0,100000.0,7027455.0,567109.0,1522000.0,21000.0,1500.0,139910.0,250.0,11273.0,4901.0,50400.0,44054.0,28771.0,112539.0,64435.0,56297.0,121.0,1000.0,12453.0],"couleur":"#8CB0DC","mediane":44054.0,"pctAvecPart":51.21951219512195},{"groupe":"Rassemblement National","total":144,"valeur":4601115.0,"deputes":122,"avecPart":42,"valeurs":[29670.0,1000.0,19200.0,9000.0,515.0,229.0,1682.0,337602.0,400000.0,47091.0,2918.0,14575.0,20000.0,80020.0,150.0,1000.0,331717.0,932.0,21049.0,10000.0,3008.0,53518.0,19881.0,65000.0,616800.0,208.0,169959.0,780.0,200.0,10200.0,404766.0,97885.0,19000.0,288700.0,1000.0,162112.0,326000.0,114960.0,98044.0,30100.0,300.0,790344.0],"couleur":"#313567","mediane":19940.5,"pctAvecPart":34.42622950819672},{"groupe":"Libertés, Indépendants, Outre-mer et Territoires","total":52,"valeur":3947097.0,"deputes":20,"avecPart":11,"valeurs":[27281.0,1800030.0,475000.0,160240.0,23090.0,165263.0,847895.0,913.0,368164.0,400.0,78821.0],"couleur":"#FFD96F","mediane":160240.0,"pctAvecPart":55.0},{"groupe":"Socialistes et apparentés","total":53,"valeur":1326255.0,"deputes":69,"avecPart":27,"valeurs":[2000.0,13663.0,1.0,221.0,60130.0,346.0,220130.0,147115.0,50000.0,97500.0,169158.0,550.0,83153.0,145612.0,153502.0,0,14.0,0,9000.0,20000.0,5600.0,69900.0,1780.0,41594.0,236.0,50.0,35000.0],"couleur":"#F5B4CE","mediane":13663.0,"pctAvecPart":39.130434782608695},{"groupe":"Écologiste et Social","total":24,"valeur":752693.0,"deputes":38,"avecPart":17,"valeurs":[8000.0,40000.0,240.0,1380.0,370691.0,80.0,500.0,0,209000.0,1900.0,3000.0,900.0,2600.0,45.0,0,109552.0,4805.0],"couleur":"#77AA79","mediane":1900.0,"pctAvecPart":44.73684210526316},{"groupe":"Non inscrit","total":15,"valeur":532222.0,"deputes":9,"avecPart":7,"valeurs":[250000.0,65000.0,0,15.0,9000.0,210830.0,-2623.0],"couleur":"#8D949A","mediane":9000.0,"pctAvecPart":77.77777777777777},{"groupe":"Gauche Démocrate et Républicaine","total":8,"valeur":164970.0,"deputes":17,"avecPart":4,"valeurs":[1300.0,245.0,1520.0,161905.0],"couleur":"#830E21","mediane":1410.0,"pctAvecPart":23.529411764705884},{"groupe":"La France insoumise - Nouveau Front Populaire","total":13,"valeur":110789.0,"deputes":70,"avecPart":8,"valeurs":[180.0,3.0,9000.0,1500.0,23000.0,240.0,219.0,76647.0],"couleur":"#C00D0D","mediane":870.0,"pctAvecPart":11.428571428571429},{"groupe":"Inconnu","total":0,"valeur":0,"deputes":1,"avecPart":0,"valeurs":[],"couleur":"","mediane":0,"pctAvecPart":0.0}],"membres":[["/pages_nominatives/martin-alexandra","Alexandra","MARTIN","Droite Républicaine"],["/pages_nominatives/firmin-le-bodo-agnes","Agnès","FIRMIN LE BODO","Horizons & Indépendants"],["/pages_nominatives/loubet-alexandre-24155","Alexandre","LOUBET","Rassemblement National"],["/pages_nominatives/allegret-pilot-alexandre-27429","Alexandre","ALLEGRET-PILOT","Union des droites pour la République"],["/pages_nominatives/masson-alexandra-24265","Alexandra","MASSON","Rassemblement National"],["/pages_nominatives/sabatou-alexandre-24164","Alexandre","SABATOU","Rassemblement National"],["/pages_nominatives/jolly-alexis-24185","Alexis","JOLLY","Rassemblement National"],["/pages_nominatives/lakrafi-amelia","Amélia","LAKRAFI","Ensemble pour la République"],["/pages_nominatives/genetet-anne","Anne","GENETET","Ensemble pour la République"],["/pages_nominatives/le-meur-annaig","Annaïg","LE MEUR","Ensemble pour la République"],["/pages_nominatives/violland-anne-cecile-24285","Anne-Cécile","VIOLLAND","Horizons & Indépendants"],["/pages_nominatives/boulogne-anthony-27516","Anthony","BOULOGNE","Rassemblement National"],["/pages_nominatives/saint-martin-arnaud-27422","Arnaud","SAINT-MARTIN","La France insoumise - Nouveau Front Populaire"],["/pages_nominatives/leaument-antoine-24198","Antoine","LÉAUMENT","La France insoumise - Nouveau Front Populaire"],["/pages_nominatives/evrard-auguste-27502","Auguste","EVRARD","Rassemblement National"],["/pages_nominatives/pradie-aurelien","Aurélien","PRADIÉ","Non inscrit"],["/pages_nominatives/lopez-liguori-aurelien-24235","Aurélien","LOPEZ-LIGUORI","Rassemblement National"],["/pages_nominatives/lenoir-bartolome-27481","Bartolomé","LENOIR","Union des droites pour la République"],["/pages_nominatives/bellay-beatrice-27470","Béatrice","BELLAY","Socialistes et apparentés"],["/pages_nominatives/belhaddad-belkhir","Belkhir","BELHADDAD","Socialistes et apparentés"],["/pages_nominatives/dirx-benjamin","Benjamin","DIRX","Ensemble pour la République"],["/pages_nominatives/sorre-bertrand","Bertrand","SORRE","Ensemble pour la République"],["/pages_nominatives/biteau-benoit-9623","Benoît","BITEAU","Écologiste et Social"],["/pages_nominatives/chaix-bernard-22632","Bernard","CHAIX","Union des droites pour la République"],["/pages_nominatives/tavernier-boris-27461","Boris","TAVERNIER","Écologiste et Social"],["/pages_nominatives/bouyx-bertrand","Bertrand","BOUYX","Horizons & Indépendants"],["/pages_nominatives/fuchs-bruno","Bruno","FUCHS","Les Démocrates"],["/pages_nominatives/klinkert-brigitte-13215","Brigitte","KLINKERT","Ensemble pour la République"],["/pages_nominatives/bilde-bruno","Bruno","BILDE","Rassemblement National"],["/pages_nominatives/galliard-minier-camille-18388","Camille","GALLIARD-MINIER","Ensemble pour la République"],["/pages_nominatives/liso-brigitte","Brigitte","LISO","Ensemble pour la République"],["/pages_nominatives/colombier-caroline-24233","Caroline","COLOMBIER","Rassemblement National"],["/pages_nominatives/yadan-caroline-24503","Caroline","YADAN","Ensemble pour la République"],["/pages_nominatives/thiebault-martinez-celine-27466","Céline","THIÉBAULT-MARTINEZ","Socialistes et apparentés"],["/pages_nominatives/de-courson-charles","Charles","DE COURSON","Libertés, Indépendants, Outre-mer et Territoires"],["/pages_nominatives/jourdan-chantal-20670","Chantal","JOURDAN","Socialistes et apparentés"],["/pages_nominatives/fournier-charles","Charles","FOURNIER","Écologiste et Social"],["/pages_nominatives/d-intorni-christelle-20430","Christelle","D'INTORNI","Union des droites pour la République"],["/pages_nominatives/baptiste-christian","Christian","BAPTISTE","Socialistes et apparentés"],["/pages_nominatives/girard-christian-24287","Christian","GIRARD","Rassemblement National"],["/pages_nominatives/arrighi-christine-24260","Christine","ARRIGHI","Écologiste et Social"],["/pages_nominatives/engrand-christine-24281","Christine","ENGRAND","Non inscrit"],["/pages_nominatives/le-nabour-christine","Christine","LE NABOUR","Ensemble pour la République"],["/pages_nominatives/pires-beaune-christine","Christine","PIRÈS BEAUNE","Socialistes et apparentés"],["/pages_nominatives/barthes-christophe-24288","Christophe","BARTHÈS","Rassemblement National"],["/pages_nominatives/naegelen-christophe","Christophe","NAEGELEN","Libertés, Indépendants, Outre-mer et Territoires"],["/pages_nominatives/blanchet-christophe","Christophe","BLANCHET","Les Démocrates"],["/pages_nominatives/plassard-christophe-24298","Christophe","PLASSARD","Horizons & Indépendants"],["/pages_nominatives/de-pelichy-constance-12077","Constance","DE PÉLICHY","Libertés, Indépendants, Outre-mer et Territoires"],["/pages_nominatives/capdevielle-colette","Colette","CAPDEVIELLE","Socialistes et apparentés"],["/pages_nominatives/le-grip-constance","Constance","LE GRIP","Ensemble pour la République"],["/pages_nominatives/isaac-sibille-cyrille","Cyrille","ISAAC-SIBILLE","Les Démocrates"],["/pages_nominatives/labaronne-daniel","Daniel","LABARONNE","Ensemble pour la République"],["/pages_nominatives/habib-david","David","HABIB","Libertés, Indépendants, Outre-mer et Territoires"],["/pages_nominatives/taupiac-david-24308","David","TAUPIAC","Libertés, Indépendants, Outre-mer et Territoires"],["/pages_nominatives/rimane-davy-24310","Davy","RIMANE","Gauche Démocrate et Républicaine"],["/pages_nominatives/lingemann-delphine-24307","Delphine","LINGEMANN","Les Démocrates"],["/pages_nominatives/potier-dominique","Dominique","POTIER","Socialistes et apparentés"],["/pages_nominatives/k-bidi-emeline-24323","Émeline","K/BIDI","Gauche Démocrate et Républicaine"],["/pages_nominatives/gregoire-emmanuel","Emmanuel","GRÉGOIRE","Socialistes et apparentés"],["/pages_nominatives/mandon-emmanuel","Emmanuel","MANDON","Les Démocrates"],["/pages_nominatives/martineau-eric-24321","Éric","MARTINEAU","Les Démocrates"],["/pages_nominatives/pauget-eric-6497","Éric","PAUGET","Droite Républicaine"],["/pages_nominatives/michoux-eric-27505","Éric","MICHOUX","Union des droites pour la République"],["/pages_nominatives/woerth-eric","Éric","WOERTH","Ensemble pour la République"],["/pages_nominatives/soudais-ersilia-24325","Ersilia","SOUDAIS","La France insoumise - Nouveau Front Populaire"],["/pages_nominatives/brun-fabrice","Fabrice","BRUN","Droite Républicaine"],["/pages_nominatives/keloua-hachi-fatiha-24329","Fatiha","KELOUA HACHI","Socialistes et apparentés"],["/pages_nominatives/riester-franck","Franck","RIESTER","Ensemble pour la République"],["/pages_nominatives/hollande-francois-27434","François","HOLLANDE","Socialistes et apparentés"],["/pages_nominatives/jolivet-francois","François","JOLIVET","Horizons & Indépendants"],["/pages_nominatives/gernigon-francois-20076","François","GERNIGON","Horizons & Indépendants"],["/pages_nominatives/giletti-frank-24205","Frank","GILETTI","Rassemblement National"],["/pages_nominatives/ceccoli-francois-xavier-27454","François-Xavier","CECCOLI","Droite Républicaine"],["/pages_nominatives/ruffin-francois","François","RUFFIN","Écologiste et Social"],["/pages_nominatives/falcon-frederic-24248","Frédéric","FALCON","Rassemblement National"],["/pages_nominatives/petit-frederic","Frédéric","PETIT","Les Démocrates"],["/pages_nominatives/vos-frederic-pierre-27512","Frédéric-Pierre","VOS","Rassemblement National"],["/pages_nominatives/meunier-frederique-6851","Frédérique","MEUNIER","Droite Républicaine"],["/pages_nominatives/attal-gabriel","Gabriel","ATTAL","Ensemble pour la République"],["/pages_nominatives/darrieussecq-genevieve","Geneviève","DARRIEUSSECQ","Les Démocrates"],["/pages_nominatives/leseul-gerard-20487","Gérard","LESEUL","Socialistes et apparentés"],["/pages_nominatives/melchior-graziella","Graziella","MELCHIOR","Ensemble pour la République"],["/pages_nominatives/verny-gerault-27511","Gérault","VERNY","Union des droites pour la République"],["/pages_nominatives/bigot-guillaume-27510","Guillaume","BIGOT","Rassemblement National"],["/pages_nominatives/garot-guillaume","Guillaume","GAROT","Socialistes et apparentés"],["/pages_nominatives/alfandari-henri-22152","Henri","ALFANDARI","Horizons & Indépendants"],["/pages_nominatives/berville-herve","Hervé","BERVILLE","Ensemble pour la République"],["/pages_nominatives/laporte-helene-24647","Hélène","LAPORTE","Rassemblement National"],["/pages_nominatives/saulignac-herve-8266","Hervé","SAULIGNAC","Socialistes et apparentés"],["/pages_nominatives/de-lepinau-herve-24309","Hervé","DE LÉPINAU","Rassemblement National"],["/pages_nominatives/davi-hendrik-24305","Hendrik","DAVI","Écologiste et Social"],["/pages_nominatives/ott-hubert-24311","Hubert","OTT","Les Démocrates"],["/pages_nominatives/rauch-isabelle-7394","Isabelle","RAUCH","Horizons & Indépendants"],["/pages_nominatives/rousset-jean-francois-24339","Jean-François","ROUSSET","Ensemble pour la République"],["/pages_nominatives/roumegas-jean-louis","Jean-Louis","ROUMÉGAS","Écologiste et Social"],["/pages_nominatives/thieriot-jean-louis","Jean-Louis","THIÉRIOT","Droite Républicaine"],["/pages_nominatives/fugit-jean-luc","Jean-Luc","FUGIT","Ensemble pour la République"],["/pages_nominatives/warsmann-jean-luc","Jean-Luc","WARSMANN","Libertés, Indépendants, Outre-mer et Territoires"],["/pages_nominatives/fievet-jean-marie","Jean-Marie","FIÉVET","Ensemble pour la République"],["/pages_nominatives/brard-jean-michel","Jean-Michel","BRARD","Horizons & Indépendants"],["/pages_nominatives/mattei-jean-paul","Jean-Paul","MATTEI","Les Démocrates"],["/pages_nominatives/bataille-jean-pierre-9443","Jean-Pierre","BATAILLE","Libertés, Indépendants, Outre-mer et Territoires"],["/pages_nominatives/taite-jean-pierre","Jean-Pierre","TAITE","Droite Républicaine"],["/pages_nominatives/vigier-jean-pierre","Jean-Pierre","VIGIER","Droite Républicaine"],["/pages_nominatives/terlier-jean","Jean","TERLIER","Ensemble pour la République"],["/pages_nominatives/castor-jean-victor-24289","Jean-Victor","CASTOR","Gauche Démocrate et Républicaine"],["/pages_nominatives/tanguy-jean-philippe-24338","Jean-Philippe","TANGUY","Rassemblement National"],["/pages_nominatives/cazeneuve-jean-rene","Jean-René","CAZENEUVE","Ensemble pour la République"],["/pages_nominatives/patrier-leitus-jeremie-24284","Jérémie","PATRIER-LEITUS","Horizons & Indépendants"],["/pages_nominatives/iordanoff-jeremie-24286","Jérémie","IORDANOFF","Écologiste et Social"],["/pages_nominatives/guedj-jerome","Jérôme","GUEDJ","Socialistes et apparentés"],["/pages_nominatives/aviragnet-joel","Joël","AVIRAGNET","Socialistes et apparentés"],["/pages_nominatives/guitton-jordan-24258","Jordan","GUITTON","Rassemblement National"],["/pages_nominatives/missoffe-josephine-28150","Joséphine","MISSOFFE","Ensemble pour la République"],["/pages_nominatives/riviere-joseph-27417","Joseph","RIVIÈRE","Rassemblement National"],["/pages_nominatives/corneloup-josiane-2422","Josiane","CORNELOUP","Droite Républicaine"],["/pages_nominatives/poueyto-josy-7484","Josy","POUEYTO","Les Démocrates"],["/pages_nominatives/laernoes-julie-17811","Julie","LAERNOES","Écologiste et Social"],["/pages_nominatives/lechanteux-julie-15939","Julie","LECHANTEUX","Rassemblement National"],["/pages_nominatives/dive-julien","Julien","DIVE","Droite Républicaine"],["/pages_nominatives/gruet-justine-24336","Justine","GRUET","Droite Républicaine"],["/pages_nominatives/ozenne-julie-27478","Julie","OZENNE","Écologiste et Social"],["/pages_nominatives/erodi-karen-24337","Karen","ERODI","La France insoumise - Nouveau Front Populaire"],["/pages_nominatives/benbrahim-karim-27472","Karim","BENBRAHIM","Socialistes et apparentés"],["/pages_nominatives/olive-karl","Karl","OLIVE","Ensemble pour la République"],["/pages_nominatives/saint-paul-laetitia","Laetitia","SAINT-PAUL","Horizons & Indépendants"],["/pages_nominatives/miller-laure","Laure","MILLER","Ensemble pour la République"],["/pages_nominatives/robert-dehault-laurence-24136","Laurence","ROBERT-DEHAULT","Rassemblement National"],["/pages_nominatives/baumel-laurent","Laurent","BAUMEL","Socialistes et apparentés"],["/pages_nominatives/lhardit-laurent-19668","Laurent","LHARDIT","Socialistes et apparentés"],["/pages_nominatives/jacobelli-laurent-24167","Laurent","JACOBELLI","Rassemblement National"],["/pages_nominatives/wauquiez-laurent","Laurent","WAUQUIEZ","Droite Républicaine"],["/pages_nominatives/magnier-lise","Lise","MAGNIER","Horizons & Indépendants"],["/pages_nominatives/kervran-loic","Loïc","KERVRAN","Horizons & Indépendants"],["/pages_nominatives/morel-louise-24139","Louise","MOREL","Les Démocrates"],["/pages_nominatives/bompard-manuel-16003","Manuel","BOMPARD","La France insoumise - Nouveau Front Populaire"],["/pages_nominatives/chavent-marc-27459","Marc","CHAVENT","Union des droites pour la République"],["/pages_nominatives/fesneau-marc","Marc","FESNEAU","Les Démocrates"],["/pages_nominatives/poussier-winsback-marie-agnes-9819","Marie-Agnès","POUSSIER-WINSBACK","Horizons & Indépendants"],["/pages_nominatives/garin-marie-charlotte-24147","Marie-Charlotte","GARIN","Écologiste et Social"],["/pages_nominatives/allemand-marie-jose-27432","Marie-José","ALLEMAND","Socialistes et apparentés"],["/pages_nominatives/pochon-marie-24145","Marie","POCHON","Écologiste et Social"],["/pages_nominatives/recalde-marie","Marie","RÉCALDE","Socialistes et apparentés"],["/pages_nominatives/hamelet-marine-24151","Marine","HAMELET","Rassemblement National"],["/pages_nominatives/karamanli-marietta","Marietta","KARAMANLI","Socialistes et apparentés"],["/pages_nominatives/le-pen-marine","Marine","LE PEN","Rassemblement National"],["/pages_nominatives/hignet-mathilde-24156","Mathilde","HIGNET","La France insoumise - Nouveau Front Populaire"],["/pages_nominatives/marchio-matthieu-24230","Matthieu","MARCHIO","Rassemblement National"],["/pages_nominatives/amblard-maxime-27439","Maxime","AMBLARD","Rassemblement National"],["/pages_nominatives/reid-arbelot-mereana-25728","Mereana","REID ARBELOT","Gauche Démocrate et Républicaine"],["/pages_nominatives/herbillon-michel","Michel","HERBILLON","Droite Républicaine"],["/pages_nominatives/bouloux-mickael-19909","Mickaël","BOULOUX","Socialistes et apparentés"],["/pages_nominatives/guiniot-michel-24237","Michel","GUINIOT","Rassemblement National"],["/pages_nominatives/frebault-moerani-27343","Moerani","FRÉBAULT","Ensemble pour la République"],["/pages_nominatives/griseti-monique-27430","Monique","GRISETI","Rassemblement National"],["/pages_nominatives/lechon-nadine-27468","Nadine","LECHON","Rassemblement National"],["/pages_nominatives/bonnet-nicolas-17262","Nicolas","BONNET","Écologiste et Social"],["/pages_nominatives/ray-nicolas-24253","Nicolas","RAY","Droite Républicaine"],["/pages_nominatives/metzdorf-nicolas","Nicolas","METZDORF","Ensemble pour la République"],["/pages_nominatives/turquois-nicolas","Nicolas","TURQUOIS","Les Démocrates"],["/pages_nominatives/le-peih-nicole","Nicole","LE PEIH","Ensemble pour la République"],["/pages_nominatives/sanquer-nicole","Nicole","SANQUER","Libertés, Indépendants, Outre-mer et Territoires"],["/pages_nominatives/gregoire-olivia","Olivia","GRÉGOIRE","Ensemble pour la République"],["/pages_nominatives/givernet-olga","Olga","GIVERNET","Ensemble pour la République"],["/pages_nominatives/serva-olivier","Olivier","SERVA","Libertés, Indépendants, Outre-mer et Territoires"],["/pages_nominatives/fayssat-olivier-27418","Olivier","FAYSSAT","Union des droites pour la République"],["/pages_nominatives/bordes-pascale-24187","Pascale","BORDES","Rassemblement National"],["/pages_nominatives/markowsky-pascal-27495","Pascal","MARKOWSKY","Rassemblement National"],["/pages_nominatives/jenft-pascal-27440","Pascal","JENFT","Rassemblement National"],["/pages_nominatives/lecamp-pascal-24264","Pascal","LECAMP","Les Démocrates"],["/pages_nominatives/hetzel-patrick","Patrick","HETZEL","Droite Républicaine"],["/pages_nominatives/christophe-paul-6595","Paul","CHRISTOPHE","Horizons & Indépendants"],["/pages_nominatives/christophle-paul-1658","Paul","CHRISTOPHLE","Socialistes et apparentés"],["/pages_nominatives/colombani-paul-andre","Paul-André","COLOMBANI","Libertés, Indépendants, Outre-mer et Territoires"],["/pages_nominatives/midy-paul-24266","Paul","MIDY","Ensemble pour la République"],["/pages_nominatives/dufau-peio-27497","Peio","DUFAU","Socialistes et apparentés"],["/pages_nominatives/goulet-perrine","Perrine","GOULET","Les Démocrates"],["/pages_nominatives/bonnecarrere-philippe","Philippe","BONNECARRÈRE","Non inscrit"],["/pages_nominatives/gosselin-philippe","Philippe","GOSSELIN","Droite Républicaine"],["/pages_nominatives/juvin-philippe","Philippe","JUVIN","Droite Républicaine"],["/pages_nominatives/latombe-philippe","Philippe","LATOMBE","Les Démocrates"],["/pages_nominatives/schreck-philippe-24293","Philippe","SCHRECK","Rassemblement National"],["/pages_nominatives/cazeneuve-pierre-19678","Pierre","CAZENEUVE","Ensemble pour la République"],["/pages_nominatives/vigier-philippe","Philippe","VIGIER","Les Démocrates"],["/pages_nominatives/meurin-pierre-24150","Pierre","MEURIN","Rassemblement National"],["/pages_nominatives/schellenberger-raphael","Raphaël","SCHELLENBERGER","Non inscrit"],["/pages_nominatives/le-bourgeois-robert-27460","Robert","LE BOURGEOIS","Rassemblement National"],["/pages_nominatives/ramos-richard","Richard","RAMOS","Les Démocrates"],["/pages_nominatives/pilato-rene-25157","René","PILATO","La France insoumise - Nouveau Front Populaire"],["/pages_nominatives/daubie-romain","Romain","DAUBIÉ","Les Démocrates"],["/pages_nominatives/eskenazi-romain-10822","Romain","ESKENAZI","Socialistes et apparentés"],["/pages_nominatives/thillaye-sabine","Sabine","THILLAYE","Les Démocrates"],["/pages_nominatives/sebaihi-sabrina-24197","Sabrina","SEBAIHI","Écologiste et Social"],["/pages_nominatives/delannoy-sandra-27339","Sandra","DELANNOY","Non inscrit"],["/pages_nominatives/le-feur-sandrine","Sandrine","LE FEUR","Ensemble pour la République"],["/pages_nominatives/regol-sandra-24199","Sandra","REGOL","Écologiste et Social"],["/pages_nominatives/rousseau-sandrine-24202","Sandrine","ROUSSEAU","Écologiste et Social"],["/pages_nominatives/huyghe-sebastien","Sébastien","HUYGHE","Ensemble pour la République"],["/pages_nominatives/chikirou-sophia-24207","Sophia","CHIKIROU","La France insoumise - Nouveau Front Populaire"],["/pages_nominatives/errante-sophie","Sophie","ERRANTE","Non inscrit"],["/pages_nominatives/panonacle-sophie","Sophie","PANONACLE","Ensemble pour la République"],["/pages_nominatives/gustave-steevy-27433","Steevy","GUSTAVE","Écologiste et Social"],["/pages_nominatives/dupont-stella","Stella","DUPONT","Non inscrit"],["/pages_nominatives/delautrette-stephane-22744","Stéphane","DELAUTRETTE","Socialistes et apparentés"],["/pages_nominatives/mazars-stephane","Stéphane","MAZARS","Ensemble pour la République"],["/pages_nominatives/viry-stephane","Stéphane","VIRY","Libertés, Indépendants, Outre-mer et Territoires"],["/pages_nominatives/berrios-sylvain","Sylvain","BERRIOS","Horizons & Indépendants"],["/pages_nominatives/maillard-sylvain","Sylvain","MAILLARD","Ensemble pour la République"],["/pages_nominatives/monnier-thibaut-27508","Thibaut","MONNIER","Rassemblement National"],["/pages_nominatives/josserand-sylvie-27442","Sylvie","JOSSERAND","Rassemblement National"],["/pages_nominatives/frappe-thierry-24232","Thierry","FRAPPÉ","Rassemblement National"],["/pages_nominatives/perez-thierry-27484","Thierry","PEREZ","Rassemblement National"],["/pages_nominatives/cazenave-thomas-1812","Thomas","CAZENAVE","Ensemble pour la République"],["/pages_nominatives/gassilloud-thomas","Thomas","GASSILLOUD","Ensemble pour la République"],["/pages_nominatives/lam-thomas-27453","Thomas","LAM","Horizons & Indépendants"],["/pages_nominatives/menage-thomas-24239","Thomas","MÉNAGÉ","Rassemblement National"],["/pages_nominatives/bazin-malgras-valerie","Valérie","BAZIN-MALGRAS","Droite Républicaine"],["/pages_nominatives/thiebaut-vincent","Vincent","THIÉBAUT","Horizons & Indépendants"],["/pages_nominatives/rolland-vincent-7763","Vincent","ROLLAND","Droite Républicaine"],["/pages_nominatives/spillebout-violette-24216","Violette","SPILLEBOUT","Ensemble pour la République"],["/pages_nominatives/albertini-xavier","Xavier","ALBERTINI","Horizons & Indépendants"],["/pages_nominatives/roseren-xavier","Xavier","ROSEREN","Horizons & Indépendants"],["/pages_nominatives/menache-yael-24218","Yaël","MÉNACHÉ","Rassemblement National"],["/pages_nominatives/braun-pivet-yael","Yaël","BRAUN-PIVET","Ensemble pour la République"],["/pages_nominatives/breton-xavier","Xavier","BRETON","Droite Républicaine"],["/pages_nominatives/duby-muller-virginie","Virginie","DUBY-MULLER","Droite Républicaine"],["/pages_nominatives/chenevard-yannick","Yannick","CHENEVARD","Ensemble pour la République"]],"societes":[["Plan de la tour SAS",27000000.0,{"Ensemble pour la République":27000000.0},[208]],["MAJI",22000000.0,{"Union des droites pour la République":22000000.0},[83]],["GALILE SAS",11124000.0,{"Union des droites pour la République":11124000.0},[63]],["ARC MANAGEMENT",10357274.0,{"Les Démocrates":10357274.0},[135]],["SC Trésorière",7997023.0,{"Horizons & Indépendants":7997023.0},[86]],["RIESTER SAS",7302000.0,{"Ensemble pour la République":7302000.0},[68]],["SAS BONPORTEAU",6692815.0,{"Union des droites pour la République":6692815.0},[166]],["SAVERIU INVESTISSEMENTS",4730000.0,{"Droite Républicaine":4730000.0},[73]],["WENDEL PARTICIPATIONS SE",3832840.0,{"Ensemble pour la République":3832840.0},[114]],["JPMJA",3462420.0,{"Horizons & Indépendants":3462420.0},[86]],["sasu la bastinde",2584441.0,{"Les Démocrates":2584441.0},[184]],["Fonciere de la Tour",2500000.0,{"Union des droites pour la République":2500000.0},[83]],["FRUTICOR",1841840.0,{"Droite Républicaine":1841840.0},[73]],["NAEGELEN SAS",1800000.0,{"Libertés, Indépendants, Outre-mer et Territoires":1800000.0},[45]],["L'Oreal",1630500.0,{"Ensemble pour la République":1630097.0,"Rassemblement National":403.0},[82,114,149,224]],["SAS BIHANNIC",1550000.0,{"Horizons & Indépendants":1550000.0},[100]],["SPFPL FIRMIN",1487220.0,{"Horizons & Indépendants":1487220.0},[1]],["VDM TECHNOLOGIES",1140200.0,{"Union des droites pour la République":1140200.0},[63]],["SARL Luxinet",875000.0,{"Ensemble pour la République":875000.0},[214]],["SELARL PHARMACIE BATAILLE",847895.0,{"Libertés, Indépendants, Outre-mer et Territoires":847895.0},[102]],["SARL CHAIX DECORATION",600000.0,{"Union des droites pour la République":600000.0},[23]],["sarl beach",584416.0,{"Les Démocrates":584416.0},[46]],["Turboself Groupe",475000.0,{"Libertés, Indépendants, Outre-mer et Territoires":475000.0},[48]],["Sarl le Pylone",400029.0,{"Droite Républicaine":400029.0},[62]],["SARL Les Quatre Cents Clous",370691.0,{"Écologiste et Social":370691.0},[74]],["Real Immo",360000.0,{"Horizons & Indépendants":360000.0},[109]],["Bouygues SA",356728.0,{"Ensemble pour la République":356728.0},[108]],["SAVERIU AGRI",295115.0,{"Droite Républicaine":295115.0},[73]],["SASU MAISON PRADIÉ",250000.0,{"Non inscrit":250000.0},[15]],["CYPRIEN SPORTS SAS",250000.0,{"Horizons & Indépendants":250000.0},[222]],["SCA Eglantine",209000.0,{"Écologiste et Social":209000.0},[118]],["Château de Montal SARL",207900.0,{"Ensemble pour la République":207900.0},[208]],["L2H MONNIER CONSEIL",201000.0,{"Rassemblement National":201000.0},[209]],["CYN SARL",200000.0,{"Ensemble pour la République":200000.0},[159]],["AXIOME NOTAIRES",200000.0,{"Ensemble pour la République":200000.0},[198]],["Sarl Le Piccolo",194994.0,{"Droite Républicaine":194994.0},[62]],["PI SYSTEMS AUTOMATION",192040.0,{"Union des droites pour la République":192040.0},[63]],["Réflexions débats perspectives & analyses",169158.0,{"Socialistes et apparentés":169158.0},[69]],["4A ENGINEERING",163200.0,{"Union des droites pour la République":163200.0},[3]],["Societe Generale",158311.0,{"Union des droites pour la République":1200.0,"Rassemblement National":157111.0},[166,187]],["PEINTA",152320.0,{"Union des droites pour la République":152320.0},[63]],["EURL Ligne42",150000.0,{"Les Démocrates":150000.0},[26]],["S2C Sud Courtage et Conseil",150000.0,{"Union des droites pour la République":150000.0},[166]],["SCPI PRIMOVIE",130559.0,{"Rassemblement National":100079.0,"Gauche Démocrate et Républicaine":30480.0},[149,150]],["LACLAREE",129390.0,{"Ensemble pour la République":129390.0},[108]],["SC Bodirose",118865.0,{"Les Démocrates":118865.0},[26]],["Ecole de la rénovation énergétique",105672.0,{"Ensemble pour la République":105672.0},[213]],["SELARL isaac-sibille",100000.0,{"Les Démocrates":100000.0},[51]],["sas rouge raisin",100000.0,{"Droite Républicaine":100000.0},[66]],["PALPATINE SAS",100000.0,{"Ensemble pour la République":100000.0},[208]],["CORUSCANT SAS",100000.0,{"Ensemble pour la République":100000.0},[208]],["SFPCOLLECTIVITES",94050.0,{"Horizons & Indépendants":94050.0},[71]],["SELARL Alégria Avocat",90000.0,{"Rassemblement National":90000.0},[90]],["PHI SAS",82857.0,{"Non inscrit":82857.0},[200]],["MEDIASCOP",75647.0,{"La France insoumise - Nouveau Front Populaire":75647.0},[199]],["Work for good Vendredi",75000.0,{"Ensemble pour la République":75000.0},[208]],["AIR LIQUIDE",72612.0,{"Rassemblement National":30460.0,"Les Démocrates":6292.0,"Libertés, Indépendants, Outre-mer et Territoires":29258.0,"Ensemble pour la République":5759.0,"Union des droites pour la République":843.0},[5,76,98,107,113,114,128,149,166]],["Crédit Mutuel",70620.0,{"Les Démocrates":29011.0,"Socialistes et apparentés":41594.0,"Non inscrit":15.0},[92,173,186]],["Selarl Lorraine Défense & Conseil",68571.0,{"Libertés, Indépendants, Outre-mer et Territoires":68571.0},[206]],["SCP CHARLES",68000.0,{"Union des droites pour la République":68000.0},[23]],["SELARL D INTORNI MESNIL CHARPAIL",65000.0,{"Union des droites pour la République":65000.0},[37]],["Caisse fédérale de Crédit Mutuel",61222.0,{"Ensemble pour la République":61222.0},[27]],["bnp paribas",60807.0,{"Horizons & Indépendants":26318.0,"Libertés, Indépendants, Outre-mer et Territoires":12859.0,"Rassemblement National":297.0,"Droite Républicaine":2823.0,"Union des droites pour la République":10767.0,"Les Démocrates":7743.0},[1,98,113,158,166,192]],["SCP SCHRECK",60000.0,{"Rassemblement National":60000.0},[182]],["LE FRANCISQUE",59730.0,{"Socialistes et apparentés":59730.0},[38]],["SELARL Pascale BORDES Avocate",54766.0,{"Rassemblement National":54766.0},[167]],["Caisse d'Epargne",50400.0,{"Droite Républicaine":50400.0},[151]],["SCPI PRIMOPIERRE",50128.0,{"Rassemblement National":50128.0},[149]],["Terrain service",50020.0,{"Rassemblement National":50020.0},[77]],["Paris FC",50000.0,{"Les Démocrates":50000.0},[26]],["M2C",50000.0,{"Socialistes et apparentés":50000.0},[59]],["CORUM ORIGIN",49050.0,{"Ensemble pour la République":49050.0},[227]],["Jumia",47233.0,{"Ensemble pour la République":47233.0},[175]],["Absteme",40000.0,{"Écologiste et Social":40000.0},[24]],["ABSCISSESERVICES",40000.0,{"Droite Républicaine":40000.0},[96]],["SA Clinique Charcot",39000.0,{"Les Démocrates":39000.0},[51]],["safran",38794.0,{"Horizons & Indépendants":13487.0,"Les Démocrates":4052.0,"Ensemble pour la République":2820.0,"Libertés, Indépendants, Outre-mer et Territoires":17212.0,"Rassemblement National":1223.0},[1,46,94,98,149]],["VALLOUREC",38695.0,{"Horizons & Indépendants":38695.0},[1,218]],["Willo 32 Inc.",37387.0,{"Ensemble pour la République":37387.0},[183]],["MANUSYSTEMS",36220.0,{"Union des droites pour la République":36220.0},[63]],["Total",35229.0,{"Libertés, Indépendants, Outre-mer et Territoires":35229.0},[98]],["VIRIDIEN",34732.0,{"Horizons & Indépendants":34732.0},[218]],["axa",34150.0,{"Horizons & Indépendants":13520.0,"Les Démocrates":6812.0,"Libertés, Indépendants, Outre-mer et Territoires":5113.0,"Rassemblement National":320.0,"Union des droites pour la République":2522.0,"Ensemble pour la République":5863.0},[1,60,76,98,113,149,160,166,192,224]],["thales",33430.0,{"Horizons & Indépendants":31330.0,"Rassemblement National":767.0,"Union des droites pour la République":1333.0},[1,149,166]],["SECTION PALOISE SASP",32000.0,{"Les Démocrates":32000.0},[101]],["SCPI Epagne Pierre",30258.0,{"Gauche Démocrate et Républicaine":30258.0},[150]],["sanofi",30184.0,{"Horizons & Indépendants":18324.0,"Ensemble pour la République":2859.0,"Libertés, Indépendants, Outre-mer et Territoires":3273.0,"Rassemblement National":4342.0,"Droite Républicaine":1386.0},[1,82,98,128,149,158]],["Incentive Agency",30100.0,{"Rassemblement National":30100.0},[212]],["OPEN !",30000.0,{"Ensemble pour la République":30000.0},[42]],["LVI Avocats associés",30000.0,{"Rassemblement National":30000.0},[77]],["orange",27944.0,{"Horizons & Indépendants":5488.0,"Libertés, Indépendants, Outre-mer et Territoires":1779.0,"Rassemblement National":189.0,"Socialistes et apparentés":1780.0,"Union des droites pour la République":18708.0},[1,25,98,149,152,166,218]],["Crédit Agricole",27698.0,{"Les Démocrates":788.0,"La France insoumise - Nouveau Front Populaire":359.0,"Ensemble pour la République":14130.0,"Droite Républicaine":12421.0},[138,147,189,224,226]],["WEID",27600.0,{"Union des droites pour la République":27600.0},[3]],["Sarl Panonacle Immobilier",26357.0,{"Ensemble pour la République":26357.0},[201]],["COACHING 4.0",25730.0,{"Union des droites pour la République":25730.0},[3]],["Banque Fédérative du Crédit Mutuel",22928.0,{"Ensemble pour la République":22928.0},[27]],["Scoiété Générale",22665.0,{"Horizons & Indépendants":22665.0},[218]],["Danone",21373.0,{"Libertés, Indépendants, Outre-mer et Territoires":21140.0,"Rassemblement National":233.0},[98,149]],["21 YIELD",21000.0,{"Union des droites pour la République":21000.0},[3]],["Epargne pierre",20787.0,{"Ensemble pour la République":20787.0},[227]],["SG actions US",20582.0,{"Droite Républicaine":20582.0},[180]],["SAS NCH",20504.0,{"Droite Républicaine":20504.0},[116]],["credit agricole",20324.0,{"Horizons & Indépendants":14475.0,"Ensemble pour la République":1166.0,"Libertés, Indépendants, Outre-mer et Territoires":4618.0,"Rassemblement National":65.0},[1,87,98,99,113]],["Panem & Circenses Group",20140.0,{"Ensemble pour la République":20140.0},[183]],["CREDIT MUTUEL",20015.0,{"Droite Républicaine":20000.0,"Les Démocrates":15.0},[103,184]],["CDMC",20000.0,{"Les Démocrates":20000.0},[56]],["La Venta",20000.0,{"Rassemblement National":20000.0},[75]],["PIERVAL SANTE25",20000.0,{"Ensemble pour la République":20000.0},[227]],["RENAULT",19930.0,{"Horizons & Indépendants":11195.0,"Rassemblement National":946.0,"Libertés, Indépendants, Outre-mer et Territoires":5221.0,"Ensemble pour la République":2568.0},[1,16,54,98,99,113]],["SCPI PERIAL",19881.0,{"Rassemblement National":19881.0},[131]],["Corum XL",19410.0,{"Ensemble pour la République":19410.0},[227]],["EUROVALYS",18909.0,{"Ensemble pour la République":18909.0},[227]],["SG actions euro",18621.0,{"Droite Républicaine":18621.0},[180]],["ENGIE",17527.0,{"Libertés, Indépendants, Outre-mer et Territoires":852.0,"Ensemble pour la République":4624.0,"Rassemblement National":2115.0,"Les Démocrates":741.0,"Union des droites pour la République":2501.0,"Droite Républicaine":6694.0},[54,82,98,128,138,166,179,224]],["l oreal",17430.0,{"Horizons & Indépendants":17430.0},[1]],["SCPI Epargne Foncière",17367.0,{"Gauche Démocrate et Républicaine":17367.0},[150]],["sarl new holding lmb",17000.0,{"Les Démocrates":17000.0},[46]],["MANUSTRA",16520.0,{"Union des droites pour la République":16520.0},[63]],["SLE Brest Leon",16520.0,{"Ensemble pour la République":16520.0},[82]],["STELLANTIS",16299.0,{"Horizons & Indépendants":10879.0,"Rassemblement National":771.0,"Droite Républicaine":3900.0,"Union des droites pour la République":749.0},[1,149,158,166]],["La Chaise Française",15813.0,{"Union des droites pour la République":15813.0},[17]],["TotalEnergies",15372.0,{"Les Démocrates":15372.0},[160,192]],["NANOBIOTIX",15351.0,{"Ensemble pour la République":15351.0},[94]],["SAS Agrigaz",15000.0,{"Libertés, Indépendants, Outre-mer et Territoires":15000.0},[34]],["COFIMAGE 36",15000.0,{"Socialistes et apparentés":15000.0},[204]],["schneider electric",14926.0,{"Horizons & Indépendants":9513.0,"Rassemblement National":5413.0},[1,128,149]],["total energies",14162.0,{"Horizons & Indépendants":8167.0,"Droite Républicaine":4935.0,"Union des droites pour la République":1060.0},[1,158,166]],["Sopra Steria Group",13896.0,{"Ensemble pour la République":13896.0},[224]],["FERMAP-ALU",13500.0,{"Rassemblement National":13500.0},[169]],["Air France",13440.0,{"Union des droites pour la République":30.0,"Les Démocrates":13369.0,"Droite Républicaine":41.0},[3,46,179]],["Totalénergie",13175.0,{"Ensemble pour la République":13175.0},[99]],["vinci",13174.0,{"Horizons & Indépendants":11015.0,"Union des droites pour la République":2159.0},[1,166]],["eurazeo",12352.0,{"Horizons & Indépendants":12352.0},[1]],["Allianz",11055.0,{"Les Démocrates":9365.0,"Union des droites pour la République":1690.0},[76,166]],["Saint Gobain cie",10904.0,{"Libertés, Indépendants, Outre-mer et Territoires":10904.0},[98]],["SCHNEIDER ELECTRIC SE",10901.0,{"Ensemble pour la République":10901.0},[114]],["SG actions France",10239.0,{"Droite Républicaine":10239.0},[180]],["SAS EKOKLEAN ON DEMAND",10000.0,{"Ensemble pour la République":10000.0},[7]],["BNPI",10000.0,{"Rassemblement National":10000.0},[115]],["COFIMAGE 34",10000.0,{"Socialistes et apparentés":10000.0},[204]],["COFIMAGE 35",10000.0,{"Socialistes et apparentés":10000.0},[204]],["SAINT GOBAIN",9829.0,{"Ensemble pour la République":7616.0,"Droite Républicaine":2213.0},[114,158]],["AMUNDI EQUILIBRE ACTIONS EURO",9622.0,{"Non inscrit":9622.0},[203]],["AMUNDI",9547.0,{"Horizons & Indépendants":9547.0},[1]],["Credit Mutuel Enseignant Loire Haute-Loire",9253.0,{"Ensemble pour la République":9253.0},[97]],["SARL Piste Verte",9000.0,{"Rassemblement National":9000.0},[6]],["Bred",9000.0,{"La France insoumise - Nouveau Front Populaire":9000.0},[65]],["Totalénergies",8979.0,{"Ensemble pour la République":8979.0},[224]],["CAISSE D'EPARGNE- SLE AUBE",8940.0,{"Rassemblement National":8940.0},[113]],["total energies SE",8684.0,{"Ensemble pour la République":8684.0},[82]],["LVMH",8452.0,{"Rassemblement National":1427.0,"Union des droites pour la République":1339.0,"Les Démocrates":2014.0,"Ensemble pour la République":3672.0},[72,166,192,224]],["ESSILOR LUXOTTICA",7864.0,{"Ensemble pour la République":7864.0},[114]],["AIRBUS",7756.0,{"Les Démocrates":2742.0,"Rassemblement National":4878.0,"Union des droites pour la République":136.0},[76,128,166]],["FDJ",7683.0,{"Droite Républicaine":3953.0,"Les Démocrates":3730.0},[158,181]],["KO PRODUCTION",7650.0,{"Ensemble pour la République":7650.0},[125]],["Hermès intl",7638.0,{"Ensemble pour la République":7638.0},[224]],["Conseil Stratégies Publiques SARL",7500.0,{"Socialistes et apparentés":7500.0},[130]],["BNP",7500.0,{"Droite Républicaine":7500.0},[179]],["Vivendi",7450.0,{"Rassemblement National":7450.0},[128]],["AMUNDI VALEUR DURABLE",7268.0,{"Non inscrit":7268.0},[203]],["LEGRAND",7182.0,{"Ensemble pour la République":7182.0},[114]],["BANQUE POPULAIRE AURA",7088.0,{"Droite Républicaine":7088.0},[158]],["abscisse partners",7000.0,{"Droite Républicaine":7000.0},[96]],["AMUNDI PRUDENT",6986.0,{"Non inscrit":6986.0},[203]],["Airbus se",6950.0,{"Libertés, Indépendants, Outre-mer et Territoires":6950.0},[98]],["pernod ricard",6696.0,{"Horizons & Indépendants":5660.0,"Union des droites pour la République":1036.0},[1,166]],["Rubis",6665.0,{"Union des droites pour la République":6665.0},[166]],["SG actions emergent",6536.0,{"Droite Républicaine":6536.0},[180]],["mirova actions euro d fcp",5876.0,{"Ensemble pour la République":5876.0},[82]],["Chargeurs",5775.0,{"Union des droites pour la République":5775.0},[166]],["Adp",5666.0,{"Libertés, Indépendants, Outre-mer et Territoires":955.0,"Les Démocrates":1407.0,"Droite Républicaine":3304.0},[98,138,179]],["Universal music group",5619.0,{"Rassemblement National":5619.0},[128]],["CAREGAME",5600.0,{"Socialistes et apparentés":5600.0},[143]],["Christian Dior",5204.0,{"Rassemblement National":5204.0},[128]],["Microsoft",5031.0,{"Rassemblement National":5031.0},[72,149]],["SICI",5000.0,{"Union des droites pour la République":5000.0},[23]],["EFORSA",5000.0,{"Libertés, Indépendants, Outre-mer et Territoires":5000.0},[54]],["Fumaison Occitane",5000.0,{"Libertés, Indépendants, Outre-mer et Territoires":5000.0},[54]],["FERMAP-GEST",5000.0,{"Rassemblement National":5000.0},[169]],["Française des Jeux",4884.0,{"Droite Républicaine":4884.0},[132]],["KBC GROUPE SA",4608.0,{"Ensemble pour la République":4608.0},[114]],["HERMES INTERNATIONAL",4514.0,{"Ensemble pour la République":4514.0},[114]],["Cigale",4500.0,{"Socialistes et apparentés":4500.0},[57]],["SG actions euro small cap P",4455.0,{"Droite Républicaine":4455.0},[180]],["Hermes INTL",4280.0,{"Rassemblement National":4280.0},[72]],["MICHELIN",4115.0,{"Socialistes et apparentés":138.0,"Ensemble pour la République":2283.0,"Rassemblement National":276.0,"Union des droites pour la République":1418.0},[43,50,99,149,166]],["SAS Salu'Terre d'Helios",4000.0,{"Écologiste et Social":4000.0},[22]],["SAS Soleil Volon'Terre",4000.0,{"Écologiste et Social":4000.0},[22]],["LABELLIFE RECORDS",3815.0,{"Écologiste et Social":3815.0},[202]],["Partouche groupe regroupe",3790.0,{"Rassemblement National":3790.0},[128]],["ArcelorMittal",3777.0,{"Libertés, Indépendants, Outre-mer et Territoires":3244.0,"Union des droites pour la République":533.0},[98,166]],["BNP Parisbas",3544.0,{"Ensemble pour la République":3544.0},[224]],["Veolia Environnement",3418.0,{"Libertés, Indépendants, Outre-mer et Territoires":2712.0,"Rassemblement National":110.0,"Union des droites pour la République":596.0},[98,113,166]],["sas Renaissance",3400.0,{"Les Démocrates":3400.0},[61]],["PERNOD-RICARD",3358.0,{"Ensemble pour la République":3358.0},[114]],["Apple",3349.0,{"Rassemblement National":2359.0,"Union des droites pour la République":990.0},[72,166]],["SAS DGF Invest",3250.0,{"Union des droites pour la République":3250.0},[166]],["BOUYGUES",3248.0,{"Rassemblement National":62.0,"Les Démocrates":189.0,"Ensemble pour la République":2997.0},[113,160,198]],["Alstom regroupt",3220.0,{"Rassemblement National":3220.0},[128]],["Banque Populaire",3088.0,{"Écologiste et Social":80.0,"Rassemblement National":3008.0},[91,119]],["UNIBAIL RODAMCO",3065.0,{"Droite Républicaine":3065.0},[158]],["CARREFOUR",3035.0,{"Ensemble pour la République":1410.0,"Rassemblement National":27.0,"Droite Républicaine":1598.0},[99,113,158]],["SCA LEADER INVESTISSEMENTS",3025.0,{"Les Démocrates":3025.0},[101]],["Crédit Coopératif",3000.0,{"Écologiste et Social":3000.0},[140]],["EARL BARTHES",2918.0,{"Rassemblement National":2918.0},[44]],["Kering",2845.0,{"Ensemble pour la République":2845.0},[82]],["Biomerieux",2739.0,{"Rassemblement National":2739.0},[128]],["HAFFNER ENERGY",2735.0,{"Libertés, Indépendants, Outre-mer et Territoires":2735.0},[34]],["fnac darty",2584.0,{"Horizons & Indépendants":2584.0},[1]],["Holding Saint Gatien",2509.0,{"Horizons & Indépendants":2509.0},[86]],["ERCLLA",2500.0,{"Non inscrit":2500.0},[203]],["Arc Traiteur",2500.0,{"Horizons & Indépendants":2500.0},[207]],["Biomérieux",2481.0,{"Les Démocrates":2481.0},[76]],["Osmosun",2395.0,{"Les Démocrates":2395.0},[46]],["Nexity",2218.0,{"Union des droites pour la République":2218.0},[166]],["SC Mont d'arbois",2140.0,{"Ensemble pour la République":2140.0},[163]],["Foncière Terre de Liens",2100.0,{"Écologiste et Social":2100.0},[157]],["Arkema",2092.0,{"Rassemblement National":1632.0,"Les Démocrates":460.0},[128,192]],["Continental",2053.0,{"Ensemble pour la République":2053.0},[50]],["CARIBBEAN MASKS ENVIRONMENT",2000.0,{"Socialistes et apparentés":2000.0},[18]],["SARL Condé",2000.0,{"Ensemble pour la République":2000.0},[64]],["Société Générale",1988.0,{"Libertés, Indépendants, Outre-mer et Territoires":1988.0},[98]],["Alstom",1971.0,{"Rassemblement National":1423.0,"Ensemble pour la République":548.0},[107,108,113,149]],["NEOEN",1937.0,{"Les Démocrates":1937.0},[138]],["Cap Gemini",1911.0,{"Libertés, Indépendants, Outre-mer et Territoires":1911.0},[98]],["CORRIDOR LAB SAS d'Architecture",1900.0,{"Écologiste et Social":1900.0},[122]],["SCHNEIDER",1811.0,{"Les Démocrates":1811.0},[192]],["SG liquidites PEA",1715.0,{"Droite Républicaine":1715.0},[180]],["Applied Materials",1645.0,{"Rassemblement National":1645.0},[149]],["Costco Wholesale",1587.0,{"Rassemblement National":1587.0},[72]],["EIFFAGE ENERGIE",1520.0,{"Gauche Démocrate et Républicaine":1520.0},[106]],["SAS Initiative Forêt",1500.0,{"Libertés, Indépendants, Outre-mer et Territoires":1500.0},[34]],["CAEXIS FORMATION",1500.0,{"Horizons & Indépendants":1500.0},[71]],["SARL ECONOMIE ET CONSTRUCTION",1500.0,{"La France insoumise - Nouveau Front Populaire":1500.0},[123]],["Amazon",1472.0,{"Rassemblement National":1472.0},[149]],["NOVO NORDISK",1370.0,{"Les Démocrates":1370.0},[192]],["Quadient",1321.0,{"Ensemble pour la République":1321.0},[82]],["advanced micro devices",1292.0,{"Droite Républicaine":1292.0},[180]],["VEOLIA",1291.0,{"Les Démocrates":888.0,"Rassemblement National":403.0},[138,149]],["TF1",1233.0,{"Ensemble pour la République":1041.0,"Rassemblement National":192.0},[99,149]],["STMICROELECTRONICS",1225.0,{"Rassemblement National":510.0,"Union des droites pour la République":715.0},[149,166]],["AVIRON BAYONNAIS SASP",1200.0,{"Les Démocrates":1200.0},[101]],["UTZ",1200.0,{"Rassemblement National":1200.0},[223]],["Frenesius Médical Care",1125.0,{"Ensemble pour la République":1125.0},[127]],["S.A.S FC CHAMBLY OISE",1000.0,{"Rassemblement National":1000.0},[5]],["EURL FINANCIERE BD",1000.0,{"Ensemble pour la République":1000.0},[20]],["SCP MARIE LOUISE",1000.0,{"Union des droites pour la République":1000.0},[23]],["SELARL",1000.0,{"Ensemble pour la République":1000.0},[32]],["Coopérative CAP'ECO",1000.0,{"Écologiste et Social":1000.0},[40]],["Le DRIM'S",1000.0,{"Gauche Démocrate et Républicaine":1000.0},[55]],["SARL 2FCH",1000.0,{"Rassemblement National":1000.0},[88]],["energiequitable",1000.0,{"Droite Républicaine":1000.0},[104]],["SCIC du Rapiquin",1000.0,{"Les Démocrates":1000.0},[138]],["EILIS",1000.0,{"Rassemblement National":1000.0},[185]],["Twelve International",1000.0,{"Ensemble pour la République":1000.0},[198]],["SAS ASINARIA",1000.0,{"Horizons & Indépendants":1000.0},[215]],["Union sportive bressane pays de l'Ain rugby",1000.0,{"Droite Républicaine":1000.0},[225]],["Meta",985.0,{"Rassemblement National":985.0},[149]],["uber technologies",980.0,{"Droite Républicaine":980.0},[180]],["AMUNDI EUROPE MONDE (D) FCP 3D",907.0,{"Libertés, Indépendants, Outre-mer et Territoires":907.0},[54]],["ATOUT VERT HORIZON 3DEC",861.0,{"Libertés, Indépendants, Outre-mer et Territoires":861.0},[54]],["SARL marquises rock construction",855.0,{"Ensemble pour la République":855.0},[154]],["BDR",800.0,{"Ensemble pour la République":800.0},[159]],["SYNAPSE FINANCES",790.0,{"Les Démocrates":790.0},[188]],["STMICROELECTONICS",772.0,{"Les Démocrates":772.0},[192]],["associé dans une SELARL d'avocats",770.0,{"Ensemble pour la République":770.0},[205]],["EDF",767.0,{"Ensemble pour la République":767.0},[99]],["SARL La Rapugue",750.0,{"Rassemblement National":750.0},[72]],["aeroports de Paris",729.0,{"Ensemble pour la République":729.0},[82]],["NEXAN",721.0,{"Rassemblement National":721.0},[149]],["Taiwan Semiconductor Manufacturing",704.0,{"Rassemblement National":704.0},[149]],["Alphabet Inc",704.0,{"Rassemblement National":704.0},[149]],["STEP",680.0,{"Les Démocrates":680.0},[117]],["Label Emmaüs",600.0,{"Écologiste et Social":600.0},[142]],["TOTAL Energie",598.0,{"Rassemblement National":598.0},[107]],["worldline",567.0,{"Ensemble pour la République":567.0},[82]],["Spotify",562.0,{"Rassemblement National":562.0},[149]],["H&K",555.0,{"Union des droites pour la République":555.0},[166]],["CENTRE DE CONSEIL EN CONSTRUCTION",510.0,{"Rassemblement National":510.0},[11]],["SCIC Turbul'lance",500.0,{"Socialistes et apparentés":500.0},[57]],["ANGEVINE DE CONSTRUCTION",500.0,{"Horizons & Indépendants":500.0},[71]],["sarl Chrijunotin",500.0,{"Socialistes et apparentés":500.0},[81]],["SCIC Combrailles Durables",500.0,{"Écologiste et Social":500.0},[157]],["SAS SNIPER",500.0,{"Rassemblement National":500.0},[182]],["LABELIFE EVENTS SAS",500.0,{"Écologiste et Social":500.0},[202]],["VERGNET",472.0,{"Ensemble pour la République":472.0},[94]],["Puma",459.0,{"Ensemble pour la République":459.0},[82]],["Constellation energy corporation",405.0,{"Rassemblement National":405.0},[149]],["bafacool",400.0,{"Libertés, Indépendants, Outre-mer et Territoires":400.0},[174]],["Saskkia",400.0,{"Horizons & Indépendants":400.0},[207]],["DISTRIBUIDOR INTL ALIMENTACION",396.0,{"Union des droites pour la République":396.0},[166]],["SCICA Initiatives pour une Economie Solidaire (I.E.S)",380.0,{"Écologiste et Social":380.0},[40]],["Nokia",378.0,{"Libertés, Indépendants, Outre-mer et Territoires":378.0},[98]],["OPMIBILITY",374.0,{"Ensemble pour la République":374.0},[99]],["UTI",360.0,{"Rassemblement National":360.0},[223]],["EUROTUNNEL",357.0,{"Les Démocrates":357.0},[181]],["selarl pharmacie jenner",351.0,{"Horizons & Indépendants":351.0},[1]],["SOITEC",348.0,{"Rassemblement National":348.0},[149]],["DASSAULT AVIATION",342.0,{"Rassemblement National":342.0},[149]],["SARL Hiriani",335.0,{"Libertés, Indépendants, Outre-mer et Territoires":335.0},[162]],["KALRAY",306.0,{"Les Démocrates":165.0,"Rassemblement National":141.0},[138,149]],["MALO BROCHETTES",300.0,{"Gauche Démocrate et Républicaine":300.0},[55]],["Caisse d'épargne",300.0,{"Les Démocrates":300.0},[135]],["Ici Marseille",300.0,{"Écologiste et Social":300.0},[142]],["SARL Ménagé",300.0,{"Rassemblement National":300.0},[216]],["PIERRE ET VACANCES",269.0,{"Rassemblement National":269.0},[128]],["MYBIOTECH",262.0,{"Union des droites pour la République":262.0},[3]],["SAS HDKL",250.0,{"Horizons & Indépendants":250.0},[134]],["SCOP Oxalis",240.0,{"Écologiste et Social":240.0},[36]],["BNPP IND.AMNORD CL. H FCP DEC",231.0,{"Ensemble pour la République":231.0},[114]],["Caisse locale - Crédit Agricole",229.0,{"Rassemblement National":229.0},[14]],["BIC",222.0,{"Rassemblement National":222.0},[149]],["Korian SE",214.0,{"Ensemble pour la République":214.0},[127]],["CARBIOS",208.0,{"Socialistes et apparentés":208.0},[43]],["Amundi Label tresorerie",208.0,{"Rassemblement National":208.0},[148]],["ExxonMobil",206.0,{"Rassemblement National":206.0},[149]],["Bio UV",201.0,{"Les Démocrates":201.0},[138]],["artisanales",200.0,{"Rassemblement National":200.0},[155]],["PUBLICIS",196.0,{"Rassemblement National":196.0},[149]],["Waste Management",194.0,{"Rassemblement National":194.0},[149]],["Equinox Gold",182.0,{"Union des droites pour la République":182.0},[166]],["Editions du Croquant",180.0,{"La France insoumise - Nouveau Front Populaire":180.0},[12]],["CRCA Touraine-Poitou",173.0,{"Les Démocrates":173.0},[160]],["Parts Sociétaires Crédit Agricole Volontaire",158.0,{"Libertés, Indépendants, Outre-mer et Territoires":158.0},[54]],["Geo Group",153.0,{"Rassemblement National":153.0},[149]],["Académie Thucydide",150.0,{"Rassemblement National":150.0},[84]],["Bollore",146.0,{"Union des droites pour la République":146.0},[166]],["Kenvue",130.0,{"Rassemblement National":130.0},[149]],["Micron Technology",125.0,{"Rassemblement National":125.0},[149]],["FirstEnergy",107.0,{"Rassemblement National":107.0},[149]],["SCP CAPDEVIELLE",100.0,{"Socialistes et apparentés":100.0},[49]],["SARL LES 3G",100.0,{"Horizons & Indépendants":100.0},[71]],["SCIC Bois energie 41",100.0,{"Les Démocrates":100.0},[138]],["SARL POC",100.0,{"Union des droites pour la République":100.0},[166]],["Enercoop",100.0,{"Socialistes et apparentés":100.0},[176]],["Enargia",100.0,{"Socialistes et apparentés":100.0},[176]],["Relax grill",100.0,{"Rassemblement National":100.0},[223]],["Jacquet-Métal Services",92.0,{"Les Démocrates":92.0},[160]],["WAGA ENERGY",85.0,{"Rassemblement National":85.0},[113]],["SAS Chaize Environnement",77.0,{"Ensemble pour la République":77.0},[164]],["TELEPERFORMANCE",70.0,{"Union des droites pour la République":70.0},[3]],["Cm-am DYNAMIQUE EUROPE",56.0,{"Rassemblement National":56.0},[128]],["SCIC Centrales Villageoises du Pays du Saintois",50.0,{"Socialistes et apparentés":50.0},[57]],["CFIE",50.0,{"Socialistes et apparentés":50.0},[81]],["BPCE",50.0,{"Socialistes et apparentés":50.0},[191]],["VMK",47.0,{"Ensemble pour la République":47.0},[29]],["LUCIBEL ACT",47.0,{"Les Démocrates":47.0},[138]],["GS RESEAUX",45.0,{"Écologiste et Social":45.0},[193]],["CVR Energy",44.0,{"Rassemblement National":44.0},[149]],["TOCQUEVILLE MEGATRENDS ISR C",39.0,{"Rassemblement National":39.0},[113]],["FORVIA",33.0,{"Droite Républicaine":33.0},[158]],["SA Mont-Blanc",32.0,{"Droite Républicaine":32.0},[226]],["Spiler SAS",30.0,{"Libertés, Indépendants, Outre-mer et Territoires":30.0},[45]],["Orpéa",29.0,{"Ensemble pour la République":29.0},[127]],["Parts Sociétaires Crédit Agricole Engagement",20.0,{"Libertés, Indépendants, Outre-mer et Territoires":20.0},[54]],["GL EVENTS",19.0,{"Rassemblement National":19.0},[113]],["SISA Authume Santé",15.0,{"Droite Républicaine":15.0},[121]],["NAVYA",14.0,{"Socialistes et apparentés":14.0},[124]],["ATARI",11.0,{"Union des droites pour la République":11.0},[3]],["DONTNOD",11.0,{"Les Démocrates":11.0},[138]],["DEINOVE",10.0,{"Horizons & Indépendants":10.0},[109]],["ASINA CONSEIL",10.0,{"Horizons & Indépendants":10.0},[215]],["Eutelsat Communications",8.0,{"Union des droites pour la République":8.0},[166]],["Euroapi",7.0,{"Ensemble pour la République":3.0,"Libertés, Indépendants, Outre-mer et Territoires":2.0,"Rassemblement National":2.0},[82,98,128]],["SAS Chaize",6.0,{"Ensemble pour la République":6.0},[164]],["Nicox",2.0,{"La France insoumise - Nouveau Front Populaire":2.0},[13]],["SNC JOUBERT 32",1.0,{"Horizons & Indépendants":1.0},[10]],["SNC NIEL A 5",1.0,{"Horizons & Indépendants":1.0},[10]],["SNC RIVOLI B 44",1.0,{"Horizons & Indépendants":1.0},[10]],["SNC DROUOT M 55",1.0,{"Horizons & Indépendants":1.0},[10]],["SNC RIVOLI B 86",1.0,{"Horizons & Indépendants":1.0},[10]],["SNC TERNES I 8",1.0,{"Horizons & Indépendants":1.0},[10]],["SNC SALAZIE LOCATION 2140",1.0,{"Horizons & Indépendants":1.0},[10]],["HONU LOC 3",1.0,{"Horizons & Indépendants":1.0},[10]],["Vantiva",1.0,{"La France insoumise - Nouveau Front Populaire":1.0},[13]],["ATARI REGPT",1.0,{"Horizons & Indépendants":1.0},[25]],["CERNUNNOS CONSULTING",1.0,{"Socialistes et apparentés":1.0},[33]],["PIXIUM VISIO",1.0,{"Rassemblement National":1.0},[113]],["Casino-Guichard",1.0,{"Les Démocrates":1.0},[160]],["Rallye",1.0,{"Les Démocrates":1.0},[160]],["THE MASHERBRUM COMPANY",0,{"Union des droites pour la République":0},[3]],["Groupe Vial",0,{"La France insoumise - Nouveau Front Populaire":0},[13]],["GEM ENERGY SERVICES",0,{"Socialistes et apparentés":0},[19]],["SCP BRUNETTI",0,{"Union des droites pour la République":0},[23]],["snc tbjl",0,{"Les Démocrates":0},[46]],["BP&C",0,{"Horizons & Indépendants":0},[47]],["B2GE Conseil",0,{"Socialistes et apparentés":0},[59]],["CORVAISIER",0,{"Union des droites pour la République":0},[63]],["Persigny Conseil",0,{"Rassemblement National":0},[77]],["selarf suchet",0,{"Droite Républicaine":0},[96]],["SAS COPERA N",0,{"Ensemble pour la République":0},[175]],["SARL DREAM TAHITI 2018",0,{"Ensemble pour la République":0},[175]],["SARL ARCHIPEL 2018",0,{"Ensemble pour la République":0},[175]],["SARL DREAM TAHITI 2019",0,{"Ensemble pour la République":0},[175]],["SNC ISLA 250",0,{"Ensemble pour la République":0},[175]],["SNC ISLA 251",0,{"Ensemble pour la République":0},[175]],["SNC ISLA 252",0,{"Ensemble pour la République":0},[175]],["SARL STAR",0,{"Ensemble pour la République":0},[175]],["SAS SINTIPA 7",0,{"Ensemble pour la République":0},[175]],["je n ai pas de participations directes a l'excetion de quelques parts de client mutualiste à la bpo pour 170 euros",0,{"Non inscrit":0},[178]]],"picker":[[0,"plandelatoursas",27000000.0],[1,"maji",22000000.0],[2,"galilesas",11124000.0],[3,"arcmanagement",10357274.0],[4,"sctresoriere",7997023.0],[5,"riestersas",7302000.0],[6,"sasbonporteau",6692815.0],[7,"saveriuinvestissements",4730000.0],[8,"wendelparticipationsse",3832840.0],[9,"jpmja",3462420.0],[10,"sasulabastinde",2584441.0],[11,"foncieredelatour",2500000.0],[12,"fruticor",1841840.0],[13,"naegelensas",1800000.0],[114,"loreal",1647930.0],[15,"sasbihannic",1550000.0],[16,"spfplfirmin",1487220.0],[17,"vdmtechnologies",1140200.0],[18,"sarlluxinet",875000.0],[19,"selarlpharmaciebataille",847895.0],[20,"sarlchaixdecoration",600000.0],[21,"sarlbeach",584416.0],[22,"turboselfgroupe",475000.0],[23,"sarllepylone",400029.0],[24,"sarllesquatrecentsclous",370691.0],[25,"realimmo",360000.0],[26,"bouyguessa",356728.0],[27,"saveriuagri",295115.0],[28,"sasumaisonpradie",250000.0],[29,"cypriensportssas",250000.0],[30,"scaeglantine",209000.0],[31,"chateaudemontalsarl",207900.0],[32,"l2hmonnierconseil",201000.0],[33,"cynsarl",200000.0],[34,"axiomenotaires",200000.0],[35,"sarllepiccolo",194994.0],[36,"pisystemsautomation",192040.0],[37,"reflexionsdebatsperspectives&analyses",169158.0],[38,"4aengineering",163200.0],[221,"societegenerale",160299.0],[40,"peinta",152320.0],[41,"eurlligne42",150000.0],[42,"s2csudcourtageetconseil",150000.0],[43,"scpiprimovie",130559.0],[44,"laclaree",129390.0],[45,"scbodirose",118865.0],[46,"ecoledelarenovationenergetique",105672.0],[47,"selarlisaac-sibille",100000.0],[48,"sasrougeraisin",100000.0],[49,"palpatinesas",100000.0],[50,"coruscantsas",100000.0],[51,"sfpcollectivites",94050.0],[57,"creditmutuel",90635.0],[52,"selarlalegriaavocat",90000.0],[53,"phisas",82857.0],[54,"mediascop",75647.0],[55,"workforgoodvendredi",75000.0],[56,"airliquide",72612.0],[58,"selarllorrainedefense&conseil",68571.0],[59,"scpcharles",68000.0],[60,"selarldintornimesnilcharpail",65000.0],[61,"caissefederaledecreditmutuel",61222.0],[62,"bnpparibas",60807.0],[63,"scpschreck",60000.0],[64,"lefrancisque",59730.0],[65,"selarlpascalebordesavocate",54766.0],[302,"caissedepargne",50700.0],[67,"scpiprimopierre",50128.0],[68,"terrainservice",50020.0],[69,"parisfc",50000.0],[70,"m2c",50000.0],[71,"corumorigin",49050.0],[102,"creditagricole",48022.0],[72,"jumia",47233.0],[73,"absteme",40000.0],[74,"abscisseservices",40000.0],[75,"sacliniquecharcot",39000.0],[76,"safran",38794.0],[77,"vallourec",38695.0],[126,"totalenergies",38513.0],[78,"willo32inc.",37387.0],[79,"manusystems",36220.0],[80,"total",35229.0],[81,"viridien",34732.0],[82,"axa",34150.0],[83,"thales",33430.0],[84,"sectionpaloisesasp",32000.0],[85,"scpiepagnepierre",30258.0],[86,"sanofi",30184.0],[87,"incentiveagency",30100.0],[88,"open!",30000.0],[89,"lviavocatsassocies",30000.0],[90,"orange",27944.0],[92,"weid",27600.0],[93,"sarlpanonacleimmobilier",26357.0],[94,"coaching4.0",25730.0],[95,"banquefederativeducreditmutuel",22928.0],[96,"scoietegenerale",22665.0],[97,"danone",21373.0],[98,"21yield",21000.0],[99,"epargnepierre",20787.0],[100,"sgactionsus",20582.0],[101,"sasnch",20504.0],[103,"panem&circensesgroup",20140.0],[105,"cdmc",20000.0],[106,"laventa",20000.0],[107,"piervalsante25",20000.0],[108,"renault",19930.0],[109,"scpiperial",19881.0],[110,"corumxl",19410.0],[111,"eurovalys",18909.0],[112,"sgactionseuro",18621.0],[113,"engie",17527.0],[115,"scpiepargnefonciere",17367.0],[116,"sarlnewholdinglmb",17000.0],[117,"manustra",16520.0],[118,"slebrestleon",16520.0],[119,"stellantis",16299.0],[120,"lachaisefrancaise",15813.0],[122,"nanobiotix",15351.0],[123,"sasagrigaz",15000.0],[124,"cofimage36",15000.0],[125,"schneiderelectric",14926.0],[127,"soprasteriagroup",13896.0],[130,"totalenergie",13773.0],[128,"fermap-alu",13500.0],[129,"airfrance",13440.0],[131,"vinci",13174.0],[132,"eurazeo",12352.0],[184,"hermesintl",11918.0],[133,"allianz",11055.0],[134,"saintgobaincie",10904.0],[135,"schneiderelectricse",10901.0],[136,"sgactionsfrance",10239.0],[137,"sasekokleanondemand",10000.0],[138,"bnpi",10000.0],[139,"cofimage34",10000.0],[140,"cofimage35",10000.0],[141,"saintgobain",9829.0],[142,"amundiequilibreactionseuro",9622.0],[143,"amundi",9547.0],[144,"creditmutuelenseignantloirehaute-loire",9253.0],[145,"sarlpisteverte",9000.0],[146,"bred",9000.0],[148,"caissedepargne-sleaube",8940.0],[149,"totalenergiesse",8684.0],[150,"lvmh",8452.0],[151,"essilorluxottica",7864.0],[152,"airbus",7756.0],[153,"fdj",7683.0],[154,"koproduction",7650.0],[156,"conseilstrategiespubliquessarl",7500.0],[157,"bnp",7500.0],[158,"vivendi",7450.0],[159,"amundivaleurdurable",7268.0],[160,"legrand",7182.0],[161,"banquepopulaireaura",7088.0],[162,"abscissepartners",7000.0],[163,"amundiprudent",6986.0],[164,"airbusse",6950.0],[165,"pernodricard",6696.0],[166,"rubis",6665.0],[167,"sgactionsemergent",6536.0],[168,"mirovaactionseurodfcp",5876.0],[169,"chargeurs",5775.0],[170,"adp",5666.0],[171,"universalmusicgroup",5619.0],[172,"caregame",5600.0],[212,"biomerieux",5220.0],[173,"christiandior",5204.0],[174,"microsoft",5031.0],[175,"sici",5000.0],[176,"eforsa",5000.0],[177,"fumaisonoccitane",5000.0],[178,"fermap-gest",5000.0],[179,"francaisedesjeux",4884.0],[180,"kbcgroupesa",4608.0],[181,"hermesinternational",4514.0],[182,"cigale",4500.0],[183,"sgactionseurosmallcapp",4455.0],[185,"michelin",4115.0],[186,"sassaluterredhelios",4000.0],[187,"sassoleilvolonterre",4000.0],[188,"labelliferecords",3815.0],[189,"partouchegrouperegroupe",3790.0],[190,"arcelormittal",3777.0],[191,"bnpparisbas",3544.0],[192,"veoliaenvironnement",3418.0],[193,"sasrenaissance",3400.0],[194,"pernod-ricard",3358.0],[195,"apple",3349.0],[196,"sasdgfinvest",3250.0],[197,"bouygues",3248.0],[198,"alstomregroupt",3220.0],[199,"banquepopulaire",3088.0],[200,"unibailrodamco",3065.0],[201,"carrefour",3035.0],[202,"scaleaderinvestissements",3025.0],[203,"creditcooperatif",3000.0],[204,"earlbarthes",2918.0],[205,"kering",2845.0],[207,"haffnerenergy",2735.0],[208,"fnacdarty",2584.0],[209,"holdingsaintgatien",2509.0],[210,"erclla",2500.0],[211,"arctraiteur",2500.0],[213,"osmosun",2395.0],[214,"nexity",2218.0],[215,"scmontdarbois",2140.0],[216,"fonciereterredeliens",2100.0],[217,"arkema",2092.0],[218,"continental",2053.0],[219,"caribbeanmasksenvironment",2000.0],[220,"sarlconde",2000.0],[222,"alstom",1971.0],[223,"neoen",1937.0],[224,"capgemini",1911.0],[225,"corridorlabsasdarchitecture",1900.0],[226,"schneider",1811.0],[227,"sgliquiditespea",1715.0],[228,"appliedmaterials",1645.0],[229,"costcowholesale",1587.0],[230,"eiffageenergie",1520.0],[231,"sasinitiativeforet",1500.0],[232,"caexisformation",1500.0],[233,"sarleconomieetconstruction",1500.0],[234,"amazon",1472.0],[235,"novonordisk",1370.0],[236,"quadient",1321.0],[237,"advancedmicrodevices",1292.0],[238,"veolia",1291.0],[239,"tf1",1233.0],[240,"stmicroelectronics",1225.0],[241,"avironbayonnaissasp",1200.0],[242,"utz",1200.0],[243,"frenesiusmedicalcare",1125.0],[244,"s.a.sfcchamblyoise",1000.0],[245,"eurlfinancierebd",1000.0],[246,"scpmarielouise",1000.0],[247,"selarl",1000.0],[248,"cooperativecapeco",1000.0],[249,"ledrims",1000.0],[250,"sarl2fch",1000.0],[251,"energiequitable",1000.0],[252,"scicdurapiquin",1000.0],[253,"eilis",1000.0],[254,"twelveinternational",1000.0],[255,"sasasinaria",1000.0],[256,"unionsportivebressanepaysdelainrugby",1000.0],[257,"meta",985.0],[258,"ubertechnologies",980.0],[259,"amundieuropemonde(d)fcp3d",907.0],[260,"atoutverthorizon3dec",861.0],[261,"sarlmarquisesrockconstruction",855.0],[262,"bdr",800.0],[263,"synapsefinances",790.0],[264,"stmicroelectonics",772.0],[265,"associedansuneselarldavocats",770.0],[266,"edf",767.0],[267,"sarllarapugue",750.0],[268,"aeroportsdeparis",729.0],[269,"nexan",721.0],[270,"taiwansemiconductormanufacturing",704.0],[271,"alphabetinc",704.0],[272,"step",680.0],[273,"labelemmaus",600.0],[275,"worldline",567.0],[276,"spotify",562.0],[277,"h&k",555.0],[278,"centredeconseilenconstruction",510.0],[279,"scicturbullance",500.0],[280,"angevinedeconstruction",500.0],[281,"sarlchrijunotin",500.0],[282,"sciccombraillesdurables",500.0],[283,"sassniper",500.0],[284,"labelifeeventssas",500.0],[285,"vergnet",472.0],[286,"puma",459.0],[287,"constellationenergycorporation",405.0],[288,"bafacool",400.0],[289,"saskkia",400.0],[290,"distribuidorintlalimentacion",396.0],[291,"scicainitiativespouruneeconomiesolidaire(i.e.s)",380.0],[292,"nokia",378.0],[293,"opmibility",374.0],[294,"uti",360.0],[295,"eurotunnel",357.0],[296,"selarlpharmaciejenner",351.0],[297,"soitec",348.0],[298,"dassaultaviation",342.0],[299,"sarlhiriani",335.0],[300,"kalray",306.0],[301,"malobrochettes",300.0],[303,"icimarseille",300.0],[304,"sarlmenage",300.0],[305,"pierreetvacances",269.0],[306,"mybiotech",262.0],[307,"sashdkl",250.0],[308,"scopoxalis",240.0],[309,"bnppind.amnordcl.hfcpdec",231.0],[310,"caisselocale-creditagricole",229.0],[311,"bic",222.0],[312,"korianse",214.0],[313,"carbios",208.0],[314,"amundilabeltresorerie",208.0],[315,"exxonmobil",206.0],[316,"biouv",201.0],[317,"artisanales",200.0],[318,"publicis",196.0],[319,"wastemanagement",194.0],[320,"equinoxgold",182.0],[321,"editionsducroquant",180.0],[322,"crcatouraine-poitou",173.0],[323,"partssocietairescreditagricolevolontaire",158.0],[324,"geogroup",153.0],[325,"academiethucydide",150.0],[326,"bollore",146.0],[327,"kenvue",130.0],[328,"microntechnology",125.0],[329,"firstenergy",107.0],[330,"scpcapdevielle",100.0],[331,"sarlles3g",100.0],[332,"scicboisenergie41",100.0],[333,"sarlpoc",100.0],[334,"enercoop",100.0],[335,"enargia",100.0],[336,"relaxgrill",100.0],[337,"jacquet-metalservices",92.0],[338,"wagaenergy",85.0],[339,"saschaizeenvironnement",77.0],[340,"teleperformance",70.0],[341,"cm-amdynamiqueeurope",56.0],[342,"sciccentralesvillageoisesdupaysdusaintois",50.0],[343,"cfie",50.0],[344,"bpce",50.0],[345,"vmk",47.0],[346,"lucibelact",47.0],[347,"gsreseaux",45.0],[348,"cvrenergy",44.0],[349,"tocquevillemegatrendsisrc",39.0],[350,"forvia",33.0],[351,"samont-blanc",32.0],[352,"spilersas",30.0],[353,"orpea",29.0],[354,"partssocietairescreditagricoleengagement",20.0],[355,"glevents",19.0],[356,"sisaauthumesante",15.0],[357,"navya",14.0],[358,"atari",11.0],[359,"dontnod",11.0],[360,"deinove",10.0],[361,"asinaconseil",10.0],[362,"eutelsatcommunications",8.0],[363,"euroapi",7.0],[364,"saschaize",6.0],[365,"nicox",2.0],[366,"sncjoubert32",1.0],[367,"sncniela5",1.0],[368,"sncrivolib44",1.0],[369,"sncdrouotm55",1.0],[370,"sncrivolib86",1.0],[371,"sncternesi8",1.0],[372,"sncsalazielocation2140",1.0],[373,"honuloc3",1.0],[374,"vantiva",1.0],[375,"atariregpt",1.0],[376,"cernunnosconsulting",1.0],[377,"pixiumvisio",1.0],[378,"casino-guichard",1.0],[379,"rallye",1.0],[380,"themasherbrumcompany",0],[381,"groupevial",0],[382,"gemenergyservices",0],[383,"scpbrunetti",0],[384,"snctbjl",0],[385,"bp&c",0],[386,"b2geconseil",0],[387,"corvaisier",0],[388,"persignyconseil",0],[389,"selarfsuchet",0],[390,"sascoperan",0],[391,"sarldreamtahiti2018",0],[392,"sarlarchipel2018",0],[393,"sarldreamtahiti2019",0],[394,"sncisla250",0],[395,"sncisla251",0],[396,"sncisla252",0],[397,"sarlstar",0],[398,"sassintipa7",0],[399,"jenaipasdeparticipationsdirectesalexcetiondequelquespartsdeclientmutualistealabpopour170euros",0]],"sunburst":[[0,0,1,[],1],[1,1922698.0,23,[[16,1487220.0],[83,31330.0],[62,26318.0],[86,18324.0],[114,17430.0],[102,14475.0],[82,13520.0],[76,13487.0],[132,12352.0],[108,11195.0],[131,11015.0],[119,10879.0]],3],[2,29670.0,1,[],1],[3,237903.0,9,[[38,163200.0],[92,27600.0],[94,25730.0],[98,21000.0],[306,262.0],[340,70.0],[129,30.0],[358,11.0]],0],[4,1000.0,1,[],1],[5,19200.0,2,[[56,18200.0],[244,1000.0]],0],[6,9000.0,1,[[145,9000.0]],0],[7,10000.0,1,[[137,10000.0]],0],[8,5000.0,1,[],1],[9,61197.0,1,[],1],[10,8.0,8,[[366,1.0],[367,1.0],[368,1.0],[369,1.0],[370,1.0],[371,1.0],[372,1.0],[373,1.0]],0],[11,515.0,3,[[278,510.0]],2],[12,180.0,1,[[321,180.0]],0],[13,3.0,3,[[365,2.0],[374,1.0]],0],[14,229.0,1,[[310,229.0]],0],[15,250000.0,1,[[28,250000.0]],0],[16,1682.0,2,[[108,902.0]],1],[17,15813.0,1,[[120,15813.0]],0],[18,2000.0,1,[[219,2000.0]],0],[19,13663.0,3,[],2],[20,19897.0,3,[[245,1000.0]],2],[21,250.0,1,[],1],[22,8000.0,2,[[186,4000.0],[187,4000.0]],0],[23,794000.0,9,[[20,600000.0],[59,68000.0],[175,5000.0],[246,1000.0]],4],[24,40000.0,1,[[73,40000.0]],0],[25,227.0,2,[[90,226.0],[375,1.0]],0],[26,318865.0,3,[[41,150000.0],[45,118865.0],[69,50000.0]],0],[27,84150.0,4,[[61,61222.0],[95,12246.0],[95,5556.0],[95,5126.0]],0],[28,337602.0,1,[],1],[29,47.0,1,[[345,47.0]],0],[30,74414.0,1,[],1],[31,400000.0,1,[],1],[32,1000.0,1,[[247,1000.0]],0],[33,1.0,1,[[376,1.0]],0],[34,27281.0,4,[[123,15000.0],[207,2735.0],[231,1500.0]],1],[35,221.0,2,[],2],[36,240.0,1,[[308,240.0]],0],[37,297023.0,4,[[60,65000.0]],3],[38,60130.0,2,[[64,59730.0]],1],[39,47091.0,1,[],1],[40,1380.0,2,[[248,1000.0],[291,380.0]],0],[41,65000.0,2,[],2],[42,30000.0,1,[[88,30000.0]],0],[43,346.0,2,[[313,208.0],[185,138.0]],0],[44,2918.0,1,[[204,2918.0]],0],[45,1800030.0,2,[[13,1800000.0],[352,30.0]],0],[46,1739803.0,12,[[21,584416.0],[116,17000.0],[129,12622.0],[76,4052.0],[213,2395.0],[129,747.0]],5],[47,0,2,[],1],[48,475000.0,1,[[22,475000.0]],0],[49,220130.0,4,[[330,100.0]],3],[50,2813.0,2,[[218,2053.0],[185,760.0]],0],[51,437500.0,6,[[47,100000.0],[75,39000.0]],4],[52,600000.0,1,[],1],[53,160240.0,3,[],3],[54,23090.0,9,[[176,5000.0],[177,5000.0],[259,907.0],[260,861.0],[108,211.0],[323,158.0],[113,124.0],[354,20.0]],1],[55,1300.0,2,[[249,1000.0],[301,300.0]],0],[56,20000.0,1,[[105,20000.0]],0],[57,147115.0,7,[[182,4500.0],[279,500.0],[342,50.0]],4],[58,245.0,1,[],1],[59,50000.0,2,[[70,50000.0]],0],[60,1920.0,1,[[82,1920.0]],0],[61,4165.0,2,[[193,3400.0]],1],[62,905023.0,5,[[23,400029.0],[35,194994.0]],3],[63,12661300.0,7,[[2,11124000.0],[17,1140200.0],[36,192040.0],[40,152320.0],[79,36220.0],[117,16520.0]],0],[64,2000.0,1,[[220,2000.0]],0],[65,9000.0,1,[[146,9000.0]],0],[66,100000.0,1,[[48,100000.0]],0],[67,97500.0,1,[],1],[68,9732800.0,11,[[5,7302000.0]],10],[69,169158.0,1,[[37,169158.0]],0],[70,327055.0,2,[],2],[71,96500.0,8,[[51,94050.0],[232,1500.0],[280,500.0],[331,100.0]],4],[72,14575.0,6,[[184,4280.0],[174,4172.0],[195,2359.0],[229,1587.0],[150,1427.0],[267,750.0]],0],[73,7027455.0,4,[[7,4730000.0],[12,1841840.0],[27,295115.0]],1],[74,370691.0,1,[[24,370691.0]],0],[75,20000.0,1,[[106,20000.0]],0],[76,24283.0,5,[[133,9365.0],[56,6292.0],[82,3403.0],[152,2742.0],[212,2481.0]],0],[77,80020.0,3,[[68,50020.0],[89,30000.0]],0],[78,567109.0,2,[],2],[79,130000.0,1,[],1],[80,19837.0,3,[],3],[81,550.0,2,[[281,500.0],[343,50.0]],0],[82,69866.0,12,[[14,29247.0],[118,16520.0],[149,8684.0],[168,5876.0],[86,2859.0],[205,2845.0],[236,1321.0],[113,756.0],[268,729.0],[275,567.0],[286,459.0],[363,3.0]],0],[83,24500000.0,2,[[1,22000000.0],[11,2500000.0]],0],[84,150.0,1,[[325,150.0]],0],[85,83153.0,1,[],1],[86,11525012.0,4,[[4,7997023.0],[9,3462420.0],[209,2509.0]],1],[87,91.0,1,[[102,91.0]],0],[88,1000.0,1,[[250,1000.0]],0],[89,145612.0,1,[],1],[90,331717.0,3,[[52,90000.0]],2],[91,80.0,1,[[199,80.0]],0],[92,29011.0,1,[[57,29011.0]],0],[93,119900.0,1,[],1],[94,18643.0,4,[[122,15351.0],[76,2820.0],[285,472.0]],1],[95,500.0,1,[],1],[96,1522000.0,5,[[74,40000.0],[162,7000.0]],2],[97,9253.0,1,[[144,9253.0]],0],[98,165263.0,21,[[80,35229.0],[56,26153.0],[97,21140.0],[76,17212.0],[62,12859.0],[134,10904.0],[164,6950.0],[82,5113.0],[108,5010.0],[102,4618.0],[86,3273.0],[190,3244.0]],0],[99,21933.0,8,[[130,13175.0],[108,2568.0],[185,1523.0],[201,1410.0],[102,1075.0],[239,1041.0],[266,767.0],[293,374.0]],0],[100,1550000.0,1,[[15,1550000.0]],0],[101,184225.0,5,[[84,32000.0],[202,3025.0],[241,1200.0]],2],[102,847895.0,1,[[19,847895.0]],0],[103,21000.0,3,[[104,20000.0]],2],[104,1500.0,2,[[251,1000.0]],1],[105,62126.0,1,[],1],[106,1520.0,1,[[230,1520.0]],0],[107,932.0,3,[[274,598.0],[222,172.0],[56,162.0]],0],[108,718644.0,4,[[26,356728.0],[44,129390.0],[222,548.0]],1],[109,360010.0,2,[[25,360000.0],[360,10.0]],0],[110,0,1,[],1],[111,153502.0,5,[],5],[112,0,1,[],1],[113,21049.0,16,[[148,8940.0],[56,2279.0],[62,297.0],[192,110.0],[338,85.0],[102,65.0],[82,64.0],[197,62.0],[108,44.0],[349,39.0],[201,27.0],[355,19.0]],2],[114,4567383.0,12,[[8,3832840.0],[135,10901.0],[151,7864.0],[141,7616.0],[160,7182.0],[14,6488.0],[56,5759.0],[180,4608.0],[181,4514.0],[194,3358.0],[309,231.0]],1],[115,10000.0,1,[[138,10000.0]],0],[116,139910.0,3,[[101,20504.0]],2],[117,680.0,1,[[272,680.0]],0],[118,209000.0,2,[[30,209000.0]],1],[119,3008.0,1,[[199,3008.0]],0],[120,250.0,2,[],2],[121,11273.0,3,[[356,15.0]],2],[122,1900.0,1,[[225,1900.0]],0],[123,1500.0,1,[[233,1500.0]],0],[124,14.0,1,[[357,14.0]],0],[125,8750.0,2,[[154,7650.0]],1],[126,60000.0,1,[],1],[127,136368.0,4,[[243,1125.0],[312,214.0],[353,29.0]],1],[128,53518.0,15,[[56,8361.0],[158,7450.0],[171,5619.0],[173,5204.0],[152,4878.0],[125,4502.0],[189,3790.0],[86,3681.0],[198,3220.0],[206,2739.0],[113,2115.0],[217,1632.0]],0],[129,0,1,[],1],[130,9000.0,2,[[156,7500.0]],1],[131,19881.0,1,[[109,19881.0]],0],[132,4901.0,2,[[179,4884.0]],1],[133,126390.0,1,[],1],[134,250.0,1,[[307,250.0]],0],[135,10359186.0,3,[[3,10357274.0],[302,300.0]],1],[136,23000.0,2,[],2],[137,24674.0,1,[],1],[138,52375.0,13,[[223,1937.0],[170,1407.0],[252,1000.0],[238,888.0],[91,748.0],[113,741.0],[316,201.0],[300,165.0],[332,100.0],[346,47.0],[91,40.0],[359,11.0]],1],[139,70000.0,1,[],1],[140,3000.0,1,[[203,3000.0]],0],[141,20000.0,1,[],1],[142,900.0,2,[[273,600.0],[303,300.0]],0],[143,5600.0,1,[[172,5600.0]],0],[144,65000.0,1,[],1],[145,69900.0,2,[],2],[146,616800.0,1,[],1],[147,240.0,2,[[91,140.0]],1],[148,208.0,1,[[314,208.0]],0],[149,169959.0,38,[[43,100079.0],[67,50128.0],[228,1645.0],[234,1472.0],[56,1458.0],[222,1234.0],[76,1223.0],[257,985.0],[125,911.0],[174,859.0],[119,771.0],[83,767.0]],0],[150,161905.0,4,[[43,30480.0],[85,30258.0],[115,17367.0]],1],[151,50400.0,1,[[66,50400.0]],0],[152,1780.0,1,[[90,1780.0]],0],[153,780.0,1,[],1],[154,855.0,1,[[261,855.0]],0],[155,200.0,1,[[317,200.0]],0],[156,10200.0,1,[],1],[157,2600.0,2,[[216,2100.0],[282,500.0]],0],[158,44054.0,12,[[161,7088.0],[126,4935.0],[153,3953.0],[119,3900.0],[200,3065.0],[62,2823.0],[141,2213.0],[201,1598.0],[86,1386.0],[350,33.0]],2],[159,200800.0,2,[[33,200000.0],[262,800.0]],0],[160,179227.0,10,[[121,762.0],[197,189.0],[82,174.0],[322,173.0],[337,92.0],[378,1.0],[379,1.0]],3],[161,402514.0,1,[],1],[162,913.0,2,[[299,335.0]],1],[163,2140.0,1,[[215,2140.0]],0],[164,83.0,2,[[339,77.0],[364,6.0]],0],[165,368164.0,4,[],4],[166,7762994.0,40,[[6,6692815.0],[42,150000.0],[90,18708.0],[62,10767.0],[166,6665.0],[169,5775.0],[196,3250.0],[82,2522.0],[113,2501.0],[214,2218.0],[131,2159.0],[133,1690.0]],9],[167,404766.0,3,[[65,54766.0]],2],[168,97885.0,1,[],1],[169,19000.0,3,[[128,13500.0],[178,5000.0]],1],[170,95839.0,1,[],1],[171,28771.0,1,[],1],[172,70150.0,2,[],2],[173,41594.0,1,[[57,41594.0]],0],[174,400.0,2,[[288,400.0]],1],[175,47233.0,10,[[72,47233.0]],0],[176,236.0,3,[[334,100.0],[335,100.0]],1],[177,549970.0,2,[],2],[178,0,1,[],0],[179,112539.0,5,[[157,7500.0],[113,6694.0],[170,3304.0],[129,41.0]],1],[180,64435.0,10,[[100,19283.0],[112,18621.0],[136,10239.0],[167,6536.0],[183,4455.0],[227,1715.0],[100,1299.0],[237,1292.0],[258,980.0]],1],[181,4087.0,2,[[153,3730.0],[295,357.0]],0],[182,288700.0,10,[[63,60000.0],[283,500.0]],8],[183,153283.0,4,[[78,34200.0],[103,20140.0],[78,3187.0]],1],[184,2584465.0,3,[[10,2584441.0],[104,15.0]],1],[185,1000.0,1,[[253,1000.0]],0],[186,15.0,1,[[57,15.0]],0],[187,162112.0,2,[[39,157111.0]],1],[188,790.0,1,[[263,790.0]],0],[189,219.0,1,[[91,219.0]],0],[190,1800.0,2,[],2],[191,50.0,1,[[344,50.0]],0],[192,127095.0,9,[[121,14610.0],[62,7743.0],[150,2014.0],[226,1811.0],[235,1370.0],[82,1315.0],[264,772.0],[217,460.0]],1],[193,45.0,1,[[347,45.0]],0],[194,9000.0,1,[],1],[195,1500.0,1,[],1],[196,0,1,[],1],[197,109552.0,1,[],1],[198,203997.0,3,[[34,200000.0],[197,2997.0],[254,1000.0]],0],[199,76647.0,2,[[54,75647.0]],1],[200,210830.0,2,[[53,82857.0]],1],[201,276357.0,2,[[93,26357.0]],1],[202,4805.0,3,[[188,3815.0],[284,500.0]],1],[203,-2623.0,7,[[142,9622.0],[159,7268.0],[163,6986.0],[210,2500.0]],3],[204,35000.0,3,[[124,15000.0],[139,10000.0],[140,10000.0]],0],[205,88770.0,2,[[265,770.0]],1],[206,78821.0,3,[[58,68571.0]],2],[207,8500.0,4,[[211,2500.0],[289,400.0]],2],[208,27832900.0,6,[[0,27000000.0],[31,207900.0],[49,100000.0],[50,100000.0],[55,75000.0]],1],[209,326000.0,2,[[32,201000.0]],1],[210,114960.0,3,[],3],[211,98044.0,2,[],2],[212,30100.0,1,[[87,30100.0]],0],[213,105672.0,1,[[46,105672.0]],0],[214,885000.0,2,[[18,875000.0]],1],[215,402793.0,3,[[255,1000.0],[361,10.0]],1],[216,300.0,1,[[304,300.0]],0],[217,56297.0,2,[],2],[218,91637.0,4,[[81,34732.0],[77,34220.0],[96,22665.0],[90,20.0]],0],[219,121.0,1,[],1],[220,3542.0,1,[],1],[221,105537.0,6,[],6],[222,250000.0,1,[[29,250000.0]],0],[223,790344.0,4,[[242,1200.0],[294,360.0],[336,100.0]],1],[224,1655952.0,9,[[14,1594362.0],[91,14130.0],[127,13896.0],[147,8979.0],[155,7638.0],[82,5863.0],[113,3868.0],[150,3672.0],[191,3544.0]],0],[225,1000.0,1,[[256,1000.0]],0],[226,12453.0,2,[[91,12421.0],[351,32.0]],0],[227,177656.0,6,[[71,49050.0],[99,20787.0],[107,20000.0],[110,19410.0],[111,18909.0]],1]],"sankey":[[1,[[16,1487220.0],[296,351.0],[82,13520.0],[62,26318.0],[102,14475.0],[132,12352.0],[208,2584.0],[114,17430.0],[90,5242.0],[165,5660.0],[76,13487.0],[86,18324.0],[125,9513.0],[83,31330.0],[126,8167.0],[131,11015.0],[143,9547.0],[119,10879.0],[77,4475.0],[108,11195.0]]],[3,[[38,163200.0],[306,262.0],[94,25730.0],[92,27600.0],[98,21000.0],[340,70.0],[129,30.0],[358,11.0]]],[5,[[56,18200.0],[244,1000.0]]],[6,[[145,9000.0]]],[7,[[137,10000.0]]],[10,[[366,1.0],[367,1.0],[368,1.0],[369,1.0],[370,1.0],[371,1.0],[372,1.0],[373,1.0]]],[11,[[278,510.0]]],[12,[[321,180.0]]],[13,[[365,2.0],[374,1.0]]],[14,[[310,229.0]]],[15,[[28,250000.0]]],[16,[[108,902.0]]],[17,[[120,15813.0]]],[18,[[219,2000.0]]],[20,[[245,1000.0]]],[22,[[186,4000.0],[187,4000.0]]],[23,[[246,1000.0],[59,68000.0],[175,5000.0],[20,600000.0]]],[24,[[73,40000.0]]],[25,[[90,226.0],[375,1.0]]],[26,[[69,50000.0],[41,150000.0],[45,118865.0]]],[27,[[95,22928.0],[61,61222.0]]],[29,[[345,47.0]]],[32,[[247,1000.0]]],[33,[[376,1.0]]],[34,[[231,1500.0],[123,15000.0],[207,2735.0]]],[36,[[308,240.0]]],[37,[[60,65000.0]]],[38,[[64,59730.0]]],[40,[[248,1000.0],[291,380.0]]],[42,[[88,30000.0]]],[43,[[185,138.0],[313,208.0]]],[44,[[204,2918.0]]],[45,[[13,1800000.0],[352,30.0]]],[46,[[21,584416.0],[116,17000.0],[129,13369.0],[213,2395.0],[76,4052.0]]],[48,[[22,475000.0]]],[49,[[330,100.0]]],[50,[[185,760.0],[218,2053.0]]],[51,[[47,100000.0],[75,39000.0]]],[54,[[176,5000.0],[177,5000.0],[108,211.0],[113,124.0],[259,907.0],[260,861.0],[354,20.0],[323,158.0]]],[55,[[249,1000.0],[301,300.0]]],[56,[[105,20000.0]]],[57,[[342,50.0],[279,500.0],[182,4500.0]]],[59,[[70,50000.0]]],[60,[[82,1920.0]]],[61,[[193,3400.0]]],[62,[[23,400029.0],[35,194994.0]]],[63,[[2,11124000.0],[17,1140200.0],[117,16520.0],[79,36220.0],[36,192040.0],[40,152320.0]]],[64,[[220,2000.0]]],[65,[[146,9000.0]]],[66,[[48,100000.0]]],[68,[[5,7302000.0]]],[69,[[37,169158.0]]],[71,[[51,94050.0],[232,1500.0],[331,100.0],[280,500.0]]],[72,[[267,750.0],[174,4172.0],[229,1587.0],[195,2359.0],[150,1427.0],[184,4280.0]]],[73,[[7,4730000.0],[12,1841840.0],[27,295115.0]]],[74,[[24,370691.0]]],[75,[[106,20000.0]]],[76,[[56,6292.0],[152,2742.0],[133,9365.0],[82,3403.0],[212,2481.0]]],[77,[[89,30000.0],[68,50020.0]]],[81,[[281,500.0],[343,50.0]]],[82,[[268,729.0],[113,756.0],[363,3.0],[205,2845.0],[14,29247.0],[286,459.0],[236,1321.0],[86,2859.0],[118,16520.0],[149,8684.0],[275,567.0],[168,5876.0]]],[83,[[1,22000000.0],[11,2500000.0]]],[84,[[325,150.0]]],[86,[[9,3462420.0],[4,7997023.0],[209,2509.0]]],[87,[[102,91.0]]],[88,[[250,1000.0]]],[90,[[52,90000.0]]],[91,[[199,80.0]]],[92,[[57,29011.0]]],[94,[[76,2820.0],[122,15351.0],[285,472.0]]],[96,[[74,40000.0],[162,7000.0]]],[97,[[144,9253.0]]],[98,[[102,4618.0],[76,17212.0],[56,29258.0],[80,35229.0],[86,3273.0],[82,5113.0],[97,21140.0],[192,2712.0],[134,10904.0],[224,1911.0],[221,1988.0],[62,12859.0],[108,5010.0],[90,1779.0],[113,728.0],[170,955.0],[164,6950.0],[292,378.0],[190,3244.0],[363,2.0]]],[99,[[130,13175.0],[108,2568.0],[185,1523.0],[239,1041.0],[266,767.0],[102,1075.0],[201,1410.0],[293,374.0]]],[100,[[15,1550000.0]]],[101,[[202,3025.0],[84,32000.0],[241,1200.0]]],[102,[[19,847895.0]]],[103,[[104,20000.0]]],[104,[[251,1000.0]]],[106,[[230,1520.0]]],[107,[[56,162.0],[222,172.0],[274,598.0]]],[108,[[44,129390.0],[222,548.0],[26,356728.0]]],[109,[[25,360000.0],[360,10.0]]],[113,[[56,2279.0],[222,17.0],[82,64.0],[62,297.0],[197,62.0],[201,27.0],[102,65.0],[355,19.0],[377,1.0],[108,44.0],[349,39.0],[192,110.0],[338,85.0],[148,8940.0]]],[114,[[8,3832840.0],[56,5759.0],[151,7864.0],[181,4514.0],[14,6488.0],[160,7182.0],[194,3358.0],[141,7616.0],[135,10901.0],[180,4608.0],[309,231.0]]],[115,[[138,10000.0]]],[116,[[101,20504.0]]],[117,[[272,680.0]]],[118,[[30,209000.0]]],[119,[[199,3008.0]]],[121,[[356,15.0]]],[122,[[225,1900.0]]],[123,[[233,1500.0]]],[124,[[357,14.0]]],[125,[[154,7650.0]]],[127,[[243,1125.0],[312,214.0],[353,29.0]]],[128,[[56,8361.0],[86,3681.0],[125,4502.0],[158,7450.0],[173,5204.0],[113,2115.0],[198,3220.0],[217,1632.0],[341,56.0],[189,3790.0],[206,2739.0],[363,2.0],[152,4878.0],[171,5619.0],[305,269.0]]],[130,[[156,7500.0]]],[131,[[109,19881.0]]],[132,[[179,4884.0]]],[134,[[307,250.0]]],[135,[[3,10357274.0],[302,300.0]]],[138,[[332,100.0],[170,1407.0],[91,788.0],[113,741.0],[238,888.0],[316,201.0],[359,11.0],[300,165.0],[346,47.0],[223,1937.0],[252,1000.0]]],[140,[[203,3000.0]]],[142,[[273,600.0],[303,300.0]]],[143,[[172,5600.0]]],[147,[[91,140.0]]],[148,[[314,208.0]]],[149,[[56,1458.0],[222,1234.0],[76,1223.0],[125,911.0],[119,771.0],[83,767.0],[269,721.0],[86,661.0],[240,510.0],[238,403.0],[14,403.0],[297,348.0],[298,342.0],[185,276.0],[82,256.0],[97,233.0],[311,222.0],[318,196.0],[239,192.0],[90,189.0],[300,141.0],[270,704.0],[271,704.0],[234,1472.0],[228,1645.0],[287,405.0],[348,44.0],[315,206.0],[329,107.0],[324,153.0],[327,130.0],[257,985.0],[328,125.0],[174,859.0],[276,562.0],[319,194.0],[43,100079.0],[67,50128.0]]],[150,[[85,30258.0],[115,17367.0],[43,30480.0]]],[151,[[66,50400.0]]],[152,[[90,1780.0]]],[154,[[261,855.0]]],[155,[[317,200.0]]],[157,[[282,500.0],[216,2100.0]]],[158,[[62,2823.0],[86,1386.0],[126,4935.0],[200,3065.0],[161,7088.0],[201,1598.0],[350,33.0],[153,3953.0],[141,2213.0],[119,3900.0]]],[159,[[33,200000.0],[262,800.0]]],[160,[[82,174.0],[197,189.0],[378,1.0],[337,92.0],[379,1.0],[121,762.0],[322,173.0]]],[162,[[299,335.0]]],[163,[[215,2140.0]]],[164,[[339,77.0],[364,6.0]]],[166,[[56,843.0],[152,136.0],[133,1690.0],[190,533.0],[82,2522.0],[62,10767.0],[326,146.0],[169,5775.0],[290,396.0],[113,2501.0],[362,8.0],[277,555.0],[150,1339.0],[185,1418.0],[214,2218.0],[90,18708.0],[165,1036.0],[166,6665.0],[39,1200.0],[119,749.0],[240,715.0],[83,1333.0],[126,1060.0],[192,596.0],[131,2159.0],[195,990.0],[320,182.0],[196,3250.0],[6,6692815.0],[42,150000.0],[333,100.0]]],[167,[[65,54766.0]]],[169,[[178,5000.0],[128,13500.0]]],[173,[[57,41594.0]]],[174,[[288,400.0]]],[175,[[72,47233.0]]],[176,[[334,100.0],[335,100.0]]],[179,[[157,7500.0],[113,6694.0],[170,3304.0],[129,41.0]]],[180,[[112,18621.0],[183,4455.0],[136,10239.0],[227,1715.0],[167,6536.0],[100,20582.0],[237,1292.0],[258,980.0]]],[181,[[295,357.0],[153,3730.0]]],[182,[[283,500.0],[63,60000.0]]],[183,[[78,37387.0],[103,20140.0]]],[184,[[10,2584441.0],[104,15.0]]],[185,[[253,1000.0]]],[186,[[57,15.0]]],[187,[[39,157111.0]]],[188,[[263,790.0]]],[189,[[91,219.0]]],[191,[[344,50.0]]],[192,[[150,2014.0],[226,1811.0],[82,1315.0],[217,460.0],[62,7743.0],[121,14610.0],[235,1370.0],[264,772.0]]],[193,[[347,45.0]]],[198,[[197,2997.0],[34,200000.0],[254,1000.0]]],[199,[[54,75647.0]]],[200,[[53,82857.0]]],[201,[[93,26357.0]]],[202,[[284,500.0],[188,3815.0]]],[203,[[163,6986.0],[159,7268.0],[142,9622.0],[210,2500.0]]],[204,[[139,10000.0],[124,15000.0],[140,10000.0]]],[205,[[265,770.0]]],[206,[[58,68571.0]]],[207,[[211,2500.0],[289,400.0]]],[208,[[49,100000.0],[50,100000.0],[0,27000000.0],[31,207900.0],[55,75000.0]]],[209,[[32,201000.0]]],[212,[[87,30100.0]]],[213,[[46,105672.0]]],[214,[[18,875000.0]]],[215,[[361,10.0],[255,1000.0]]],[216,[[304,300.0]]],[218,[[81,34732.0],[90,20.0],[77,34220.0],[96,22665.0]]],[222,[[29,250000.0]]],[223,[[336,100.0],[294,360.0],[242,1200.0]]],[224,[[14,1594362.0],[127,13896.0],[91,14130.0],[147,8979.0],[82,5863.0],[150,3672.0],[155,7638.0],[191,3544.0],[113,3868.0]]],[225,[[256,1000.0]]],[226,[[91,12421.0],[351,32.0]]],[227,[[99,20787.0],[110,19410.0],[107,20000.0],[111,18909.0],[71,49050.0]]]]};
@@ -0,0 +1,2 @@
+/* AUTO-GENERATED — do not edit manually, run fetch_data.py instead */
+window.HATVP_DATA_SENATEURS_AGG={"n":337,"kpis":{"membres":337,"valeur":89931171.0,"moyenne":266858.0741839763,"mediane":30000.0},"groupes":[{"groupe":"Les Républicains","total":270,"valeur":70999786.0,"deputes":125,"avecPart":60,"valeurs":[2500.0,95065.0,3576328.0,42000.0,1437628.0,376000.0,10000.0,108248.0,26430.0,762.0,240000.0,1510000.0,2048.0,3648895.0,5136.0,155496.0,15100.0,216047.0,1500.0,5379076.0,1178028.0,2000.0,42569.0,957250.0,1292698.0,36089200.0,285640.0,250.0,23134.0,533500.0,712448.0,0,1326140.0,0,0,500.0,2865000.0,847019.0,164762.0,57944.0,113318.0,6236.0,6000.0,4000000.0,104725.0,4720.0,3468.0,92000.0,256539.0,540000.0,30000.0,500.0,300.0,144000.0,367.0,1312772.0,280000.0,7500.0,591000.0,280000.0],"couleur":"#004494","mediane":106486.5,"pctAvecPart":48.0},{"groupe":"Les Indépendants - République et Territoires","total":39,"valeur":11791358.0,"deputes":19,"avecPart":9,"valeurs":[385000.0,1.0,91196.0,10343526.0,20.0,378973.0,106.0,142536.0,450000.0],"couleur":"#8B4CC8","mediane":142536.0,"pctAvecPart":47.36842105263158},{"groupe":"Union Centriste","total":69,"valeur":5342202.0,"deputes":58,"avecPart":19,"valeurs":[926122.0,75.0,80000.0,1000.0,561801.0,100557.0,62100.0,160000.0,0,12000.0,84554.0,38725.0,2607.0,39870.0,3070000.0,250.0,160250.0,27291.0,15000.0],"couleur":"#F4A900","mediane":39870.0,"pctAvecPart":32.758620689655174},{"groupe":"Socialiste, Écologiste et Républicain","total":33,"valeur":1267040.0,"deputes":64,"avecPart":19,"valeurs":[18833.0,150.0,250.0,6050.0,15000.0,1006.0,12969.0,4020.0,159.0,4550.0,2114.0,2000.0,28110.0,14540.0,245614.0,3800.0,3978.0,3897.0,900000.0],"couleur":"#E75480","mediane":4020.0,"pctAvecPart":29.6875},{"groupe":"Écologiste - Solidarité et Territoires","total":17,"valeur":233487.0,"deputes":16,"avecPart":8,"valeurs":[10000.0,145071.0,12192.0,1000.0,59674.0,500.0,2050.0,3000.0],"couleur":"#3DAA6A","mediane":6500.0,"pctAvecPart":50.0},{"groupe":"Communiste Républicain Citoyen et Écologiste - Kanaky","total":6,"valeur":146719.0,"deputes":18,"avecPart":3,"valeurs":[2500.0,144219.0,0],"couleur":"#CC1111","mediane":2500.0,"pctAvecPart":16.666666666666668},{"groupe":"Rassemblement Démocratique et Social Européen","total":7,"valeur":114864.0,"deputes":15,"avecPart":3,"valeurs":[320.0,17494.0,97050.0],"couleur":"#FF6633","mediane":17494.0,"pctAvecPart":20.0},{"groupe":"Rassemblement des démocrates, progressistes et indépendants","total":5,"valeur":35715.0,"deputes":18,"avecPart":3,"valeurs":[1000.0,21248.0,13467.0],"couleur":"#FF8000","mediane":13467.0,"pctAvecPart":16.666666666666668},{"groupe":"Réunion administrative des Sénateurs ne figurant sur la liste d'aucun groupe","total":0,"valeur":0,"deputes":4,"avecPart":0,"valeurs":[],"couleur":"#888888","mediane":0,"pctAvecPart":0.0}],"membres":[["/pages_nominatives/evren-agnes","Agnès","EVREN","Les Républicains"],["/pages_nominatives/canayer-agnes","Agnès","CANAYER","Les Républicains"],["/pages_nominatives/mellouli-akli-26179","Akli","MELLOULI","Écologiste - Solidarité et Territoires"],["/pages_nominatives/chatillon-alain","Alain","CHATILLON","Les Républicains"],["/pages_nominatives/cazabonne-alain","Alain","CAZABONNE","Union Centriste"],["/pages_nominatives/houpert-alain","Alain","HOUPERT","Les Républicains"],["/pages_nominatives/de-montgolfier-alberic","Albéric","DE MONTGOLFIER","Les Républicains"],["/pages_nominatives/joyandet-alain","Alain","JOYANDET","Les Républicains"],["/pages_nominatives/borchio-fontimp-alexandra","Alexandra","BORCHIO FONTIMP","Les Républicains"],["/pages_nominatives/basquin-alexandre-28265","Alexandre","BASQUIN","Communiste Républicain Citoyen et Écologiste - Kanaky"],["/pages_nominatives/gacquerre-amel-22328","Amel","GACQUERRE","Union Centriste"],["/pages_nominatives/chain-larche-anne","Anne","CHAIN-LARCHÉ","Les Républicains"],["/pages_nominatives/ouizille-alexandre-26165","Alexandre","OUIZILLE","Socialiste, Écologiste et Républicain"],["/pages_nominatives/nedelec-anne-marie-6753","Anne-Marie","NÉDÉLEC","Les Républicains"],["/pages_nominatives/romagny-anne-sophie-26168","Anne-Sophie","ROMAGNY","Union Centriste"],["/pages_nominatives/souyris-anne","Anne","SOUYRIS","Écologiste - Solidarité et Territoires"],["/pages_nominatives/billon-annick","Annick","BILLON","Union Centriste"],["/pages_nominatives/jacquemet-annick-4471","Annick","JACQUEMET","Union Centriste"],["/pages_nominatives/guhl-antoinette","Antoinette","GUHL","Écologiste - Solidarité et Territoires"],["/pages_nominatives/bazin-arnaud-473","Arnaud","BAZIN","Les Républicains"],["/pages_nominatives/gosselin-beatrice-21171","Béatrice","GOSSELIN","Les Républicains"],["/pages_nominatives/jomier-bernard","Bernard","JOMIER","Socialiste, Écologiste et Républicain"],["/pages_nominatives/belin-bruno-686","Bruno","BELIN","Les Républicains"],["/pages_nominatives/belrhiti-catherine-19194","Catherine","BELRHITI","Les Républicains"],["/pages_nominatives/sido-bruno","Bruno","SIDO","Les Républicains"],["/pages_nominatives/di-folco-catherine","Catherine","DI FOLCO","Les Républicains"],["/pages_nominatives/apourceau-poly-cathy","Cathy","APOURCEAU-POLY","Communiste Républicain Citoyen et Écologiste - Kanaky"],["/pages_nominatives/dumas-catherine","Catherine","DUMAS","Les Républicains"],["/pages_nominatives/bilhac-christian-20723","Christian","BILHAC","Rassemblement Démocratique et Social Européen"],["/pages_nominatives/deseyne-chantal","Chantal","DESEYNE","Les Républicains"],["/pages_nominatives/cambon-christian","Christian","CAMBON","Les Républicains"],["/pages_nominatives/herzog-christine","Christine","HERZOG","Union Centriste"],["/pages_nominatives/klinger-christian-17670","Christian","KLINGER","Les Républicains"],["/pages_nominatives/nougein-claude","Claude","NOUGEIN","Les Républicains"],["/pages_nominatives/raynal-claude","Claude","RAYNAL","Socialiste, Écologiste et Républicain"],["/pages_nominatives/imbert-corinne","Corinne","IMBERT","Les Républicains"],["/pages_nominatives/narassiguin-corinne-26163","Corinne","NARASSIGUIN","Socialiste, Écologiste et Républicain"],["/pages_nominatives/michallet-damien-18275","Damien","MICHALLET","Les Républicains"],["/pages_nominatives/chasseing-daniel","Daniel","CHASSEING","Les Indépendants - République et Territoires"],["/pages_nominatives/fargeot-daniel-18061","Daniel","FARGEOT","Union Centriste"],["/pages_nominatives/salmon-daniel-20689","Daniel","SALMON","Écologiste - Solidarité et Territoires"],["/pages_nominatives/wattebled-dany","Dany","WATTEBLED","Les Indépendants - République et Territoires"],["/pages_nominatives/margueritte-david-9666","David","MARGUERITTE","Les Républicains"],["/pages_nominatives/de-legge-dominique","Dominique","DE LEGGE","Les Républicains"],["/pages_nominatives/theophile-dominique","Dominique","THÉOPHILE","Rassemblement des démocrates, progressistes et indépendants"],["/pages_nominatives/courtial-edouard","Édouard","COURTIAL","Union Centriste"],["/pages_nominatives/verien-dominique","Dominique","VÉRIEN","Union Centriste"],["/pages_nominatives/kerrouche-eric-5218","Éric","KERROUCHE","Socialiste, Écologiste et Républicain"],["/pages_nominatives/blanc-etienne","Étienne","BLANC","Les Républicains"],["/pages_nominatives/renaud-garabedian-evelyne","Évelyne","RENAUD-GARABEDIAN","Les Républicains"],["/pages_nominatives/gay-fabien","Fabien","GAY","Communiste Républicain Citoyen et Écologiste - Kanaky"],["/pages_nominatives/patient-georges","Georges","PATIENT","Rassemblement des démocrates, progressistes et indépendants"],["/pages_nominatives/larcher-gerard","Gérard","LARCHER","Les Républicains"],["/pages_nominatives/favreau-gilbert","Gilbert","FAVREAU","Les Républicains"],["/pages_nominatives/blanc-gregory-26176","Grégory","BLANC","Écologiste - Solidarité et Territoires"],["/pages_nominatives/devinaz-gilbert-luc","Gilbert-Luc","DEVINAZ","Socialiste, Écologiste et Républicain"],["/pages_nominatives/gontard-guillaume","Guillaume","GONTARD","Écologiste - Solidarité et Territoires"],["/pages_nominatives/chevrollier-guillaume","Guillaume","CHEVROLLIER","Les Républicains"],["/pages_nominatives/leroy-henri","Henri","LEROY","Les Républicains"],["/pages_nominatives/saury-hugues-7977","Hugues","SAURY","Les Républicains"],["/pages_nominatives/grosperrin-jacques","Jacques","GROSPERRIN","Les Républicains"],["/pages_nominatives/vogel-jean-pierre","Jean Pierre","VOGEL","Les Républicains"],["/pages_nominatives/blanc-jean-baptiste-1299","Jean-Baptiste","BLANC","Les Républicains"],["/pages_nominatives/husson-jean-francois","Jean-François","HUSSON","Les Républicains"],["/pages_nominatives/rapin-jean-francois","Jean-François","RAPIN","Les Républicains"],["/pages_nominatives/michau-jean-jacques-20703","Jean-Jacques","MICHAU","Socialiste, Écologiste et Républicain"],["/pages_nominatives/hingray-jean-20701","Jean","HINGRAY","Union Centriste"],["/pages_nominatives/ruelle-jean-luc-26153","Jean-Luc","RUELLE","Les Républicains"],["/pages_nominatives/arnaud-jean-michel","Jean-Michel","ARNAUD","Union Centriste"],["/pages_nominatives/hugonet-jean-raymond","Jean-Raymond","HUGONET","Les Républicains"],["/pages_nominatives/grand-jean-pierre","Jean-Pierre","GRAND","Les Indépendants - République et Territoires"],["/pages_nominatives/darras-jerome-10410","Jérôme","DARRAS","Socialiste, Écologiste et Républicain"],["/pages_nominatives/khalife-khalife","Khalifé","KHALIFÉ","Les Républicains"],["/pages_nominatives/daniel-karine","Karine","DANIEL","Socialiste, Écologiste et Républicain"],["/pages_nominatives/garnier-laurence","Laurence","GARNIER","Les Républicains"],["/pages_nominatives/muller-bronn-laurence-20699","Laurence","MULLER-BRONN","Les Républicains"],["/pages_nominatives/harribey-laurence-9619","Laurence","HARRIBEY","Socialiste, Écologiste et Républicain"],["/pages_nominatives/lafon-laurent","Laurent","LAFON","Union Centriste"],["/pages_nominatives/somon-laurent-8265","Laurent","SOMON","Les Républicains"],["/pages_nominatives/josende-lauriane-14750","Lauriane","JOSENDE","Les Républicains"],["/pages_nominatives/de-nicolay-louis-jean","Louis-Jean","DE NICOLAŸ","Les Républicains"],["/pages_nominatives/vogel-louis","Louis","VOGEL","Les Indépendants - République et Territoires"],["/pages_nominatives/daubresse-marc-philippe","Marc-Philippe","DAUBRESSE","Les Républicains"],["/pages_nominatives/lermytte-marie-claude-26173","Marie-Claude","LERMYTTE","Les Indépendants - République et Territoires"],["/pages_nominatives/carrere-gee-marie-claire-23617","Marie-Claire","CARRÈRE-GÉE","Les Républicains"],["/pages_nominatives/aeschlimann-marie-do-20223","Marie-Do","AESCHLIMANN","Les Républicains"],["/pages_nominatives/monier-marie-pierre","Marie-Pierre","MONIER","Socialiste, Écologiste et Républicain"],["/pages_nominatives/mercier-marie","Marie","MERCIER","Les Républicains"],["/pages_nominatives/berthet-martine-885","Martine","BERTHET","Les Républicains"],["/pages_nominatives/vogel-melanie-22959","Mélanie","VOGEL","Écologiste - Solidarité et Territoires"],["/pages_nominatives/bonnus-michel","Michel","BONNUS","Les Républicains"],["/pages_nominatives/canevet-michel","Michel","CANÉVET","Union Centriste"],["/pages_nominatives/masset-michel-16259","Michel","MASSET","Rassemblement Démocratique et Social Européen"],["/pages_nominatives/jourda-muriel","Muriel","JOURDA","Les Républicains"],["/pages_nominatives/sollogoub-nadia","Nadia","SOLLOGOUB","Union Centriste"],["/pages_nominatives/cadic-olivier","Olivier","CADIC","Union Centriste"],["/pages_nominatives/rietmann-olivier-20714","Olivier","RIETMANN","Les Républicains"],["/pages_nominatives/jacquin-olivier","Olivier","JACQUIN","Socialiste, Écologiste et Républicain"],["/pages_nominatives/martin-pascal-5947","Pascal","MARTIN","Union Centriste"],["/pages_nominatives/demas-patricia-20180","Patricia","DEMAS","Les Républicains"],["/pages_nominatives/joly-patrice-4300","Patrice","JOLY","Socialiste, Écologiste et Républicain"],["/pages_nominatives/chaize-patrick","Patrick","CHAIZE","Les Républicains"],["/pages_nominatives/chauvet-patrick-1641","Patrick","CHAUVET","Union Centriste"],["/pages_nominatives/kanner-patrick","Patrick","KANNER","Socialiste, Écologiste et Républicain"],["/pages_nominatives/mouiller-philippe","Philippe","MOUILLER","Les Républicains"],["/pages_nominatives/levi-pierre-antoine-20691","Pierre-Antoine","LEVI","Union Centriste"],["/pages_nominatives/rochette-pierre-jean-16232","Pierre Jean","ROCHETTE","Les Indépendants - République et Territoires"],["/pages_nominatives/verzelen-pierre-jean-8728","Pierre-Jean","VERZELEN","Les Indépendants - République et Territoires"],["/pages_nominatives/temal-rachid","Rachid","TEMAL","Socialiste, Écologiste et Républicain"],["/pages_nominatives/daubet-raphael-20101","Raphaël","DAUBET","Rassemblement Démocratique et Social Européen"],["/pages_nominatives/pointereau-remy","Rémy","POINTEREAU","Les Républicains"],["/pages_nominatives/pla-sebastien-20788","Sebastien","PLA","Socialiste, Écologiste et Républicain"],["/pages_nominatives/piednoir-stephane","Stéphane","PIEDNOIR","Les Républicains"],["/pages_nominatives/sautarel-stephane-15271","Stéphane","SAUTAREL","Les Républicains"],["/pages_nominatives/robert-sylvie","Sylvie","ROBERT","Socialiste, Écologiste et Républicain"],["/pages_nominatives/cozic-thierry-17766","Thierry","COZIC","Socialiste, Écologiste et Républicain"],["/pages_nominatives/meignen-thierry","Thierry","MEIGNEN","Les Républicains"],["/pages_nominatives/paoli-gagin-vanina-20708","Vanina","PAOLI-GAGIN","Les Indépendants - République et Territoires"],["/pages_nominatives/lurel-victorin","Victorin","LUREL","Socialiste, Écologiste et Républicain"],["/pages_nominatives/delahaye-vincent","Vincent","DELAHAYE","Union Centriste"],["/pages_nominatives/malet-viviane-5657","Viviane","MALET","Les Républicains"],["/pages_nominatives/louault-vincent","Vincent","LOUAULT","Les Indépendants - République et Territoires"],["/pages_nominatives/jadot-yannick","Yannick","JADOT","Écologiste - Solidarité et Territoires"],["/pages_nominatives/iacovelli-xavier","Xavier","IACOVELLI","Rassemblement des démocrates, progressistes et indépendants"]],"societes":[["Cofinin",12232827.0,{"Les Républicains":12232827.0},[49]],["SGL",11239544.0,{"Les Républicains":11239544.0},[49]],["Cible Financière",9727250.0,{"Les Républicains":9727250.0},[49]],["NOUGEIN SA",5369076.0,{"Les Républicains":5369076.0},[33]],["SOPARMA FINANCE",4000000.0,{"Les Républicains":4000000.0},[80]],["CINEBOOK Ltd",3070000.0,{"Union Centriste":3070000.0},[95]],["Selas Vogel & Vogel",2452241.0,{"Les Indépendants - République et Territoires":2452241.0},[81]],["SCM Saint Louis en Vallage",1950000.0,{"Les Républicains":1950000.0},[24]],["Traktir",1785000.0,{"Les Républicains":1785000.0},[49]],["EURL Pharmacie IMBERT",1176754.0,{"Les Républicains":1176754.0},[35]],["SASU Cabinet JP VOGEL LE MANS",600000.0,{"Les Républicains":600000.0},[61]],["Chemin de Fer",529583.0,{"Les Républicains":529583.0},[49]],["Belle Isle investissements",515000.0,{"Les Républicains":515000.0},[67]],["SA ALTEXA LE MANS",373520.0,{"Les Républicains":373520.0},[61]],["ACA France",350000.0,{"Les Républicains":350000.0},[67]],["EARL DOMAINE DE LA PATURIE",326000.0,{"Les Républicains":326000.0},[7]],["ABI",280654.0,{"Union Centriste":280654.0},[4]],["SAS LOUIS",280000.0,{"Les Républicains":280000.0},[90]],["SAS Vogel Holding",277862.0,{"Les Indépendants - République et Territoires":277862.0},[81]],["SARL Panorama de la haute venelle LE MANS",257000.0,{"Les Républicains":257000.0},[61]],["BGR",255739.0,{"Les Républicains":255739.0},[49]],["Sarl SIDO TA",250000.0,{"Les Républicains":250000.0},[24]],["SARL FINANCIERE ROCHETTE",200160.0,{"Les Indépendants - République et Territoires":200160.0},[106]],["Foncière Mozart",197179.0,{"Les Républicains":197179.0},[49]],["CARS ROCHETTE",159000.0,{"Les Indépendants - République et Territoires":159000.0},[106]],["MDI",144000.0,{"Les Républicains":144000.0},[101]],["Evergreen",140160.0,{"Les Indépendants - République et Territoires":140160.0},[117]],["AIR LIQUIDE",139337.0,{"Les Républicains":46654.0,"Écologiste - Solidarité et Territoires":79851.0,"Union Centriste":669.0,"Socialiste, Écologiste et Républicain":12163.0},[1,13,15,27,30,48,77,100]],["HERMES INTERNATIONAL",116980.0,{"Les Républicains":116980.0},[48]],["SCPI SOFIDY IMMORENTE",108232.0,{"Les Républicains":108232.0},[11]],["Azur",93557.0,{"Les Républicains":93557.0},[49]],["LVMH MOET HENNESSY VUITTON",92046.0,{"Les Républicains":92046.0},[48]],["SARL Attitude Evénement",80000.0,{"Union Centriste":80000.0},[14]],["ROCHE HOLDING BJ",76470.0,{"Les Républicains":76470.0},[48]],["ROBECO SUSTAIN GBL",66201.0,{"Les Républicains":66201.0},[48]],["SAS FIDECY",60000.0,{"Union Centriste":60000.0},[39]],["AXA",56444.0,{"Les Républicains":19580.0,"Écologiste - Solidarité et Territoires":36190.0,"Union Centriste":674.0},[1,15,27,30,42,77]],["RECAPE SA",54000.0,{"Les Républicains":54000.0},[3]],["EURL JOY DEVELOPPEMENT",50000.0,{"Les Républicains":50000.0},[7]],["SA OCEP",42000.0,{"Les Républicains":42000.0},[87]],["ERAMET",37200.0,{"Écologiste - Solidarité et Territoires":37200.0},[54]],["PASIPHAE",34409.0,{"Union Centriste":34409.0},[94]],["cerp rhin rhone mediterranee",34038.0,{"Les Républicains":34038.0},[88]],["VEOLIA ENVIRONNEMENT",33360.0,{"Les Républicains":33360.0},[1,74]],["SAS Vogel Digital",31500.0,{"Les Indépendants - République et Territoires":31500.0},[81]],["NESTLE",31449.0,{"Les Républicains":31449.0},[48]],["SCP JOURDA FAIVRE",30000.0,{"Les Républicains":30000.0},[93]],["Thalès",26537.0,{"Les Républicains":26537.0},[74]],["LVMH",25631.0,{"Les Républicains":25631.0},[30]],["TOTAL",25143.0,{"Les Républicains":25143.0},[1,27]],["TOTALENERGIES SE",24648.0,{"Les Républicains":24648.0},[30]],["SANOFI",23593.0,{"Les Républicains":23161.0,"Union Centriste":432.0},[1,27,30,77]],["GETLINK",23388.0,{"Union Centriste":23388.0},[105]],["PEA",23134.0,{"Les Républicains":23134.0},[57]],["VINCI",22544.0,{"Les Républicains":22544.0},[1,27,30]],["BNP PARIBAS",20897.0,{"Les Républicains":20897.0},[27,30]],["SARL Ouest Mégavision",20000.0,{"Les Républicains":20000.0},[20]],["A2 Services SARL",19920.0,{"Union Centriste":19920.0},[31]],["AIRBUS",18720.0,{"Les Républicains":17124.0,"Socialiste, Écologiste et Républicain":1074.0,"Union Centriste":522.0},[1,27,65,77,85]],["SAS Vogel Edition",18705.0,{"Les Indépendants - République et Territoires":18705.0},[81]],["LVMH MOET VUITTON",18501.0,{"Les Républicains":18501.0},[27]],["FCPI QI 2017",18403.0,{"Les Républicains":18403.0},[48]],["Placide Europe",17556.0,{"Les Républicains":17556.0},[49]],["SARL Vogel & Cie",17000.0,{"Les Indépendants - République et Territoires":17000.0},[81]],["PERNOD RICARD",16743.0,{"Les Républicains":15590.0,"Union Centriste":1153.0},[1,27,30,48,77]],["SCHNEIDER",16238.0,{"Les Républicains":16238.0},[30]],["FCPI TRUFFLE FORTUNE N6",14846.0,{"Les Républicains":14846.0},[48]],["Air france",14540.0,{"Socialiste, Écologiste et Républicain":14540.0},[103]],["TRUFFLE INNOCROSS 2016",14490.0,{"Les Républicains":14490.0},[48]],["PEA Annick JACQUEMET",14311.0,{"Union Centriste":14311.0},[17]],["Vogel Academy",14298.0,{"Les Indépendants - République et Territoires":14298.0},[81]],["Innate Pharma",14136.0,{"Écologiste - Solidarité et Territoires":14136.0},[54]],["FCP TRUFFLE INNOC 2015",13813.0,{"Les Républicains":13813.0},[48]],["L OREAL",13756.0,{"Les Républicains":13756.0},[1,27]],["AIRBUS SE",13638.0,{"Les Républicains":13638.0},[30]],["NEX CAP 2023 ISF",13500.0,{"Les Républicains":13500.0},[48]],["SAS GOOD POKE",13402.0,{"Rassemblement des démocrates, progressistes et indépendants":13402.0},[123]],["SCHNEIDER ELECTRIC",12783.0,{"Les Républicains":12783.0},[27]],["MICHELIN",12235.0,{"Les Républicains":12235.0},[1,27,30]],["Equinoxe Conseil",12192.0,{"Écologiste - Solidarité et Territoires":12192.0},[18]],["DANONE",12052.0,{"Les Républicains":11879.0,"Union Centriste":173.0},[1,27,30,77]],["ERNESTE SAS",12000.0,{"Union Centriste":12000.0},[66]],["L'OREAL",11488.0,{"Les Républicains":11488.0},[30]],["CAP GEMINI",11117.0,{"Les Républicains":9752.0,"Union Centriste":1365.0},[27,30,105]],["AYVENS",10152.0,{"Les Républicains":10152.0},[42]],["STELLANTIS",10014.0,{"Les Républicains":9869.0,"Union Centriste":145.0},[1,27,42,77]],["AM Conseil",10000.0,{"Écologiste - Solidarité et Territoires":10000.0},[2]],["SARL MASSETIMMO",10000.0,{"Rassemblement Démocratique et Social Européen":10000.0},[92]],["LVMH MOET HENESSY VUITTON",9847.0,{"Les Républicains":9847.0},[1]],["Unibail-Rodamco",9161.0,{"Socialiste, Écologiste et Républicain":9161.0},[100]],["THALES",8808.0,{"Les Républicains":8808.0},[1,27,30]],["HERMES",8798.0,{"Les Républicains":8798.0},[30]],["KERING",8512.0,{"Les Républicains":5470.0,"Socialiste, Écologiste et Républicain":3042.0},[27,30,65]],["Copera",8219.0,{"Les Républicains":8219.0},[49]],["SAINT GOBAIN",8055.0,{"Les Républicains":8055.0},[1,27,30]],["VEOLIA",7796.0,{"Les Républicains":7796.0},[27,30]],["SCHNEIDER ELECTRIC SE",7691.0,{"Les Républicains":7691.0},[1]],["MagellanConsulting",7500.0,{"Les Républicains":7500.0},[113]],["Orange",7424.0,{"Les Républicains":3452.0,"Socialiste, Écologiste et Républicain":3254.0,"Les Indépendants - République et Territoires":718.0},[42,65,117]],["ENGIE",7029.0,{"Les Républicains":1133.0,"Écologiste - Solidarité et Territoires":5896.0},[13,15,85]],["FCPI TRUFFLE FORTUNE 5",6961.0,{"Les Républicains":6961.0},[48]],["FCPI FORTUNE 3",6710.0,{"Les Républicains":6710.0},[48]],["STELLANTIS NV",6691.0,{"Les Républicains":6691.0},[30]],["SAFRAN",6552.0,{"Les Républicains":6552.0},[27,30]],["STMICROELECTRONICS",6400.0,{"Les Républicains":6400.0},[1,27]],["AIR LIQUIDE PRIME",6129.0,{"Les Républicains":6129.0},[27]],["Outremers 360°",6050.0,{"Socialiste, Écologiste et Républicain":6050.0},[36]],["BNP PARISBAS",6013.0,{"Les Républicains":6013.0},[1]],["Banque Populaire",6000.0,{"Les Républicains":6000.0},[79]],["SARL CED",6000.0,{"Rassemblement Démocratique et Social Européen":6000.0},[92]],["STMICROELECTRO",5973.0,{"Les Républicains":5973.0},[30]],["HERMES INT",5773.0,{"Les Républicains":5773.0},[27]],["FDJ",5767.0,{"Les Républicains":1711.0,"Union Centriste":159.0,"Socialiste, Écologiste et Républicain":3897.0},[42,77,115]],["PEA BANQUE POSTALE",5527.0,{"Écologiste - Solidarité et Territoires":5527.0},[15]],["Renault",5510.0,{"Écologiste - Solidarité et Territoires":5338.0,"Union Centriste":172.0},[54,77]],["UNI HOCHE",5406.0,{"Les Républicains":5406.0},[48]],["GECINA",5383.0,{"Écologiste - Solidarité et Territoires":5383.0},[15]],["SG",5265.0,{"Les Républicains":5265.0},[30]],["FCPI TRUFFLE fORTUNE 4",5159.0,{"Les Républicains":5159.0},[48]],["Crédit agricole SA",4777.0,{"Les Républicains":4777.0},[42]],["SLE Bearn",4720.0,{"Les Républicains":4720.0},[84]],["Renaissance eur.si",4675.0,{"Les Républicains":4675.0},[88]],["Amundi val duraP3D",4664.0,{"Les Républicains":4664.0},[88]],["HERMÈS INTERNATIONAL",4464.0,{"Les Républicains":4464.0},[1]],["oddo bhf ave.cr 3d",4462.0,{"Les Républicains":4462.0},[88]],["AXEREAL",4288.0,{"Union Centriste":4288.0},[94]],["EVOA",3978.0,{"Socialiste, Écologiste et Républicain":3978.0},[114]],["société générale",3865.0,{"Les Républicains":3865.0},[27]],["Inventiva",3486.0,{"Socialiste, Écologiste et Républicain":3486.0},[100]],["claranova",3300.0,{"Socialiste, Écologiste et Républicain":3300.0},[100]],["ACCOR",3241.0,{"Les Républicains":3241.0},[42]],["SAFRAN PROV;ECH",3201.0,{"Les Républicains":3201.0},[1]],["HEINEKEN NV",3135.0,{"Les Républicains":3135.0},[30]],["CAPGEMINI",3117.0,{"Les Républicains":2598.0,"Union Centriste":519.0},[1,77]],["C0NNECT INOVATION",3075.0,{"Socialiste, Écologiste et Républicain":3075.0},[65]],["DASSAULT SYSTEM",3066.0,{"Les Républicains":3066.0},[30]],["PERFELIA",3000.0,{"Écologiste - Solidarité et Territoires":3000.0},[54]],["Energie Partagée Investissement",3000.0,{"Écologiste - Solidarité et Territoires":3000.0},[122]],["DASSAULT SYSTEMES",2859.0,{"Les Républicains":2859.0},[27]],["COFACE",2858.0,{"Les Républicains":2858.0},[42]],["Compagnie des Alpes",2836.0,{"Les Républicains":2836.0},[42]],["SARL ESPACE IMMO",2550.0,{"Socialiste, Écologiste et Républicain":2550.0},[76]],["BABYLONE EURL",2500.0,{"Les Républicains":2500.0},[0]],["SAS Société Nouvelle Liberté Edition",2500.0,{"Communiste Républicain Citoyen et Écologiste - Kanaky":2500.0},[9]],["credit agricole",2457.0,{"Socialiste, Écologiste et Républicain":1006.0,"Union Centriste":1451.0},[55,105]],["ESSILORLUXOTTIC",2389.0,{"Les Républicains":2389.0},[30]],["Pierre et vacances",2256.0,{"Les Républicains":2256.0},[42]],["AMUNDI STRAT ACT EURO C FCP 3D",2234.0,{"Les Républicains":2234.0},[59]],["CRÉDIT AGRICOLE",2104.0,{"Les Républicains":907.0,"Union Centriste":1197.0},[1,77,94]],["HEINEKEN",2080.0,{"Les Républicains":2080.0},[27]],["BIO SANTE",2050.0,{"Socialiste, Écologiste et Républicain":2050.0},[65]],["creditmutuel",2048.0,{"Les Républicains":2048.0},[23]],["CONNECTING PARTS FRANCE",2000.0,{"Les Républicains":2000.0},[37]],["SARL ECC",2000.0,{"Union Centriste":2000.0},[39]],["Aqui ! Presse",2000.0,{"Socialiste, Écologiste et Républicain":2000.0},[76]],["VPMC.FR",2000.0,{"Écologiste - Solidarité et Territoires":2000.0},[89]],["S.C.O.P. S.A. ARDELAINE",2000.0,{"Socialiste, Écologiste et Républicain":2000.0},[97]],["UNITED",2000.0,{"Les Indépendants - République et Territoires":2000.0},[106]],["SARL Auberge du Moulin",2000.0,{"Socialiste, Écologiste et Républicain":2000.0},[111]],["essilor intl",1973.0,{"Les Républicains":1973.0},[27]],["DASSAULT SYSTÈME SE",1942.0,{"Les Républicains":1942.0},[1]],["Hermès",1863.0,{"Union Centriste":1863.0},[77]],["FrançaisedesJeux",1780.0,{"Union Centriste":1780.0},[91]],["PUBLICIS GROUPE",1766.0,{"Les Républicains":1414.0,"Union Centriste":352.0},[1,77]],["ASML HOLDING",1514.0,{"Les Républicains":1514.0},[1]],["BANS INVEST",1416.0,{"Les Républicains":1416.0},[49]],["Maisons du monde",1289.0,{"Les Républicains":1289.0},[42]],["Amundi Stratégies Actions Euro C",1158.0,{"Les Indépendants - République et Territoires":1158.0},[117]],["Clairance SE",1109.0,{"Les Républicains":1109.0},[42]],["ESSILORLUXOTTICA",1067.0,{"Les Républicains":1067.0},[1]],["Ile de Sein energies",1000.0,{"Écologiste - Solidarité et Territoires":1000.0},[40]],["ERG",1000.0,{"Les Républicains":1000.0},[49]],["SCMDaubet Garcia Barrouilhet",1000.0,{"Rassemblement Démocratique et Social Européen":1000.0},[109]],["NATIXIS",952.0,{"Union Centriste":952.0},[105]],["Émeis",826.0,{"Les Républicains":826.0},[42]],["EDENRED",825.0,{"Les Républicains":825.0},[1]],["PEA Espèces Annick JACQUEMET",780.0,{"Union Centriste":780.0},[17]],["Vivendi",771.0,{"Socialiste, Écologiste et Républicain":250.0,"Les Républicains":521.0},[34,42]],["TELEPERFORMANCE",682.0,{"Les Républicains":682.0},[1]],["CENTRAVET",610.0,{"Les Républicains":610.0},[52]],["DADEAS",600.0,{"Les Républicains":600.0},[82]],["SEM CENTRALES VILLAGEOISES TRIEVCES",500.0,{"Écologiste - Solidarité et Territoires":500.0},[56]],["WICAP Levels 3D",500.0,{"Les Indépendants - République et Territoires":500.0},[117]],["REXEL",426.0,{"Les Républicains":426.0},[85]],["AMUNDI",418.0,{"Les Républicains":418.0},[85]],["PUMA",412.0,{"Socialiste, Écologiste et Républicain":412.0},[65]],["Canal plus",401.0,{"Les Républicains":401.0},[42]],["Sodexo",400.0,{"Union Centriste":400.0},[77]],["COFINVEST",327.0,{"Les Républicains":327.0},[49]],["SARL BEMORAL",300.0,{"Les Républicains":300.0},[99]],["Havas",290.0,{"Les Républicains":290.0},[42]],["Louis hachette group",270.0,{"Les Républicains":270.0},[42]],["PS OLIVET",214.0,{"Les Républicains":214.0},[59]],["Solway",199.0,{"Union Centriste":199.0},[77]],["LA DEPECHE DU MIDI",152.0,{"Les Républicains":152.0},[3]],["SAS Kerwatt",150.0,{"Union Centriste":150.0},[91]],["ARCHOS",130.0,{"Union Centriste":130.0},[105]],["Valeo",125.0,{"Union Centriste":125.0},[77]],["Ubisoft Entertain",117.0,{"Union Centriste":117.0},[77]],["ADP",106.0,{"Les Indépendants - République et Territoires":106.0},[107]],["SAS FIDECY EXPERTISE & CONSEIL",100.0,{"Union Centriste":100.0},[39]],["SAS Centrales Villageoises",100.0,{"Union Centriste":100.0},[91]],["Bouygues",68.0,{"Union Centriste":68.0},[77]],["SCOP des masques",50.0,{"Union Centriste":50.0},[91]],["AIR FRANCE KLM",42.0,{"Socialiste, Écologiste et Républicain":42.0},[65]],["Carrefour",34.0,{"Union Centriste":34.0},[77]],["Crédit Mutuel",30.0,{"Les Républicains":30.0},[52]],["FNAC DARTY",20.0,{"Socialiste, Écologiste et Républicain":20.0},[65]],["DELTA DRONE",5.0,{"Union Centriste":5.0},[105]],["ER",1.0,{"Les Républicains":1.0},[49]],["Alcona",1.0,{"Les Républicains":1.0},[49]],["Vivarinco",1.0,{"Les Républicains":1.0},[49]],["Sainte Véronique",0,{"Les Républicains":0},[49]],["M64",0,{"Les Républicains":0},[49]],["Evasion",0,{"Les Républicains":0},[49]],["H.T.N.",0,{"Les Républicains":0},[49]],["SOCIETE DE L'UNIVERS",0,{"Les Républicains":0},[49]],["SNJH",0,{"Communiste Républicain Citoyen et Écologiste - Kanaky":0},[50]],["SELARL Drai & Associés",0,{"Les Républicains":0},[62]],["SARL Les Terres du Ludes",0,{"Les Républicains":0},[80]],["SARL L ARLEQUIN",0,{"Les Républicains":0},[90]]],"picker":[[0,"cofinin",12232827.0],[1,"sgl",11239544.0],[2,"ciblefinanciere",9727250.0],[3,"nougeinsa",5369076.0],[4,"soparmafinance",4000000.0],[5,"cinebookltd",3070000.0],[6,"selasvogel&vogel",2452241.0],[7,"scmsaintlouisenvallage",1950000.0],[8,"traktir",1785000.0],[9,"eurlpharmacieimbert",1176754.0],[10,"sasucabinetjpvogellemans",600000.0],[11,"chemindefer",529583.0],[12,"belleisleinvestissements",515000.0],[13,"saaltexalemans",373520.0],[14,"acafrance",350000.0],[15,"earldomainedelapaturie",326000.0],[16,"abi",280654.0],[17,"saslouis",280000.0],[18,"sasvogelholding",277862.0],[19,"sarlpanoramadelahautevenellelemans",257000.0],[20,"bgr",255739.0],[21,"sarlsidota",250000.0],[22,"sarlfinanciererochette",200160.0],[23,"foncieremozart",197179.0],[24,"carsrochette",159000.0],[25,"mdi",144000.0],[26,"evergreen",140160.0],[27,"airliquide",139337.0],[123,"hermesinternational",121444.0],[29,"scpisofidyimmorente",108232.0],[30,"azur",93557.0],[31,"lvmhmoethennessyvuitton",92046.0],[32,"sarlattitudeevenement",80000.0],[33,"rocheholdingbj",76470.0],[34,"robecosustaingbl",66201.0],[35,"sasfidecy",60000.0],[36,"axa",56444.0],[37,"recapesa",54000.0],[38,"eurljoydeveloppement",50000.0],[39,"saocep",42000.0],[40,"eramet",37200.0],[90,"thales",35345.0],[41,"pasiphae",34409.0],[42,"cerprhinrhonemediterranee",34038.0],[43,"veoliaenvironnement",33360.0],[44,"sasvogeldigital",31500.0],[45,"nestle",31449.0],[46,"scpjourdafaivre",30000.0],[48,"lvmh",25631.0],[73,"loreal",25244.0],[49,"total",25143.0],[50,"totalenergiesse",24648.0],[51,"sanofi",23593.0],[52,"getlink",23388.0],[53,"pea",23134.0],[54,"vinci",22544.0],[55,"bnpparibas",20897.0],[56,"sarlouestmegavision",20000.0],[57,"a2servicessarl",19920.0],[58,"airbus",18720.0],[59,"sasvogeledition",18705.0],[60,"lvmhmoetvuitton",18501.0],[61,"fcpiqi2017",18403.0],[62,"placideeurope",17556.0],[63,"sarlvogel&cie",17000.0],[64,"pernodricard",16743.0],[65,"schneider",16238.0],[66,"fcpitrufflefortunen6",14846.0],[67,"airfrance",14540.0],[68,"truffleinnocross2016",14490.0],[69,"peaannickjacquemet",14311.0],[70,"vogelacademy",14298.0],[133,"capgemini",14234.0],[71,"innatepharma",14136.0],[72,"fcptruffleinnoc2015",13813.0],[74,"airbusse",13638.0],[75,"nexcap2023isf",13500.0],[76,"sasgoodpoke",13402.0],[77,"schneiderelectric",12783.0],[78,"michelin",12235.0],[79,"equinoxeconseil",12192.0],[80,"danone",12052.0],[81,"ernestesas",12000.0],[91,"hermes",10661.0],[84,"ayvens",10152.0],[85,"stellantis",10014.0],[86,"amconseil",10000.0],[87,"sarlmassetimmo",10000.0],[88,"lvmhmoethenessyvuitton",9847.0],[89,"unibail-rodamco",9161.0],[92,"kering",8512.0],[93,"copera",8219.0],[94,"saintgobain",8055.0],[95,"veolia",7796.0],[96,"schneiderelectricse",7691.0],[97,"magellanconsulting",7500.0],[98,"orange",7424.0],[99,"engie",7029.0],[100,"fcpitrufflefortune5",6961.0],[101,"fcpifortune3",6710.0],[102,"stellantisnv",6691.0],[103,"safran",6552.0],[104,"stmicroelectronics",6400.0],[105,"airliquideprime",6129.0],[106,"outremers360°",6050.0],[107,"bnpparisbas",6013.0],[108,"banquepopulaire",6000.0],[109,"sarlced",6000.0],[110,"stmicroelectro",5973.0],[111,"hermesint",5773.0],[112,"fdj",5767.0],[113,"peabanquepostale",5527.0],[114,"renault",5510.0],[115,"unihoche",5406.0],[116,"gecina",5383.0],[117,"sg",5265.0],[118,"fcpitrufflefortune4",5159.0],[119,"creditagricolesa",4777.0],[120,"slebearn",4720.0],[121,"renaissanceeur.si",4675.0],[122,"amundivaldurap3d",4664.0],[148,"creditagricole",4561.0],[124,"oddobhfave.cr3d",4462.0],[125,"axereal",4288.0],[126,"evoa",3978.0],[127,"societegenerale",3865.0],[128,"inventiva",3486.0],[129,"claranova",3300.0],[130,"accor",3241.0],[131,"safranprov;ech",3201.0],[132,"heinekennv",3135.0],[134,"c0nnectinovation",3075.0],[135,"dassaultsystem",3066.0],[136,"perfelia",3000.0],[137,"energiepartageeinvestissement",3000.0],[138,"dassaultsystemes",2859.0],[139,"coface",2858.0],[140,"compagniedesalpes",2836.0],[141,"sarlespaceimmo",2550.0],[142,"babyloneeurl",2500.0],[143,"sassocietenouvelleliberteedition",2500.0],[145,"essilorluxottic",2389.0],[146,"pierreetvacances",2256.0],[147,"amundistratacteurocfcp3d",2234.0],[149,"heineken",2080.0],[151,"creditmutuel",2078.0],[150,"biosante",2050.0],[152,"connectingpartsfrance",2000.0],[153,"sarlecc",2000.0],[154,"aqui!presse",2000.0],[155,"vpmc.fr",2000.0],[156,"s.c.o.p.s.a.ardelaine",2000.0],[157,"united",2000.0],[158,"sarlaubergedumoulin",2000.0],[159,"essilorintl",1973.0],[160,"dassaultsystemese",1942.0],[162,"francaisedesjeux",1780.0],[163,"publicisgroupe",1766.0],[164,"asmlholding",1514.0],[165,"bansinvest",1416.0],[166,"maisonsdumonde",1289.0],[167,"amundistrategiesactionseuroc",1158.0],[168,"clairancese",1109.0],[169,"essilorluxottica",1067.0],[170,"iledeseinenergies",1000.0],[171,"erg",1000.0],[172,"scmdaubetgarciabarrouilhet",1000.0],[173,"natixis",952.0],[174,"emeis",826.0],[175,"edenred",825.0],[176,"peaespecesannickjacquemet",780.0],[177,"vivendi",771.0],[178,"teleperformance",682.0],[179,"centravet",610.0],[180,"dadeas",600.0],[181,"semcentralesvillageoisestrievces",500.0],[182,"wicaplevels3d",500.0],[183,"rexel",426.0],[184,"amundi",418.0],[185,"puma",412.0],[186,"canalplus",401.0],[187,"sodexo",400.0],[188,"cofinvest",327.0],[189,"sarlbemoral",300.0],[190,"havas",290.0],[191,"louishachettegroup",270.0],[192,"psolivet",214.0],[193,"solway",199.0],[194,"ladepechedumidi",152.0],[195,"saskerwatt",150.0],[196,"archos",130.0],[197,"valeo",125.0],[198,"ubisoftentertain",117.0],[199,"adp",106.0],[200,"sasfidecyexpertise&conseil",100.0],[201,"sascentralesvillageoises",100.0],[202,"bouygues",68.0],[203,"scopdesmasques",50.0],[204,"airfranceklm",42.0],[205,"carrefour",34.0],[207,"fnacdarty",20.0],[208,"deltadrone",5.0],[209,"er",1.0],[210,"alcona",1.0],[211,"vivarinco",1.0],[212,"sainteveronique",0],[213,"m64",0],[214,"evasion",0],[215,"h.t.n.",0],[216,"societedelunivers",0],[217,"snjh",0],[218,"selarldrai&associes",0],[219,"sarllesterresduludes",0],[220,"sarllarlequin",0]],"sunburst":[[0,2500.0,1,[[142,2500.0]],0],[1,95065.0,28,[[88,9847.0],[49,8517.0],[96,7691.0],[107,6013.0],[51,5663.0],[58,5352.0],[73,5277.0],[54,4977.0],[123,4464.0],[27,4404.0],[36,3346.0],[131,3201.0]],0],[2,10000.0,1,[[86,10000.0]],0],[3,3576328.0,11,[[37,54000.0],[194,152.0]],9],[4,926122.0,4,[[16,280654.0]],3],[5,42000.0,1,[],1],[6,1437628.0,10,[],10],[7,376000.0,2,[[15,326000.0],[38,50000.0]],0],[8,10000.0,1,[],1],[9,2500.0,1,[[143,2500.0]],0],[10,75.0,2,[],2],[11,108248.0,2,[[29,108232.0]],1],[12,18833.0,1,[],1],[13,26430.0,3,[[27,25094.0],[99,494.0]],1],[14,80000.0,1,[[32,80000.0]],0],[15,145071.0,6,[[27,79851.0],[36,36190.0],[99,5896.0],[113,5527.0],[116,5383.0]],1],[16,1000.0,1,[],1],[17,561801.0,9,[[69,14311.0],[176,780.0]],7],[18,12192.0,1,[[79,12192.0]],0],[19,762.0,1,[],1],[20,240000.0,2,[[56,20000.0]],1],[21,150.0,1,[],1],[22,1510000.0,1,[],1],[23,2048.0,1,[[151,2048.0]],0],[24,3648895.0,7,[[7,1950000.0],[21,250000.0]],5],[25,5136.0,1,[],1],[26,144219.0,4,[],4],[27,155496.0,27,[[60,18501.0],[49,16626.0],[77,12783.0],[58,9787.0],[55,8736.0],[73,8479.0],[54,7328.0],[51,7128.0],[105,6129.0],[111,5773.0],[85,4854.0],[36,4797.0]],0],[28,320.0,1,[],1],[29,15100.0,1,[],1],[30,216047.0,26,[[48,25631.0],[50,24648.0],[65,16238.0],[74,13638.0],[55,12161.0],[82,11488.0],[51,10370.0],[54,10239.0],[27,9377.0],[91,8798.0],[36,7380.0],[102,6691.0]],0],[31,100557.0,4,[[57,19920.0]],3],[32,1500.0,1,[],1],[33,5379076.0,3,[[3,5341908.0],[3,27168.0]],1],[34,250.0,1,[[177,250.0]],0],[35,1178028.0,3,[[9,1176754.0]],2],[36,6050.0,1,[[106,6050.0]],0],[37,2000.0,1,[[152,2000.0]],0],[38,385000.0,2,[],2],[39,62100.0,3,[[35,60000.0],[153,2000.0],[200,100.0]],0],[40,1000.0,1,[[170,1000.0]],0],[41,1.0,2,[],2],[42,42569.0,18,[[84,10152.0],[119,4777.0],[36,4057.0],[98,3452.0],[130,3241.0],[139,2858.0],[140,2836.0],[146,2256.0],[85,2048.0],[112,1711.0],[166,1289.0],[168,1109.0]],1],[43,957250.0,2,[],2],[44,1000.0,1,[],1],[45,160000.0,1,[],1],[46,0,3,[],3],[47,15000.0,1,[],1],[48,1292698.0,19,[[28,116980.0],[31,92046.0],[33,76470.0],[34,66201.0],[45,31449.0],[61,18403.0],[66,14846.0],[68,14490.0],[72,13813.0],[75,13500.0],[64,9926.0],[100,6961.0]],3],[49,36089200.0,21,[[0,12232827.0],[1,11239544.0],[2,9727250.0],[8,1785000.0],[11,529583.0],[20,255739.0],[23,197179.0],[30,93557.0],[62,17556.0],[93,8219.0],[165,1416.0],[171,1000.0]],0],[50,0,1,[],0],[51,21248.0,1,[],1],[52,285640.0,3,[[179,610.0],[206,30.0]],1],[53,250.0,1,[],1],[54,59674.0,4,[[40,37200.0],[71,14136.0],[114,5338.0],[136,3000.0]],0],[55,1006.0,1,[[144,1006.0]],0],[56,500.0,1,[[181,500.0]],0],[57,23134.0,1,[[53,23134.0]],0],[58,533500.0,1,[],1],[59,712448.0,4,[[147,2234.0],[192,214.0]],2],[60,0,3,[],3],[61,1326140.0,6,[[10,600000.0],[13,373520.0],[19,257000.0]],3],[62,0,1,[],0],[63,0,1,[],1],[64,500.0,1,[],1],[65,12969.0,8,[[98,3254.0],[134,3075.0],[92,3042.0],[150,2050.0],[58,1074.0],[185,412.0],[204,42.0],[207,20.0]],0],[66,12000.0,1,[[81,12000.0]],0],[67,2865000.0,3,[[12,515000.0],[14,350000.0]],1],[68,84554.0,1,[],1],[69,847019.0,1,[],1],[70,91196.0,2,[],2],[71,4020.0,1,[],1],[72,164762.0,4,[],4],[73,159.0,1,[],1],[74,57944.0,2,[[43,31407.0],[47,26537.0]],0],[75,113318.0,4,[],4],[76,4550.0,2,[[141,2550.0],[154,2000.0]],0],[77,38725.0,20,[[161,1863.0],[64,1153.0],[36,674.0],[27,669.0],[58,522.0],[133,519.0],[51,432.0],[187,400.0],[163,352.0],[193,199.0],[80,173.0],[114,172.0]],1],[78,6236.0,2,[],2],[79,6000.0,1,[[108,6000.0]],0],[80,4000000.0,2,[[4,4000000.0]],0],[81,10343526.0,10,[[6,2452241.0],[18,277862.0],[44,31500.0],[59,18705.0],[63,17000.0],[70,14298.0]],4],[82,104725.0,2,[[180,600.0]],1],[83,20.0,2,[],2],[84,4720.0,1,[[120,4720.0]],0],[85,3468.0,4,[[58,1985.0],[99,639.0],[183,426.0],[184,418.0]],0],[86,2114.0,1,[],1],[87,92000.0,2,[[39,42000.0]],1],[88,256539.0,7,[[42,34038.0],[121,4675.0],[122,4664.0],[124,4462.0]],3],[89,2050.0,2,[[155,2000.0]],1],[90,540000.0,4,[[17,280000.0]],2],[91,2607.0,5,[[162,1780.0],[195,150.0],[201,100.0],[203,50.0]],1],[92,17494.0,3,[[87,10000.0],[109,6000.0]],1],[93,30000.0,1,[[46,30000.0]],0],[94,39870.0,3,[[41,34409.0],[125,4288.0],[148,1173.0]],0],[95,3070000.0,1,[[5,3070000.0]],0],[96,500.0,1,[],1],[97,2000.0,1,[[156,2000.0]],0],[98,250.0,1,[],1],[99,300.0,1,[[189,300.0]],0],[100,28110.0,4,[[27,12163.0],[89,9161.0],[128,3486.0],[129,3300.0]],0],[101,144000.0,1,[[25,144000.0]],0],[102,160250.0,2,[],2],[103,14540.0,1,[[67,14540.0]],0],[104,367.0,2,[],2],[105,27291.0,6,[[52,23388.0],[144,1451.0],[83,1365.0],[173,952.0],[196,130.0],[208,5.0]],0],[106,378973.0,13,[[22,200160.0],[24,159000.0],[157,2000.0]],10],[107,106.0,1,[[199,106.0]],0],[108,245614.0,2,[],2],[109,97050.0,3,[[172,1000.0]],2],[110,1312772.0,5,[],5],[111,3800.0,3,[[158,2000.0]],2],[112,280000.0,1,[],1],[113,7500.0,1,[[97,7500.0]],0],[114,3978.0,1,[[126,3978.0]],0],[115,3897.0,1,[[112,3897.0]],0],[116,591000.0,1,[],1],[117,142536.0,4,[[26,140160.0],[167,1158.0],[98,718.0],[182,500.0]],0],[118,900000.0,1,[],1],[119,15000.0,1,[],1],[120,280000.0,1,[],1],[121,450000.0,3,[],3],[122,3000.0,1,[[137,3000.0]],0],[123,13467.0,3,[[76,13402.0]],2]],"sankey":[[0,[[142,2500.0]]],[1,[[27,4404.0],[36,3346.0],[107,6013.0],[133,2598.0],[148,907.0],[80,2294.0],[160,1942.0],[169,1067.0],[123,4464.0],[73,5277.0],[88,9847.0],[78,2714.0],[94,1247.0],[51,5663.0],[96,7691.0],[90,1591.0],[49,8517.0],[43,1953.0],[54,4977.0],[58,5352.0],[164,1514.0],[175,825.0],[64,977.0],[163,1414.0],[178,682.0],[85,2967.0],[104,1621.0],[131,3201.0]]],[2,[[86,10000.0]]],[3,[[194,152.0],[37,54000.0]]],[4,[[16,280654.0]]],[7,[[15,326000.0],[38,50000.0]]],[9,[[143,2500.0]]],[11,[[29,108232.0]]],[13,[[27,25094.0],[99,494.0]]],[14,[[32,80000.0]]],[15,[[116,5383.0],[36,36190.0],[27,79851.0],[99,5896.0],[113,5527.0]]],[17,[[176,780.0],[69,14311.0]]],[18,[[79,12192.0]]],[20,[[56,20000.0]]],[23,[[151,2048.0]]],[24,[[7,1950000.0],[21,250000.0]]],[27,[[159,1973.0],[60,18501.0],[78,3973.0],[51,7128.0],[127,3865.0],[49,16626.0],[27,1191.0],[105,6129.0],[36,4797.0],[55,8736.0],[83,4091.0],[80,3970.0],[138,2859.0],[111,5773.0],[92,2021.0],[73,8479.0],[64,1840.0],[103,2729.0],[94,3210.0],[77,12783.0],[90,2486.0],[95,3508.0],[54,7328.0],[58,9787.0],[149,2080.0],[85,4854.0],[104,4779.0]]],[30,[[74,13638.0],[27,9377.0],[36,7380.0],[55,12161.0],[83,5661.0],[80,5615.0],[135,3066.0],[145,2389.0],[132,3135.0],[91,8798.0],[92,3449.0],[82,11488.0],[48,25631.0],[78,5548.0],[64,2847.0],[103,3823.0],[94,3598.0],[51,10370.0],[65,16238.0],[117,5265.0],[102,6691.0],[110,5973.0],[90,4731.0],[50,24648.0],[95,4288.0],[54,10239.0]]],[31,[[57,19920.0]]],[33,[[3,5369076.0]]],[34,[[177,250.0]]],[35,[[9,1176754.0]]],[36,[[106,6050.0]]],[37,[[152,2000.0]]],[39,[[35,60000.0],[153,2000.0],[200,100.0]]],[40,[[170,1000.0]]],[42,[[130,3241.0],[36,4057.0],[84,10152.0],[186,401.0],[168,1109.0],[139,2858.0],[140,2836.0],[119,4777.0],[174,826.0],[190,290.0],[112,1711.0],[191,270.0],[166,1289.0],[98,3452.0],[146,2256.0],[85,2048.0],[177,521.0]]],[48,[[27,6588.0],[45,31449.0],[28,116980.0],[31,92046.0],[64,9926.0],[33,76470.0],[101,6710.0],[61,18403.0],[118,5159.0],[100,6961.0],[66,14846.0],[72,13813.0],[75,13500.0],[34,66201.0],[68,14490.0],[115,5406.0]]],[49,[[2,9727250.0],[0,12232827.0],[93,8219.0],[8,1785000.0],[62,17556.0],[209,1.0],[30,93557.0],[20,255739.0],[210,1.0],[23,197179.0],[11,529583.0],[211,1.0],[1,11239544.0],[165,1416.0],[171,1000.0],[188,327.0]]],[52,[[206,30.0],[179,610.0]]],[54,[[136,3000.0],[114,5338.0],[40,37200.0],[71,14136.0]]],[55,[[144,1006.0]]],[56,[[181,500.0]]],[57,[[53,23134.0]]],[59,[[147,2234.0],[192,214.0]]],[61,[[10,600000.0],[13,373520.0],[19,257000.0]]],[65,[[204,42.0],[58,1074.0],[207,20.0],[92,3042.0],[98,3254.0],[185,412.0],[150,2050.0],[134,3075.0]]],[66,[[81,12000.0]]],[67,[[14,350000.0],[12,515000.0]]],[74,[[43,31407.0],[47,26537.0]]],[76,[[141,2550.0],[154,2000.0]]],[77,[[27,669.0],[36,674.0],[202,68.0],[133,519.0],[205,34.0],[148,24.0],[80,173.0],[161,1863.0],[112,159.0],[64,1153.0],[163,352.0],[114,172.0],[51,432.0],[187,400.0],[198,117.0],[197,125.0],[58,522.0],[193,199.0],[85,145.0]]],[79,[[108,6000.0]]],[80,[[4,4000000.0]]],[81,[[63,17000.0],[59,18705.0],[44,31500.0],[18,277862.0],[6,2452241.0],[70,14298.0]]],[82,[[180,600.0]]],[84,[[120,4720.0]]],[85,[[183,426.0],[58,1985.0],[99,639.0],[184,418.0]]],[87,[[39,42000.0]]],[88,[[42,34038.0],[122,4664.0],[121,4675.0],[124,4462.0]]],[89,[[155,2000.0]]],[90,[[17,280000.0]]],[91,[[201,100.0],[195,150.0],[203,50.0],[162,1780.0]]],[92,[[109,6000.0],[87,10000.0]]],[93,[[46,30000.0]]],[94,[[148,1173.0],[125,4288.0],[41,34409.0]]],[95,[[5,3070000.0]]],[97,[[156,2000.0]]],[99,[[189,300.0]]],[100,[[27,12163.0],[129,3300.0],[128,3486.0],[89,9161.0]]],[101,[[25,144000.0]]],[103,[[67,14540.0]]],[105,[[196,130.0],[144,1451.0],[83,1365.0],[52,23388.0],[173,952.0],[208,5.0]]],[106,[[24,159000.0],[22,200160.0],[157,2000.0]]],[107,[[199,106.0]]],[109,[[172,1000.0]]],[111,[[158,2000.0]]],[113,[[97,7500.0]]],[114,[[126,3978.0]]],[115,[[112,3897.0]]],[117,[[98,718.0],[167,1158.0],[26,140160.0],[182,500.0]]],[122,[[137,3000.0]]],[123,[[76,13402.0]]]]};
@@ -4,15 +4,37 @@ Télécharge les données HATVP (DIA deputés) + groupes Assemblée Nationale
 et génère un data.json utilisable par le site statique.
 """
 
+import argparse
 import csv
+import gzip
+import hashlib
+import http.client
 import json
+import multiprocessing
+import os
+import queue
 import re
+import shutil
 import html as htmlmod
+import tempfile
+import threading
+import time
 import unicodedata
-import urllib.request
 import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from io import StringIO
+import zipfile
+import zlib
+from collections import Counter
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor, as_completed, wait)
+from contextlib import contextmanager
+from functools import partial
+from io import BufferedReader, BytesIO, RawIOBase, TextIOWrapper
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import brotli   # optionnel : variantes .br des fichiers de sortie
+except ImportError:
+    brotli = None
 
 CSV_URL = "https://www.hatvp.fr/livraison/opendata/liste.csv"
 AN_HEMICYCLE_URL = "https://www.assemblee-nationale.fr/dyn/vos-deputes/hemicycle"
@@ -20,6 +42,54 @@ AN_EMBED_BASE = "https://www.assemblee-nationale.fr/dyn/embed/acteur-presentatio
 DOSSIERS_BASE = "https://www.hatvp.fr/livraison/dossiers/"
 SENAT_GRP_BASE = "https://www.senat.fr/senateurs"
 
+# Filtres par type de mandat appliqués au CSV HATVP (colonne type_mandat,
+# normalisée en minuscules). Ajouter une entrée suffit pour créer un bucket.
+MANDATS = {
+    "deputes":   lambda m: m == "depute",
+    # accepte "senateur" et "sénateur" (avec/sans accent)
+    "senateurs": lambda m: m in ("senateur", "sénateur", "sénatrice", "senatrice"),
+}
+
+# Cache HTTP local (corps + ETag / Last-Modified des dossiers XML)
+CACHE_DIR = ".cache"
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+# Correspondance PA id → (nom, groupe, couleur) des députés, revalidée après TTL
+AN_GROUPES_STORE = os.path.join(CACHE_DIR, "an_groupes.json")
+AN_GROUPES_TTL   = 7 * 24 * 3600   # secondes
+
+# Politesse par hôte : (connexions keep-alive simultanées, requêtes par seconde)
+HOST_LIMITS = {
+    "www.hatvp.fr":               (8, 10.0),
+    "www.assemblee-nationale.fr": (10, 15.0),
+    "www.senat.fr":               (4, 5.0),
+}
+DEFAULT_HOST_LIMIT = (4, 5.0)
+HTTP_BUDGET   = 16     # requêtes simultanées tous hôtes confondus (les deux chambres)
+# Une connexion keep-alive inactive depuis plus longtemps a probablement été
+# fermée par le serveur (Apache : 5 s par défaut) : elle n'est pas réutilisée
+KEEPALIVE_IDLE = 4.0   # secondes
+MAX_RETRIES   = 3      # tentatives supplémentaires sur timeout / erreur réseau / 5xx
+RETRY_BACKOFF = 0.5    # secondes, doublé à chaque tentative
+MAX_REDIRECTS = 5
+USER_AGENT    = "Mozilla/5.0"
+
+# Pipeline dossiers : threads de téléchargement → file bornée → processus de parsing
+DOWNLOAD_WORKERS = 15
+DOWNLOAD_QUEUE   = 64    # dossiers bruts en attente de parsing (contre-pression)
+
+# Correspondance floue des noms : similarité minimale (trigrammes) et écart
+# minimal avec le second candidat pour conclure sans ambiguïté
+MATCH_MIN_SCORE = 0.5
+MATCH_MARGIN    = 0.1
+# Replis : similarité d'édition minimale des prénoms, sauf si l'un est contenu
+# dans l'autre (« Marie » / « Marie-France ») — « Sebastian » / « Sébastien »
+# passe, « Jeanne » / « Jean » et « Mario » / « Marie » non
+MATCH_PRENOM_MIN = 0.85
+# Repli trigrammes : chaque token du nom de famille doit se retrouver chez le
+# candidat, à une faute de frappe près pour les tokens d'au moins 4 lettres
+MATCH_NOM_EDITS  = 1
+GROUPE_INCONNU  = {"groupe": "Inconnu", "couleur": "", "groupe_complet": "Inconnu"}
+
 # Couleurs des groupes du Sénat (par slug de page)
 SENAT_GROUP_COLORS = {
     "ump":  "#004494",   # Les Républicains
@@ -35,27 +105,805 @@ SENAT_GROUP_COLORS = {
 
 # ── Helpers ────────────────────────────────────────────────────────────────
 
-def norm_key(s):
-    """Normalise une chaîne pour la correspondance nom/prénom : minuscules, apostrophes uniformisées."""
-    s = re.sub(r"['\u2019\u2018\u02bc\u0060]", "'", s or "")
-    return s.lower().strip()
-
 def ascii_key(s):
     """Variante ASCII sans diacritiques (pour matcher les graphies simplifiées)."""
     nfkd = unicodedata.normalize("NFD", s or "")
     return "".join(c for c in nfkd if unicodedata.category(c) != "Mn").lower().strip()
 
-def fetch(url, timeout=15):
-    req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-    with urllib.request.urlopen(req, timeout=timeout) as r:
-        return r.read().decode("utf-8", errors="replace")
+_progress_lock  = threading.Lock()
+_progress_local = threading.local()   # .label : chambre de la tâche en cours
 
 def progress(msg, pct=None):
-    if pct is not None:
-        bar = "█" * (pct // 5) + "░" * (20 - pct // 5)
-        print(f"\r[{bar}] {pct:3d}%  {msg}", end="", flush=True)
-    else:
-        print(f"\n{msg}", flush=True)
+    # Run ordonnancé : les chambres avancent en parallèle, chaque ligne est
+    # préfixée par la sienne ; un message de plusieurs lignes (bilans) est
+    # écrit d'un bloc
+    label = getattr(_progress_local, "label", None)
+    if label:
+        msg = "\n".join(f"[{label}] {line}" if line else line for line in msg.split("\n"))
+    with _progress_lock:
+        if pct is not None:
+            bar = "█" * (pct // 5) + "░" * (20 - pct // 5)
+            print(f"\r[{bar}] {pct:3d}%  {msg}", end="", flush=True)
+        else:
+            print(f"\n{msg}", flush=True)
+
+# ── Instrumentation ────────────────────────────────────────────────────────
+# Mesures structurées du run (durées et CPU par étape, requêtes par hôte,
+# parsing par dossier, correspondance des groupes), écrites en JSON avec
+# --report pour suivre dans le temps les ralentissements d'un hôte ou du parsing.
+
+REPORT_FORMAT  = "hatvp-run-report/1"
+REPORT_SLOWEST = 10   # URLs / dossiers les plus lents conservés dans le rapport
+
+def percentiles(values, scale=1.0):
+    """p50 / p90 / p99 / max (rang le plus proche), multipliés par `scale`."""
+    if not values:
+        return {}
+    v = sorted(values)
+    pick = lambda q: round(v[min(len(v) - 1, int(q * len(v)))] * scale, 2)
+    return {"p50": pick(0.5), "p90": pick(0.9), "p99": pick(0.99), "max": round(v[-1] * scale, 2)}
+
+
+class RunReport:
+    """Collecte thread-safe des mesures d'un run. La durée d'une requête va du
+    premier essai à la fin de la lecture (attente du pool et reprises
+    comprises) ; le TTFB est celui du dernier essai."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.stages = []
+        self.requests = []    # (hôte, url, statut, durée, ttfb, octets, tentatives)
+        self.parses = []      # (xml, durée, octets)
+        self.matching = {}
+        self.cache = {}
+
+    @contextmanager
+    def stage(self, name):
+        begin = time.time()
+        wall, cpu, children = time.perf_counter(), time.process_time(), os.times()
+        try:
+            yield
+        finally:
+            end = os.times()
+            stage = {
+                "etape": name,
+                # Les étapes des deux chambres se recouvrent : début relatif au
+                # run, et CPU du processus entier pendant l'étape
+                "debut_s": round(begin - self.started, 3),
+                "mur_s": round(time.perf_counter() - wall, 4),
+                "cpu_s": round(time.process_time() - cpu, 4),
+                # processus de parsing (comptés une fois le pool arrêté)
+                "cpu_enfants_s": max(0.0, round(end.children_user + end.children_system
+                                                - children.children_user
+                                                - children.children_system, 4)),
+            }
+            with self._lock:
+                self.stages.append(stage)
+
+    def request(self, url, status, seconds, ttfb, nbytes, attempts):
+        with self._lock:
+            self.requests.append((urlsplit(url).netloc, url, status, seconds, ttfb,
+                                  nbytes, attempts))
+
+    def parse(self, xml, seconds, nbytes):
+        with self._lock:
+            self.parses.append((xml, seconds, nbytes))
+
+    def hosts(self):
+        by_host = {}
+        for host, _, status, seconds, ttfb, nbytes, attempts in self.requests:
+            h = by_host.setdefault(host, {"requetes": 0, "statuts": Counter(), "reprises": 0,
+                                          "octets": 0, "_durees": [], "_ttfb": []})
+            h["requetes"] += 1
+            h["statuts"][str(status)] += 1
+            h["reprises"] += attempts - 1
+            h["octets"] += nbytes
+            h["_durees"].append(seconds)
+            if ttfb is not None:
+                h["_ttfb"].append(ttfb)
+        for host, h in by_host.items():
+            h["echecs"] = sum(1 for f in fetch_failures if urlsplit(f["url"]).netloc == host)
+            h["duree_ms"] = percentiles(h.pop("_durees"), 1000)
+            h["ttfb_ms"] = percentiles(h.pop("_ttfb"), 1000)
+        return by_host
+
+    def to_dict(self):
+        with self._lock:
+            slowest = sorted(self.requests, key=lambda r: -r[3])[:REPORT_SLOWEST]
+            parse_times = [s for _, s, _ in self.parses]
+            slow_parses = sorted(self.parses, key=lambda p: -p[1])[:REPORT_SLOWEST]
+            return {
+                "format": REPORT_FORMAT,
+                "debut": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(self.started)),
+                "duree_s": round(time.time() - self.started, 3),
+                "etapes": list(self.stages),
+                "hotes": self.hosts(),
+                "plus_lentes": [{"url": url, "statut": status, "duree_ms": round(s * 1000, 1),
+                                 "tentatives": attempts}
+                                for _, url, status, s, _, _, attempts in slowest],
+                "parsing": {
+                    "dossiers": len(self.parses),
+                    "total_s": round(sum(parse_times), 4),
+                    "octets": sum(n for _, _, n in self.parses),
+                    "duree_ms": percentiles(parse_times, 1000),
+                    "plus_lents": [{"xml": xml, "duree_ms": round(s * 1000, 2), "octets": n}
+                                   for xml, s, n in slow_parses],
+                },
+                "cache": dict(self.cache),
+                "correspondance": dict(self.matching),
+                "echecs": list(fetch_failures),
+            }
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=1)
+
+run_report = RunReport()
+
+# ── Moteur HTTP ────────────────────────────────────────────────────────────
+# Un pool de connexions keep-alive par hôte (http.client), borné en nombre de
+# connexions et en débit (seau à jetons), avec reprises bornées sur timeout,
+# erreur réseau et 5xx. Les échecs définitifs sont consignés dans
+# fetch_failures au lieu d'être avalés silencieusement.
+
+class FetchError(Exception):
+    """Échec définitif d'une requête HTTP (statut inattendu ou reprises épuisées)."""
+
+    def __init__(self, url, message, status=None):
+        super().__init__(f"{url}: {message}")
+        self.url = url
+        self.message = message
+        self.status = status
+
+
+class BodyReadError(FetchError):
+    """Connexion coupée ou flux corrompu pendant la lecture du corps, une fois
+    la réponse fournie : la requête entière est relancée par read_retrying."""
+
+
+class TokenBucket:
+    """Limiteur de débit : `rate` jetons par seconde, rafale max `burst`."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Erreurs d'une connexion réutilisée que le serveur a fermée entre deux
+# requêtes (RemoteDisconnected, ECONNRESET, EPIPE)
+STALE_ERRORS = (ConnectionError, http.client.BadStatusLine)
+
+class HostPool:
+    """Connexions keep-alive réutilisables vers un hôte (scheme, host)."""
+
+    def __init__(self, scheme, host, max_conns, rate):
+        self.scheme = scheme
+        self.host = host
+        self.bucket = TokenBucket(rate, burst=max_conns)
+        self._slots = threading.BoundedSemaphore(max_conns)
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _connect(self, timeout):
+        if REPLAY_ADDR is not None:
+            # Rejeu : tout passe par le serveur local, l'hôte d'origine est
+            # transmis dans l'en-tête Host (limites par hôte inchangées)
+            return http.client.HTTPConnection(*REPLAY_ADDR, timeout=timeout)
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.host, timeout=timeout)
+
+    def _checkout(self, timeout):
+        """Retourne (connexion, réutilisée) ; les connexions inactives depuis
+        plus de KEEPALIVE_IDLE secondes sont fermées au passage."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [c for c, since in self._idle if now - since > KEEPALIVE_IDLE]
+            self._idle = [(c, since) for c, since in self._idle if now - since <= KEEPALIVE_IDLE]
+            conn = self._idle.pop()[0] if self._idle else None
+        for c in expired:
+            c.close()
+        if conn is None:
+            return self._connect(timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _checkin(self, conn, resp):
+        if resp.will_close or not resp.isclosed():
+            conn.close()
+            return
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+
+    @contextmanager
+    def open(self, path, headers, timeout):
+        """Émet un GET et fournit la réponse ; la connexion retourne au pool
+        si la réponse a été lue jusqu'au bout."""
+        self._slots.acquire()
+        conn = None
+        budget = False
+        try:
+            self.bucket.acquire()
+            # Budget global pris après le créneau de l'hôte : un hôte n'a jamais
+            # plus de max_conns requêtes en attente, aucun ne peut monopoliser
+            # le budget au détriment des autres
+            _http_budget.acquire()
+            budget = True
+            conn, reused = self._checkout(timeout)
+            if REPLAY_ADDR is not None:
+                headers = {**headers, "Host": self.host, REPLAY_SCHEME_HEADER: self.scheme}
+            t0 = time.perf_counter()
+            while True:
+                try:
+                    conn.request("GET", path, headers=headers)
+                    resp = conn.getresponse()
+                    break
+                except STALE_ERRORS:
+                    if not reused:
+                        raise
+                    # Connexion keep-alive déjà fermée par le serveur : nouvel
+                    # essai immédiat, qui ne compte pas comme une reprise
+                    conn.close()
+                    conn, reused = self._checkout(timeout)
+            resp.ttfb = time.perf_counter() - t0
+            yield resp
+            self._checkin(conn, resp)
+            conn = None
+        finally:
+            if conn is not None:
+                conn.close()
+            if budget:
+                _http_budget.release()
+            self._slots.release()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+_http_budget = threading.BoundedSemaphore(HTTP_BUDGET)
+_failures_lock = threading.Lock()
+fetch_failures = []   # [{url, erreur, tentatives}] — échecs définitifs du run
+
+def _pool_for(url):
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            max_conns, rate = HOST_LIMITS.get(parts.hostname, DEFAULT_HOST_LIMIT)
+            pool = _pools[key] = HostPool(parts.scheme, parts.netloc, max_conns, rate)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    return pool, path
+
+def _record_failure(url, err, attempts):
+    message = err.message if isinstance(err, FetchError) else str(err)
+    with _failures_lock:
+        fetch_failures.append({"url": url, "erreur": message, "tentatives": attempts})
+
+RETRYABLE_ERRORS = (TimeoutError, ConnectionError, http.client.HTTPException, OSError)
+
+class _CountingReader(RawIOBase):
+    """Compte les octets (décompressés) lus par l'appelant ; une erreur réseau
+    ou de décompression pendant la lecture, ou un corps plus court que son
+    Content-Length, devient une BodyReadError."""
+
+    def __init__(self, resp, stream, url):
+        self.resp = resp
+        self.stream = stream
+        self.url = url
+        self.nbytes = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        try:
+            n = self.stream.readinto(b)
+        except (*RETRYABLE_ERRORS, EOFError, zlib.error) as e:
+            raise BodyReadError(self.url, repr(e)) from e
+        if not n and b and self.resp.length:
+            # HTTPResponse.readinto rend 0 sur fin de connexion prématurée
+            raise BodyReadError(self.url, f"corps tronqué ({self.resp.length} octets manquants)")
+        self.nbytes += n or 0
+        return n
+
+def _counted(resp, stream, url):
+    counter = _CountingReader(resp, stream, url)
+    reader = BufferedReader(counter)
+    reader.status = resp.status
+    reader.getheader = resp.getheader
+    return reader, counter
+
+@contextmanager
+def open_url(url, timeout=15, headers=None):
+    """Ouvre une réponse HTTP à lire en flux (redirections suivies, reprises
+    sur erreur avant le premier octet). La réponse fournie est décompressée
+    si le serveur a répondu en gzip ; son attribut `status` est conservé.
+    Une coupure pendant la lecture lève BodyReadError, à relancer avec
+    read_retrying (le flux déjà lu ne peut pas être rejoué ici)."""
+    hdrs = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+    hdrs.update(headers or {})
+    requested = url
+    attempt = 0
+    redirects = 0
+    started = time.perf_counter()
+    while True:
+        pool, path = _pool_for(url)
+        yielded = False
+        counter = resp = None
+        try:
+            location = server_error = None
+            with pool.open(path, hdrs, timeout) as resp:
+                if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+                    resp.read()
+                    location = resp.getheader("Location")
+                elif resp.status >= 500 or resp.status == 429:
+                    resp.read()
+                    server_error = resp.status
+                elif resp.getheader("Content-Encoding", "").lower() == "gzip":
+                    stream, counter = _counted(resp, gzip.GzipFile(fileobj=resp), url)
+                    yielded = True
+                    yield _recording(requested, stream)
+                    # Vider le flux brut pour pouvoir réutiliser la connexion
+                    # (sinon elle est simplement fermée)
+                    try:
+                        resp.read()
+                    except RETRYABLE_ERRORS:
+                        pass
+                else:
+                    stream, counter = _counted(resp, resp, url)
+                    yielded = True
+                    yield _recording(requested, stream)
+            if server_error:
+                raise FetchError(url, f"HTTP {server_error}", server_error)
+        except (FetchError, *RETRYABLE_ERRORS) as e:
+            # Après la réponse fournie : BodyReadError remonte à read_retrying,
+            # une erreur propre à l'appelant n'est pas rejouée
+            if yielded:
+                raise
+            retryable = not isinstance(e, FetchError) or (e.status or 0) >= 500 or e.status == 429
+            if not retryable or attempt >= MAX_RETRIES:
+                _record_failure(url, e, attempt + 1)
+                run_report.request(url, getattr(e, "status", None),
+                                   time.perf_counter() - started,
+                                   getattr(resp, "ttfb", None), 0, attempt + 1)
+                raise e if isinstance(e, FetchError) else FetchError(url, repr(e)) from e
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
+            continue
+        if location is None:
+            run_report.request(url, resp.status, time.perf_counter() - started, resp.ttfb,
+                               counter.nbytes if counter else 0, attempt + 1)
+            return
+        redirects += 1
+        if redirects > MAX_REDIRECTS:
+            _record_failure(url, "trop de redirections", attempt + 1)
+            raise FetchError(url, "trop de redirections")
+        url = urljoin(url, location)
+
+def read_retrying(url, read):
+    """Exécute `read()` (ouverture et lecture complète d'une réponse) en la
+    relançant sur BodyReadError, avec les reprises et délais d'open_url ;
+    l'échec définitif est consigné."""
+    started = time.perf_counter()
+    attempt = 0
+    while True:
+        try:
+            return read()
+        except BodyReadError as e:
+            if attempt >= MAX_RETRIES:
+                _record_failure(url, e, attempt + 1)
+                run_report.request(url, None, time.perf_counter() - started, None, 0,
+                                   attempt + 1)
+                raise
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
+
+def request(url, timeout=15, headers=None):
+    """GET complet : retourne (statut, en-têtes utiles, corps en octets)."""
+    def read():
+        with open_url(url, timeout=timeout, headers=headers) as r:
+            body = r.read()
+            meta = {"etag": r.getheader("ETag"), "last_modified": r.getheader("Last-Modified")}
+            return r.status, meta, body
+    return read_retrying(url, read)
+
+def fetch(url, timeout=15):
+    status, _, body = request(url, timeout=timeout)
+    if status != 200:
+        _record_failure(url, f"HTTP {status}", 1)
+        raise FetchError(url, f"HTTP {status}", status)
+    return body.decode("utf-8", errors="replace")
+
+# ── Cache HTTP persistant ──────────────────────────────────────────────────
+# Un fichier .body (contenu brut) + un fichier .json (ETag, Last-Modified,
+# date_publication HATVP) par URL, rangés par hash SHA-1 de l'URL.
+
+_cache_lock  = threading.Lock()
+cache_stats  = {"frais": 0, "revalides": 0, "telecharges": 0}
+
+def _cache_count(kind, stats=None):
+    with _cache_lock:
+        cache_stats[kind] += 1
+        if stats is not None:
+            stats[kind] += 1
+
+def _cache_paths(url):
+    h = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    base = os.path.join(HTTP_CACHE_DIR, h[:2], h)
+    return base + ".body", base + ".json"
+
+def _tmp_path(path):
+    """Fichier temporaire voisin de `path`, propre au thread (renommé ensuite)."""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = _tmp_path(path)
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def _cache_load(url):
+    """Retourne (meta, body) depuis le cache, ou (None, None) si absent/incomplet."""
+    body_path, meta_path = _cache_paths(url)
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, None
+    return meta, body
+
+def _cache_store(url, meta, body=None):
+    body_path, meta_path = _cache_paths(url)
+    if body is not None:
+        _write_atomic(body_path, body)
+    _write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+def fetch_cached(url, timeout=15, version=None, stats=None):
+    """Comme fetch(), mais avec cache disque et revalidation conditionnelle ;
+    retourne le corps brut (octets). Les compteurs de cache_stats (cumul du
+    run) sont aussi incrémentés dans `stats` s'il est fourni.
+
+    `version` identifie la version publiée du document (ici la date_publication
+    du CSV HATVP) : si elle est identique à celle du cache, aucune requête n'est
+    émise. Sinon la requête porte If-None-Match / If-Modified-Since et un 304
+    réutilise le corps en cache.
+    """
+    meta, body = _cache_load(url)
+    if meta is not None and version and meta.get("version") == version:
+        _cache_count("frais", stats)
+        if recorder is not None:
+            recorder.add(url, body)
+        return body
+
+    headers = {}
+    if meta is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    status, new_meta, new_body = request(url, timeout=timeout, headers=headers)
+    if status == 304 and meta is not None:
+        # Non modifié : on garde le corps, on enregistre la nouvelle version
+        if version and meta.get("version") != version:
+            meta["version"] = version
+            _cache_store(url, meta)
+        _cache_count("revalides", stats)
+        if recorder is not None:
+            recorder.add(url, body)
+        return body
+    if status != 200:
+        _record_failure(url, f"HTTP {status}", 1)
+        raise FetchError(url, f"HTTP {status}", status)
+
+    new_meta.update(url=url, version=version)
+    _cache_store(url, new_meta, new_body)
+    _cache_count("telecharges", stats)
+    return new_body
+
+# ── Enregistrement et rejeu ───────────────────────────────────────────────
+# --record DIR : chaque réponse utilisée par le run (CSV, hémicycle, pages
+# embed, pages de groupes du Sénat, dossiers XML, y compris ceux servis par le
+# cache) est archivée par contenu : objects/<sha256[:2]>/<sha256> + index.json
+# (URL → objet), complété au fil du run par le journal index.log pour qu'un
+# run interrompu garde ses réponses. --replay HÔTE:PORT redirige toutes les
+# connexions vers un serveur local qui sert cette archive (python bench.py
+# serve ARCHIVE) ; cache HTTP, magasin des groupes et sorties vont alors dans
+# --replay-dir, ceux du site restent intacts.
+
+ARCHIVE_FORMAT = "hatvp-archive/1"
+REPLAY_SCHEME_HEADER = "X-Replay-Scheme"
+REPLAY_DIR = "replay"   # défaut de --replay-dir
+recorder = None       # Archive alimentée en mode --record
+REPLAY_ADDR = None    # (hôte, port) du serveur de rejeu en mode --replay
+
+class Archive:
+    """Archive de réponses HTTP adressée par contenu."""
+
+    def __init__(self, root):
+        self.root = root
+        self.index_path = os.path.join(root, "index.json")
+        self.journal_path = os.path.join(root, "index.log")
+        self._lock = threading.Lock()
+        self._journal = None
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                self.entries = json.load(f)["entries"]
+        except (OSError, ValueError, KeyError):
+            self.entries = {}
+        # Entrées d'un run --record interrompu avant save()
+        try:
+            with open(self.journal_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        url, entry = json.loads(line)
+                    except ValueError:
+                        break   # dernière ligne tronquée
+                    self.entries[url] = entry
+        except OSError:
+            pass
+
+    def object_path(self, sha):
+        return os.path.join(self.root, "objects", sha[:2], sha)
+
+    def add(self, url, body, content_type=None):
+        sha = hashlib.sha256(body).hexdigest()
+        path = self.object_path(sha)
+        if not os.path.exists(path):
+            _write_atomic(path, body)
+        entry = {"sha256": sha, "size": len(body), "content_type": content_type}
+        with self._lock:
+            if self.entries.get(url) == entry:
+                return
+            self.entries[url] = entry
+            if self._journal is None:
+                os.makedirs(self.root, exist_ok=True)
+                self._journal = open(self.journal_path, "a", encoding="utf-8")
+            self._journal.write(_dumps([url, entry]))
+            self._journal.write("\n")
+            self._journal.flush()
+
+    def get(self, url):
+        """Retourne (entrée d'index, corps) ou (None, None) si l'URL est absente."""
+        entry = self.entries.get(url)
+        if entry is None:
+            return None, None
+        with open(self.object_path(entry["sha256"]), "rb") as f:
+            return entry, f.read()
+
+    def save(self):
+        """Réécrit index.json avec toutes les entrées ; le journal est vidé."""
+        with self._lock:
+            data = {"format": ARCHIVE_FORMAT, "entries": dict(sorted(self.entries.items()))}
+            _write_atomic(self.index_path,
+                          json.dumps(data, ensure_ascii=False, indent=1).encode("utf-8"))
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            try:
+                os.remove(self.journal_path)
+            except FileNotFoundError:
+                pass
+
+def start_recording(root):
+    global recorder
+    recorder = Archive(root)
+    return recorder
+
+def use_replay(host, port):
+    global REPLAY_ADDR
+    with _pools_lock:
+        _pools.clear()   # connexions ouvertes vers les vrais hôtes
+    REPLAY_ADDR = (host, int(port))
+
+def _recording(url, stream):
+    """En mode --record, lit la réponse 200 en entier pour l'archiver et la
+    restitue sous forme de flux équivalent."""
+    if recorder is None or stream.status != 200:
+        return stream
+    body = stream.read()
+    recorder.add(url, body, stream.getheader("Content-Type"))
+    copy = BytesIO(body)
+    copy.status = stream.status
+    copy.getheader = stream.getheader
+    return copy
+
+# ── Correspondance des noms ──────────────────────────────────────────────
+
+def name_tokens(s):
+    """Tokens canoniques d'un nom : entités HTML décodées, sans accents,
+    minuscules, découpé sur espaces, tirets et apostrophes."""
+    return tuple(re.findall(r"[a-z0-9]+", ascii_key(htmlmod.unescape(s or ""))))
+
+def trigrams(s):
+    s = f"  {s} "
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+def trigram_similarity(a, b):
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+def edit_distance(a, b):
+    """Distance de Levenshtein (insertions, suppressions, substitutions)."""
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+def prenom_close(a, b):
+    """Vrai si les prénoms (tuples de tokens) désignent la même personne :
+    l'un contient l'autre, ou ils ne diffèrent que d'une faute de graphie."""
+    a, b = set(a), set(b)
+    if not a or not b:
+        return False
+    if a <= b or b <= a:
+        return True
+    x, y = " ".join(sorted(a)), " ".join(sorted(b))
+    return 1 - edit_distance(x, y) / max(len(x), len(y)) >= MATCH_PRENOM_MIN
+
+def surname_rest(nom_toks, cand_toks):
+    """Tokens du candidat hors nom de famille si chaque token de nom_toks y
+    figure (exactement, ou à MATCH_NOM_EDITS près dès 4 lettres), sinon None."""
+    rest = set(cand_toks)
+    for t in nom_toks:
+        if t in rest:
+            rest.discard(t)
+            continue
+        near = [c for c in rest if max(len(t), len(c)) >= 4
+                and edit_distance(t, c) <= MATCH_NOM_EDITS]
+        if not near:
+            return None
+        rest.discard(min(near, key=lambda c: edit_distance(t, c)))
+    return rest
+
+
+class NameMatcher:
+    """Index nom → groupe construit une fois par chambre.
+
+    Chaque candidat est indexé une seule fois par son nom complet canonique
+    (tokens triés, donc indépendant de l'ordre NOM / Prénom), plus un index
+    token → candidats et trigramme → candidats pour le repli approché.
+    Les correspondances ambiguës ne sont pas tranchées : elles sont comptées
+    et listées dans report(), comme les correspondances approchées.
+    """
+
+    def __init__(self):
+        self._entries = []      # entrée de groupe par candidat
+        self._names = []        # nom affichable par candidat
+        self._tokens = []       # tokens canoniques par candidat
+        self._exact = {}        # clé canonique → [indices]
+        self._by_token = {}     # token → {indices}
+        self._by_gram = {}      # trigramme → {indices}
+        self.stats = Counter()
+        self.unmatched = []
+        self.ambiguous = []
+        self.approximate = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, full_name, entry):
+        """Indexe un candidat par son nom complet (« Prénom NOM » ou « NOM Prénom »)."""
+        toks = name_tokens(full_name)
+        if not toks:
+            return
+        i = len(self._entries)
+        self._entries.append(entry)
+        self._names.append(" ".join(full_name.split()))
+        self._tokens.append(set(toks))
+        key = " ".join(sorted(toks))
+        self._exact.setdefault(key, []).append(i)
+        for t in toks:
+            self._by_token.setdefault(t, set()).add(i)
+        for g in trigrams(key):
+            self._by_gram.setdefault(g, set()).add(i)
+
+    def _resolve(self, idx, nom, prenom):
+        """Retourne l'entrée si tous les candidats pointent vers le même groupe."""
+        entries = {tuple(sorted(self._entries[i].items())): self._entries[i] for i in idx}
+        if len(entries) == 1:
+            return next(iter(entries.values()))
+        self.stats["ambigus"] += 1
+        self.ambiguous.append({"nom": nom, "prenom": prenom,
+                               "candidats": sorted(self._names[i] for i in idx)})
+        return None
+
+    def match(self, nom, prenom):
+        """Retourne l'entrée de groupe de (nom, prenom), ou None."""
+        nom_toks, prenom_toks = name_tokens(nom), name_tokens(prenom)
+        key = " ".join(sorted(nom_toks + prenom_toks))
+        idx = self._exact.get(key)
+        if idx:
+            found = self._entries[idx[0]] if len(idx) == 1 else self._resolve(idx, nom, prenom)
+            if found is not None:
+                self.stats["exacts"] += 1
+            return found
+
+        # Repli 1 : candidats contenant tous les tokens du nom de famille,
+        # dont le prénom est proche, départagés par la similarité du prénom
+        sets = [self._by_token.get(t) for t in nom_toks]
+        if sets and all(sets):
+            scored = self._score_prenoms(set.intersection(*sets), nom_toks, prenom_toks)
+            if len(scored) == 1:
+                return self._approx(scored[0][1], nom, prenom, scored[0][0])
+            found = self._pick(scored, nom, prenom)
+            if found is not False:
+                return found
+
+        # Repli 2 : trigrammes du nom complet (graphies divergentes), limités
+        # aux candidats dont le nom de famille et le prénom restent proches
+        grams = trigrams(key)
+        counts = Counter(i for g in grams for i in self._by_gram.get(g, ()))
+        scored = sorted(((trigram_similarity(grams, trigrams(" ".join(sorted(self._tokens[i])))), i, "")
+                         for i, _ in counts.most_common(20)
+                         if prenom_close(prenom_toks, surname_rest(nom_toks, self._tokens[i]) or ())),
+                        reverse=True)
+        found = self._pick(scored, nom, prenom)
+        if found is not False:
+            return found
+        self.stats["introuvables"] += 1
+        self.unmatched.append({"nom": nom, "prenom": prenom})
+        return None
+
+    def _score_prenoms(self, cands, nom_toks, prenom_toks):
+        """[(similarité du prénom, indice, prénom du candidat)] des candidats
+        dont le prénom est proche, triés par similarité décroissante."""
+        prenom_grams = trigrams(" ".join(prenom_toks))
+        scored = []
+        for i in cands:
+            rest = self._tokens[i] - set(nom_toks)
+            if prenom_close(prenom_toks, rest):
+                rest = " ".join(sorted(rest))
+                scored.append((trigram_similarity(prenom_grams, trigrams(rest)), i, rest))
+        return sorted(scored, reverse=True)
+
+    def _pick(self, scored, nom, prenom):
+        """Meilleur candidat d'une liste triée (score, indice, _) ; None si
+        ambigu, False si aucun candidat n'atteint MATCH_MIN_SCORE."""
+        if not scored or scored[0][0] < MATCH_MIN_SCORE:
+            return False
+        best = scored[0][0]
+        close = [i for score, i, _ in scored if best - score < MATCH_MARGIN]
+        found = self._resolve(close, nom, prenom)
+        if found is not None:
+            self._approx(close[0], nom, prenom, best)
+        return found
+
+    def _approx(self, i, nom, prenom, score):
+        """Compte et liste une correspondance approchée (vérifiable dans le bilan)."""
+        self.stats["approches"] += 1
+        self.approximate.append({"nom": nom, "prenom": prenom, "candidat": self._names[i],
+                                 "score": round(score, 2)})
+        return self._entries[i]
+
+    def report(self):
+        return {"candidats": len(self), **self.stats,
+                "approches_detail": self.approximate,
+                "ambigus_detail": self.ambiguous, "introuvables_detail": self.unmatched}
+
 
 # ── Groupes parlementaires depuis l'Assemblée Nationale ───────────────────
 
@@ -65,10 +913,10 @@ def fetch_pa_presentation(pa_id):
         html = fetch(AN_EMBED_BASE + pa_id, timeout=10)
         # Extract name from <a href="/dyn/deputes/PA...">Name</a>
         nom_match = re.search(r'href="/dyn/deputes/PA\d+"[^>]*>([^<]+)</a>', html)
-        nom = nom_match.group(1).strip() if nom_match else ""
+        nom = htmlmod.unescape(nom_match.group(1)).strip() if nom_match else ""
         # Extract groupe from background-color span
         groupe_match = re.search(r'background-color:[^;]+;\s*color:[^"]+">.*?<span>([^<]+)</span>', html, re.DOTALL)
-        groupe = groupe_match.group(1).strip() if groupe_match else ""
+        groupe = htmlmod.unescape(groupe_match.group(1)).strip() if groupe_match else ""
         # Extract color
         color_match = re.search(r'background-color:\s*(#[0-9a-fA-F]{6})', html)
         couleur = color_match.group(1) if color_match else ""
@@ -76,97 +924,205 @@ def fetch_pa_presentation(pa_id):
     except Exception:
         return pa_id, "", "", ""
 
-def load_groupes():
+def scrape_hemicycle():
+    """Retourne {PA id: couleur du siège} depuis la page hémicycle de l'AN."""
+    html = fetch(AN_HEMICYCLE_URL, timeout=15)
+    # Extract JSON blobs: {"couleur":"#...","tooltipUrl":"/dyn/embed/acteur-presentation/PA..."}
+    raw_blocks = re.findall(r'\{&quot;couleur&quot;[^}]+\}', html)
+    seats = {}
+    for b in raw_blocks:
+        decoded = htmlmod.unescape(b)
+        try:
+            obj = json.loads(decoded)
+        except ValueError:
+            continue
+        pa_match = re.search(r'PA(\d+)', obj.get('tooltipUrl', ''))
+        if pa_match:
+            seats.setdefault('PA' + pa_match.group(1), (obj.get('couleur') or "").lower())
+    return seats
+
+def _as_list(x):
+    return x if isinstance(x, list) else ([] if x is None else [x])
+
+def _text(x):
+    return x.get("#text", "") if isinstance(x, dict) else (x or "")
+
+def load_an_opendata(path):
+    """Lit un export open data AN « acteurs / mandats / organes » (zip ou dossier
+    de fichiers JSON, ou fichier JSON unique) → {PA id: (nom, groupe, couleur)}
+    pour le groupe politique (GP) en cours de chaque député."""
+    docs = []
+    if os.path.isdir(path):
+        for dirpath, _, files in os.walk(path):
+            for name in files:
+                if name.endswith(".json"):
+                    with open(os.path.join(dirpath, name), encoding="utf-8") as f:
+                        docs.append(json.load(f))
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as z:
+            for name in z.namelist():
+                if name.endswith(".json"):
+                    docs.append(json.loads(z.read(name).decode("utf-8")))
+    else:
+        with open(path, encoding="utf-8") as f:
+            docs.append(json.load(f))
+
+    acteurs, organes = [], {}
+    for doc in docs:
+        export = doc.get("export", doc)
+        acteurs += _as_list(export.get("acteur")) + _as_list((export.get("acteurs") or {}).get("acteur"))
+        for o in _as_list(export.get("organe")) + _as_list((export.get("organes") or {}).get("organe")):
+            if o.get("codeType") == "GP":
+                organes[_text(o.get("uid"))] = (o.get("libelle") or "", o.get("couleurAssociee") or "")
+
+    result = {}
+    for a in acteurs:
+        ident = (a.get("etatCivil") or {}).get("ident") or {}
+        nom = f"{ident.get('prenom', '')} {ident.get('nom', '')}".strip()
+        for m in _as_list((a.get("mandats") or {}).get("mandat")):
+            if m.get("typeOrgane") != "GP" or m.get("dateFin"):
+                continue
+            ref = _text(((m.get("organes") or {}).get("organeRef")))
+            if ref in organes and nom:
+                groupe, couleur = organes[ref]
+                result[_text(a.get("uid"))] = (nom, groupe, couleur)
+    return result
+
+def _load_store(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def load_groupes(ttl=AN_GROUPES_TTL, opendata=None, store_path=AN_GROUPES_STORE):
+    """Construit l'index des groupes des députés.
+
+    Les PA ids en cours sont lus sur la page hémicycle ; la correspondance
+    PA id → (nom, groupe, couleur) vient du magasin persistant `store_path`.
+    Seuls les PA ids absents, expirés (plus vieux que `ttl` secondes) ou dont
+    le siège a changé de couleur depuis le run précédent (changement de
+    groupe) sont redemandés à la page embed de l'AN.
+    `opendata` (export AN acteurs/organes) permet de remplir le magasin en bloc.
+    """
+    store = _load_store(store_path)
+    now = time.time()
+
+    if opendata:
+        progress(f"Lecture de l'export open data AN ({opendata})...")
+        bulk = load_an_opendata(opendata)
+        for pa_id, (nom, groupe, couleur) in bulk.items():
+            store[pa_id] = {"nom": nom, "groupe": groupe, "couleur": couleur, "maj": now}
+        progress(f"  → {len(bulk)} députés avec groupe en cours")
+
     progress("Extraction des PA IDs depuis l'hémicycle AN...")
     try:
-        html = fetch(AN_HEMICYCLE_URL, timeout=15)
-        # Extract JSON blobs: {"couleur":"#...","tooltipUrl":"/dyn/embed/acteur-presentation/PA..."}
-        raw_blocks = re.findall(r'\{&quot;couleur&quot;[^}]+\}', html)
-        pa_ids = []
-        for b in raw_blocks:
-            decoded = htmlmod.unescape(b)
-            try:
-                obj = json.loads(decoded)
-                pa_match = re.search(r'PA(\d+)', obj.get('tooltipUrl', ''))
-                if pa_match:
-                    pa_ids.append('PA' + pa_match.group(1))
-            except Exception:
-                pass
-        pa_ids = list(dict.fromkeys(pa_ids))  # deduplicate preserving order
-        progress(f"  → {len(pa_ids)} PA IDs extraits")
+        seats = scrape_hemicycle()
+        progress(f"  → {len(seats)} PA IDs extraits")
     except Exception as e:
         progress(f"  ⚠ Impossible d'accéder à l'hémicycle: {e}")
-        return {}
+        if not store:
+            return NameMatcher()
+        progress(f"  → repli sur les {len(store)} députés du magasin local")
+        seats = {pa_id: v.get("siege", "") for pa_id, v in store.items()}
 
-    progress(f"\nRécupération des groupes ({len(pa_ids)} requêtes AN)...")
-    groupes_by_nom = {}   # key: nom normalisé → {groupe, couleur, groupe_complet}
-    done = 0
+    # La couleur du siège n'est comparée qu'à celle de l'hémicycle au run
+    # précédent ("siege") : la couleur enregistrée vient de la page embed ou
+    # de l'open data (couleurAssociee), qui ne suivent pas la même palette
+    stale = [pa_id for pa_id, siege in seats.items()
+             if pa_id not in store
+             or now - store[pa_id].get("maj", 0) > ttl
+             or siege and store[pa_id].get("siege") not in (None, siege)]
 
+    progress(f"\nRécupération des groupes ({len(stale)} requêtes AN, "
+             f"{len(seats) - len(stale)} depuis le magasin local)...")
+    done = 0
+    failed = set()
     with ThreadPoolExecutor(max_workers=20) as pool:
-        futures = {pool.submit(fetch_pa_presentation, pid): pid for pid in pa_ids}
+        futures = {pool.submit(fetch_pa_presentation, pid): pid for pid in stale}
         for fut in as_completed(futures):
             pa_id, nom, groupe, couleur = fut.result()
             if nom:
-                # Normalize: "M. Gérault Verny" or "Mme Yaël Braun-Pivet"
-                clean = re.sub(r'^(M\.|Mme\.?)\s*', '', nom).strip()
-                parts = clean.split()
-                entry = {"groupe": groupe, "couleur": couleur, "groupe_complet": groupe}
-                # Key: last word as nom, rest as prenom (French convention: Prénom NOM)
-                # But since casing is mixed, index many variants
-                if len(parts) >= 2:
-                    # "Gérault Verny" → nom=Verny, prenom=Gérault
-                    nom_an = parts[-1].upper()
-                    prenom_an = ' '.join(parts[:-1])
-                    groupes_by_nom[norm_key(f"{nom_an}_{prenom_an}")] = entry
-                    groupes_by_nom[norm_key(nom_an)] = entry
-                    # Also try multi-word last names: "Braun-Pivet" → BRAUN-PIVET
-                    # "Agnès Firmin Le Bodo" → nom=FIRMIN LE BODO
-                    for split_idx in range(1, len(parts)):
-                        nom_part = ' '.join(parts[split_idx:]).upper()
-                        prenom_part = ' '.join(parts[:split_idx])
-                        groupes_by_nom[norm_key(f"{nom_part}_{prenom_part}")] = entry
-                        groupes_by_nom[norm_key(nom_part)] = entry
-                groupes_by_nom[norm_key(clean)] = entry
+                store[pa_id] = {"nom": nom, "groupe": groupe, "couleur": couleur, "maj": time.time()}
+            else:
+                failed.add(pa_id)
             done += 1
-            pct = int(done / len(pa_ids) * 100)
-            progress(f"{done}/{len(pa_ids)} – {nom or pa_id} → {groupe}", pct)
+            pct = int(done / len(stale) * 100)
+            progress(f"{done}/{len(stale)} – {nom or pa_id} → {groupe}", pct)
+    # Couleurs de siège de référence pour le prochain run (sauf entrées dont
+    # le rafraîchissement a échoué : elles seront redemandées)
+    sieges = 0
+    for pa_id, siege in seats.items():
+        if (siege and pa_id in store and pa_id not in failed
+                and store[pa_id].get("siege") != siege):
+            store[pa_id]["siege"] = siege
+            sieges += 1
+    if stale or opendata or sieges:
+        _write_atomic(store_path, json.dumps(store, ensure_ascii=False, indent=1).encode("utf-8"))
 
-    progress(f"\n  → {len(pa_ids)} députés, groupes récupérés depuis AN")
-    return groupes_by_nom
+    groupes = NameMatcher()
+    for pa_id in seats:
+        e = store.get(pa_id)
+        if e and e.get("nom"):
+            # Normalize: "M. Gérault Verny" or "Mme Yaël Braun-Pivet"
+            clean = re.sub(r'^(M\.|Mme\.?)\s*', '', e["nom"]).strip()
+            groupes.add(clean, {"groupe": e["groupe"], "couleur": e["couleur"],
+                                "groupe_complet": e["groupe"]})
+    progress(f"\n  → {len(seats)} députés, {len(groupes)} groupes récupérés depuis AN")
+    return groupes
 
 # ── CSV HATVP ─────────────────────────────────────────────────────────────
 
-def load_csv():
-    progress("Chargement CSV HATVP...")
-    text = fetch(CSV_URL)
-    reader = csv.DictReader(StringIO(text), delimiter=";")
-    entries = {}
-    for row in reader:
-        if (row.get("type_mandat") == "depute"
-                and row.get("type_document") == "dia"
-                and row.get("open_data", "").endswith(".xml")
-                and row.get("statut_publication") == "Livrée"):
-            key = f"{row['nom']}_{row['prenom']}".lower()
-            # Garder une seule entrée par député (la plus récente = la première vue)
-            if key not in entries:
-                entries[key] = {
-                    "prenom": row["prenom"],
-                    "nom": row["nom"],
-                    "qualite": row["qualite"],
-                    "departement": row["departement"],
-                    "xml": row["open_data"],
-                    "url": row["url_dossier"],
-                    "date": row.get("date_publication", ""),
-                }
-    progress(f"  → {len(entries)} députés avec DIA publiée")
-    return list(entries.values())
+def load_csv(mandats=MANDATS):
+    """Lit liste.csv en un seul passage streaming et répartit les DIA publiées
+    par type de mandat : {nom_du_bucket: [entrées]}."""
+    progress("Chargement CSV HATVP (lecture en flux)...")
+
+    def read():
+        # Relancée depuis le début si la connexion coupe en cours de lecture
+        buckets = {name: {} for name in mandats}
+        with open_url(CSV_URL) as r:
+            if r.status != 200:
+                raise FetchError(CSV_URL, f"HTTP {r.status}", r.status)
+            stream = TextIOWrapper(r, encoding="utf-8", errors="replace", newline="")
+            for row in csv.DictReader(stream, delimiter=";"):
+                # Ligne courte (champs manquants = None) : ignorée comme les autres
+                if (row.get("type_document") != "dia"
+                        or not (row.get("open_data") or "").endswith(".xml")
+                        or row.get("statut_publication") != "Livrée"
+                        or not row.get("nom")):
+                    continue
+                mandat = (row.get("type_mandat") or "").lower().strip()
+                for name, accept in mandats.items():
+                    if not accept(mandat):
+                        continue
+                    entries = buckets[name]
+                    key = f"{row['nom']}_{row['prenom']}".lower()
+                    # Garder une seule entrée par élu (la plus récente = la première vue)
+                    if key not in entries:
+                        entries[key] = {
+                            "prenom": row["prenom"],
+                            "nom": row["nom"],
+                            "qualite": row["qualite"] or "",
+                            "departement": row["departement"] or "",
+                            "xml": row["open_data"],
+                            "url": row["url_dossier"] or "",
+                            "date": row.get("date_publication") or "",
+                        }
+                    break
+        return buckets
+
+    buckets = read_retrying(CSV_URL, read)
+    for name, entries in buckets.items():
+        progress(f"  → {len(entries)} {name} avec DIA publiée")
+    return {name: list(entries.values()) for name, entries in buckets.items()}
 
 # ── Groupes parlementaires depuis le Sénat ────────────────────────────────
 
 def load_groupes_senat():
     """Scrape senat.fr group pages to build sénateur → groupe + couleur mapping."""
     progress("Récupération des groupes du Sénat (senat.fr/senateurs/)...")
-    groupes_by_nom = {}
+    groupes = NameMatcher()
 
     # Step 1: discover group page slugs from the main groups listing
     try:
@@ -188,13 +1144,21 @@ def load_groupes_senat():
 
     progress(f"  → {len(slugs)} groupes à scraper: {slugs}")
 
-    total_senators = 0
-    for slug in slugs:
-        url = f"{SENAT_GRP_BASE}/{slug}.html"
+    def fetch_page(slug):
         try:
-            html = fetch(url, timeout=15)
+            return slug, fetch(f"{SENAT_GRP_BASE}/{slug}.html", timeout=15), None
         except Exception as e:
-            progress(f"\n  ⚠ {slug}.html inaccessible: {e}")
+            return slug, None, e
+
+    # Pages téléchargées en parallèle (bornées par HOST_LIMITS["www.senat.fr"]),
+    # traitées (et signalées) dans l'ordre des slugs pour un index déterministe
+    with ThreadPoolExecutor(max_workers=len(slugs)) as pool:
+        pages = list(pool.map(fetch_page, slugs))
+
+    total_senators = 0
+    for slug, html, err in pages:
+        if html is None:
+            progress(f"\n  ⚠ {slug}.html inaccessible: {err}")
             continue
 
         # Extract group full name from H1
@@ -235,194 +1199,1676 @@ def load_groupes_senat():
             if not nom:
                 continue
 
-            # Index multiple key variants for robust matching
-            groupes_by_nom[norm_key(nom)] = entry
-            groupes_by_nom[ascii_key(nom)] = entry  # ASCII fallback (e.g. NICOLAY for NICOLAŸ)
-            if prenom:
-                groupes_by_nom[norm_key(f"{nom}_{prenom}")] = entry
-                groupes_by_nom[norm_key(f"{prenom}_{nom}")] = entry
-                groupes_by_nom[ascii_key(f"{nom}_{prenom}")] = entry
-            # sub-name variants (e.g. "ESTROSI SASSONE" → also "SASSONE")
-            nom_parts = nom.split()
-            for i in range(1, len(nom_parts)):
-                groupes_by_nom[norm_key(" ".join(nom_parts[i:]))] = entry
+            groupes.add(f"{nom} {prenom}", entry)
             count += 1
 
         total_senators += count
         progress(f"  {slug}: {groupe_complet} — {count} sénateurs")
 
-    progress(f"\n  → {len(groupes_by_nom)} entrées indexées · {total_senators} sénateurs au total")
-    return groupes_by_nom
-
-
-def load_csv_senateurs():
-    """Charge les sénateurs avec DIA publiée depuis le CSV HATVP."""
-    progress("Chargement CSV HATVP (sénateurs)...")
-    text = fetch(CSV_URL)
-    reader = csv.DictReader(StringIO(text), delimiter=";")
-    entries = {}
-    for row in reader:
-        mandat = (row.get("type_mandat") or "").lower().strip()
-        # accepte "senateur" et "sénateur" (avec/sans accent)
-        if (mandat in ("senateur", "sénateur", "sénatrice", "senatrice")
-                and row.get("type_document") == "dia"
-                and row.get("open_data", "").endswith(".xml")
-                and row.get("statut_publication") == "Livrée"):
-            key = f"{row['nom']}_{row['prenom']}".lower()
-            if key not in entries:
-                entries[key] = {
-                    "prenom": row["prenom"],
-                    "nom":    row["nom"],
-                    "qualite":     row["qualite"],
-                    "departement": row["departement"],
-                    "xml": row["open_data"],
-                    "url": row["url_dossier"],
-                    "date": row.get("date_publication", ""),
-                }
-    progress(f"  → {len(entries)} sénateurs avec DIA publiée")
-    return list(entries.values())
+    progress(f"\n  → {len(groupes)} sénateurs indexés · {total_senators} sénateurs au total")
+    return groupes
 
 
 # ── Parse XML ─────────────────────────────────────────────────────────────
 
-def parse_xml(xml_text):
-    participations = []
+# Sections DIA extraites : balise DTO → (clé de sortie, {balise: champ}).
+# Seuls les enfants directs de chaque item sont lus (les montants annuels
+# imbriqués sont ignorés).
+DIA_SECTIONS = {
+    "participationFinanciereDto": ("participations", {
+        "nomSociete": "societe", "evaluation": "evaluation",
+        "nombreParts": "nbParts", "remuneration": "remuneration",
+    }),
+    "activProfCinqDerniereDto": ("activites", {
+        "description": "description", "employeur": "employeur",
+        "dateDebut": "debut", "dateFin": "fin",
+    }),
+    "mandatElectifDto": ("mandats", {
+        "descriptionMandat": "description", "dateDebut": "debut", "dateFin": "fin",
+    }),
+    "participationDirigeantDto": ("organes", {
+        "nomSociete": "societe", "activite": "activite",
+        "dateDebut": "debut", "dateFin": "fin",
+    }),
+}
+NUMERIC_FIELDS = {"evaluation", "nbParts", "remuneration"}
+
+def clean_text(s):
+    """Réduit les blancs internes (retours à la ligne, indentation XML) à un espace."""
+    return " ".join((s or "").split())
+
+def _to_float(s):
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
-        return participations
+        return float(s or 0)
+    except ValueError:
+        return 0.0
 
-    for node in root.iter("participationFinanciereDto"):
-        neant = node.find("neant")
-        if neant is not None and neant.text and neant.text.strip() == "true":
-            continue
-        # Structure: participationFinanciereDto > items (wrapper) > items (each entry)
-        items_wrapper = node.find("items")
-        if items_wrapper is None:
-            continue
-        for item in items_wrapper.findall("items"):
-            societe = (item.findtext("nomSociete") or "").strip()
-            if not societe:
+def empty_dia():
+    return {key: [] for key, _ in DIA_SECTIONS.values()}
+
+# Au-delà de cette taille, un dossier est parsé en flux (XMLPullParser) : les
+# sous-arbres déjà traités sont libérés, la mémoire ne suit plus la taille
+# du document. En dessous, l'arbre complet (accélérateur C) est plus rapide.
+PARSE_STREAM_MIN = 512 * 1024
+PARSE_CHUNK      = 64 * 1024
+
+def _dto_items(node, fields):
+    """Items d'une section DIA (<XxxDto>), [] si elle est déclarée néant."""
+    if (node.findtext("neant") or "").strip() == "true":
+        return []
+    items = []
+    for el in node.iterfind("items/items"):
+        item = {}
+        for child, name in fields.items():
+            text = el.findtext(child)
+            item[name] = _to_float(text) if name in NUMERIC_FIELDS else clean_text(text)
+        if item.get("societe") or "nomSociete" not in fields:
+            items.append(item)
+    return items
+
+def parse_xml(source):
+    """Parse une DIA et retourne {section: [items]}.
+
+    Structure attendue : <XxxDto> > <neant> + <items> (enveloppe) > <items>
+    (chaque entrée) ; seuls les champs de DIA_SECTIONS sont lus. `source` :
+    octets, texte ou objet fichier binaire. Les dossiers courants (octets de
+    moins de PARSE_STREAM_MIN) passent par l'arbre complet, les autres par
+    parse_xml_stream. Lève ET.ParseError si le document est invalide.
+    """
+    if isinstance(source, str) or (isinstance(source, (bytes, bytearray))
+                                   and len(source) < PARSE_STREAM_MIN):
+        root = ET.fromstring(source)
+        result = empty_dia()
+        for tag, (key, fields) in DIA_SECTIONS.items():
+            for node in root.iter(tag):
+                result[key].extend(_dto_items(node, fields))
+        return result
+    return parse_xml_stream(source)
+
+def parse_xml_stream(source):
+    """Comme parse_xml, en flux : le document (octets ou objet fichier
+    binaire) est lu par blocs de PARSE_CHUNK, chaque section est extraite à
+    sa fermeture et les enfants terminés de la racine sont libérés."""
+    if isinstance(source, (bytes, bytearray)):
+        chunks = (source[i:i + PARSE_CHUNK] for i in range(0, len(source), PARSE_CHUNK))
+    else:
+        chunks = iter(lambda: source.read(PARSE_CHUNK), b"")
+    parser = ET.XMLPullParser(events=("start", "end"))
+    result = empty_dia()
+    root, depth = None, 0
+
+    def consume():
+        nonlocal root, depth
+        for event, elem in parser.read_events():
+            if event == "start":
+                if root is None:
+                    root = elem
+                depth += 1
                 continue
-            evaluation = 0.0
-            try:
-                evaluation = float(item.findtext("evaluation") or 0)
-            except ValueError:
-                pass
-            nb_parts = 0.0
-            try:
-                nb_parts = float(item.findtext("nombreParts") or 0)
-            except ValueError:
-                pass
-            remun = 0.0
-            try:
-                remun = float(item.findtext("remuneration") or 0)
-            except ValueError:
-                pass
-            participations.append({
-                "societe": societe,
-                "evaluation": evaluation,
-                "nbParts": nb_parts,
-                "remuneration": remun,
-            })
+            depth -= 1
+            section = DIA_SECTIONS.get(elem.tag)
+            if section is not None:
+                result[section[0]].extend(_dto_items(elem, section[1]))
+            if depth == 1:
+                root.clear()   # sous-arbre de premier niveau traité
 
-    return participations
+    for chunk in chunks:
+        parser.feed(chunk)
+        consume()
+    parser.close()
+    consume()
+    return result
 
 # ── Fetch XML d'un député ─────────────────────────────────────────────────
 
-def fetch_deputy_xml(entry):
+def download_dossier(entry, stats=None):
+    """Étape I/O : retourne (octets du dossier, erreur)."""
     url = DOSSIERS_BASE + entry["xml"]
     try:
-        text = fetch(url, timeout=20)
-        return parse_xml(text)
-    except Exception:
-        return []
+        return fetch_cached(url, timeout=20, version=entry.get("date"), stats=stats), None
+    except FetchError as e:
+        return None, str(e)
+
+def parse_dossier(data):
+    """Étape CPU (exécutée dans un processus du pool) : retourne
+    (sections, erreur, durée du parsing en secondes)."""
+    t0 = time.perf_counter()
+    try:
+        return parse_xml(data), None, time.perf_counter() - t0
+    except ET.ParseError as e:
+        return empty_dia(), f"XML invalide ({e})", time.perf_counter() - t0
 
 # ── Helpers mutualisés ─────────────────────────────────────────────────────
 
-def build_results(members, groupes, label="parlementaires"):
-    """Télécharge les XML et associe les groupes pour une liste de parlementaires."""
+def groupe_fields(groupes, nom, prenom):
+    """Champs groupe d'une entrée de sortie, d'après l'index des groupes."""
+    g = groupes.match(nom, prenom) or GROUPE_INCONNU
+    return {
+        "groupe":        g.get("groupe_complet") or g.get("groupe", "Inconnu"),
+        "groupe_sigle":  g.get("groupe", "Inconnu"),
+        "couleur_groupe": g.get("couleur", ""),
+    }
+
+def make_record(dep, groupes, dia, erreur=None):
+    """Assemble l'entrée de sortie d'un parlementaire (groupe + sections DIA)."""
+    nom    = dep["nom"].upper()
+    prenom = dep["prenom"]
+    record = {
+        "prenom": prenom,
+        "nom":    nom,
+        "qualite":     dep["qualite"],
+        "departement": dep["departement"],
+        "url":         dep["url"],
+        "xml":         dep["xml"],
+        "date":        dep["date"],
+        **groupe_fields(groupes, nom, prenom),
+        "participations": dia["participations"],
+        "activites":      dia["activites"],
+        "mandats":        dia["mandats"],
+        "organes":        dia["organes"],
+    }
+    if erreur:
+        # Dossier illisible : signalé explicitement, retenté au prochain run
+        record["erreur"] = erreur
+    return record
+
+
+def _download_into(entry, q, stop, stats):
+    try:
+        data, erreur = download_dossier(entry, stats)
+    except Exception as e:
+        # fetch_dossiers attend exactement un résultat par dossier : une
+        # erreur imprévue (écriture du cache…) devient l'erreur du dossier
+        data, erreur = None, f"{DOSSIERS_BASE + entry['xml']}: {e!r}"
+    while not stop.is_set():
+        try:
+            q.put((entry, data, erreur), timeout=0.5)
+            return
+        except queue.Full:
+            continue
+
+
+def parse_pool(workers):
+    """Pool de processus du parsing. Il démarre alors que les threads de
+    téléchargement tournent déjà : sous POSIX, les processus sont lancés par
+    un forkserver plutôt que par fork() d'un processus multithread."""
+    ctx = (multiprocessing.get_context("forkserver")
+           if "forkserver" in multiprocessing.get_all_start_methods() else None)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+
+def fetch_dossiers(members, label="parlementaires", parse_workers=None, cpu_pool=None,
+                   sink=None):
+    """Télécharge et parse les dossiers d'une liste de parlementaires ;
+    retourne [(entrée, sections, erreur)] dans l'ordre d'arrivée, ou les passe
+    un à un à `sink(entrée, sections, erreur)` sans les garder (retour vide).
+
+    Deux étages : des threads téléchargent les dossiers bruts dans une file
+    bornée, un ProcessPoolExecutor les parse. `cpu_pool` est un pool partagé
+    (celui du Scheduler) ; à défaut un pool de `parse_workers` processus est
+    créé pour l'appel (défaut : nombre de cœurs, 0 = parsing dans le processus
+    principal).
+    """
     progress(f"\nTéléchargement de {len(members)} fichiers XML ({label})...")
+    if parse_workers is None:
+        parse_workers = os.cpu_count() or 1
+    dossiers = []
+    count = 0
+    stats = dict.fromkeys(cache_stats, 0)
+
+    def collect(dep, dia, erreur):
+        nonlocal count
+        count += 1
+        pct = int(count / len(members) * 100)
+        progress(f"{label} {count}/{len(members)} – {dep['nom'].upper()} {dep['prenom']} "
+                 f"({len(dia['participations'])} participations)", pct)
+        if sink is None:
+            dossiers.append((dep, dia, erreur))
+        else:
+            sink(dep, dia, erreur)
+
+    def collect_parsed(futs):
+        for fut in futs:
+            dep, size = pending.pop(fut)
+            dia, erreur, seconds = fut.result()
+            run_report.parse(dep["xml"], seconds, size)
+            collect(dep, dia, erreur and f"{DOSSIERS_BASE + dep['xml']}: {erreur}")
+
+    q = queue.Queue(maxsize=DOWNLOAD_QUEUE)
+    stop = threading.Event()
+    pending = {}   # future de parsing → (entrée, taille du dossier)
+    own_pool = cpu_pool is None and parse_workers > 0
+    if own_pool:
+        cpu_pool = parse_pool(parse_workers)
+    io_pool = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+    try:
+        for d in members:
+            io_pool.submit(_download_into, d, q, stop, stats)
+        for _ in members:
+            dep, data, erreur = q.get()
+            if history is not None and data is not None:
+                history.add_dossier(dep["xml"], data)
+            if erreur:
+                collect(dep, empty_dia(), erreur)
+            elif cpu_pool is None:
+                dia, erreur, seconds = parse_dossier(data)
+                run_report.parse(dep["xml"], seconds, len(data))
+                collect(dep, dia, erreur and f"{DOSSIERS_BASE + dep['xml']}: {erreur}")
+            else:
+                # Borne le nombre de dossiers en vol côté processus
+                if len(pending) >= 2 * DOWNLOAD_QUEUE:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect_parsed(finished)
+                pending[cpu_pool.submit(parse_dossier, data)] = (dep, len(data))
+                collect_parsed([f for f in list(pending) if f.done()])
+        collect_parsed(list(as_completed(list(pending))))
+    finally:
+        stop.set()
+        io_pool.shutdown(wait=True, cancel_futures=True)
+        if own_pool:
+            cpu_pool.shutdown(wait=True, cancel_futures=True)
+    progress(f"\n  → cache HTTP ({label}) : {stats['frais']} à jour sans requête · "
+             f"{stats['revalides']} revalidés (304) · {stats['telecharges']} téléchargés")
+    run_report.cache[label] = stats
+    return dossiers
+
+def archive_kept(kept, label="parlementaires"):
+    """--history avec --incremental : archive les dossiers des entrées
+    conservées qui manquent à l'historique (premier run --history d'une
+    sortie incrémentale). Ils sont lus via le cache HTTP, sans requête s'il
+    est à jour pour la même date_publication."""
+    missing = [r for r in kept if r["xml"] not in history.dossiers]
+    if not missing:
+        return
+    progress(f"\nArchivage de {len(missing)} dossiers inchangés ({label})...")
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        for r, (data, erreur) in zip(missing, pool.map(download_dossier, missing)):
+            if data is None:
+                progress(f"  ⚠ {r['xml']} non archivé : {erreur}")
+            else:
+                history.add_dossier(r["xml"], data)
+
+
+class DossierSpool:
+    """File sur disque des dossiers parsés d'une chambre (une ligne JSON par
+    dossier, ou par entrée conservée en mode incrémental), relue une fois les
+    groupes chargés : la mémoire ne dépend pas du nombre de dossiers. Les
+    variantes de noms de société sont comptées à l'écriture (`canon`)."""
+
+    def __init__(self, canon):
+        self.canon = canon
+        self.file = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self.n = 0
+
+    def add(self, dep, dia, erreur=None):
+        self.canon.observe(dia["participations"])
+        self._write([dep, dia, erreur])
+
+    def add_record(self, record):
+        self.canon.observe(record["participations"])
+        self._write([record])
+
+    def _write(self, item):
+        self.file.write(_dumps(item))
+        self.file.write("\n")
+        self.n += 1
+
+    def records(self, groupes):
+        """Entrées finales (groupe associé, y compris aux entrées conservées ;
+        libellés canoniques), dans l'ordre d'arrivée."""
+        self.canon.finish()
+        self.file.seek(0)
+        for line in self.file:
+            item = json.loads(line)
+            if len(item) == 1:
+                # Entrée conservée : réassociée à l'index courant
+                record = item[0]
+                record.update(groupe_fields(groupes, record["nom"], record["prenom"]))
+            else:
+                dep, dia, erreur = item
+                record = make_record(dep, groupes, dia, erreur)
+            self.canon.apply(record["participations"])
+            yield record
+
+    def close(self):
+        self.file.close()
+
+
+def match_results(dossiers, groupes, label="parlementaires"):
+    """Associe les groupes aux dossiers parsés et assemble les entrées de sortie.
+    L'association reste dans le processus principal (NameMatcher)."""
+    results = [make_record(dep, groupes, dia, erreur) for dep, dia, erreur in dossiers]
+    report_matches(groupes, label)
+    run_report.matching[label] = groupes.report()
+    return results
+
+
+def build_results(members, groupes, label="parlementaires", parse_workers=None):
+    """Télécharge les XML et associe les groupes pour une liste de parlementaires
+    (fetch_dossiers puis match_results, sans ordonnanceur)."""
+    return canonicalize_societes(
+        match_results(fetch_dossiers(members, label, parse_workers), groupes, label))
+
+
+def report_matches(groupes, label="parlementaires"):
+    """Affiche le bilan de correspondance des groupes (approchés, ambigus et
+    introuvables)."""
+    st = groupes.stats
+    lines = [f"  → groupes ({label}) : {st['exacts']} exacts · {st['approches']} approchés · "
+             f"{st['ambigus']} ambigus · {st['introuvables']} introuvables"]
+    lines += [f"    ~ {a['nom']} {a['prenom']} → {a['candidat']} ({a['score']})"
+              for a in groupes.approximate]
+    lines += [f"    ? {a['nom']} {a['prenom']} — candidats : {', '.join(a['candidats'])}"
+              for a in groupes.ambiguous]
+    lines += [f"    ✗ {u['nom']} {u['prenom']}" for u in groupes.unmatched]
+    progress("\n".join(lines))
+
+
+# ── Sociétés : noms canoniques et identifiants ───────────────────────────
+# nomSociete est saisi librement : blancs, casse, accents, ponctuation, forme
+# juridique ("Airbus se", "AIRBUS") et marqueur "[Données non publiées]"
+# varient d'une déclaration à l'autre. Chaque participation publique reçoit
+# un identifiant stable `sid` (mots significatifs sans accents, joints par
+# des tirets) et le libellé le plus fréquent de sa société ; les non publiées
+# gardent un libellé normalisé, sans identifiant.
+
+# Formes juridiques retirées en début ou fin de nom (les SCI, SCEA, GAEC… et
+# les fonds FCP/SCPI font partie de l'identité de la structure et restent)
+LEGAL_FORMS = {"sa", "sas", "sasu", "sarl", "eurl", "se", "nv", "plc", "ltd", "inc",
+               "ag", "gmbh", "spa", "bv", "llc"}
+NON_PUBLIC_MARKER = "[Données non publiées]"
+NON_PUBLIC_RE = re.compile(r"\[?\s*donn[ée]es\s+non\s+publi[ée]es\s*\]?", re.IGNORECASE)
+
+def societe_tokens(name):
+    """Mots d'un nom de société : minuscules, sans accents ; la ponctuation sépare."""
+    return re.findall(r"[a-z0-9]+", ascii_key(name))
+
+def societe_id(name):
+    """Identifiant stable : mots significatifs joints par « - » (le séparateur
+    évite que « AB CD » et « ABC D » se confondent)."""
+    tokens = societe_tokens(name)
+    while len(tokens) > 1 and tokens[-1] in LEGAL_FORMS:
+        tokens.pop()
+    while len(tokens) > 1 and tokens[0] in LEGAL_FORMS:
+        tokens.pop(0)
+    return "-".join(tokens)
+
+def _most_frequent(counter):
+    # Variante la plus fréquente, puis ordre alphabétique
+    return min(counter.items(), key=lambda kv: (-kv[1], kv[0]))[0]
+
+class SocieteCanon:
+    """Libellés canoniques en deux temps, pour traiter les entrées en flux :
+    observe() normalise les participations et compte les variantes de chaque
+    société, finish() fixe les libellés une fois toutes les variantes vues,
+    apply() les réécrit."""
+
+    def __init__(self):
+        self.variants, self.hidden = {}, {}   # sid / base non publiée → Counter
+        self.labels = self.hidden_labels = None
+
+    def observe(self, participations):
+        for p in participations:
+            name = clean_text(p.get("societe"))
+            if NON_PUBLIC_RE.search(name):
+                base = clean_text(NON_PUBLIC_RE.sub("", name))
+                p["societe"] = f"{base} {NON_PUBLIC_MARKER}" if base else NON_PUBLIC_MARKER
+                p.pop("sid", None)
+                self.hidden.setdefault(societe_id(base) or base, Counter())[p["societe"]] += 1
+                continue
+            p["societe"] = name
+            sid = societe_id(name) if name else ""
+            if sid:
+                p["sid"] = sid
+                self.variants.setdefault(sid, Counter())[name] += 1
+            else:
+                p.pop("sid", None)
+
+    def finish(self):
+        self.labels = {sid: _most_frequent(c) for sid, c in self.variants.items()}
+        self.hidden_labels = {name: _most_frequent(c)
+                              for c in self.hidden.values() for name in c}
+        return self
+
+    def apply(self, participations):
+        for p in participations:
+            if "sid" in p:
+                p["societe"] = self.labels[p["sid"]]
+            elif p["societe"] in self.hidden_labels:
+                p["societe"] = self.hidden_labels[p["societe"]]
+
+def canonicalize_societes(results):
+    """Réécrit en place les noms de société des participations (libellé
+    canonique + `sid`) et retourne `results`."""
+    canon = SocieteCanon()
+    for r in results:
+        canon.observe(r["participations"])
+    canon.finish()
+    for r in results:
+        canon.apply(r["participations"])
+    return results
+
+
+# ── Agrégats précalculés pour le site ─────────────────────────────────────
+# Reproduisent, pour la vue par défaut (aucun filtre, mode bourse désactivé),
+# les calculs faits au chargement par app.js : aggregateByGroupe, updateKpis,
+# buildSunburstData, getSocietyList, buildBarSocietesStacked et les flux du sankey.
+
+SUNBURST_TOP_SOCIETES = 12
+
+def is_non_public(name):
+    """Équivalent de isNonPublic() côté front."""
+    return not name or "non publi" in name or "Non publi" in name
+
+def normalize_search(s):
+    """Équivalent de normalizeSearch() côté front : minuscules, sans accents,
+    apostrophes ni espaces."""
+    s = unicodedata.normalize("NFD", (s or "").lower())
+    s = "".join(c for c in s if not "\u0300" <= c <= "\u036f")
+    return re.sub(r"\s+", "", re.sub(r"['\u2019\u2018`]", "", s))
+
+def median(values):
+    if not values:
+        return 0
+    v = sorted(values)
+    m = len(v) // 2
+    return v[m] if len(v) % 2 else (v[m - 1] + v[m]) / 2
+
+class Aggregates:
+    """Agrégats calculés entrée par entrée (add), sérialisés par chunks() ou
+    result(). Les lignes par parlementaire (membres, sunburst, sankey) sont
+    gardées sur disque jusqu'à l'écriture ; seules les tables par société et
+    par groupe restent en mémoire.
+
+    Pour rester léger, parlementaires et sociétés ne sont écrits qu'une fois
+    (`membres`, `societes`) et référencés ailleurs par leur indice :
+      membres  : [url, prénom, nom, groupe]
+      societes : [libellé, valeur totale, {groupe: valeur}, [indices membres], sid]
+      picker   : [indice société, sid, valeur totale]
+      nonPublic: [libellé non publié, [indices membres]]
+      tokens   : [[mot, [indices sociétés], [indices nonPublic]?]] trié par
+                 mot (recherche par préfixe)
+      sunburst : [indice membre, valeur, nb participations,
+                  [[indice société, valeur] × 12 max], nb non publiées]
+      sankey   : [indice membre, [[indice société, valeur cumulée]]]
+    """
+
+    def __init__(self):
+        self.n = self.n_membres = 0
+        self.groupes, self.couleurs = {}, {}
+        self.societes, self.soc_index, self.picker = [], {}, {}
+        self.non_publics, self.np_index = [], {}
+        self.rows = {k: tempfile.TemporaryFile("w+", encoding="utf-8")
+                     for k in ("membres", "sunburst", "sankey")}
+        self.all_vals = []
+
+    def _row(self, kind, row):
+        f = self.rows[kind]
+        f.write(_dumps(row))
+        f.write("\n")
+
+    def add(self, r):
+        self.n += 1
+        societes, non_publics = self.societes, self.non_publics
+        g = htmlmod.unescape(r.get("groupe") or "") or "Inconnu"
+        if g not in self.couleurs and r.get("couleur_groupe"):
+            self.couleurs[g] = r["couleur_groupe"]
+        parts = [{**p, "societe": clean_text(p.get("societe"))} for p in r["participations"]]
+        val = sum(p.get("evaluation") or 0 for p in parts)
+        acc = self.groupes.setdefault(g, {"groupe": g, "total": 0, "valeur": 0, "deputes": 0,
+                                          "avecPart": 0, "valeurs": []})
+        acc["deputes"] += 1
+        acc["total"] += len(parts)
+        acc["valeur"] += val
+        self.all_vals.append(val)
+        if not parts:
+            return
+        acc["avecPart"] += 1
+        acc["valeurs"].append(val)
+        mi = self.n_membres
+        self.n_membres += 1
+        self._row("membres", [r["url"], r["prenom"], r["nom"], g])
+
+        # Société → valeur par groupe et détenteurs ; sélecteur ; flux sankey
+        flows = {}
+        public = []
+        non_public = 0
+        for p in parts:
+            if is_non_public(p["societe"]):
+                non_public += 1
+                ni = self.np_index.setdefault(p["societe"], len(non_publics))
+                if ni == len(non_publics):
+                    non_publics.append([p["societe"], []])
+                if not non_publics[ni][1] or non_publics[ni][1][-1] != mi:
+                    non_publics[ni][1].append(mi)
+                continue
+            ev = p.get("evaluation") or 0
+            key = p.get("sid") or normalize_search(p["societe"])
+            si = self.soc_index.get(key)
+            if si is None:
+                si = self.soc_index[key] = len(societes)
+                societes.append([p["societe"], 0, {}, [], key])
+            soc = societes[si]
+            soc[1] += ev
+            soc[2][g] = soc[2].get(g, 0) + ev
+            if not soc[3] or soc[3][-1] != mi:
+                soc[3].append(mi)
+            self.picker.setdefault(key, [si, key, 0])[2] += ev
+            if ev:
+                flows[si] = flows.get(si, 0) + ev
+            if ev > 0:
+                public.append((si, ev))
+        if flows:
+            self._row("sankey", [mi, [[si, v] for si, v in flows.items()]])
+        # cf. buildSunburstData : 12 plus grosses participations publiques
+        public.sort(key=lambda x: -x[1])
+        self._row("sunburst", [mi, val, len(parts),
+                               [[si, ev] for si, ev in public[:SUNBURST_TOP_SOCIETES]],
+                               non_public])
+
+    def _stream(self, kind, remap=None):
+        """Tableau JSON des lignes `kind`, relues du disque ; `remap` réécrit
+        chaque ligne (indices de sociétés)."""
+        f = self.rows[kind]
+        f.flush()
+        f.seek(0)
+        yield "["
+        for i, line in enumerate(f):
+            if i:
+                yield ","
+            yield _dumps(remap(json.loads(line))) if remap else line.rstrip("\n")
+        f.seek(0, os.SEEK_END)
+        yield "]"
+
+    def chunks(self):
+        """Texte JSON des agrégats, morceau par morceau."""
+        societes, n = self.societes, self.n
+        by_groupe = sorted(self.groupes.values(), key=lambda a: -a["valeur"])
+        for acc in by_groupe:
+            acc["couleur"] = self.couleurs.get(acc["groupe"], "")
+            acc["mediane"] = median(acc["valeurs"])
+            acc["pctAvecPart"] = 100 * acc["avecPart"] / acc["deputes"]
+        # Sociétés triées par valeur décroissante ; les indices sont remappés
+        order = sorted(range(len(societes)), key=lambda i: -societes[i][1])
+        remap = {old: new for new, old in enumerate(order)}
+        # Index inversé mot → sociétés (recherche par préfixe de mot ; le
+        # site y ajoute la recherche par sous-chaîne dans les libellés)
+        tokens = {}
+        for si, soc in enumerate(societes):
+            for tok in set(societe_tokens(soc[0])):
+                tokens.setdefault(tok, ([], []))[0].append(remap[si])
+        for ni, (label, _) in enumerate(self.non_publics):
+            for tok in set(societe_tokens(label)):
+                tokens.setdefault(tok, ([], []))[1].append(ni)
+        total = sum(self.all_vals)
+        head = {
+            "n": n,
+            "kpis": {"membres": n, "valeur": total,
+                     "moyenne": total / n if n else 0,
+                     "mediane": median([v for v in self.all_vals if v > 0])},
+            "groupes": by_groupe,
+        }
+        yield _dumps(head)[:-1]   # objet laissé ouvert
+        yield ',"membres":'
+        yield from self._stream("membres")
+        yield ',"societes":'
+        yield _dumps([societes[i] for i in order])
+        yield ',"picker":'
+        yield _dumps(sorted(([remap[si], norm, t] for si, norm, t in self.picker.values()),
+                            key=lambda x: -x[2]))
+        yield ',"sunburst":'
+        yield from self._stream("sunburst", lambda row: [
+            row[0], row[1], row[2], [[remap[si], ev] for si, ev in row[3]], row[4]])
+        yield ',"sankey":'
+        yield from self._stream("sankey", lambda row: [
+            row[0], [[remap[si], v] for si, v in row[1]]])
+        yield ',"nonPublic":'
+        yield _dumps(self.non_publics)
+        yield ',"tokens":'
+        yield _dumps([[tok, sorted(si), ni] if ni else [tok, sorted(si)]
+                      for tok, (si, ni) in sorted(tokens.items())])
+        yield "}"
+
+    def result(self):
+        return json.loads("".join(self.chunks()))
+
+    def close(self):
+        for f in self.rows.values():
+            f.close()
+
+def compute_aggregates(results):
+    """Calcule en un seul passage sur les résultats les agrégats par groupe,
+    les KPIs, l'index société → détenteurs et les hiérarchies sunburst/sankey
+    (format détaillé : Aggregates)."""
+    agg = Aggregates()
+    try:
+        for r in results:
+            agg.add(r)
+        return agg.result()
+    finally:
+        agg.close()
+
+# ── Format compact (colonnes + table de chaînes) ──────────────────────────
+# Même contenu que data.json, stocké par colonnes : un tableau par champ des
+# parlementaires, et pour chaque section DIA (participations, activites…) le
+# nombre d'items par parlementaire puis un tableau par champ. Les colonnes à
+# fortes répétitions sont internées dans une table de chaînes commune.
+# Décodé par expandCompact() (compact.js) ou expand_compact().
+
+COMPACT_FORMAT = "hatvp-compact/1"
+COMPACT_INTERNED = {
+    "qualite", "departement", "date", "groupe", "groupe_sigle", "couleur_groupe",
+    "societe", "sid", "description", "employeur", "activite", "debut", "fin",
+}
+
+def _compact_number(v):
+    # 5000.0 → 5000 : identique une fois relu en JS, plus court en JSON
+    return int(v) if isinstance(v, float) and v.is_integer() else v
+
+def compact_results(results):
+    """Convertit une liste de records (format data.json) au format compact."""
+    strings, index = [], {}
+
+    def intern(s):
+        i = index.get(s)
+        if i is None:
+            i = index[s] = len(strings)
+            strings.append(s)
+        return i
+
+    # Ordre des clés conservé (première apparition) ; sections = champs listes
+    keys, sections = {}, {}
+    for r in results:
+        for k, v in r.items():
+            keys.setdefault(k, None)
+            if isinstance(v, list):
+                fields = sections.setdefault(k, {})
+                for item in v:
+                    for f in item:
+                        fields.setdefault(f, None)
+
+    def column(name, values):
+        if name in COMPACT_INTERNED:
+            return [None if v is None else intern(v) for v in values]
+        return [_compact_number(v) for v in values]
+
+    membres, secs = {}, {}
+    for k in keys:
+        if k in sections:
+            items = [item for r in results for item in r.get(k, [])]
+            secs[k] = {
+                "n": [len(r[k]) if k in r else None for r in results],
+                "cols": {f: column(f, [item.get(f) for item in items]) for f in sections[k]},
+            }
+        else:
+            membres[k] = column(k, [r.get(k) for r in results])
+    return {
+        "format": COMPACT_FORMAT,
+        "n": len(results),
+        "keys": list(keys),
+        "interned": sorted(COMPACT_INTERNED & (set(membres) | {f for s in sections.values() for f in s})),
+        "strings": strings,
+        "membres": membres,
+        "sections": secs,
+    }
+
+def expand_compact(c):
+    """Inverse de compact_results() (les valeurs null des colonnes sont omises)."""
+    strings, interned = c["strings"], set(c["interned"])
+
+    def values(name, col):
+        return [None if v is None else strings[v] for v in col] if name in interned else col
+
+    membres = {k: values(k, col) for k, col in c["membres"].items()}
+    sections = {}
+    for k, s in c["sections"].items():
+        cols = {f: values(f, col) for f, col in s["cols"].items()}
+        items, pos = [], 0
+        for count in s["n"]:
+            if count is None:
+                items.append(None)
+                continue
+            items.append([{f: col[j] for f, col in cols.items() if col[j] is not None}
+                          for j in range(pos, pos + count)])
+            pos += count
+        sections[k] = items
     results = []
-    done = 0
-    with ThreadPoolExecutor(max_workers=15) as pool:
-        futures = {pool.submit(fetch_deputy_xml, d): d for d in members}
-        for fut in as_completed(futures):
-            dep = futures[fut]
-            parts = fut.result()
-            nom    = dep["nom"].upper()
-            prenom = dep["prenom"]
-            g = (groupes.get(norm_key(f"{nom}_{prenom}"))
-                 or groupes.get(norm_key(f"{prenom}_{nom}"))
-                 or groupes.get(norm_key(nom))
-                 or groupes.get(ascii_key(f"{nom}_{prenom}"))   # fallback: strip accents
-                 or groupes.get(ascii_key(nom))
-                 or {"groupe": "Inconnu", "couleur": "", "groupe_complet": "Inconnu"})
-            results.append({
-                "prenom": prenom,
-                "nom":    nom,
-                "qualite":     dep["qualite"],
-                "departement": dep["departement"],
-                "url":         dep["url"],
-                "groupe":        g.get("groupe_complet") or g.get("groupe", "Inconnu"),
-                "groupe_sigle":  g.get("groupe", "Inconnu"),
-                "couleur_groupe": g.get("couleur", ""),
-                "participations": parts,
-            })
-            done += 1
-            pct = int(done / len(members) * 100)
-            progress(f"{done}/{len(members)} – {nom} {prenom} ({len(parts)} participations)", pct)
+    for i in range(c["n"]):
+        r = {}
+        for k in c["keys"]:
+            v = sections[k][i] if k in sections else membres[k][i]
+            if v is not None:
+                r[k] = v
+        results.append(r)
     return results
 
+# ── Fichiers précompressés ────────────────────────────────────────────────
+
+def precompress(data):
+    """Retourne {extension: octets} : .gz toujours, .br si brotli est installé."""
+    out = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        out[".br"] = brotli.compress(data, quality=11)
+    return out
+
+def write_precompressed(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    for ext, blob in precompress(data).items():
+        with open(path + ext, "wb") as f:
+            f.write(blob)
+
+def drop_precompressed(path):
+    for ext in (".gz", ".br"):
+        try:
+            os.remove(path + ext)
+        except FileNotFoundError:
+            pass
+
+def size_lines(variants):
+    """Lignes du tableau taille brute / gzip / brotli de chaque variante
+    {libellé: str}."""
+    lines = [f"  {'format':<22}{'brut':>10}{'gzip':>10}{'brotli':>10}"]
+    for label, text in variants.items():
+        data = text.encode("utf-8")
+        comp = precompress(data)
+        br = f"{len(comp['.br']) / 1024:.0f} Ko" if ".br" in comp else "—"
+        lines.append(f"  {label:<22}{len(data) / 1024:>7.0f} Ko"
+                     f"{len(comp['.gz']) / 1024:>7.0f} Ko{br:>10}")
+    return lines
+
+def size_report(variants):
+    """Affiche le tableau de size_lines()."""
+    print("\n".join(size_lines(variants)))
+
+# ── Résumé + détails par groupe (chargement à la demande) ────────────────
+# Le bundle JS ne contient plus qu'un résumé par parlementaire (identité,
+# groupe, totaux, principales sociétés du tableau) et le manifeste des shards :
+# un fichier de détails (sections DIA complètes) par groupe, nommé d'après
+# le hash de son contenu, que app.js charge quand un filtre l'exige.
+# Les fichiers hashés peuvent être servis avec un cache long.
+
+SHARDS_DIR  = "shards"
+SHARDS_FORMAT = "hatvp-shards/1"
+SUMMARY_TOP = 4    # sociétés publiques affichées par ligne du tableau
+
+def _shard_slug(name):
+    return re.sub(r"[^a-z0-9]+", "-", ascii_key(name)).strip("-") or "inconnu"
+
+def _shards_dir(json_file):
+    stem = os.path.splitext(os.path.basename(json_file))[0]
+    return os.path.join(os.path.dirname(json_file), SHARDS_DIR, stem)
+
+def drop_shards(json_file):
+    """Supprime shards/<base>/ d'un run --shards précédent (le bundle n'y fait
+    plus référence), et shards/ s'il est vide."""
+    out_dir = _shards_dir(json_file)
+    shutil.rmtree(out_dir, ignore_errors=True)
+    try:
+        os.rmdir(os.path.dirname(out_dir))
+    except OSError:
+        pass   # absent, ou shards d'une autre chambre
+
+def _hashed_name(stem, data):
+    return f"{stem}.{hashlib.sha1(data).hexdigest()[:10]}.json"
+
+def member_summary(r, shard):
+    """Record réduit aux champs scalaires + totaux, sans les sections DIA."""
+    parts = r["participations"]
+    summary = {k: v for k, v in r.items() if not isinstance(v, list)}
+    public = sorted((p for p in parts if not is_non_public(p["societe"])),
+                    key=lambda p: -p["evaluation"])
+    summary.update({
+        "nbParts": len(parts),
+        "valeurTotale": sum(p["evaluation"] for p in parts),
+        "top": [{"societe": p["societe"], "sid": p.get("sid"), "evaluation": p["evaluation"]}
+                for p in public[:SUMMARY_TOP]],
+        "nbNonPublic": len(parts) - len(public),
+        "shard": shard,
+    })
+    return summary
+
+def write_shards(results, json_file, write=_write_atomic):
+    """Écrit les détails par groupe dans shards/<base>/ et retourne
+    (résumés, manifeste, fichiers du jeu). `write(chemin, octets)` écrit
+    chaque fichier (StreamWriter : temporaire renommé avec les autres
+    sorties) ; les shards d'un run précédent sont retirés ensuite par
+    prune_shards."""
+    stem = os.path.splitext(os.path.basename(json_file))[0]
+    out_dir = _shards_dir(json_file)
+    os.makedirs(out_dir, exist_ok=True)
+
+    slugs, by_shard, summaries = {}, {}, []
+    for r in results:
+        g = r["groupe"]
+        if g not in slugs:
+            slug = base = _shard_slug(g)
+            n = 2
+            while slug in by_shard:
+                slug, n = f"{base}-{n}", n + 1
+            slugs[g] = slug
+            by_shard[slug] = {}
+        by_shard[slugs[g]][r["url"]] = {k: v for k, v in r.items()
+                                        if isinstance(v, list) and k not in SITE_OMIT}
+        summaries.append(member_summary(r, slugs[g]))
+
+    def dump(name, obj):
+        data = json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        path = os.path.join(out_dir, _hashed_name(name, data))
+        if not os.path.exists(path):   # même hash = même contenu
+            write(path, data)
+        return os.path.basename(path), len(data)
+
+    groupes = {slug: g for g, slug in slugs.items()}
+    shards = {}
+    for slug, details in by_shard.items():
+        file, size = dump(slug, details)
+        shards[slug] = {"file": file, "groupe": groupes[slug], "n": len(details), "bytes": size}
+    summary_file, _ = dump("summary", summaries)
+    manifest = {
+        "format": SHARDS_FORMAT,
+        "n": len(results),
+        "base": f"{SHARDS_DIR}/{stem}/",
+        "summary": summary_file,
+        "shards": shards,
+    }
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    write(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=1).encode("utf-8"))
+
+    keep = {summary_file, "manifest.json"} | {s["file"] for s in shards.values()}
+    written = [os.path.join(out_dir, f) for f in sorted(keep)]
+    return summaries, manifest, written
+
+def prune_shards(shard_files):
+    """Supprime du dossier de `shard_files` (jeu courant, cf. write_shards) les
+    fichiers d'un run précédent, variantes .gz / .br comprises."""
+    out_dir = os.path.dirname(shard_files[0])
+    keep = {os.path.basename(f) for f in shard_files}
+    for name in os.listdir(out_dir):
+        if name.split(".json")[0] + ".json" not in keep:
+            os.remove(os.path.join(out_dir, name))
+
+def _suffixed(path, suffix):
+    base, ext = os.path.splitext(path)
+    return f"{base}{suffix}{ext}"
+
+JS_HEADER = "/* AUTO-GENERATED — do not edit manually, run fetch_data.py instead */\n"
+
+def write_js_bundle(f, js_var, json_str, extra=()):
+    """Écrit le bundle dans le fichier texte `f` ; extra : affectations
+    (variable, json) écrites avant js_var."""
+    f.write(JS_HEADER)
+    for var, value in extra:
+        f.write(f"{var}={value};\n")
+    f.write(f"{js_var}=")
+    f.write(json_str)
+    f.write(";\n")
+
+# ── Écriture en flux ──────────────────────────────────────────────────────
+# Les entrées sont sérialisées une à une, dès qu'elles sont prêtes, dans des
+# fichiers temporaires renommés à la fin : un run interrompu laisse les
+# sorties précédentes intactes. Bilan, agrégats et arbre d'historique sont
+# calculés au passage, sans relire les entrées ; seuls --compact et --shards,
+# qui regroupent les entrées par colonne ou par groupe, les gardent en mémoire.
+
+def _dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# Sections DIA gardées dans data.json et le NDJSON (mode incrémental,
+# historique) mais absentes des bundles JS et des shards : le site n'affiche
+# que les participations.
+SITE_OMIT = ("activites", "mandats", "organes")
+
+def site_record(r):
+    """Entrée telle qu'embarquée pour le site (sans les sections SITE_OMIT)."""
+    return {k: v for k, v in r.items() if k not in SITE_OMIT}
+
+class OutputStats:
+    """Bilan d'une sortie, mis à jour entrée par entrée."""
+
+    def __init__(self):
+        self.n = self.parts = self.valeur = self.avec = self.inconnus = 0
+        self.echecs = []   # (nom, prénom, erreur)
+
+    def add(self, r):
+        parts = r["participations"]
+        self.n += 1
+        self.parts += len(parts)
+        self.valeur += sum(p["evaluation"] for p in parts)
+        self.avec += bool(parts)
+        self.inconnus += r["groupe"] == "Inconnu"
+        if r.get("erreur"):
+            self.echecs.append((r["nom"], r["prenom"], r["erreur"]))
+
+    def lines(self):
+        """Bilan de la sortie, ligne par ligne."""
+        lines = [f"✓ {self.n} entrées · {self.parts} participations · {self.valeur/1e6:.1f}M€",
+                 f"✓ {self.avec} avec au moins une participation · "
+                 f"{self.inconnus} sans groupe identifié"]
+        if self.echecs:
+            lines.append(f"⚠ {len(self.echecs)} dossiers non récupérés (champ \"erreur\") :")
+            lines += [f"    {nom} {prenom} — {erreur}" for nom, prenom, erreur in self.echecs]
+        return lines
 
-def write_output(results, json_file, js_file, js_var):
-    """Écrit les résultats en JSON + JS embarqué."""
-    json_str = json.dumps(results, ensure_ascii=False, separators=(",", ":"))
-    progress(f"\nÉcriture de {json_file}...")
-    with open(json_file, "w", encoding="utf-8") as f:
-        f.write(json_str)
-    progress(f"Écriture de {js_file} (bundle embarqué)...")
-    with open(js_file, "w", encoding="utf-8") as f:
-        f.write("/* AUTO-GENERATED — do not edit manually, run fetch_data.py instead */\n")
-        f.write(f"{js_var}=")
-        f.write(json_str)
-        f.write(";\n")
-    total_parts = sum(len(r["participations"]) for r in results)
-    total_val   = sum(p["evaluation"] for r in results for p in r["participations"])
-    avec        = sum(1 for r in results if r["participations"])
-    inconnus    = sum(1 for r in results if r["groupe"] == "Inconnu")
-    print(f"\n✓ {len(results)} entrées · {total_parts} participations · {total_val/1e6:.1f}M€")
-    print(f"✓ {avec} avec au moins une participation · {inconnus} sans groupe identifié")
-    print(f"✓ {json_file} + {js_file} générés")
+
+class StreamWriter:
+    """Écrit les entrées d'une chambre au fil de l'eau : JSON (tableau), bundle
+    JS et, avec ndjson=True, <base>.ndjson (une entrée par ligne). Chaque
+    entrée est sérialisée une fois pour le JSON et le NDJSON, une seconde
+    fois sans les sections SITE_OMIT pour le bundle. S'utilise comme
+    contexte : les fichiers ne remplacent les sorties qu'à la sortie sans
+    erreur (close), une exception les supprime (abort). Options compact /
+    shards : voir write_output."""
+
+    def __init__(self, json_file, js_file, js_var, compact=False, shards=False, ndjson=False):
+        self.json_file, self.js_file, self.js_var = json_file, js_file, js_var
+        self.compact, self.shards = compact, shards
+        self.ndjson_file = os.path.splitext(json_file)[0] + ".ndjson" if ndjson else None
+        self.stats = OutputStats()
+        self.aggregates = Aggregates()
+        self.tree = {} if history is not None else None   # fiche → sha256 (--history)
+        self.index = {} if history is not None else None  # fiche → _index_entry()
+        self.buffer = [] if compact or shards else None   # bundle calculé à la fin
+        self.chars = 0   # taille du JSON complet
+        self._files = {}
+        self._json = self._open(json_file)
+        self._json.write("[")
+        self._js = None
+        if self.buffer is None:
+            self._js = self._open(js_file)
+            self._js.write(f"{JS_HEADER}{js_var}=[")
+        self._nd = self._open(self.ndjson_file) if ndjson else None
+        progress(f"\nÉcriture de {' + '.join(self._files)} (en flux)...")
+
+    def _open(self, path):
+        tmp = _tmp_path(path)
+        f = open(tmp, "w", encoding="utf-8")
+        self._files[path] = (tmp, f)
+        return f
+
+    def _stage(self, path, data):
+        """Écrit `data` (octets) dans le temporaire de `path`, renommé avec
+        les autres sorties."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = _tmp_path(path)
+        with open(tmp, "wb") as f:
+            f.write(data)
+        self._files[path] = (tmp, f)
+
+    def add(self, r):
+        s = _dumps(r)
+        sep = "," if self.stats.n else ""
+        self._json.write(sep)
+        self._json.write(s)
+        if self._js is not None:
+            self._js.write(sep)
+            self._js.write(_dumps(site_record(r)))
+        if self._nd is not None:
+            f = self._nd
+            f.write(s)
+            f.write("\n")
+        self.chars += len(sep) + len(s)
+        self.stats.add(r)
+        self.aggregates.add(r)
+        if self.tree is not None:
+            key = _member_key(r)
+            self.tree[key] = history.put_json(r)
+            self.index[key] = _index_entry(r)
+        if self.buffer is not None:
+            self.buffer.append(r)
+
+    def abort(self):
+        self.aggregates.close()
+        for tmp, f in self._files.values():
+            f.close()
+            try:
+                os.remove(tmp)
+            except FileNotFoundError:
+                pass
+
+    def close(self):
+        try:
+            self._finish()
+        except BaseException:
+            self.abort()
+            raise
+        self.aggregates.close()
+
+    def _finish(self):
+        self._json.write("]")
+        if self._js is not None:
+            self._js.write("];\n")
+        self.chars += 2
+        streamed = list(self._files)
+        bundle = self._write_bundle() if self.buffer is not None else []
+        agg_json = _suffixed(self.json_file, "_aggregats")
+        agg_js = _suffixed(self.js_file, "_aggregats")
+        progress(f"Écriture de {agg_json} + {agg_js} (agrégats précalculés)...")
+        fj, fs = self._open(agg_json), self._open(agg_js)
+        fs.write(f"{JS_HEADER}{self.js_var}_AGG=")
+        for chunk in self.aggregates.chunks():
+            fj.write(chunk)
+            fs.write(chunk)
+        fs.write(";\n")
+        # Tout est écrit : les temporaires remplacent les sorties (shards
+        # avant le manifeste et le bundle qui les référencent), puis les
+        # fichiers du run précédent sont retirés
+        for path, (tmp, f) in self._files.items():
+            f.close()
+            os.replace(tmp, path)
+        written = streamed[:1] + bundle + streamed[1:] + [agg_json, agg_js]
+        shard_files = self.shard_files if self.shards else []
+        if self.shards:
+            prune_shards(shard_files)
+        else:
+            drop_shards(self.json_file)   # détails d'un run --shards précédent
+        for path in written + shard_files:
+            if self.compact:
+                write_precompressed(path)
+            else:
+                drop_precompressed(path)   # variantes d'un run --compact précédent
+        # Bilan écrit d'un bloc : l'autre chambre peut finir en même temps
+        summary = []
+        if self.compact:
+            with open(self.json_file, encoding="utf-8") as f:
+                json_str = f.read()
+            summary.append(f"  Tailles ({'gzip + brotli' if brotli else 'gzip ; brotli non installé'}) :")
+            summary += size_lines({self.json_file: json_str, self.compact_json: self.compact_str})
+            summary.append("")
+        summary += self.stats.lines()
+        summary.append(f"✓ {' + '.join(written)} générés"
+                       + ((" (+ .gz/.br)" if brotli else " (+ .gz)") if self.compact else ""))
+        if self.shards:
+            summary.append(f"✓ {len(shard_files)} fichiers dans {self.manifest['base']} · bundle "
+                           f"{self.js_file} réduit aux résumés ({self.bundle_chars / 1024:.0f} Ko "
+                           f"au lieu de {self.chars / 1024:.0f} Ko)")
+        progress("\n".join(summary))
+
+    def _write_bundle(self):
+        """Bundle JS (et *_compact.json, shards) des modes compact / shards,
+        qui ont besoin de toutes les entrées, écrits en temporaires comme les
+        autres sorties ; retourne les fichiers écrits."""
+        results, extra, written = self.buffer, (), [self.js_file]
+        bundled = [site_record(r) for r in results]
+        if self.shards:
+            bundled, self.manifest, self.shard_files = write_shards(results, self.json_file,
+                                                                    self._stage)
+            progress(f"Écriture de {len(self.manifest['shards'])} shards dans "
+                     f"{self.manifest['base']}...")
+            extra = [(f"{self.js_var}_SHARDS", _dumps(self.manifest))]
+        if self.compact:
+            self.compact_json = _suffixed(self.json_file, "_compact")
+            self.compact_str = _dumps(compact_results(results))
+            progress(f"Écriture de {self.compact_json} + {self.js_file} (format compact)...")
+            self._stage(self.compact_json, self.compact_str.encode("utf-8"))
+            bundle_str = _dumps(compact_results(bundled))
+            write_js_bundle(self._open(self.js_file), self.js_var,
+                            f"expandCompact({bundle_str})", extra)
+            written.append(self.compact_json)
+        else:
+            progress(f"Écriture de {self.js_file} (bundle embarqué)...")
+            bundle_str = _dumps(bundled)
+            write_js_bundle(self._open(self.js_file), self.js_var, bundle_str, extra)
+        self.bundle_chars = len(bundle_str)
+        return written
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_output(results, json_file, js_file, js_var, compact=False, shards=False,
+                 ndjson=False):
+    """Écrit les résultats en JSON + JS embarqué, plus les agrégats précalculés
+    (<base>_aggregats.json / .js, variable <js_var>_AGG) ; retourne le
+    StreamWriter (bilan, arbre d'historique).
+
+    Le bundle JS omet les sections SITE_OMIT, que le site n'affiche pas.
+
+    compact=True : le bundle JS embarque le format compact (décodé par
+    compact.js), <base>_compact.json (complet) est écrit, chaque fichier reçoit ses
+    variantes précompressées .gz / .br et un comparatif de tailles est affiché.
+
+    shards=True : le bundle JS ne contient que les résumés et le manifeste
+    (<js_var>_SHARDS) ; les détails vont dans shards/<base>/. data.json reste
+    complet (mode incrémental, réutilisation).
+
+    ndjson=True : écrit aussi <base>.ndjson, une entrée par ligne."""
+    with StreamWriter(json_file, js_file, js_var, compact, shards, ndjson) as out:
+        for r in results:
+            out.add(r)
+    return out
+
+
+# ── Mode incrémental ──────────────────────────────────────────────────────
+
+def load_previous(json_file):
+    """Charge la sortie d'un run précédent, indexée par fichier XML HATVP."""
+    try:
+        with open(json_file, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {r["xml"]: r for r in data if r.get("xml")}
+
+
+def split_incremental(members, previous):
+    """Sépare les parlementaires à retraiter de ceux réutilisables tels quels.
+
+    Une entrée est réutilisée si le même fichier open_data a déjà été traité
+    avec la même date_publication ; les parlementaires absents du CSV courant
+    disparaissent simplement de la sortie.
+    """
+    todo, kept = [], []
+    for m in members:
+        prev = previous.get(m["xml"])
+        if prev is not None and prev.get("date") == m["date"] and not prev.get("erreur"):
+            # Champs issus du CSV : gratuits à rafraîchir, sans nouvelle requête
+            kept.append({**prev,
+                         "qualite":     m["qualite"],
+                         "departement": m["departement"],
+                         "url":         m["url"]})
+        else:
+            todo.append(m)
+    departs = len(set(previous) - {m["xml"] for m in members})
+    progress(f"  → incrémental : {len(kept)} inchangés · {len(todo)} nouveaux ou modifiés · "
+             f"{departs} départs")
+    return todo, kept
+
+
+# ── Historique des runs ───────────────────────────────────────────────────
+# --history DIR : magasin d'instantanés append-only adressé par contenu.
+# Dossiers XML et entrées parsées sont stockés une seule fois, compressés
+# (objects/<sha256[:2]>/<sha256>) ; chaque chambre d'un run est un arbre
+# {fiche: entrée} partagé par les runs identiques, et chaque run un petit
+# manifeste runs/<id>.json. Le stockage croît avec les changements, pas avec
+# le nombre de runs ; un diff ne relit que les entrées dont le hash a changé,
+# et, filtré par parlementaire ou société, seulement celles que l'index de
+# recherche de la chambre (nom et sociétés par fiche) désigne.
+
+HISTORY_FORMAT = "hatvp-history/1"
+
+history = None   # SnapshotStore alimenté en mode --history
+
+def start_history(root):
+    global history
+    history = SnapshotStore(root)
+    return history
+
+def _member_key(r):
+    """Identifiant stable d'un parlementaire d'un run à l'autre (fiche HATVP)."""
+    return r.get("url") or f"{r['nom']}_{r['prenom']}"
+
+def _index_entry(r):
+    """Clés de recherche d'une entrée pour l'index de l'historique :
+    [nom et fiche, [sociétés]], sans accents ni casse."""
+    return [ascii_key(f"{r['prenom']} {r['nom']} {_member_key(r)}"),
+            sorted({ascii_key(p.get("societe")) for p in r.get("participations") or []})]
+
+def _run_order(run):
+    # 20240101-120000-10 après 20240101-120000-9 : suffixe comparé en nombre
+    m = re.fullmatch(r"(.*\d{8}-\d{6})-(\d+)", run)
+    return (m.group(1), int(m.group(2))) if m else (run, 1)
+
+def _participations_by_societe(record):
+    """{identifiant société: {societe, evaluation}} ; les lignes d'une même
+    société sont cumulées."""
+    out = {}
+    for p in record.get("participations") or []:
+        societe = p.get("societe") or ""
+        key = p.get("sid") or societe_id(societe)
+        cur = out.setdefault(key, {"societe": societe, "evaluation": 0.0})
+        cur["evaluation"] += p.get("evaluation") or 0
+    return out
+
+def diff_participations(old, new):
+    """Participations nouvelles, retirées et réévaluées entre deux versions de
+    l'entrée d'un parlementaire (None = absent du run)."""
+    before = _participations_by_societe(old or {})
+    after = _participations_by_societe(new or {})
+    changes = []
+    for k in sorted(before.keys() | after.keys()):
+        a, b = before.get(k), after.get(k)
+        if a is None:
+            changes.append({"type": "nouvelle", "societe": b["societe"],
+                            "avant": None, "apres": b["evaluation"]})
+        elif b is None:
+            changes.append({"type": "retiree", "societe": a["societe"],
+                            "avant": a["evaluation"], "apres": None})
+        elif a["evaluation"] != b["evaluation"]:
+            changes.append({"type": "reevaluee", "societe": b["societe"],
+                            "avant": a["evaluation"], "apres": b["evaluation"]})
+    return changes
+
+
+class SnapshotStore:
+    """Instantanés des sorties du pipeline, dédupliqués par contenu."""
+
+    def __init__(self, root):
+        self.root = root
+        self.runs_dir = os.path.join(root, "runs")
+        self.dossiers_path = os.path.join(root, "dossiers.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.dossiers_path, encoding="utf-8") as f:
+                self.dossiers = json.load(f)["dossiers"]   # fichier XML → [sha256 des versions]
+        except (OSError, ValueError, KeyError):
+            self.dossiers = {}
+
+    def object_path(self, sha):
+        return os.path.join(self.root, "objects", sha[:2], sha)
+
+    def put(self, data):
+        sha = hashlib.sha256(data).hexdigest()
+        path = self.object_path(sha)
+        if not os.path.exists(path):
+            _write_atomic(path, gzip.compress(data, mtime=0))
+        return sha
+
+    def get(self, sha):
+        with open(self.object_path(sha), "rb") as f:
+            return gzip.decompress(f.read())
+
+    def put_json(self, obj):
+        return self.put(json.dumps(obj, ensure_ascii=False, sort_keys=True,
+                                   separators=(",", ":")).encode("utf-8"))
+
+    def get_json(self, sha):
+        return json.loads(self.get(sha))
+
+    def add_dossier(self, name, data):
+        """Archive un dossier XML brut ; un même fichier republié avec un autre
+        contenu ajoute une version."""
+        sha = self.put(data)
+        with self._lock:
+            versions = self.dossiers.setdefault(name, [])
+            if sha not in versions:
+                versions.append(sha)
+
+    def snapshot(self, trees, indexes=None):
+        """Enregistre un run {libellé: arbre {fiche: sha256 de l'entrée}} et, s'il
+        est fourni, l'index de recherche {libellé: {fiche: _index_entry()}}
+        (construits au fil de l'écriture, cf. StreamWriter) ; retourne son
+        identifiant."""
+        entry = {}
+        for label, tree in trees.items():
+            entry[label] = {"arbre": self.put_json(tree), "n": len(tree)}
+            if indexes and label in indexes:
+                entry[label]["index"] = self.put_json(indexes[label])
+        os.makedirs(self.runs_dir, exist_ok=True)
+        run = base = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+        n = 2
+        while os.path.exists(os.path.join(self.runs_dir, run + ".json")):
+            run, n = f"{base}-{n}", n + 1
+        manifest = {"format": HISTORY_FORMAT, "run": run,
+                    "date": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "chambres": entry}
+        _write_atomic(os.path.join(self.runs_dir, run + ".json"),
+                      json.dumps(manifest, ensure_ascii=False, indent=1).encode("utf-8"))
+        with self._lock:
+            data = {"format": HISTORY_FORMAT, "dossiers": dict(sorted(self.dossiers.items()))}
+        _write_atomic(self.dossiers_path, json.dumps(data, ensure_ascii=False, indent=1).encode("utf-8"))
+        return run
+
+    def runs(self):
+        """Identifiants des runs, du plus ancien au plus récent."""
+        try:
+            names = os.listdir(self.runs_dir)
+        except OSError:
+            return []
+        return sorted((n[:-5] for n in names if n.endswith(".json")), key=_run_order)
+
+    def resolve(self, ref):
+        """Run désigné par son identifiant, un préfixe unique ou un rang
+        depuis la fin (-1 = dernier run)."""
+        runs = self.runs()
+        if re.fullmatch(r"-\d+", ref):
+            if int(ref) == 0:
+                raise KeyError(f"rang {ref!r} invalide (-1 = dernier run)")
+            if int(ref) < -len(runs):
+                raise KeyError(f"seulement {len(runs)} runs dans {self.root}")
+            return runs[int(ref)]
+        if ref in runs:
+            return ref
+        found = [r for r in runs if r.startswith(ref)]
+        if len(found) != 1:
+            raise KeyError(f"run {ref!r} {'ambigu' if found else 'introuvable'}")
+        return found[0]
+
+    def manifest(self, run):
+        with open(os.path.join(self.runs_dir, run + ".json"), encoding="utf-8") as f:
+            return json.load(f)
+
+    def tree(self, run, chamber):
+        entry = self.manifest(run)["chambres"].get(chamber)
+        return self.get_json(entry["arbre"]) if entry else {}
+
+    def _matching(self, keys, entries, membre, societe):
+        """Fiches de `keys` dont une version (ancienne ou nouvelle) correspond
+        aux filtres d'après l'index de recherche ; sans index (run antérieur à
+        l'index), toutes les fiches sont gardées."""
+        indexes = [e and e.get("index") for e in entries]
+        if not all(e is None or sha for e, sha in zip(entries, indexes)):
+            return keys
+        indexes = [self.get_json(sha) for sha in indexes if sha]
+
+        def match(key):
+            for index in indexes:
+                nom, societes = index.get(key) or ("", ())
+                if membre and membre not in nom:
+                    continue
+                if not societe or any(societe in s for s in societes):
+                    return True
+            return False
+
+        return [k for k in keys if match(k)]
+
+    def diff(self, old_run, new_run, chamber=None, membre=None, societe=None):
+        """Participations nouvelles, retirées et réévaluées entre deux runs, par
+        parlementaire. Seules les entrées dont le hash diffère sont relues, et
+        parmi elles, avec `membre` ou `societe` (sous-chaîne sans accents ni
+        casse), celles que l'index de recherche désigne."""
+        old_m, new_m = self.manifest(old_run), self.manifest(new_run)
+        chambers = [chamber] if chamber else sorted(old_m["chambres"].keys()
+                                                    | new_m["chambres"].keys())
+        membre, societe = ascii_key(membre), ascii_key(societe)
+        out = []
+        for label in chambers:
+            old_e, new_e = old_m["chambres"].get(label), new_m["chambres"].get(label)
+            if old_e and new_e and old_e["arbre"] == new_e["arbre"]:
+                continue
+            old_t = self.get_json(old_e["arbre"]) if old_e else {}
+            new_t = self.get_json(new_e["arbre"]) if new_e else {}
+            keys = [k for k in sorted(old_t.keys() | new_t.keys())
+                    if old_t.get(k) != new_t.get(k)]
+            if membre or societe:
+                keys = self._matching(keys, (old_e, new_e), membre, societe)
+            for key in keys:
+                old_r = self.get_json(old_t[key]) if key in old_t else None
+                new_r = self.get_json(new_t[key]) if key in new_t else None
+                ref = new_r or old_r
+                if membre and membre not in ascii_key(f"{ref['prenom']} {ref['nom']} {key}"):
+                    continue
+                changes = [c for c in diff_participations(old_r, new_r)
+                           if not societe or societe in ascii_key(c["societe"])]
+                if changes:
+                    out.append({"chambre": label, "membre": key, "nom": ref["nom"],
+                                "prenom": ref["prenom"], "groupe": ref.get("groupe", ""),
+                                "changements": changes})
+        return out
+
+
+# ── Ordonnancement ────────────────────────────────────────────────────────
+# Les deux chambres forment un seul graphe de tâches : lecture du CSV, pages
+# de groupes et dossiers avancent en même temps, sous le budget HTTP global
+# (HTTP_BUDGET) et les limites par hôte ; chaque chambre est écrite dès
+# qu'elle est prête.
+
+# (clé de load_csv, libellé, sortie JSON, bundle JS, variable JS)
+CHAMBERS = [
+    ("deputes",   "députés",   "data.json",           "data.js",
+     "window.HATVP_DATA"),
+    ("senateurs", "sénateurs", "data_senateurs.json", "data_senateurs.js",
+     "window.HATVP_DATA_SENATEURS"),
+]
+
+class Scheduler:
+    """Graphe de tâches : une tâche démarre dès que ses dépendances sont
+    terminées et reçoit leurs résultats en arguments ; un échec est propagé
+    aux tâches qui en dépendent, les autres branches continuent. Le parsing
+    de toutes les tâches partage un même pool de processus (`cpu`)."""
+
+    def __init__(self, parse_workers=None):
+        if parse_workers is None:
+            parse_workers = os.cpu_count() or 1
+        self.cpu = parse_pool(parse_workers) if parse_workers > 0 else None
+        # Aucune tâche n'attend une autre : un thread par tâche prête suffit
+        self._threads = ThreadPoolExecutor(max_workers=8)
+        self.tasks = {}
+
+    def task(self, name, fn, *deps, label=None):
+        """Ajoute la tâche `name` ; `label` préfixe ses lignes de progression."""
+        fut = self.tasks[name] = Future()
+        remaining = [len(deps)]
+        lock = threading.Lock()
+
+        def start():
+            failed = [d.exception() for d in deps if d.exception() is not None]
+            if failed:
+                fut.set_exception(failed[0])
+            else:
+                self._threads.submit(self._run, name, fut, fn, [d.result() for d in deps],
+                                     label)
+
+        def on_done(_):
+            with lock:
+                remaining[0] -= 1
+                ready = remaining[0] == 0
+            if ready:
+                start()
+
+        for d in deps:
+            d.add_done_callback(on_done)
+        if not deps:
+            start()
+        return fut
+
+    def _run(self, name, fut, fn, args, label):
+        _progress_local.label = label
+        try:
+            with run_report.stage(name):
+                result = fn(*args)
+        except BaseException as e:
+            fut.set_exception(e)
+        else:
+            fut.set_result(result)
+        finally:
+            _progress_local.label = None
+
+    def wait(self):
+        """Attend toutes les tâches, puis relève la première erreur rencontrée."""
+        wait(list(self.tasks.values()))
+        for fut in self.tasks.values():
+            if fut.exception() is not None:
+                raise fut.exception()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._threads.shutdown(wait=True)
+        if self.cpu is not None:
+            self.cpu.shutdown(wait=True, cancel_futures=True)
+
+
+def schedule_chamber(sched, listes, key, label, load_groupes_fn, json_file, js_file, js_var,
+                     incremental=False, compact=False, shards=False, ndjson=False):
+    """Ajoute au graphe les tâches d'une chambre et retourne la tâche finale
+    (StreamWriter de la sortie écrite, ou None si le CSV ne contient aucun
+    parlementaire de la chambre) :
+
+        load_csv → selection → dossiers ──┐
+                             (DossierSpool) ├→ write_output (correspondance,
+                           load_groupes ───┘   libellés canoniques, en flux)
+
+    Les groupes sont chargés dès le départ, pendant la lecture du CSV et les
+    téléchargements, y compris en mode incrémental : les entrées conservées
+    sont elles aussi réassociées (changements de groupe, « Inconnu »).
+    """
+    def select(listes):
+        members = listes[key]
+        if not members:
+            progress(f"  ⚠ Aucun parlementaire ({label}) trouvé dans le CSV HATVP "
+                     f"(vérifier type_mandat)")
+            return None
+        if incremental:
+            return split_incremental(members, load_previous(json_file))
+        return members, []
+
+    def dossiers(selection):
+        if selection is None:
+            return None
+        todo, kept = selection
+        # Les entrées conservées (--incremental) sont recanonicalisées avec les
+        # nouvelles : un libellé dépend de toutes les variantes de la chambre
+        spool = DossierSpool(SocieteCanon())
+        for r in kept:
+            spool.add_record(r)
+        if history is not None:
+            archive_kept(kept, label)
+        if todo:
+            fetch_dossiers(todo, label, cpu_pool=sched.cpu, sink=spool.add)
+        return spool
+
+    def write(selection, groupes, spool):
+        if spool is None:
+            return None
+        try:
+            with StreamWriter(json_file, js_file, js_var, compact, shards, ndjson) as out:
+                for record in spool.records(groupes):
+                    out.add(record)
+        finally:
+            spool.close()
+        report_matches(groupes, label)
+        run_report.matching[label] = groupes.report()
+        return out
+
+    sel = sched.task(f"selection:{label}", select, listes, label=label)
+    grp = sched.task(f"load_groupes:{label}", load_groupes_fn, label=label)
+    dl = sched.task(f"dossiers:{label}", dossiers, sel, label=label)
+    return sched.task(f"write_output:{label}", write, sel, grp, dl, label=label)
+
+
+def run_chambers(loaders, parse_workers=None, incremental=False, compact=False, shards=False,
+                 ndjson=False, out_dir=""):
+    """Traite toutes les chambres de CHAMBERS en parallèle ; `loaders` associe
+    à chaque clé la fonction de chargement de ses groupes. Retourne
+    {libellé: StreamWriter} (bilan et arbre d'historique de chaque sortie)."""
+    with Scheduler(parse_workers) as sched:
+        listes = sched.task("load_csv", load_csv)
+        finals = {
+            label: schedule_chamber(sched, listes, key, label, loaders[key],
+                                    os.path.join(out_dir, json_file),
+                                    os.path.join(out_dir, js_file), js_var,
+                                    incremental, compact, shards, ndjson)
+            for key, label, json_file, js_file, js_var in CHAMBERS
+        }
+        sched.wait()
+    return {label: fut.result() for label, fut in finals.items()}
 
 
 # ── Main ───────────────────────────────────────────────────────────────────
 
-def main():
-    # ── Députés ────────────────────────────────────────────────────────────
-    print("\n══ ASSEMBLÉE NATIONALE — DÉPUTÉS ══")
-    groupes_an  = load_groupes()
-    deputies    = load_csv()
-    res_deputes = build_results(deputies, groupes_an, "députés")
-
-    # Correctif manuel (apostrophes Unicode non reconnues par le scraping AN)
-    overrides = {'/pages_nominatives/d-intorni-christelle-20430': 'Union des droites pour la République'}
-    for r in res_deputes:
-        if overrides.get(r["url"]):
-            r["groupe"] = overrides[r["url"]]
-
-    write_output(res_deputes, "data.json", "data.js", "window.HATVP_DATA")
-
-    # ── Sénateurs ──────────────────────────────────────────────────────────
-    print("\n══ SÉNAT — SÉNATEURS ══")
-    groupes_senat  = load_groupes_senat()
-    senateurs      = load_csv_senateurs()
-    if senateurs:
-        res_senateurs = build_results(senateurs, groupes_senat, "sénateurs")
-        write_output(res_senateurs, "data_senateurs.json", "data_senateurs.js",
-                     "window.HATVP_DATA_SENATEURS")
-    else:
-        progress("  ⚠ Aucun sénateur trouvé dans le CSV HATVP (vérifier type_mandat)")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--incremental", action="store_true",
+                        help="ne retraiter que les déclarations nouvelles ou modifiées "
+                             "depuis la sortie précédente")
+    parser.add_argument("--parse-workers", type=int, default=None, metavar="N",
+                        help="processus de parsing XML (défaut : nombre de cœurs, "
+                             "0 = dans le processus principal)")
+    parser.add_argument("--groupes-ttl", type=float, default=AN_GROUPES_TTL / 86400,
+                        metavar="JOURS",
+                        help="durée de validité du magasin PA id → groupe (défaut : 7 jours)")
+    parser.add_argument("--an-opendata", metavar="CHEMIN",
+                        help="export open data AN acteurs/organes (zip, dossier ou JSON) "
+                             "pour remplir le magasin des groupes sans requête embed")
+    parser.add_argument("--shards", action="store_true",
+                        help="bundles JS réduits aux résumés ; détails par groupe dans "
+                             "shards/ (noms hashés), chargés à la demande par le site")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="écrire aussi data.ndjson / data_senateurs.ndjson "
+                             "(une entrée par ligne)")
+    parser.add_argument("--compact", action="store_true",
+                        help="bundles JS au format compact (colonnes + table de chaînes), "
+                             "*_compact.json et variantes précompressées .gz / .br")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", metavar="DOSSIER",
+                      help="archiver toutes les réponses utilisées par le run "
+                           "(archive adressée par contenu, rejouable avec --replay)")
+    mode.add_argument("--replay", metavar="HÔTE:PORT",
+                      help="envoyer toutes les requêtes au serveur de rejeu local "
+                           "(python bench.py serve ARCHIVE)")
+    parser.add_argument("--replay-dir", default=REPLAY_DIR, metavar="DOSSIER",
+                        help="avec --replay : dossier du cache HTTP, du magasin des groupes "
+                             f"et des sorties (défaut : {REPLAY_DIR}/)")
+    parser.add_argument("--history", metavar="DOSSIER",
+                        help="ajouter un instantané du run (dossiers XML + entrées, "
+                             "dédupliqués) à l'historique ; diffs avec history.py")
+    parser.add_argument("--report", metavar="FICHIER",
+                        help="écrire un rapport JSON du run : durées par étape, "
+                             "latences par hôte, parsing, cache, correspondances, échecs")
+    parser.add_argument("--profile", metavar="FICHIER",
+                        help="profiler le processus principal (cProfile) ; "
+                             "lire avec python -m pstats FICHIER")
+    args = parser.parse_args(argv)
+
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        run(args)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f"✓ profil écrit dans {args.profile}")
+        if args.report:
+            run_report.write(args.report)
+            print(f"✓ rapport du run écrit dans {args.report}")
+
+
+def run(args):
+    """Déroule le pipeline complet selon les options de la ligne de commande."""
+    global HTTP_CACHE_DIR
+    out_dir, store_path = "", AN_GROUPES_STORE
+    if args.record:
+        start_recording(args.record)
+        # Toutes les pages embed doivent figurer dans l'archive
+        args.groupes_ttl = 0
+    if args.replay:
+        host, _, port = args.replay.rpartition(":")
+        use_replay(host or "127.0.0.1", port)
+        # Les réponses rejouées ne doivent pas remplacer le cache ni les
+        # sorties du site
+        out_dir = args.replay_dir
+        HTTP_CACHE_DIR = os.path.join(out_dir, CACHE_DIR, "http")
+        store_path = os.path.join(out_dir, CACHE_DIR, "an_groupes.json")
+        os.makedirs(out_dir, exist_ok=True)
+        print(f"\nRejeu : cache et sorties dans {out_dir}/")
+
+    print("\n══ ASSEMBLÉE NATIONALE + SÉNAT (en parallèle) ══")
+    loaders = {
+        "deputes":   partial(load_groupes, ttl=args.groupes_ttl * 86400,
+                             opendata=args.an_opendata, store_path=store_path),
+        "senateurs": load_groupes_senat,
+    }
+    if args.history:
+        start_history(args.history)
+    outputs = run_chambers(loaders, args.parse_workers, args.incremental, args.compact,
+                           args.shards, args.ndjson, out_dir)
+    if history is not None:
+        done = {label: out for label, out in outputs.items() if out is not None}
+        run_id = history.snapshot({label: out.tree for label, out in done.items()},
+                                  {label: out.index for label, out in done.items()})
+        print(f"\n✓ instantané {run_id} ajouté à l'historique {history.root}")
+
+    if fetch_failures:
+        print(f"\n⚠ {len(fetch_failures)} requêtes en échec définitif :")
+        for f in fetch_failures:
+            print(f"    {f['url']} — {f['erreur']} ({f['tentatives']} tentatives)")
+
+    if recorder is not None:
+        recorder.save()
+        size = sum(e["size"] for e in recorder.entries.values())
+        print(f"\n✓ {len(recorder.entries)} réponses archivées dans {recorder.root} "
+              f"({size / 1e6:.1f} Mo)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Historique des runs de fetch_data.py (magasin alimenté par --history DOSSIER).
+
+  python history.py list [--history DOSSIER]
+      Liste les runs : date, nombre de parlementaires par chambre, chambres
+      inchangées depuis le run précédent (=), taille du magasin.
+
+  python history.py diff [ANCIEN] [NOUVEAU] [--chambre C] [--membre M] [--societe S] [--json]
+      Participations nouvelles (+), retirées (-) et réévaluées (~) entre deux
+      runs, par parlementaire. Un run se désigne par son identifiant, un
+      préfixe unique ou un rang depuis la fin (défaut : -2 et -1, soit les
+      deux derniers runs).
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import fetch_data
+
+DEFAULT_HISTORY = "history"
+
+def euros(v):
+    return "—" if v is None else f"{v:,.0f} €".replace(",", " ")
+
+def store_size(root):
+    count = size = 0
+    for dirpath, _, files in os.walk(os.path.join(root, "objects")):
+        for name in files:
+            count += 1
+            size += os.path.getsize(os.path.join(dirpath, name))
+    return count, size
+
+# ── Commandes ──────────────────────────────────────────────────────────────
+
+def cmd_list(store, args):
+    runs = store.runs()
+    if not runs:
+        sys.exit(f"aucun run dans {store.root}")
+    previous = {}
+    for run in runs:
+        chambres = store.manifest(run)["chambres"]
+        cols = []
+        for label, entry in sorted(chambres.items()):
+            same = previous.get(label) == entry["arbre"]
+            cols.append(f"{label} {entry['n']}{' =' if same else ''}")
+            previous[label] = entry["arbre"]
+        print(f"{run}   " + " · ".join(cols))
+    count, size = store_size(store.root)
+    print(f"\n{len(runs)} runs · {count} objets · {size / 1e6:.1f} Mo")
+
+SIGNS = {"nouvelle": "+", "retiree": "-", "reevaluee": "~"}
+
+def cmd_diff(store, args):
+    old, new = store.resolve(args.old), store.resolve(args.new)
+    changes = store.diff(old, new, args.chambre, args.membre, args.societe)
+    if args.json:
+        json.dump({"ancien": old, "nouveau": new, "membres": changes}, sys.stdout,
+                  ensure_ascii=False, indent=1)
+        print()
+        return
+    print(f"{old} → {new}")
+    counts = {t: 0 for t in SIGNS}
+    for m in changes:
+        print(f"\n{m['prenom']} {m['nom']} ({m['groupe']}, {m['chambre']})")
+        for c in m["changements"]:
+            counts[c["type"]] += 1
+            value = (euros(c["apres"]) if c["type"] == "nouvelle"
+                     else euros(c["avant"]) if c["type"] == "retiree"
+                     else f"{euros(c['avant'])} → {euros(c['apres'])}")
+            print(f"  {SIGNS[c['type']]} {c['societe']} : {value}")
+    print(f"\n{len(changes)} parlementaires · {counts['nouvelle']} nouvelles · "
+          f"{counts['retiree']} retirées · {counts['reevaluee']} réévaluées")
+
+# ── Main ───────────────────────────────────────────────────────────────────
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip(),
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", default=DEFAULT_HISTORY, metavar="DOSSIER",
+                        help=f"magasin d'historique (défaut : {DEFAULT_HISTORY})")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("list", help="runs enregistrés")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("diff", help="changements de participations entre deux runs")
+    p.add_argument("old", nargs="?", default="-2", help="run de référence (défaut : -2)")
+    p.add_argument("new", nargs="?", default="-1", help="run comparé (défaut : -1)")
+    p.add_argument("--chambre", help="députés ou sénateurs (défaut : toutes)")
+    p.add_argument("--membre", help="filtrer par nom de parlementaire ou fiche")
+    p.add_argument("--societe", help="filtrer par nom de société")
+    p.add_argument("--json", action="store_true", help="sortie JSON")
+    p.set_defaults(func=cmd_diff)
+
+    args = parser.parse_args(argv)
+    store = fetch_data.SnapshotStore(args.history)
+    try:
+        args.func(store, args)
+    except KeyError as e:
+        sys.exit(e.args[0])
+
+
+if __name__ == "__main__":
+    main()
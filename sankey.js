@@ -20,13 +20,37 @@ function _sankeySource() {
   if (activeSocietes && activeSocietes.size > 0) {
     base = base.filter(d =>
       filterParticipations(d.participations).some(p =>
-        !isNonPublic(p.societe) && activeSocietes.has(normalizeSearch(p.societe))
+        !isNonPublic(p.societe) && activeSocietes.has(socId(p))
       )
     );
   }
   return base;
 }
 
+// Flux député → société retenus par les filtres de valeur. Vue par défaut : flux
+// cumulés précalculés par fetch_data.py ; sinon, une entrée par participation.
+function _sankeyFlows(source, minVal, maxVal) {
+  const agg = typeof precomputed === 'function' ? precomputed() : null;
+  const flows = [];
+  if (agg && minVal <= 0 && maxVal >= 9999999999) {
+    for (const [mi, links] of agg.sankey) {
+      const d = agg.membres[mi];
+      for (const [si, value] of links) {
+        const label = agg.societes[si].label;
+        flows.push({ d, key: label.toUpperCase(), label, value });
+      }
+    }
+    return flows;
+  }
+  for (const d of source) {
+    for (const p of filterParticipations(d.participations)) {
+      if (isNonPublic(p.societe) || !p.evaluation || p.evaluation < minVal || p.evaluation > maxVal) continue;
+      flows.push({ d, key: p.societe.toUpperCase(), label: p.societe, value: p.evaluation });
+    }
+  }
+  return flows;
+}
+
 function buildSankey() {
   const topN   = parseInt(document.getElementById('sankey-top-n')?.value    || '9999', 10);
   const minVal = parseInt(document.getElementById('sankey-min-val')?.value  || '0', 10);
@@ -37,17 +61,11 @@ function buildSankey() {
   wrap.innerHTML = '';
 
   // ── 1. Source : filtres globaux ───────────────────────────────────────────
-  const source = _sankeySource();
+  const flows = _sankeyFlows(_sankeySource(), minVal, maxVal);
 
   // ── 2. Agrégat sociétés pour top N ───────────────────────────────────────
   const socTotal = {};
-  for (const d of source) {
-    for (const p of filterParticipations(d.participations)) {
-      if (isNonPublic(p.societe) || !p.evaluation || p.evaluation < minVal || p.evaluation > maxVal) continue;
-      const key = p.societe.toUpperCase();
-      socTotal[key] = (socTotal[key] || 0) + p.evaluation;
-    }
-  }
+  for (const f of flows) socTotal[f.key] = (socTotal[f.key] || 0) + f.value;
 
   const sorted = Object.entries(socTotal).sort((a, b) => b[1] - a[1]);
   const topSocSet = new Set(
@@ -74,28 +92,23 @@ function buildSankey() {
     return nodeMap[id];
   }
 
-  for (const d of source) {
+  for (const { d, key, label, value } of flows) {
+    if (!topSocSet.has(key)) continue;
     const g  = d.groupe || 'Inconnu';
     const gC = gColor(g);
     const depName = `${d.prenom} ${d.nom}`;
 
-    for (const p of filterParticipations(d.participations)) {
-      if (isNonPublic(p.societe) || !p.evaluation || p.evaluation < minVal || p.evaluation > maxVal) continue;
-      const key = p.societe.toUpperCase();
-      if (!topSocSet.has(key)) continue;
+    const iG   = getNode('groupe',  g,        shortGroupe(g), gC,                                   { fullName: g });
+    const iDep = getNode('depute',  d.url,    depName,        d3.color(gC)?.brighter(0.5) ?? gC,   { url: d.url, groupe: g, prenom: d.prenom, nom: d.nom });
+    const iSoc = getNode('societe', key,      label,          '#6fa8bf',                            { fullName: label, key });
 
-      const iG   = getNode('groupe',  g,        shortGroupe(g), gC,                                   { fullName: g });
-      const iDep = getNode('depute',  d.url,    depName,        d3.color(gC)?.brighter(0.5) ?? gC,   { url: d.url, groupe: g, prenom: d.prenom, nom: d.nom });
-      const iSoc = getNode('societe', key,      p.societe,      '#6fa8bf',                            { fullName: p.societe, key });
+    const lgd = links.findIndex(l => l.source === iG && l.target === iDep);
+    if (lgd === -1) links.push({ source: iG, target: iDep, value, _groupe: g });
+    else links[lgd].value += value;
 
-      const lgd = links.findIndex(l => l.source === iG && l.target === iDep);
-      if (lgd === -1) links.push({ source: iG, target: iDep, value: p.evaluation, _groupe: g });
-      else links[lgd].value += p.evaluation;
-
-      const lds = links.findIndex(l => l.source === iDep && l.target === iSoc);
-      if (lds === -1) links.push({ source: iDep, target: iSoc, value: p.evaluation, _groupe: g });
-      else links[lds].value += p.evaluation;
-    }
+    const lds = links.findIndex(l => l.source === iDep && l.target === iSoc);
+    if (lds === -1) links.push({ source: iDep, target: iSoc, value, _groupe: g });
+    else links[lds].value += value;
   }
 
   if (!links.length) {
@@ -0,0 +1,105 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fetch_data  # noqa: E402
+
+
+def dia_xml(participations=(), neant=False):
+    """Dossier DIA minimal : [(société, évaluation)] → octets XML."""
+    items = "".join(
+        f"<items><nomSociete>{societe}</nomSociete><evaluation>{evaluation}</evaluation>"
+        f"<nombreParts>1</nombreParts></items>"
+        for societe, evaluation in participations)
+    return (
+        "<declaration><participationFinanciereDto>"
+        f"<neant>{'true' if neant else 'false'}</neant><items>{items}</items>"
+        "</participationFinanciereDto></declaration>"
+    ).encode("utf-8")
+
+
+def member(i, nom=None, prenom="Jean"):
+    """Entrée CSV d'un parlementaire (format load_csv)."""
+    return {"nom": nom or f"Nom{i}", "prenom": prenom, "qualite": "M.", "departement": "75",
+            "url": f"https://www.hatvp.fr/pages_nominatives/nom{i}", "xml": f"nom{i}.xml",
+            "date": "2024-01-01"}
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    """Cache HTTP, historique et compteurs propres à chaque test."""
+    monkeypatch.setattr(fetch_data, "HTTP_CACHE_DIR", str(tmp_path / "http"))
+    monkeypatch.setattr(fetch_data, "history", None)
+    monkeypatch.setattr(fetch_data, "run_report", fetch_data.RunReport())
+    fetch_data.fetch_failures.clear()
+    yield
+    fetch_data.fetch_failures.clear()
+
+
+class FakeServer:
+    """Serveur HTTP local scripté : `routes[chemin]` est une liste de réponses
+    (statut, en-têtes, corps) ou de fonctions(handler), servies dans l'ordre ;
+    la dernière est répétée. `log` garde (chemin, en-têtes) de chaque requête.
+    `idle_timeout` : secondes au bout desquelles une connexion keep-alive
+    inactive est fermée par le serveur."""
+
+    def __init__(self, idle_timeout=None):
+        self.routes = {}
+        self.log = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            timeout = idle_timeout
+
+            def do_GET(self):
+                server.log.append((self.path, dict(self.headers)))
+                responses = server.routes.get(self.path) or [(404, {}, b"")]
+                resp = responses.pop(0) if len(responses) > 1 else responses[0]
+                if callable(resp):
+                    return resp(self)
+                status, headers, body = resp
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.httpd.server_port}{path}"
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def truncated(handler):
+    """Réponse coupée : Content-Length annoncé supérieur au corps envoyé."""
+    handler.send_response(200)
+    handler.send_header("Content-Length", "100")
+    handler.end_headers()
+    handler.wfile.write(b"partiel")
+    handler.close_connection = True
+
+
+@pytest.fixture
+def http_server(monkeypatch):
+    monkeypatch.setattr(fetch_data, "DEFAULT_HOST_LIMIT", (4, 1000.0))
+    monkeypatch.setattr(fetch_data, "RETRY_BACKOFF", 0)
+    server = FakeServer()
+    yield server
+    server.close()
+    fetch_data._pools.clear()
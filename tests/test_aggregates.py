@@ -0,0 +1,90 @@
+import copy
+import json
+
+import fetch_data
+from conftest import member
+
+
+def dia(*participations):
+    return {"participations": [{"societe": s, "evaluation": v, "nbParts": 1.0, "remuneration": 0.0}
+                               for s, v in participations],
+            "activites": [], "mandats": [], "organes": []}
+
+
+# Variantes d'une même société, non publiées, montants nuls, sans participation
+DOSSIERS = [
+    (member(1, "DUPONT"), dia(("AIRBUS SE", 1000), ("Thales", 0), ("Airbus", 500))),
+    (member(2, "MARTIN"), dia(("Airbus", 300), ("[Données non publiées]", 0))),
+    (member(3, "DURAND"), dia()),
+    (member(4, "PETIT"), dia(("  Crédit   Agricole ", 40), ("Thales", 2000),
+                             ("SCI Les Tilleuls [données non publiées]", 0))),
+    (member(5, "ROBERT"), dia(("credit agricole", 10), ("Airbus", 100))),
+]
+
+
+def matcher():
+    m = fetch_data.NameMatcher()
+    for i, (dep, _) in enumerate(DOSSIERS):
+        m.add(f"{dep['prenom']} {dep['nom']}", {"groupe": f"G{i % 2}", "couleur": f"#00000{i % 2}"})
+    return m
+
+
+def batch_results():
+    dossiers = copy.deepcopy(DOSSIERS)
+    return fetch_data.canonicalize_societes(
+        fetch_data.match_results([(dep, d, None) for dep, d in dossiers], matcher()))
+
+
+def test_spool_canon_matches_canonicalize_societes():
+    expected = batch_results()
+    dossiers = copy.deepcopy(DOSSIERS)
+    # Une entrée conservée (--incremental) passe par add_record
+    kept = expected[0]
+    spool = fetch_data.DossierSpool(fetch_data.SocieteCanon())
+    spool.add_record(copy.deepcopy(kept))
+    for dep, d in dossiers[1:]:
+        spool.add(dep, d)
+    try:
+        streamed = list(spool.records(matcher()))
+    finally:
+        spool.close()
+    assert streamed == expected
+    labels = {p["sid"]: p["societe"] for r in streamed for p in r["participations"] if "sid" in p}
+    assert labels == {"airbus": "Airbus", "thales": "Thales", "credit-agricole": "Crédit Agricole"}
+
+
+def test_chunks_match_compute_aggregates():
+    results = batch_results()
+    agg = fetch_data.Aggregates()
+    try:
+        for r in results:
+            agg.add(r)
+        text = "".join(agg.chunks())
+    finally:
+        agg.close()
+    data = json.loads(text)
+    assert data == fetch_data.compute_aggregates(results)
+
+    assert data["kpis"] == {"membres": 5, "valeur": 3950.0, "moyenne": 790.0, "mediane": 900.0}
+    assert [s[0] for s in data["societes"]] == ["Thales", "Airbus", "Crédit Agricole"]
+    assert data["societes"][1][1:4] == [1900.0, {"G0": 1600.0, "G1": 300.0}, [0, 1, 3]]
+    # Indices de sociétés remappés après le tri par valeur
+    [row] = [s for s in data["sunburst"] if s[0] == 2]
+    assert [(data["societes"][si][0], v) for si, v in row[3]] == [
+        ("Thales", 2000.0), ("Crédit Agricole", 40.0)]
+    assert [m[2] for m in data["membres"]] == ["DUPONT", "MARTIN", "PETIT", "ROBERT"]
+    assert data["nonPublic"] == [["[Données non publiées]", [1]],
+                                 ["SCI Les Tilleuls [Données non publiées]", [2]]]
+    tokens = dict((t[0], t[1:]) for t in data["tokens"])
+    assert tokens["tilleuls"] == [[], [1]]
+    assert tokens["credit"] == [[2]]
+
+
+def test_stream_writer_aggregates_match_written_data(tmp_path):
+    results = batch_results()
+    json_file = str(tmp_path / "data.json")
+    fetch_data.write_output(results, json_file, str(tmp_path / "data.js"), "window.D")
+    with open(json_file, encoding="utf-8") as f:
+        written = json.load(f)
+    with open(tmp_path / "data_aggregats.json", encoding="utf-8") as f:
+        assert json.load(f) == fetch_data.compute_aggregates(written)
@@ -0,0 +1,34 @@
+import json
+import os
+
+import fetch_data
+
+
+def test_index_survives_interrupted_recording(tmp_path):
+    root = str(tmp_path / "archive")
+    archive = fetch_data.Archive(root)
+    archive.add("https://a/1", b"un", "text/xml")
+    archive.add("https://a/2", b"deux")
+    archive.add("https://a/1", b"un", "text/xml")   # inchangée : pas de nouvelle ligne
+    # Run interrompu : pas de save(), dernière ligne du journal tronquée
+    with open(os.path.join(root, "index.log"), "a", encoding="utf-8") as f:
+        f.write('["https://a/3", {"sha')
+    reopened = fetch_data.Archive(root)
+    assert sorted(reopened.entries) == ["https://a/1", "https://a/2"]
+    assert reopened.get("https://a/2")[1] == b"deux"
+
+
+def test_save_folds_journal_into_index(tmp_path):
+    root = str(tmp_path / "archive")
+    archive = fetch_data.Archive(root)
+    archive.add("https://a/1", b"un")
+    archive.save()
+    assert not os.path.exists(os.path.join(root, "index.log"))
+    archive.add("https://a/1", b"modifie")
+    reopened = fetch_data.Archive(root)
+    assert reopened.get("https://a/1")[1] == b"modifie"
+    reopened.save()
+    with open(os.path.join(root, "index.json"), encoding="utf-8") as f:
+        index = json.load(f)
+    assert index["entries"]["https://a/1"]["size"] == len(b"modifie")
+    assert not os.path.exists(os.path.join(root, "index.log"))
@@ -0,0 +1,65 @@
+from collections import Counter
+
+import pytest
+
+import fetch_data
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+def first_then(server, path, *responses):
+    server.routes[path] = [(200, {"ETag": ETAG, "Last-Modified": LAST_MODIFIED}, b"v1"),
+                           *responses]
+    return server.url(path)
+
+
+def test_revalidation_304_reuses_cached_body(http_server):
+    url = first_then(http_server, "/d.xml", (304, {}, b""))
+    stats = Counter()
+    assert fetch_data.fetch_cached(url, stats=stats) == b"v1"
+    assert fetch_data.fetch_cached(url, stats=stats) == b"v1"
+    assert stats == {"telecharges": 1, "revalides": 1}
+    (_, first), (_, second) = http_server.log
+    assert "If-None-Match" not in first
+    assert second["If-None-Match"] == ETAG
+    assert second["If-Modified-Since"] == LAST_MODIFIED
+
+
+def test_revalidation_200_replaces_cached_body(http_server):
+    url = first_then(http_server, "/d.xml", (200, {"ETag": '"v2"'}, b"v2"))
+    stats = Counter()
+    fetch_data.fetch_cached(url, stats=stats)
+    assert fetch_data.fetch_cached(url, stats=stats) == b"v2"
+    meta, body = fetch_data._cache_load(url)
+    assert (meta["etag"], body) == ('"v2"', b"v2")
+    assert stats == {"telecharges": 2}
+
+
+def test_same_version_is_served_without_request(http_server):
+    url = first_then(http_server, "/d.xml", (500, {}, b""))
+    stats = Counter()
+    fetch_data.fetch_cached(url, version="2024-01-01", stats=stats)
+    assert fetch_data.fetch_cached(url, version="2024-01-01", stats=stats) == b"v1"
+    assert len(http_server.log) == 1
+    assert stats == {"telecharges": 1, "frais": 1}
+
+
+def test_new_version_revalidates_and_records_version(http_server):
+    url = first_then(http_server, "/d.xml", (304, {}, b""))
+    fetch_data.fetch_cached(url, version="2024-01-01")
+    assert fetch_data.fetch_cached(url, version="2024-06-01") == b"v1"
+    assert http_server.log[-1][1]["If-None-Match"] == ETAG
+    meta, _ = fetch_data._cache_load(url)
+    assert meta["version"] == "2024-06-01"
+    # La nouvelle version est désormais servie sans requête
+    fetch_data.fetch_cached(url, version="2024-06-01")
+    assert len(http_server.log) == 2
+
+
+def test_error_keeps_cached_entry(http_server):
+    url = first_then(http_server, "/d.xml", (404, {}, b""))
+    fetch_data.fetch_cached(url)
+    with pytest.raises(fetch_data.FetchError):
+        fetch_data.fetch_cached(url)
+    assert fetch_data._cache_load(url)[1] == b"v1"
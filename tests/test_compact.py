@@ -0,0 +1,46 @@
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import fetch_data
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RESULTS = [
+    {"prenom": "Jean", "nom": "DUPONT", "groupe": "Groupe A", "departement": "75",
+     "participations": [{"societe": "Airbus", "sid": "airbus", "evaluation": 5000.0,
+                         "nbParts": 12.5, "remuneration": 0.0},
+                        {"societe": "SCI Les Tilleuls", "evaluation": 1.0e6,
+                         "nbParts": 1.0, "remuneration": 120.0}],
+     "mandats": [{"description": "Maire", "debut": "2020", "fin": ""}]},
+    # Sections vides ou absentes, champ propre à une entrée
+    {"prenom": "Marie", "nom": "MARTIN", "groupe": "Groupe A", "departement": "2A",
+     "participations": [], "erreur": "HTTP 500"},
+    {"prenom": "Éloïse", "nom": "L'HÔTE", "groupe": "Groupe B", "departement": "75",
+     "participations": [{"societe": "Airbus", "sid": "airbus", "evaluation": 0.5,
+                         "nbParts": 0.0, "remuneration": 0.0}],
+     "mandats": []},
+]
+
+
+def test_compact_round_trip():
+    compact = fetch_data.compact_results(RESULTS)
+    assert compact["n"] == 3
+    assert json.loads(json.dumps(fetch_data.expand_compact(compact))) == RESULTS
+    # Colonnes internées : une seule occurrence de chaque chaîne
+    assert compact["strings"].count("Airbus") == 1
+    assert fetch_data.expand_compact(fetch_data.compact_results([])) == []
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node non installé")
+def test_compact_js_round_trip():
+    compact = fetch_data._dumps(fetch_data.compact_results(RESULTS))
+    with open(os.path.join(ROOT, "compact.js"), encoding="utf-8") as f:
+        decoder = f.read()
+    script = (f"globalThis.window = globalThis;\n{decoder}\n"
+              f"process.stdout.write(JSON.stringify(expandCompact({compact})));\n")
+    out = subprocess.run(["node", "-e", script], capture_output=True, check=True)
+    assert json.loads(out.stdout) == RESULTS
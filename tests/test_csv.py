@@ -0,0 +1,49 @@
+import fetch_data
+
+HEADER = ("civilite;prenom;nom;classement;type_mandat;qualite;type_document;departement;"
+          "date_publication;date_depot;nom_fichier;url_dossier;open_data;statut_publication;"
+          "id_origine;url_photo")
+
+
+def row(prenom, nom, mandat, document="dia", open_data=None, statut="Livrée",
+        date="2024-01-01", departement="75"):
+    open_data = f"{nom.lower()}-{document}.xml" if open_data is None else open_data
+    return (f"M.;{prenom};{nom};{nom.lower()};{mandat};Député;{document};{departement};"
+            f"{date};{date};f.pdf;/pages_nominatives/{nom.lower()};{open_data};{statut};1;")
+
+
+def serve_csv(http_server, monkeypatch, lines):
+    http_server.routes["/liste.csv"] = [(200, {"Content-Type": "text/csv"},
+                                         "\n".join([HEADER, *lines]).encode("utf-8"))]
+    monkeypatch.setattr(fetch_data, "CSV_URL", http_server.url("/liste.csv"))
+
+
+def test_buckets_by_mandate(http_server, monkeypatch):
+    serve_csv(http_server, monkeypatch, [
+        row("Jean", "DUPONT", "depute", date="2024-03-01"),
+        row("Jean", "DUPONT", "depute", date="2023-01-01", open_data="ancien.xml"),  # doublon
+        row("Marie", "MARTIN", "Sénatrice "),
+        row("Paul", "DURAND", "senateur"),
+        row("Luc", "PETIT", "europeen"),                        # mandat hors buckets
+    ])
+    buckets = fetch_data.load_csv()
+    assert set(buckets) == set(fetch_data.MANDATS)
+    [dupont] = buckets["deputes"]
+    assert dupont == {"prenom": "Jean", "nom": "DUPONT", "qualite": "Député",
+                      "departement": "75", "xml": "dupont-dia.xml",
+                      "url": "/pages_nominatives/dupont", "date": "2024-03-01"}
+    assert [e["nom"] for e in buckets["senateurs"]] == ["MARTIN", "DURAND"]
+
+
+def test_skipped_and_malformed_rows(http_server, monkeypatch):
+    serve_csv(http_server, monkeypatch, [
+        row("Jean", "DUPONT", "depute", document="di"),          # pas une DIA
+        row("Anne", "LEROY", "depute", statut="En cours"),       # non livrée
+        row("Eric", "MOREAU", "depute", open_data=""),           # sans fichier open data
+        "M.;Tronquée;LIGNE;ligne;depute;Député;dia",              # ligne courte
+        "",
+        row("Marie", "MARTIN", "depute"),
+    ])
+    buckets = fetch_data.load_csv()
+    assert [e["nom"] for e in buckets["deputes"]] == ["MARTIN"]
+    assert buckets["senateurs"] == []
@@ -0,0 +1,83 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import fetch_data
+from conftest import dia_xml, member
+
+
+def fake_download(entry, stats=None):
+    i = int(entry["xml"][3:-4])
+    return dia_xml([(f"Societe {i}", 1000 * i)]), None
+
+
+def test_fetch_dossiers_inline_parse(monkeypatch):
+    monkeypatch.setattr(fetch_data, "download_dossier", fake_download)
+    members = [member(i) for i in range(5)]
+    dossiers = fetch_data.fetch_dossiers(members, "test", parse_workers=0)
+    assert sorted(dep["xml"] for dep, _, _ in dossiers) == sorted(m["xml"] for m in members)
+    for dep, dia, erreur in dossiers:
+        i = int(dep["xml"][3:-4])
+        assert erreur is None
+        assert dia["participations"] == [{"societe": f"Societe {i}", "evaluation": 1000.0 * i,
+                                          "nbParts": 1.0, "remuneration": 0.0}]
+
+
+def test_fetch_dossiers_sink_with_back_pressure(monkeypatch):
+    # File d'une place et parsing lent : le seuil 2 × DOWNLOAD_QUEUE de
+    # dossiers en vol est atteint et fetch_dossiers attend un parsing
+    monkeypatch.setattr(fetch_data, "DOWNLOAD_QUEUE", 1)
+    monkeypatch.setattr(fetch_data, "download_dossier", fake_download)
+    parse = fetch_data.parse_dossier
+
+    def slow_parse(data):
+        time.sleep(0.01)
+        return parse(data)
+
+    monkeypatch.setattr(fetch_data, "parse_dossier", slow_parse)
+    members = [member(i) for i in range(20)]
+    received = []
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        out = fetch_data.fetch_dossiers(members, "test", cpu_pool=pool,
+                                        sink=lambda *item: received.append(item))
+    assert out == []
+    assert sorted(dep["xml"] for dep, _, _ in received) == sorted(m["xml"] for m in members)
+    assert all(erreur is None and len(dia["participations"]) == 1
+               for _, dia, erreur in received)
+
+
+def test_fetch_dossiers_reports_download_errors(monkeypatch):
+    monkeypatch.setattr(fetch_data, "download_dossier",
+                        lambda entry, stats=None: (None, "HTTP 500"))
+    dossiers = fetch_data.fetch_dossiers([member(1)], "test", parse_workers=0)
+    assert [(dep["xml"], dia, erreur) for dep, dia, erreur in dossiers] == [
+        ("nom1.xml", fetch_data.empty_dia(), "HTTP 500")]
+
+
+def test_fetch_dossiers_invalid_xml(monkeypatch):
+    monkeypatch.setattr(fetch_data, "download_dossier",
+                        lambda entry, stats=None: (b"<declaration>", None))
+    [(dep, dia, erreur)] = fetch_data.fetch_dossiers([member(1)], "test", parse_workers=0)
+    assert dia == fetch_data.empty_dia()
+    assert erreur.startswith(fetch_data.DOSSIERS_BASE + "nom1.xml: XML invalide")
+
+
+def test_unexpected_download_exception_does_not_hang(monkeypatch):
+    def broken(entry, stats=None):
+        if entry["xml"] == "nom2.xml":
+            raise OSError("disque plein")
+        return fake_download(entry)
+
+    monkeypatch.setattr(fetch_data, "download_dossier", broken)
+    dossiers = fetch_data.fetch_dossiers([member(i) for i in range(4)], "test", parse_workers=0)
+    errors = {dep["xml"]: erreur for dep, _, erreur in dossiers}
+    assert len(errors) == 4
+    assert errors["nom2.xml"] == f"{fetch_data.DOSSIERS_BASE}nom2.xml: OSError('disque plein')"
+    assert all(e is None for xml, e in errors.items() if xml != "nom2.xml")
+
+
+def test_fetch_dossiers_process_pool(monkeypatch):
+    monkeypatch.setattr(fetch_data, "download_dossier", fake_download)
+    members = [member(i) for i in range(4)]
+    dossiers = fetch_data.fetch_dossiers(members, "test", parse_workers=2)
+    assert sorted((dep["xml"], dia["participations"][0]["societe"]) for dep, dia, _ in dossiers) \
+        == [(f"nom{i}.xml", f"Societe {i}") for i in range(4)]
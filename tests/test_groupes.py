@@ -0,0 +1,64 @@
+import json
+
+import fetch_data
+
+SEATS = {"PA1": "#ff0000", "PA2": "#0000ff"}
+
+
+def run(monkeypatch, store_path, seats, embed=None):
+    """load_groupes avec hémicycle et pages embed simulés ; retourne
+    (matcher, PA ids redemandés)."""
+    fetched = []
+
+    def presentation(pa_id):
+        fetched.append(pa_id)
+        nom, groupe = (embed or {}).get(pa_id, ("", ""))
+        return pa_id, nom, groupe, "#123456" if nom else ""
+
+    monkeypatch.setattr(fetch_data, "scrape_hemicycle", lambda: dict(seats))
+    monkeypatch.setattr(fetch_data, "fetch_pa_presentation", presentation)
+    return fetch_data.load_groupes(store_path=store_path), sorted(fetched)
+
+
+def write_store(path, entries):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entries, f)
+
+
+def test_opendata_colours_do_not_force_refresh(tmp_path, monkeypatch):
+    # Magasin rempli par l'open data : couleurAssociee ≠ couleur de l'hémicycle
+    path = str(tmp_path / "an_groupes.json")
+    write_store(path, {
+        "PA1": {"nom": "Jean Dupont", "groupe": "Groupe A", "couleur": "#aa0000", "maj": 9e12},
+        "PA2": {"nom": "Marie Martin", "groupe": "Groupe B", "couleur": "#0000aa", "maj": 9e12},
+    })
+    groupes, fetched = run(monkeypatch, path, SEATS)
+    assert fetched == []
+    assert groupes.match("DUPONT", "Jean")["groupe"] == "Groupe A"
+    _, fetched = run(monkeypatch, path, SEATS)
+    assert fetched == []
+
+
+def test_seat_colour_change_refreshes_member(tmp_path, monkeypatch):
+    path = str(tmp_path / "an_groupes.json")
+    embed = {"PA1": ("Jean Dupont", "Groupe A"), "PA2": ("Marie Martin", "Groupe B")}
+    _, fetched = run(monkeypatch, path, SEATS, embed)
+    assert fetched == ["PA1", "PA2"]
+    _, fetched = run(monkeypatch, path, SEATS, embed)
+    assert fetched == []
+    # PA2 change de groupe : son siège prend la couleur de PA1
+    embed["PA2"] = ("Marie Martin", "Groupe A")
+    groupes, fetched = run(monkeypatch, path, {**SEATS, "PA2": "#ff0000"}, embed)
+    assert fetched == ["PA2"]
+    assert groupes.match("MARTIN", "Marie")["groupe"] == "Groupe A"
+
+
+def test_failed_refresh_is_retried(tmp_path, monkeypatch):
+    path = str(tmp_path / "an_groupes.json")
+    embed = {"PA1": ("Jean Dupont", "Groupe A"), "PA2": ("Marie Martin", "Groupe B")}
+    run(monkeypatch, path, SEATS, embed)
+    moved = {**SEATS, "PA2": "#ff0000"}
+    _, fetched = run(monkeypatch, path, moved, {"PA1": embed["PA1"]})   # embed PA2 en échec
+    assert fetched == ["PA2"]
+    _, fetched = run(monkeypatch, path, moved, embed)
+    assert fetched == ["PA2"]
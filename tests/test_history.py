@@ -0,0 +1,121 @@
+import json
+import os
+
+import pytest
+
+import fetch_data
+
+
+def record(i, participations, nom=None):
+    return {"prenom": "Jean", "nom": nom or f"NOM{i}", "groupe": "Groupe A",
+            "url": f"https://www.hatvp.fr/pages_nominatives/nom{i}",
+            "participations": [{"societe": s, "evaluation": v} for s, v in participations]}
+
+
+def snapshot(store, records):
+    tree = {fetch_data._member_key(r): store.put_json(r) for r in records}
+    index = {fetch_data._member_key(r): fetch_data._index_entry(r) for r in records}
+    return store.snapshot({"députés": tree}, {"députés": index})
+
+
+@pytest.fixture
+def store(tmp_path):
+    return fetch_data.SnapshotStore(str(tmp_path / "history"))
+
+
+def test_diff_between_runs(store):
+    old = snapshot(store, [record(1, [("Airbus", 100), ("Thales", 50)]),
+                           record(2, [("Total", 10)]),
+                           record(3, [("Orange", 5)])])
+    new = snapshot(store, [record(1, [("Airbus", 150), ("Dassault", 20)]),
+                           record(2, [("Total", 10)]),
+                           record(4, [("Orange", 7)])])
+    changes = {m["nom"]: m["changements"] for m in store.diff(old, new)}
+    assert changes == {
+        "NOM1": [{"type": "reevaluee", "societe": "Airbus", "avant": 100, "apres": 150},
+                 {"type": "nouvelle", "societe": "Dassault", "avant": None, "apres": 20},
+                 {"type": "retiree", "societe": "Thales", "avant": 50, "apres": None}],
+        "NOM3": [{"type": "retiree", "societe": "Orange", "avant": 5, "apres": None}],
+        "NOM4": [{"type": "nouvelle", "societe": "Orange", "avant": None, "apres": 7}],
+    }
+    assert store.diff(new, new) == []
+
+
+def test_filtered_diff_reads_only_indexed_records(store, monkeypatch):
+    old = snapshot(store, [record(i, [(f"Societe {i}", i)]) for i in range(50)]
+                   + [record(99, [("Crédit Agricole", 1)], nom="DURAND")])
+    new = snapshot(store, [record(i, [(f"Societe {i}", i + 1)]) for i in range(50)]
+                   + [record(99, [("Crédit Agricole", 2)], nom="DURAND")])
+    reads = []
+    get_json = store.get_json
+    monkeypatch.setattr(store, "get_json", lambda sha: reads.append(sha) or get_json(sha))
+
+    [m] = store.diff(old, new, societe="credit agricole")
+    assert m["nom"] == "DURAND"
+    # 2 arbres + 2 index + les 2 versions de l'entrée retenue
+    assert len(reads) == 6
+
+    reads.clear()
+    [m] = store.diff(old, new, membre="durand")
+    assert m["changements"][0]["societe"] == "Crédit Agricole"
+    assert len(reads) == 6
+    assert store.diff(old, new, membre="durand", societe="societe") == []
+
+
+def test_diff_without_index_falls_back_to_records(store):
+    r = record(1, [("Airbus", 1)])
+    old = store.snapshot({"députés": {fetch_data._member_key(r): store.put_json(r)}})
+    new = snapshot(store, [record(1, [("Airbus", 2)])])
+    assert [m["nom"] for m in store.diff(old, new, membre="nom1")] == ["NOM1"]
+
+
+def test_resolve(store, monkeypatch):
+    runs = ["20240101-120000", "20240101-120000-2", "20240101-120000-10", "20240102-080000"]
+    os.makedirs(store.runs_dir)
+    for run in reversed(runs):
+        open(os.path.join(store.runs_dir, run + ".json"), "w").close()
+    assert store.runs() == runs
+    assert store.resolve("-1") == "20240102-080000"
+    assert store.resolve("-2") == "20240101-120000-10"
+    assert store.resolve("-4") == runs[0]
+    assert store.resolve("20240102") == "20240102-080000"
+    assert store.resolve("20240101-120000") == runs[0]   # identifiant exact
+    for ref in ("-0", "-5", "20240101", "2025"):
+        with pytest.raises(KeyError):
+            store.resolve(ref)
+
+
+def test_snapshot_suffixes_sort_numerically(store, monkeypatch):
+    monkeypatch.setattr(fetch_data.time, "gmtime", lambda *a: fetch_data.time.struct_time(
+        (2024, 1, 1, 12, 0, 0, 0, 1, 0)))
+    runs = [snapshot(store, [record(1, [("Airbus", i)])]) for i in range(11)]
+    assert runs[-1] == "20240101-120000-11"
+    assert store.runs() == runs
+    assert store.resolve("-1") == runs[-1]
+
+
+def test_incremental_run_archives_kept_dossiers(http_server, monkeypatch, tmp_path):
+    from conftest import dia_xml
+    from test_csv import row, serve_csv
+    serve_csv(http_server, monkeypatch, [row("Jean", "DUPONT", "depute"),
+                                         row("Paul", "DURAND", "senateur")])
+    monkeypatch.setattr(fetch_data, "DOSSIERS_BASE", http_server.url("/dossiers/"))
+    bodies = {"dupont": dia_xml([("Airbus", 1000)]), "durand": dia_xml(neant=True)}
+    for nom, body in bodies.items():
+        http_server.routes[f"/dossiers/{nom}-dia.xml"] = [(200, {}, body)]
+    loaders = dict.fromkeys(("deputes", "senateurs"), fetch_data.NameMatcher)
+    fetch_data.run_chambers(loaders, parse_workers=0, out_dir=str(tmp_path))
+
+    # Premier run --history sur une sortie existante : rien n'est retraité,
+    # mais les dossiers conservés sont archivés depuis le cache HTTP
+    store = fetch_data.start_history(str(tmp_path / "history"))
+    http_server.log.clear()
+    outputs = fetch_data.run_chambers(loaders, parse_workers=0, incremental=True,
+                                      out_dir=str(tmp_path))
+    assert [path for path, _ in http_server.log] == ["/liste.csv"]
+    assert {name: [store.get(sha) for sha in shas] for name, shas in store.dossiers.items()} == \
+        {f"{nom}-dia.xml": [body] for nom, body in bodies.items()}
+    run = store.snapshot({label: out.tree for label, out in outputs.items()})
+    with open(store.dossiers_path, encoding="utf-8") as f:
+        assert set(json.load(f)["dossiers"]) == {"dupont-dia.xml", "durand-dia.xml"}
+    assert store.runs() == [run]
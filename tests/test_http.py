@@ -0,0 +1,119 @@
+import gzip
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import fetch_data
+from conftest import FakeServer, truncated
+
+
+def test_request_reuses_keep_alive_connection(http_server):
+    http_server.routes["/a"] = [(200, {"ETag": '"v1"'}, b"contenu")]
+    for _ in range(3):
+        status, meta, body = fetch_data.request(http_server.url("/a"))
+        assert (status, meta["etag"], body) == (200, '"v1"', b"contenu")
+    pool, _ = fetch_data._pool_for(http_server.url("/a"))
+    assert len(pool._idle) == 1
+
+
+def test_request_decodes_gzip(http_server):
+    http_server.routes["/gz"] = [(200, {"Content-Encoding": "gzip"}, gzip.compress(b"x" * 1000))]
+    assert fetch_data.request(http_server.url("/gz"))[2] == b"x" * 1000
+
+
+def test_request_retries_server_errors(http_server):
+    http_server.routes["/flaky"] = [(503, {}, b""), (200, {}, b"ok")]
+    assert fetch_data.request(http_server.url("/flaky"))[2] == b"ok"
+    assert not fetch_data.fetch_failures
+
+
+def test_request_retries_truncated_body(http_server):
+    http_server.routes["/cut"] = [truncated, truncated, (200, {}, b"complet")]
+    assert fetch_data.request(http_server.url("/cut"))[2] == b"complet"
+    assert len(http_server.log) == 3
+    assert not fetch_data.fetch_failures
+
+
+def test_truncated_body_final_failure_is_recorded(http_server):
+    http_server.routes["/cut"] = [truncated]
+    with pytest.raises(fetch_data.FetchError):
+        fetch_data.request(http_server.url("/cut"))
+    assert len(http_server.log) == fetch_data.MAX_RETRIES + 1
+    [failure] = fetch_data.fetch_failures
+    assert failure["url"] == http_server.url("/cut")
+    assert failure["tentatives"] == fetch_data.MAX_RETRIES + 1
+    assert fetch_data.run_report.requests[-1][2] is None   # statut
+
+
+def test_retries_exhausted_on_server_error(http_server):
+    http_server.routes["/down"] = [(500, {}, b"")]
+    with pytest.raises(fetch_data.FetchError) as e:
+        fetch_data.request(http_server.url("/down"))
+    assert e.value.status == 500
+    assert fetch_data.fetch_failures[0]["tentatives"] == fetch_data.MAX_RETRIES + 1
+
+
+def test_client_error_is_not_retried(http_server):
+    http_server.routes["/gone"] = [(404, {}, b"")]
+    with pytest.raises(fetch_data.FetchError):
+        fetch_data.fetch(http_server.url("/gone"))
+    assert len(http_server.log) == 1
+
+
+def test_redirect_is_followed(http_server):
+    http_server.routes["/old"] = [(301, {"Location": "/new"}, b"")]
+    http_server.routes["/new"] = [(200, {}, b"ici")]
+    assert fetch_data.fetch(http_server.url("/old")) == "ici"
+
+
+def test_corrupt_gzip_body_is_retried(http_server):
+    body = gzip.compress(b"x" * 1000)
+    http_server.routes["/gz"] = [(200, {"Content-Encoding": "gzip"}, body[:-12]),
+                                 (200, {"Content-Encoding": "gzip"}, body)]
+    assert fetch_data.request(http_server.url("/gz"))[2] == b"x" * 1000
+    assert len(http_server.log) == 2
+
+
+def test_stale_keep_alive_connections_are_replaced(monkeypatch):
+    # Serveur qui ferme les connexions inactives, délai de reprise prohibitif :
+    # une connexion morte ne doit coûter ni tentative ni attente
+    monkeypatch.setattr(fetch_data, "DEFAULT_HOST_LIMIT", (4, 1000.0))
+    monkeypatch.setattr(fetch_data, "RETRY_BACKOFF", 10)
+    monkeypatch.setattr(fetch_data, "KEEPALIVE_IDLE", 60)
+    server = FakeServer(idle_timeout=0.2)
+
+    def slow(handler):
+        time.sleep(0.2)
+        handler.send_response(200)
+        handler.send_header("Content-Length", "2")
+        handler.end_headers()
+        handler.wfile.write(b"ok")
+
+    try:
+        server.routes["/a"] = [slow]
+        url = server.url("/a")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert list(pool.map(lambda _: fetch_data.request(url)[2], range(4))) == [b"ok"] * 4
+        http_pool, _ = fetch_data._pool_for(url)
+        assert len(http_pool._idle) == 4
+        time.sleep(0.5)   # le serveur ferme les quatre connexions
+        t0 = time.perf_counter()
+        assert fetch_data.request(url)[2] == b"ok"
+        assert time.perf_counter() - t0 < 2
+        assert not fetch_data.fetch_failures
+        assert fetch_data.run_report.requests[-1][-1] == 1   # une seule tentative
+    finally:
+        server.close()
+        fetch_data._pools.clear()
+
+
+def test_idle_connections_past_threshold_are_not_reused(http_server, monkeypatch):
+    http_server.routes["/a"] = [(200, {}, b"ok")]
+    fetch_data.request(http_server.url("/a"))
+    pool, _ = fetch_data._pool_for(http_server.url("/a"))
+    monkeypatch.setattr(fetch_data, "KEEPALIVE_IDLE", 0)
+    time.sleep(0.01)
+    conn, reused = pool._checkout(5)
+    conn.close()
+    assert not reused and pool._idle == []
@@ -0,0 +1,41 @@
+import fetch_data
+from conftest import member
+
+
+def previous_record(i, date="2024-01-01", groupe="Groupe A", nom=None, **extra):
+    m = member(i, nom)
+    return {**m, "nom": m["nom"].upper(), "date": date, "qualite": "Mme", "departement": "13",
+            "url": "https://ancienne/url", "groupe": groupe, "groupe_sigle": groupe,
+            "couleur_groupe": "#000000", "participations": [], **extra}
+
+
+def test_split_incremental():
+    previous = {r["xml"]: r for r in [
+        previous_record(1),                              # inchangé
+        previous_record(2, date="2023-06-01"),           # republié
+        previous_record(3, erreur="HTTP 500"),           # en échec au run précédent
+        previous_record(4),                              # parti
+    ]}
+    members = [member(1), member(2), member(3), member(5)]   # 5 : nouveau
+    todo, kept = fetch_data.split_incremental(members, previous)
+    assert [m["xml"] for m in todo] == ["nom2.xml", "nom3.xml", "nom5.xml"]
+    [r] = kept
+    # Champs du CSV rafraîchis, le reste repris tel quel
+    assert (r["xml"], r["qualite"], r["departement"], r["url"]) == (
+        "nom1.xml", "M.", "75", member(1)["url"])
+    assert r["groupe"] == "Groupe A"
+
+
+def test_kept_records_are_rematched():
+    groupes = fetch_data.NameMatcher()
+    groupes.add("Jean Nom1", {"groupe": "GB", "groupe_complet": "Groupe B", "couleur": "#00f"})
+    spool = fetch_data.DossierSpool(fetch_data.SocieteCanon())
+    spool.add_record(previous_record(1))                       # a changé de groupe
+    spool.add_record(previous_record(2, groupe="Inconnu", nom="Durand"))   # toujours introuvable
+    try:
+        records = list(spool.records(groupes))
+    finally:
+        spool.close()
+    assert [(r["groupe"], r["groupe_sigle"], r["couleur_groupe"]) for r in records] == [
+        ("Groupe B", "GB", "#00f"), ("Inconnu", "Inconnu", "")]
+    assert list(records[0]) == list(previous_record(1))   # ordre des clés conservé
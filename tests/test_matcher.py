@@ -0,0 +1,88 @@
+import fetch_data
+
+RN  = {"groupe": "RN", "couleur": "#0d378a", "groupe_complet": "Rassemblement National"}
+EPR = {"groupe": "EPR", "couleur": "#ffd600", "groupe_complet": "Ensemble pour la République"}
+UDR = {"groupe": "UDR", "couleur": "#1c2b6b", "groupe_complet": "Union des droites pour la République"}
+
+
+def matcher(*candidates):
+    m = fetch_data.NameMatcher()
+    for name, entry in candidates:
+        m.add(name, entry)
+    return m
+
+
+def test_exact_match_ignores_order_case_accents_and_entities():
+    m = matcher(("Christelle D&#039;Intorni", UDR), ("Éric Ciotti", UDR))
+    assert m.match("D'INTORNI", "Christelle") is UDR
+    assert m.match("CIOTTI", "Eric") is UDR
+    assert m.match("Ciotti", "ÉRIC") is UDR
+    assert m.stats["exacts"] == 3
+    assert not m.approximate
+
+
+def test_homonyms_in_same_group_are_exact():
+    m = matcher(("Jean Martin", RN), ("Jean Martin", RN))
+    assert m.match("MARTIN", "Jean") is RN
+    assert m.stats["exacts"] == 1
+
+
+def test_homonyms_in_different_groups_are_ambiguous():
+    m = matcher(("Jean Martin", RN), ("Jean Martin", EPR))
+    assert m.match("MARTIN", "Jean") is None
+    assert m.stats["ambigus"] == 1
+    assert m.ambiguous[0]["candidats"] == ["Jean Martin", "Jean Martin"]
+
+
+def test_compound_first_name_is_approximate_and_reported():
+    m = matcher(("Marie-France Lorho", RN), ("Paul Durand", EPR))
+    assert m.match("LORHO", "Marie") is RN
+    assert m.stats["approches"] == 1
+    assert m.approximate == [{"nom": "LORHO", "prenom": "Marie",
+                              "candidat": "Marie-France Lorho", "score": m.approximate[0]["score"]}]
+
+
+def test_unique_surname_with_different_first_name_is_not_matched():
+    # Même nom de famille, prénom sans rapport (seule l'initiale coïncide)
+    m = matcher(("Jacqueline Maquet", EPR))
+    assert m.match("MAQUET", "Jordan") is None
+    assert m.stats["introuvables"] == 1
+    assert m.unmatched == [{"nom": "MAQUET", "prenom": "Jordan"}]
+
+
+def test_first_name_ranks_surname_candidates():
+    m = matcher(("Sébastien Chenu", RN), ("Sabine Chenu", EPR))
+    assert m.match("CHENU", "Sebastian") is RN
+    assert m.stats["approches"] == 1
+
+
+def test_misspelled_full_name_uses_trigrams():
+    m = matcher(("Marine Le Pen", RN), ("Gabriel Attal", EPR))
+    assert m.match("LE PENN", "Marine") is RN
+    assert m.approximate[0]["candidat"] == "Marine Le Pen"
+
+
+def test_not_found():
+    m = matcher(("Marine Le Pen", RN))
+    assert m.match("DUPONT", "Jean") is None
+    assert m.stats["introuvables"] == 1
+    report = m.report()
+    assert report["candidats"] == 1
+    assert report["introuvables_detail"] == [{"nom": "DUPONT", "prenom": "Jean"}]
+
+
+def test_close_but_different_names_are_not_matched():
+    # Un mauvais groupe est pire que « Inconnu »
+    m = matcher(("Paul Dupont", RN), ("Marie Lebrun", EPR), ("Jean Martin", UDR))
+    for nom, prenom in [("DUPONTEL", "Paul"), ("BRUN", "Marie"), ("LEBRUN", "Mario"),
+                        ("MARTINE", "Jeanne"), ("MARTIN", "Jeanne")]:
+        assert m.match(nom, prenom) is None, (nom, prenom)
+    assert m.stats["introuvables"] == 5
+    assert not m.approximate
+
+
+def test_misspelled_surname_with_same_first_name_uses_trigrams():
+    m = matcher(("Paul Dupont", RN), ("Sébastien Martin", UDR))
+    assert m.match("DUPOND", "Paul") is RN
+    assert m.match("MARTINN", "Sebastian") is UDR
+    assert m.stats["approches"] == 2
@@ -0,0 +1,126 @@
+import json
+
+import pytest
+
+import fetch_data
+from conftest import member
+
+
+def record(i, groupe="Groupe A"):
+    r = fetch_data.make_record(member(i), fetch_data.NameMatcher(), {
+        "participations": [{"societe": f"Societe {i}", "evaluation": 1000.0 * i,
+                            "nbParts": 1.0, "remuneration": 0.0}],
+        "activites": [{"description": "Avocat", "employeur": "", "debut": "", "fin": ""}],
+        "mandats": [{"description": "Conseiller municipal", "debut": "", "fin": ""}],
+        "organes": [],
+    })
+    r["groupe"] = r["groupe_sigle"] = groupe
+    return r
+
+
+def read_bundle(path, js_var):
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    assert text.startswith(fetch_data.JS_HEADER)
+    line = [l for l in text.splitlines() if l.startswith(f"{js_var}=")][0]
+    value = line[len(js_var) + 1:-1]
+    if value.startswith("expandCompact("):
+        return fetch_data.expand_compact(json.loads(value[len("expandCompact("):-1]))
+    return json.loads(value)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_bundle_omits_site_sections(tmp_path, compact):
+    results = [record(i) for i in range(3)]
+    json_file, js_file = str(tmp_path / "data.json"), str(tmp_path / "data.js")
+    fetch_data.write_output(results, json_file, js_file, "window.D", compact=compact)
+    with open(json_file, encoding="utf-8") as f:
+        assert json.load(f) == results
+    assert read_bundle(js_file, "window.D") == [fetch_data.site_record(r) for r in results]
+    if compact:
+        with open(tmp_path / "data_compact.json", encoding="utf-8") as f:
+            assert fetch_data.expand_compact(json.load(f)) == results
+
+
+def test_run_without_shards_prunes_previous_shards(tmp_path):
+    results = [record(i, groupe=f"Groupe {i % 2}") for i in range(4)]
+    json_file, js_file = str(tmp_path / "data.json"), str(tmp_path / "data.js")
+    other = tmp_path / "shards" / "data_senateurs"
+    other.mkdir(parents=True)
+    fetch_data.write_output(results, json_file, js_file, "window.D", shards=True)
+    shards = tmp_path / "shards" / "data"
+    assert len(list(shards.iterdir())) == 4   # 2 groupes, résumés, manifeste
+    fetch_data.write_output(results, json_file, js_file, "window.D")
+    assert not shards.exists()
+    assert other.exists()   # shards de l'autre chambre
+    assert read_bundle(js_file, "window.D") == [fetch_data.site_record(r) for r in results]
+    other.rmdir()
+    fetch_data.write_output(results, json_file, js_file, "window.D")
+    assert not (tmp_path / "shards").exists()
+
+
+def test_shards_manifest(tmp_path):
+    results = [record(i, groupe=f"Groupe {i % 2}") for i in range(1, 6)]
+    results[0]["participations"].append({"societe": "[Données non publiées]", "evaluation": 5.0,
+                                         "nbParts": 1.0, "remuneration": 0.0})
+    json_file, js_file = str(tmp_path / "data.json"), str(tmp_path / "data.js")
+    fetch_data.write_output(results, json_file, js_file, "window.D", shards=True)
+    out_dir = tmp_path / "shards" / "data"
+    with open(out_dir / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    # Manifeste tel que lu par app.js (base + shards[clé].file, d.shard)
+    assert read_bundle(js_file, "window.D_SHARDS") == manifest
+    assert set(manifest) == {"format", "n", "base", "summary", "shards"}
+    assert manifest["format"] == fetch_data.SHARDS_FORMAT
+    assert manifest["base"] == "shards/data/"
+    assert manifest["n"] == len(results)
+    assert sorted(s["groupe"] for s in manifest["shards"].values()) == ["Groupe 0", "Groupe 1"]
+    assert sum(s["n"] for s in manifest["shards"].values()) == len(results)
+
+    by_url = {r["url"]: r for r in results}
+    for key, shard in manifest["shards"].items():
+        assert set(shard) == {"file", "groupe", "n", "bytes"}
+        data = (out_dir / shard["file"]).read_bytes()
+        # Nom haché sur le contenu, taille exacte
+        assert shard["file"] == fetch_data._hashed_name(key, data)
+        assert shard["bytes"] == len(data)
+        details = json.loads(data)
+        assert len(details) == shard["n"]
+        for url, sections in details.items():
+            assert by_url[url]["groupe"] == shard["groupe"]
+            assert set(sections) == {"participations"}   # SITE_OMIT exclues
+
+    data = (out_dir / manifest["summary"]).read_bytes()
+    assert manifest["summary"] == fetch_data._hashed_name("summary", data)
+    summaries = json.loads(data)
+    assert read_bundle(js_file, "window.D") == summaries
+    assert [s["url"] for s in summaries] == [r["url"] for r in results]
+    first = summaries[0]
+    assert first["nbParts"] == 2 and first["valeurTotale"] == 1005.0
+    assert [p["societe"] for p in first["top"]] == ["Societe 1"]
+    assert first["nbNonPublic"] == 1
+    assert manifest["shards"][first["shard"]]["groupe"] == first["groupe"]
+    assert all(not isinstance(v, list) for s in summaries for k, v in s.items() if k != "top")
+
+    # Même contenu, mêmes noms : un second run ne change pas le manifeste
+    fetch_data.write_output(results, json_file, js_file, "window.D", shards=True)
+    with open(out_dir / "manifest.json", encoding="utf-8") as f:
+        assert json.load(f) == manifest
+    assert len(list(out_dir.iterdir())) == 4
+
+
+def test_failed_write_keeps_previous_outputs(tmp_path, monkeypatch):
+    json_file, js_file = str(tmp_path / "data.json"), str(tmp_path / "data.js")
+    fetch_data.write_output([record(i, groupe=f"Groupe {i % 2}") for i in range(4)],
+                            json_file, js_file, "window.D", compact=True, shards=True)
+    before = {p: p.read_bytes() for p in tmp_path.rglob("*") if p.is_file()}
+
+    # Échec pendant les agrégats, après le bundle, le compact et les shards
+    def fail(self):
+        yield "{"
+        raise RuntimeError("disque plein")
+    monkeypatch.setattr(fetch_data.Aggregates, "chunks", fail)
+    with pytest.raises(RuntimeError):
+        fetch_data.write_output([record(i, groupe=f"Groupe {i % 3}") for i in range(1, 6)],
+                                json_file, js_file, "window.D", compact=True, shards=True)
+    assert {p: p.read_bytes() for p in tmp_path.rglob("*") if p.is_file()} == before
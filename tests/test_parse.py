@@ -0,0 +1,79 @@
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import fetch_data
+from conftest import dia_xml
+
+DIA = """<?xml version="1.0" encoding="UTF-8"?>
+<declaration>
+  <general><mandat><label>Député</label></mandat></general>
+  <participationFinanciereDto><neant>false</neant><items>
+    <items><nomSociete>  TOTAL
+        ENERGIES </nomSociete><evaluation>1500.5</evaluation><nombreParts>10</nombreParts>
+      <remuneration>n/a</remuneration></items>
+    <items><nomSociete></nomSociete><evaluation>99</evaluation></items>
+  </items></participationFinanciereDto>
+  <activProfCinqDerniereDto><neant>false</neant><items><items>
+    <description>Avocat
+      associé</description><employeur>Cabinet X</employeur>
+    <dateDebut>01/2015</dateDebut><dateFin>06/2022</dateFin>
+    <remuneration><montant><montant><annee>2020</annee><montant>1000</montant></montant></montant></remuneration>
+  </items></items></activProfCinqDerniereDto>
+  <mandatElectifDto><neant>true</neant><items><items>
+    <descriptionMandat>Ignoré</descriptionMandat></items></items></mandatElectifDto>
+  <participationDirigeantDto><neant>false</neant><items><items>
+    <nomSociete>SCI Les Tilleuls</nomSociete><activite>Gérant</activite>
+  </items></items></participationDirigeantDto>
+</declaration>"""
+
+
+def test_parse_all_sections():
+    dia = fetch_data.parse_xml(DIA.encode("utf-8"))
+    assert dia == {
+        "participations": [{"societe": "TOTAL ENERGIES", "evaluation": 1500.5,
+                            "nbParts": 10.0, "remuneration": 0.0}],
+        "activites": [{"description": "Avocat associé", "employeur": "Cabinet X",
+                       "debut": "01/2015", "fin": "06/2022"}],
+        "mandats": [],
+        "organes": [{"societe": "SCI Les Tilleuls", "activite": "Gérant",
+                     "debut": "", "fin": ""}],
+    }
+
+
+def test_parse_text_and_neant():
+    assert fetch_data.parse_xml(DIA) == fetch_data.parse_xml(DIA.encode("utf-8"))
+    assert fetch_data.parse_xml(dia_xml([("Airbus", 10)], neant=True)) == fetch_data.empty_dia()
+
+
+def test_parse_invalid():
+    with pytest.raises(ET.ParseError):
+        fetch_data.parse_xml(b"<declaration><items>")
+
+
+def test_stream_parser_matches_tree_parser(monkeypatch):
+    data = DIA.encode("utf-8")
+    expected = fetch_data.parse_xml(data)
+    assert fetch_data.parse_xml_stream(data) == expected
+    assert fetch_data.parse_xml_stream(io.BytesIO(data)) == expected
+    # Blocs minuscules : les sections sont coupées entre deux lectures
+    monkeypatch.setattr(fetch_data, "PARSE_CHUNK", 7)
+    assert fetch_data.parse_xml_stream(data) == expected
+
+
+def test_large_documents_are_streamed(monkeypatch):
+    data = dia_xml([(f"Societe {i}", i) for i in range(500)])
+    expected = fetch_data.parse_xml(data)
+    assert len(expected["participations"]) == 500
+    monkeypatch.setattr(fetch_data, "PARSE_STREAM_MIN", 1024)
+    calls = []
+    stream = fetch_data.parse_xml_stream
+    monkeypatch.setattr(fetch_data, "parse_xml_stream", lambda s: calls.append(s) or stream(s))
+    assert fetch_data.parse_xml(data) == expected
+    assert calls == [data]
+
+
+def test_stream_parser_invalid():
+    with pytest.raises(ET.ParseError):
+        fetch_data.parse_xml_stream(b"<declaration><items>")
@@ -0,0 +1,62 @@
+import json
+
+import fetch_data
+from conftest import dia_xml
+from test_csv import row, serve_csv
+
+
+def test_scheduled_run_report(http_server, monkeypatch, tmp_path):
+    serve_csv(http_server, monkeypatch, [
+        row("Jean", "DUPONT", "depute"),
+        row("Marie", "MARTIN", "depute"),
+        row("Paul", "DURAND", "senateur"),
+    ])
+    monkeypatch.setattr(fetch_data, "DOSSIERS_BASE", http_server.url("/dossiers/"))
+    xml = {"Content-Type": "application/xml"}
+    http_server.routes["/dossiers/dupont-dia.xml"] = [(200, xml, dia_xml([("Airbus", 1000)]))]
+    http_server.routes["/dossiers/durand-dia.xml"] = [(200, xml, dia_xml(neant=True))]
+    http_server.routes["/dossiers/martin-dia.xml"] = [(500, {}, b"")]   # échec définitif
+
+    def groupes():
+        m = fetch_data.NameMatcher()
+        m.add("Jean Dupont", {"groupe": "RN", "couleur": "#0d378a", "groupe_complet": "RN"})
+        return m
+
+    outputs = fetch_data.run_chambers({"deputes": groupes, "senateurs": groupes},
+                                      parse_workers=0, out_dir=str(tmp_path))
+    assert set(outputs) == {"députés", "sénateurs"}
+    path = tmp_path / "report.json"
+    fetch_data.run_report.write(str(path))
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+
+    assert report["format"] == fetch_data.REPORT_FORMAT
+    assert set(report) == {"format", "debut", "duree_s", "etapes", "hotes", "plus_lentes",
+                           "parsing", "cache", "correspondance", "echecs"}
+    stages = {s["etape"]: s for s in report["etapes"]}
+    assert set(stages) == {"load_csv"} | {f"{t}:{label}" for label in ("députés", "sénateurs")
+                                          for t in ("selection", "load_groupes", "dossiers",
+                                                    "write_output")}
+    for s in stages.values():
+        assert set(s) == {"etape", "debut_s", "mur_s", "cpu_s", "cpu_enfants_s"}
+        assert 0 <= s["debut_s"] <= report["duree_s"] and s["mur_s"] >= 0
+    # Les dépendances démarrent après la fin de leur tâche amont
+    for label in ("députés", "sénateurs"):
+        dl, out = stages[f"dossiers:{label}"], stages[f"write_output:{label}"]
+        assert out["debut_s"] >= dl["debut_s"] + dl["mur_s"] - 0.01
+
+    [host] = report["hotes"].values()
+    assert host["requetes"] == 4   # CSV + 3 dossiers
+    assert host["statuts"] == {"200": 3, "500": 1}
+    assert host["reprises"] == fetch_data.MAX_RETRIES
+    assert host["echecs"] == 1
+    assert set(host["duree_ms"]) == set(host["ttfb_ms"])
+    assert report["echecs"] == [{"url": http_server.url("/dossiers/martin-dia.xml"),
+                                 "erreur": "HTTP 500", "tentatives": fetch_data.MAX_RETRIES + 1}]
+    assert report["plus_lentes"][0].keys() == {"url", "statut", "duree_ms", "tentatives"}
+
+    assert report["parsing"]["dossiers"] == 2
+    assert report["parsing"]["octets"] == len(dia_xml([("Airbus", 1000)])) + len(dia_xml(neant=True))
+    assert report["correspondance"]["députés"]["exacts"] == 1
+    assert report["correspondance"]["députés"]["introuvables"] == 1
+    assert report["correspondance"]["sénateurs"]["introuvables"] == 1
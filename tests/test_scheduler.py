@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+
+import fetch_data
+
+
+def test_results_flow_to_dependents():
+    with fetch_data.Scheduler(parse_workers=0) as sched:
+        a = sched.task("a", lambda: 2)
+        b = sched.task("b", lambda: 3)
+        c = sched.task("c", lambda x, y: x * y, a, b)
+        sched.wait()
+    assert c.result() == 6
+
+
+def test_failure_propagates_to_dependents_only():
+    ran = []
+    release = threading.Event()
+
+    def boom():
+        raise ValueError("CSV illisible")
+
+    def other():
+        release.wait(5)
+        ran.append("other")
+        return "ok"
+
+    with fetch_data.Scheduler(parse_workers=0) as sched:
+        bad = sched.task("bad", boom)
+        child = sched.task("child", lambda x: ran.append("child"), bad)
+        grandchild = sched.task("grandchild", lambda x: ran.append("grandchild"), child)
+        side = sched.task("side", other)
+        release.set()
+        with pytest.raises(ValueError, match="CSV illisible"):
+            sched.wait()
+    assert ran == ["other"]
+    assert side.result() == "ok"
+    for fut in (child, grandchild):
+        assert isinstance(fut.exception(), ValueError)
+
+
+def test_progress_lines_are_prefixed_with_label(capsys):
+    with fetch_data.Scheduler(parse_workers=0) as sched:
+        sched.task("a", lambda: fetch_data.progress("\nÉcriture..."), label="Sénateurs")
+        sched.task("b", lambda: fetch_data.progress("3/10", 30), label="Députés")
+        sched.wait()
+    fetch_data.progress("sans chambre")
+    out = capsys.readouterr().out
+    assert "\n\n[Sénateurs] Écriture...\n" in out
+    assert "%  [Députés] 3/10" in out
+    assert "\nsans chambre\n" in out
+
+
+def test_chamber_summaries_are_written_as_blocks(tmp_path, capsys):
+    from test_output import record
+    results = [record(i) for i in range(3)]
+    m = fetch_data.NameMatcher()
+    m.match("DUPONT", "Jean")
+
+    def chamber(name):
+        def write():
+            fetch_data.write_output(results, str(tmp_path / f"{name}.json"),
+                                    str(tmp_path / f"{name}.js"), "window.D", compact=True)
+            fetch_data.report_matches(m, name)
+        return write
+
+    with fetch_data.Scheduler(parse_workers=0) as sched:
+        for name in ("A", "B"):
+            sched.task(name, chamber(name), label=name)
+        sched.wait()
+    lines = capsys.readouterr().out.splitlines()
+    for name in ("A", "B"):
+        # Tailles, bilan et correspondance : chaque ligne préfixée, d'un bloc
+        start = next(i for i, line in enumerate(lines)
+                     if line.startswith(f"[{name}]   Tailles ("))
+        block = lines[start:start + 8]
+        assert all(line.startswith(f"[{name}] ") or not line for line in block)
+        assert block[5].startswith(f"[{name}] ✓ 3 entrées")
+        assert lines[lines.index(f"[{name}]   → groupes ({name}) : 0 exacts · 0 approchés · "
+                                 f"0 ambigus · 1 introuvables") + 1] == f"[{name}]     ✗ DUPONT Jean"
@@ -0,0 +1,57 @@
+import fetch_data
+from fetch_data import canonicalize_societes, societe_id
+
+
+def record(*societes):
+    return {"participations": [{"societe": s, "evaluation": 100.0} for s in societes]}
+
+
+def test_societe_id_folds_case_accents_punctuation_and_legal_forms():
+    assert societe_id("TotalEnergies SE") == "totalenergies"
+    assert societe_id("  Airbus  se ") == societe_id("AIRBUS") == "airbus"
+    assert societe_id("L'Oréal") == societe_id("L’OREAL SA") == "l-oreal"
+    assert societe_id("Crédit-Agricole") == societe_id("credit agricole") == "credit-agricole"
+    assert societe_id("SAS Plan de la Tour") == "plan-de-la-tour"
+
+
+def test_societe_id_keeps_structures_and_lone_legal_form():
+    assert societe_id("SCI Les Tilleuls") == "sci-les-tilleuls"
+    assert societe_id("SA") == "sa"
+
+
+def test_societe_id_token_boundaries_do_not_collide():
+    assert societe_id("AB CD") != societe_id("ABC D")
+
+
+def test_canonicalize_uses_most_frequent_variant():
+    results = [record("AIRBUS", "Airbus SE"), record("Airbus SE"), record("airbus se")]
+    canonicalize_societes(results)
+    parts = [p for r in results for p in r["participations"]]
+    assert {(p["societe"], p["sid"]) for p in parts} == {("Airbus SE", "airbus")}
+
+
+def test_canonicalize_tie_breaks_alphabetically():
+    results = [record("b Corp"), record("B CORP")]
+    canonicalize_societes(results)
+    assert {p["societe"] for r in results for p in r["participations"]} == {"B CORP"}
+
+
+def test_canonicalize_non_public_labels_have_no_sid():
+    results = [record("SCI [Données non publiées]", "sci données non publiées"),
+               record("SCI  [données non publiées]"),
+               record("[Données non publiées]")]
+    results[0]["participations"][0]["sid"] = "stale"
+    canonicalize_societes(results)
+    parts = [p for r in results for p in r["participations"]]
+    assert [p["societe"] for p in parts] == ["SCI [Données non publiées]"] * 3 + [
+        "[Données non publiées]"]
+    assert all("sid" not in p for p in parts)
+    assert all(fetch_data.is_non_public(p["societe"]) for p in parts)
+
+
+def test_canonicalize_is_idempotent():
+    results = [record("Airbus", "AIRBUS SE", "Sanofi"), record("SANOFI")]
+    once = canonicalize_societes(results)
+    snapshot = [[dict(p) for p in r["participations"]] for r in once]
+    canonicalize_societes(results)
+    assert [r["participations"] for r in results] == snapshot